@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PyQt5 import QtCore
+
+from eddy.core.axioms import OWLAxiomTranslator
+from eddy.core.datatypes.common import Enum_
+from eddy.core.functions.signals import connect
+from eddy.core.graph import Graph
+from eddy.core.output import getLogger
+from eddy.core.trace import traced
+from eddy.core.worker import AbstractWorker, TaskScheduler
+
+
+LOGGER = getLogger()
+
+
+class Analysis(Enum_):
+    """
+    This class defines the analyses which can be performed on the diagrams of a project.
+    """
+    Axioms = 'axioms'
+    Statistics = 'statistics'
+    Validation = 'validation'
+
+
+class AnalysisResult(object):
+    """
+    Picklable result of the analyses performed on a single diagram.
+    Items are referenced by id: validation errors on edges are identified by the triple
+    (source, edge, target), while any other error is identified by the id of the offending item.
+    """
+    __slots__ = ('diagram', 'axioms', 'errors', 'seconds', 'statistics')
+
+    def __init__(self, diagram):
+        """
+        Initialize the result.
+        :type diagram: str
+        """
+        self.diagram = diagram
+        self.axioms = set()
+        self.errors = []
+        self.seconds = 0.0
+        self.statistics = {}
+
+    def __getstate__(self):
+        """
+        Returns the state of the result used for pickling.
+        :rtype: tuple
+        """
+        return self.diagram, self.axioms, self.errors, self.seconds, self.statistics
+
+    def __setstate__(self, state):
+        """
+        Restore the result from the given state.
+        :type state: tuple
+        """
+        self.diagram, self.axioms, self.errors, self.seconds, self.statistics = state
+
+
+def analyze(graph, analyses, normalize=False):
+    """
+    Perform the given analyses on the (single diagram) given graph.
+    This function is executed in the worker processes of the ProcessPool, hence it must not
+    rely on anything which is not contained in its (picklable) arguments.
+    :type graph: Graph
+    :type analyses: set
+    :type normalize: bool
+    :rtype: AnalysisResult
+    """
+    start = time.perf_counter()
+    diagram = graph.diagrams()[0]
+    result = AnalysisResult(diagram.name)
+    if Analysis.Validation in analyses:
+        for pvr in graph.validate():
+            item = pvr.item()
+            if isinstance(item, tuple):
+                result.errors.append((tuple(x.id for x in item), pvr.message()))
+            else:
+                result.errors.append(((item.id,), pvr.message()))
+    if Analysis.Axioms in analyses:
+        translator = OWLAxiomTranslator(graph, normalize=normalize)
+        result.axioms = translator.translate()
+        for item, message in translator.errors:
+            result.errors.append(((item.id,), message))
+    if Analysis.Statistics in analyses:
+        nodes = diagram.nodes()
+        result.statistics = {
+            'edges': len(diagram.edges()),
+            'identities': Counter(n.identity() for n in nodes),
+            'items': Counter(x.type() for x in nodes + diagram.edges()),
+            'nodes': len(nodes),
+            'predicates': {(n.type(), n.text()) for n in nodes if n.isPredicate()},
+        }
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+class ProcessPool(object):
+    """
+    Shared pool of worker processes used to run CPU bound analyses outside the GUI process.
+    Where supported (Python >= 3.7) worker processes are spawned rather than forked, since forking
+    a process running Qt threads is unsafe: the pool is created on first use and reused for
+    subsequent analyses. Pending futures are tracked so that they can be cancelled on shutdown.
+    """
+    Executor = None
+    Futures = set()
+    Lock = threading.Lock()
+    MaxProcesses = max(os.cpu_count() or 1, 1)
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the shared process pool executor.
+        :rtype: ProcessPoolExecutor
+        """
+        if cls.Executor is None:
+            if sys.version_info >= (3, 7):
+                context = multiprocessing.get_context('spawn')
+                cls.Executor = ProcessPoolExecutor(max_workers=cls.MaxProcesses, mp_context=context)
+            else:
+                cls.Executor = ProcessPoolExecutor(max_workers=cls.MaxProcesses)
+        return cls.Executor
+
+    @classmethod
+    def onFutureDone(cls, future):
+        """
+        Executed when a future submitted to the pool completes (or is cancelled).
+        :type future: Future
+        """
+        with cls.Lock:
+            cls.Futures.discard(future)
+
+    @classmethod
+    def shutdown(cls, wait=True):
+        """
+        Shutdown the shared process pool executor (if any), cancelling the pending futures.
+        :type wait: bool
+        """
+        if cls.Executor is not None:
+            with cls.Lock:
+                futures = list(cls.Futures)
+            for future in futures:
+                future.cancel()
+            cls.Executor.shutdown(wait=wait)
+            cls.Executor = None
+
+    @classmethod
+    def submit(cls, fn, *args):
+        """
+        Schedule the given callable to be executed in the pool, returning a Future.
+        :type fn: callable
+        :rtype: Future
+        """
+        future = cls.instance().submit(fn, *args)
+        with cls.Lock:
+            cls.Futures.add(future)
+        future.add_done_callback(cls.onFutureDone)
+        return future
+
+
+class ProjectAnalysisWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker which dispatches the diagrams of a headless graph
+    to the ProcessPool and relays the results of the analyses as soon as they are available.
+    """
+    sgnAnalyzed = QtCore.pyqtSignal(object)
+
+    def __init__(self, graph, analyses, normalize=False, processes=True):
+        """
+        Initialize the worker.
+        :type graph: Graph
+        :type analyses: set
+        :type normalize: bool
+        :type processes: bool
+        """
+        super().__init__()
+        self.analyses = analyses
+        self.graph = graph
+        self.normalize = normalize
+        self.processes = processes
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            graphs = self.graph.split()
+            if self.processes and len(graphs) > 1:
+                futures = [ProcessPool.submit(analyze, g, self.analyses, self.normalize) for g in graphs]
+                for i, future in enumerate(as_completed(futures), 1):
+                    if self.isCancelled():
+                        for f in futures:
+                            f.cancel()
+                        break
+                    self.sgnAnalyzed.emit(future.result())
+                    self.progress.emit(i, len(futures))
+            else:
+                for i, graph in enumerate(graphs, 1):
+                    if self.isCancelled():
+                        break
+                    self.sgnAnalyzed.emit(analyze(graph, self.analyses, self.normalize))
+                    self.progress.emit(i, len(graphs))
+        except Exception:
+            LOGGER.exception('Project analysis could not be completed')
+        finally:
+            self.finished.emit()
+
+
+class ProjectAnalysis(QtCore.QObject):
+    """
+    Perform CPU bound analyses (validation, OWL 2 axioms generation, statistics) on all the diagrams of a project.
+    A picklable snapshot of the project (see eddy.core.graph.Graph) is taken on the calling thread, then each
+    diagram is analyzed in a worker process of the ProcessPool and the per-diagram results are merged back on
+    the thread this object lives in: on multi-diagram projects the analysis scales with the number of cores.
+    """
+    sgnCompleted = QtCore.pyqtSignal()
+    sgnProgress = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, project, analyses=None, normalize=False, parent=None):
+        """
+        Initialize the analysis.
+        :type project: T <= Project|Graph
+        :type analyses: set
+        :type normalize: bool
+        :type parent: QObject
+        """
+        super().__init__(parent)
+        self.analyses = set(Analysis) if analyses is None else set(analyses)
+        self.completed = False
+        self.normalize = normalize
+        self.project = project
+        self.results = {}
+        self.task = None
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(object)
+    def onDiagramAnalyzed(self, result):
+        """
+        Executed when the analysis of a diagram completes.
+        :type result: AnalysisResult
+        """
+        self.results[result.diagram] = result
+
+    @QtCore.pyqtSlot()
+    def onWorkerFinished(self):
+        """
+        Executed when the analysis worker terminates.
+        """
+        self.completed = True
+        self.task = None
+        self.sgnCompleted.emit()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def axioms(self):
+        """
+        Returns the set of axioms generated for the whole project.
+        :rtype: set
+        """
+        return set().union(*(r.axioms for r in self.results.values()))
+
+    def cancel(self):
+        """
+        Cancel the running analysis.
+        """
+        if self.task:
+            TaskScheduler.instance().cancel(self.task.name)
+
+    def errors(self):
+        """
+        Returns the list of errors detected in the project as pairs (items, message),
+        where items is the tuple of project items involved in the error.
+        :rtype: list
+        """
+        errors = []
+        diagrams = {d.name: d for d in self.project.diagrams()}
+        for result in self.results.values():
+            diagram = diagrams.get(result.diagram)
+            if diagram:
+                for ids, message in result.errors:
+                    items = tuple(diagram.edge(x) if diagram.node(x) is None else diagram.node(x) for x in ids)
+                    if None not in items:
+                        errors.append((items, message))
+        return errors
+
+    def isCompleted(self):
+        """
+        Returns True if the analysis completed, False otherwise.
+        :rtype: bool
+        """
+        return self.completed
+
+    def snapshot(self):
+        """
+        Returns a picklable snapshot of the project.
+        :rtype: Graph
+        """
+        if isinstance(self.project, Graph):
+            return self.project
+        return Graph.fromProject(self.project)
+
+    def start(self, processes=True):
+        """
+        Start the analysis in background, returning immediately.
+        :type processes: bool
+        :rtype: bool
+        """
+        self.completed = False
+        self.results = {}
+        worker = ProjectAnalysisWorker(self.snapshot(), self.analyses, self.normalize, processes)
+        connect(worker.sgnAnalyzed, self.onDiagramAnalyzed)
+        connect(worker.progress, self.sgnProgress)
+        connect(worker.finished, self.onWorkerFinished)
+        self.task = TaskScheduler.instance().submit('analysis:{0}'.format(id(self)), worker)
+        return self.task is not None
+
+    def statistics(self):
+        """
+        Returns the statistics collected on the whole project.
+        :rtype: dict
+        """
+        statistics = {'edges': 0, 'identities': Counter(), 'items': Counter(), 'nodes': 0, 'predicates': set()}
+        for result in self.results.values():
+            for key, value in result.statistics.items():
+                if isinstance(value, set):
+                    statistics[key] |= value
+                else:
+                    statistics[key] += value
+        return statistics
+
+    @traced(category='analysis')
+    def run(self, processes=True):
+        """
+        Perform the analysis synchronously, blocking until all the diagrams have been analyzed.
+        :type processes: bool
+        """
+        self.completed = False
+        self.results = {}
+        worker = ProjectAnalysisWorker(self.snapshot(), self.analyses, self.normalize, processes)
+        connect(worker.sgnAnalyzed, self.onDiagramAnalyzed)
+        connect(worker.progress, self.sgnProgress)
+        worker.run()
+        worker.deleteLater()
+        self.completed = True
+        self.sgnCompleted.emit()
\ No newline at end of file
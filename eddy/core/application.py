@@ -33,6 +33,7 @@
 ##########################################################################
 
 
+import logging
 import os
 
 from PyQt5 import QtCore
@@ -48,7 +49,7 @@ from eddy.core.functions.fsystem import isdir, fexists, fread
 from eddy.core.functions.misc import format_exception
 from eddy.core.functions.path import expandPath
 from eddy.core.functions.signals import connect
-from eddy.core.output import getLogger
+from eddy.core.output import getLogger, OutputBuffer, OutputHandler
 from eddy.core.plugin import PluginManager
 from eddy.core.project import ProjectNotFoundError
 from eddy.core.project import ProjectNotValidError
@@ -141,6 +142,16 @@ class Eddy(QtWidgets.QApplication):
             settings.setValue('project/recent', projects or examples)
             settings.sync()
 
+        #############################################
+        # CONFIGURE LOGGING
+        #################################
+
+        output = OutputHandler.getDefaultBuffer()
+        output.setCapacity(settings.value('log/capacity', OutputBuffer.DefaultCapacity, int))
+        output.setLevel(settings.value('log/level', logging.DEBUG, int))
+        if settings.value('log/file', False, bool):
+            output.setFile(expandPath('@home/logs/eddy.log'))
+
         #############################################
         # CONFIGURE FONTS
         #################################
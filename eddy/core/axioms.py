@@ -0,0 +1,1003 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from eddy.core.datatypes.graphol import Item, Identity, Special, Restriction
+from eddy.core.datatypes.owl import Datatype, OWLAxiom
+from eddy.core.diagram import DiagramMalformedError
+from eddy.core.functions.misc import first, isEmpty
+from eddy.core.functions.owl import OWLShortIRI, OWLAnnotationText, OWLText
+from eddy.core.project import K_DESCRIPTION
+from eddy.core.trace import traced
+
+
+class ExpressionIndex(object):
+    """
+    Hash-consing index of the Graphol expressions of a project.
+    Every node is assigned a small integer id identifying its structure, so that nodes
+    expressing the same (sub)expression share the same id regardless of the diagram they
+    belong to. The structure of a node is described by a shallow key made of the node type,
+    identity, predicate name (or datatype, facet, restriction and cardinality) and of the ids
+    of its inputs: ordered for role chains and property assertions, unordered otherwise.
+    Since inputs are referenced by id, keys have constant size and equality checks on whole
+    expressions cost as much as comparing two integers.
+    The index is not updated as the project changes: it is meant to be built for a single job.
+    """
+    def __init__(self):
+        """
+        Initialize the index.
+        """
+        self._ids = {}
+        self._nodes = {}
+        self._table = {}
+        self._visiting = set()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def assertion(self, edge):
+        """
+        Returns the structural key of the assertion expressed by the given edge,
+        or None if the edge does not express an assertion (i.e: input edges).
+        :type edge: AbstractEdge
+        :rtype: tuple
+        """
+        if edge.type() is Item.EquivalenceEdge:
+            return edge.type(), frozenset((self.id(edge.source), self.id(edge.target)))
+        if edge.type() in {Item.InclusionEdge, Item.MembershipEdge}:
+            return edge.type(), self.id(edge.source), self.id(edge.target)
+        return None
+
+    def duplicateAssertions(self, edges):
+        """
+        Returns the groups of edges (among the given ones) expressing the same assertion.
+        :type edges: list
+        :rtype: list
+        """
+        groups = {}
+        for edge in edges:
+            key = self.assertion(edge)
+            if key is not None:
+                groups.setdefault(key, []).append(edge)
+        return [x for x in groups.values() if len(x) > 1]
+
+    def duplicates(self):
+        """
+        Returns the groups of constructor nodes (among the indexed ones) expressing the same expression.
+        :rtype: list
+        """
+        return [x for x in self._nodes.values() if len(x) > 1 and x[0].isConstructor()]
+
+    def id(self, node):
+        """
+        Returns the id of the structure of the given node, indexing it if needed.
+        :type node: AbstractNode
+        :rtype: int
+        """
+        try:
+            return self._ids[node]
+        except KeyError:
+            if node in self._visiting:
+                raise DiagramMalformedError(node, 'cyclic expression')
+            self._visiting.add(node)
+            try:
+                key = self.key(node)
+            finally:
+                self._visiting.discard(node)
+            eid = self._table.setdefault(key, len(self._table))
+            self._ids[node] = eid
+            self._nodes.setdefault(eid, []).append(node)
+            return eid
+
+    def index(self, nodes):
+        """
+        Index the given nodes.
+        :type nodes: list
+        """
+        for node in nodes:
+            self.id(node)
+
+    def key(self, node):
+        """
+        Returns the shallow structural key of the given node.
+        :type node: AbstractNode
+        :rtype: tuple
+        """
+        item = node.type()
+        if item in {Item.AttributeNode, Item.ConceptNode, Item.RoleNode}:
+            return item, node.special() or OWLText(node.text())
+        if item is Item.IndividualNode:
+            identity = node.identity()
+            return item, identity, OWLText(node.text()) if identity is Identity.Individual else node.text()
+        if item is Item.ValueDomainNode:
+            return item, node.datatype
+        if item is Item.FacetNode:
+            return item, node.datatype, node.text()
+        if item in {Item.PropertyAssertionNode, Item.RoleChainNode}:
+            edges = [node.diagram.edge(x) for x in node.inputs or ()]
+            return item, node.identity(), tuple(self.id(e.other(node)) for e in edges if e)
+        inputs = frozenset(self.id(x) for x in node.incomingNodes(lambda x: x.type() is Item.InputEdge))
+        if item in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
+            restriction = node.restriction()
+            cardinality = None
+            if restriction is Restriction.Cardinality:
+                cardinality = node.cardinality('min'), node.cardinality('max')
+            return item, node.identity(), restriction, cardinality, inputs
+        return item, node.identity(), inputs
+
+    def nodes(self, eid):
+        """
+        Returns the list of indexed nodes whose structure matches the given id.
+        :type eid: int
+        :rtype: list
+        """
+        return list(self._nodes.get(eid, ()))
+
+    def redundantAssertions(self, edges):
+        """
+        Returns the inclusion edges (among the given ones) which are implied by an equivalence edge.
+        :type edges: list
+        :rtype: list
+        """
+        equivalences = {self.assertion(e)[1] for e in edges if e.type() is Item.EquivalenceEdge}
+        return [e for e in edges if e.type() is Item.InclusionEdge \
+                and frozenset((self.id(e.source), self.id(e.target))) in equivalences]
+
+
+class OWLAxiomTranslator(object):
+    """
+    Translates Graphol nodes and edges into a pure Python intermediate form of OWL 2 axioms.
+    The translation mirrors the one performed by OWLOntologyExporterWorker, but it does not rely
+    on the OWL API: expressions and axioms are nested tuples whose first element is the name of
+    the OWL 2 functional syntax constructor, e.g:
+
+        ('SubClassOf', ('Class', 'ex:A'), ('ObjectSomeValuesFrom', ('ObjectProperty', 'ex:R'), ('Class', 'owl:Thing')))
+
+    Unordered collections of operands are stored as frozensets, so that equal axioms compare and hash
+    equal regardless of the order in which they have been drawn. The translator works both on the
+    items of a Project and on the records of a headless Graph, and its output can be pickled.
+    Structurally equal expressions (see ExpressionIndex) are translated only once.
+    """
+    Converters = {
+        Item.AttributeNode: 'getAttribute',
+        Item.ComplementNode: 'getComplement',
+        Item.ConceptNode: 'getConcept',
+        Item.DatatypeRestrictionNode: 'getDatatypeRestriction',
+        Item.DisjointUnionNode: 'getUnion',
+        Item.DomainRestrictionNode: 'getDomainRestriction',
+        Item.EnumerationNode: 'getEnumeration',
+        Item.FacetNode: 'getFacet',
+        Item.IndividualNode: 'getIndividual',
+        Item.IntersectionNode: 'getIntersection',
+        Item.PropertyAssertionNode: 'getPropertyAssertion',
+        Item.RangeRestrictionNode: 'getRangeRestriction',
+        Item.RoleChainNode: 'getRoleChain',
+        Item.RoleInverseNode: 'getRoleInverse',
+        Item.RoleNode: 'getRole',
+        Item.UnionNode: 'getUnion',
+        Item.ValueDomainNode: 'getValueDomain',
+    }
+
+    def __init__(self, project, axioms=None, normalize=False):
+        """
+        Initialize the translator.
+        :type project: T <= Project|Graph
+        :type axioms: set
+        :type normalize: bool
+        """
+        self.project = project
+        self.axiomsList = set(OWLAxiom) if axioms is None else axioms
+        self.normalize = normalize
+        self.errors = []
+        self.index = ExpressionIndex()
+        self._axioms = set()
+        self._converted = dict()
+        self._expressions = dict()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addAxiom(self, axiom):
+        """
+        Add an axiom to the axiom set.
+        :type axiom: tuple
+        """
+        self._axioms.add(axiom)
+
+    def axioms(self):
+        """
+        Returns the set of axioms.
+        :rtype: set
+        """
+        return self._axioms
+
+    def convert(self, node):
+        """
+        Build and returns the intermediate form of the given node.
+        :type node: AbstractNode
+        :rtype: tuple
+        """
+        if node not in self._converted:
+            eid = self.index.id(node)
+            if eid not in self._expressions:
+                try:
+                    func = getattr(self, self.Converters[node.type()])
+                except KeyError:
+                    raise ValueError('no conversion available for node %s' % node)
+                self._expressions[eid] = func(node)
+            self._converted[node] = self._expressions[eid]
+        return self._converted[node]
+
+    def converted(self):
+        """
+        Returns the dictionary of converted nodes.
+        :rtype: dict
+        """
+        return self._converted
+
+    def expressions(self):
+        """
+        Returns the dictionary of converted expressions, keyed by structure id.
+        :rtype: dict
+        """
+        return self._expressions
+
+    @traced(category='export')
+    def translate(self, nodes=None, edges=None):
+        """
+        Generate the axioms for the given nodes and edges (by default the ones of the whole project).
+        Malformed expressions do not abort the translation: the offending item is skipped and
+        the error is recorded in the translator errors list as a pair (item, message).
+        :type nodes: list
+        :type edges: list
+        :rtype: set
+        """
+        nodes = self.project.nodes() if nodes is None else nodes
+        edges = self.project.edges() if edges is None else edges
+
+        #############################################
+        # AXIOMS FROM NODES
+        #################################
+
+        for node in nodes:
+            try:
+                if node.type() in {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.ValueDomainNode}:
+                    self.createDeclarationAxiom(node)
+                    if node.type() is Item.AttributeNode:
+                        self.createDataPropertyAxiom(node)
+                    elif node.type() is Item.RoleNode:
+                        self.createObjectPropertyAxiom(node)
+                elif node.type() is Item.DisjointUnionNode:
+                    self.createDisjointClassesAxiom(node)
+                elif node.type() is Item.ComplementNode:
+                    if node.identity() is Identity.Concept:
+                        self.createDisjointClassesAxiom(node)
+                elif node.type() is Item.DomainRestrictionNode:
+                    self.createPropertyDomainAxiom(node)
+                elif node.type() is Item.RangeRestrictionNode:
+                    self.createPropertyRangeAxiom(node)
+                if node.isMeta():
+                    self.createAnnotationAssertionAxiom(node)
+            except (DiagramMalformedError, AttributeError, TypeError, ValueError) as e:
+                self.errors.append((getattr(e, 'item', node), str(e)))
+
+        #############################################
+        # AXIOMS FROM EDGES
+        #################################
+
+        for edge in edges:
+            try:
+                self.translateEdge(edge)
+            except (DiagramMalformedError, AttributeError, TypeError, ValueError) as e:
+                self.errors.append((getattr(e, 'item', edge), str(e)))
+
+        return self.axioms()
+
+    def translateEdge(self, edge):
+        """
+        Generate the axioms expressed by the given edge.
+        :type edge: AbstractEdge
+        """
+        if edge.type() is Item.InclusionEdge:
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createSubclassOfAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if edge.source.type() is Item.RoleChainNode:
+                    self.createSubPropertyChainOfAxiom(edge)
+                elif edge.source.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointObjectPropertiesAxiom(edge)
+                    elif edge.target.type() in {Item.RoleNode, Item.RoleInverseNode}:
+                        self.createSubObjectPropertyOfAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                if edge.source.type() is Item.AttributeNode:
+                    if edge.target.type() is Item.ComplementNode:
+                        self.createDisjointDataPropertiesAxiom(edge)
+                    elif edge.target.type() is Item.AttributeNode:
+                        self.createSubDataPropertyOfAxiom(edge)
+            # VALUE DOMAIN (ONLY DATA PROPERTY RANGE)
+            elif edge.source.type() is Item.RangeRestrictionNode and edge.target.identity() is Identity.ValueDomain:
+                # This is being handled already in createPropertyRangeAxiom.
+                pass
+            else:
+                raise DiagramMalformedError(edge, 'invalid inclusion assertion')
+
+        elif edge.type() is Item.EquivalenceEdge:
+            # CONCEPTS
+            if edge.source.identity() is Identity.Concept and edge.target.identity() is Identity.Concept:
+                self.createEquivalentClassesAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.Role and edge.target.identity() is Identity.Role:
+                if Item.RoleInverseNode in {edge.source.type(), edge.target.type()}:
+                    self.createInverseObjectPropertiesAxiom(edge)
+                else:
+                    self.createEquivalentObjectPropertiesAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.Attribute and edge.target.identity() is Identity.Attribute:
+                self.createEquivalentDataPropertiesAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid equivalence assertion')
+
+        elif edge.type() is Item.MembershipEdge:
+            # CONCEPTS
+            if edge.source.identity() is Identity.Individual and edge.target.identity() is Identity.Concept:
+                self.createClassAssertionAxiom(edge)
+            # ROLES
+            elif edge.source.identity() is Identity.RoleInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeObjectPropertyAssertionAxiom(edge)
+                else:
+                    self.createObjectPropertyAssertionAxiom(edge)
+            # ATTRIBUTES
+            elif edge.source.identity() is Identity.AttributeInstance:
+                if edge.target.type() is Item.ComplementNode:
+                    self.createNegativeDataPropertyAssertionAxiom(edge)
+                else:
+                    self.createDataPropertyAssertionAxiom(edge)
+            else:
+                raise DiagramMalformedError(edge, 'invalid membership assertion')
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    @staticmethod
+    def inverse(ope):
+        """
+        Returns the inverse of the given object property expression.
+        :type ope: tuple
+        :rtype: tuple
+        """
+        if ope[0] == 'ObjectInverseOf':
+            return ope[1]
+        return 'ObjectInverseOf', ope
+
+    def iri(self, node):
+        """
+        Returns the abbreviated IRI of the predicate represented by the given node.
+        :type node: AbstractNode
+        :rtype: str
+        """
+        return OWLShortIRI(self.project.prefix, node.text())
+
+    #############################################
+    #   NODES PROCESSING
+    #################################
+
+    def getAttribute(self, node):
+        """
+        Build and returns a OWL 2 attribute using the given graphol node.
+        :type node: AttributeNode
+        :rtype: tuple
+        """
+        if node.special() is Special.Top:
+            return 'DataProperty', 'owl:topDataProperty'
+        if node.special() is Special.Bottom:
+            return 'DataProperty', 'owl:bottomDataProperty'
+        return 'DataProperty', self.iri(node)
+
+    def getComplement(self, node):
+        """
+        Build and returns a OWL 2 complement using the given graphol node.
+        :type node: ComplementNode
+        :rtype: tuple
+        """
+        if node.identity() is Identity.Unknown:
+            raise DiagramMalformedError(node, 'unsupported operand(s)')
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.identity() in {Identity.Attribute, Identity.Concept, Identity.ValueDomain, Identity.Role}
+        incoming = node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)
+        if not incoming:
+            raise DiagramMalformedError(node, 'missing operand(s)')
+        if len(incoming) > 1:
+            raise DiagramMalformedError(node, 'too many operands')
+        operand = first(incoming)
+        if operand.identity() is Identity.Concept:
+            return 'ObjectComplementOf', self.convert(operand)
+        if operand.identity() is Identity.ValueDomain:
+            return 'DataComplementOf', self.convert(operand)
+        if operand.identity() in {Identity.Role, Identity.Attribute}:
+            return self.convert(operand)
+        raise DiagramMalformedError(node, 'unsupported operand (%s)' % operand)
+
+    def getConcept(self, node):
+        """
+        Build and returns a OWL 2 concept using the given graphol node.
+        :type node: ConceptNode
+        :rtype: tuple
+        """
+        if node.special() is Special.Top:
+            return 'Class', 'owl:Thing'
+        if node.special() is Special.Bottom:
+            return 'Class', 'owl:Nothing'
+        return 'Class', self.iri(node)
+
+    def getDatatypeRestriction(self, node):
+        """
+        Build and returns a OWL 2 datatype restriction using the given graphol node.
+        :type node: DatatypeRestrictionNode
+        :rtype: tuple
+        """
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.type() is Item.ValueDomainNode
+        f3 = lambda x: x.type() is Item.FacetNode
+        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        if not operand:
+            raise DiagramMalformedError(node, 'missing value domain node')
+        incoming = node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3)
+        if not incoming:
+            raise DiagramMalformedError(node, 'missing facet node(s)')
+        return 'DatatypeRestriction', self.convert(operand), frozenset(self.convert(x) for x in incoming)
+
+    def getDomainRestriction(self, node):
+        """
+        Build and returns a OWL 2 domain restriction using the given graphol node.
+        :type node: DomainRestrictionNode
+        :rtype: tuple
+        """
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.identity() in {Identity.Role, Identity.Attribute}
+        f3 = lambda x: x.identity() is Identity.ValueDomain
+        f4 = lambda x: x.identity() is Identity.Concept
+
+        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        if not operand:
+            raise DiagramMalformedError(node, 'missing operand(s)')
+
+        if operand.identity() is Identity.Attribute:
+            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            dre = self.convert(filler) if filler else ('Datatype', Datatype.Literal.value)
+            return self.getRestriction(node, 'Data', self.convert(operand), dre)
+
+        ope = self.convert(operand)
+        filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f4))
+        ce = self.convert(filler) if filler else ('Class', 'owl:Thing')
+        return self.getRestriction(node, 'Object', ope, ce)
+
+    def getEnumeration(self, node):
+        """
+        Build and returns a OWL 2 enumeration using the given graphol node.
+        :type node: EnumerationNode
+        :rtype: tuple
+        """
+        if node.identity() is Identity.Unknown:
+            raise DiagramMalformedError(node, 'unsupported operand(s)')
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.type() is Item.IndividualNode
+        individuals = frozenset(self.convert(x) for x in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        if not individuals:
+            raise DiagramMalformedError(node, 'missing operand(s)')
+        return 'ObjectOneOf', individuals
+
+    def getFacet(self, node):
+        """
+        Build and returns a OWL 2 facet restriction using the given graphol node.
+        :type node: FacetNode
+        :rtype: tuple
+        """
+        datatype = node.datatype
+        if not datatype:
+            raise DiagramMalformedError(node, 'disconnected facet node')
+        return 'FacetRestriction', node.facet.value, ('Literal', node.value, datatype.value)
+
+    def getIndividual(self, node):
+        """
+        Build and returns a OWL 2 individual using the given graphol node.
+        :type node: IndividualNode
+        :rtype: tuple
+        """
+        if node.identity() is Identity.Individual:
+            return 'NamedIndividual', self.iri(node)
+        elif node.identity() is Identity.Value:
+            return 'Literal', node.value, node.datatype.value
+        raise DiagramMalformedError(node, 'unsupported identity (%s)' % node.identity())
+
+    def getIntersection(self, node):
+        """
+        Build and returns a OWL 2 intersection using the given graphol node.
+        :type node: IntersectionNode
+        :rtype: tuple
+        """
+        return self.getNaryExpression(node, 'IntersectionOf')
+
+    def getNaryExpression(self, node, constructor):
+        """
+        Build and returns a OWL 2 n-ary class or data range expression using the given graphol node.
+        :type node: T <= IntersectionNode|UnionNode|DisjointUnionNode
+        :type constructor: str
+        :rtype: tuple
+        """
+        if node.identity() is Identity.Unknown:
+            raise DiagramMalformedError(node, 'unsupported operand(s)')
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.identity() is node.identity()
+        collection = frozenset(self.convert(x) for x in node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        if not collection:
+            raise DiagramMalformedError(node, 'missing operand(s)')
+        if node.identity() is Identity.Concept:
+            return 'Object{0}'.format(constructor), collection
+        return 'Data{0}'.format(constructor), collection
+
+    def getPropertyAssertion(self, node):
+        """
+        Build and returns a pair of individuals that can be used to build property assertions.
+        :type node: PropertyAssertionNode
+        :rtype: tuple
+        """
+        if node.identity() is Identity.Unknown:
+            raise DiagramMalformedError(node, 'unsupported operand(s)')
+        collection = []
+        for operand in [node.diagram.edge(i).other(node) for i in node.inputs]:
+            if operand.type() is not Item.IndividualNode:
+                raise DiagramMalformedError(node, 'unsupported operand (%s)' % operand)
+            collection.append(self.convert(operand))
+        if len(collection) < 2:
+            raise DiagramMalformedError(node, 'missing operand(s)')
+        if len(collection) > 2:
+            raise DiagramMalformedError(node, 'too many operands')
+        return tuple(collection)
+
+    def getRangeRestriction(self, node):
+        """
+        Build and returns a OWL 2 range restriction using the given graphol node.
+        :type node: RangeRestrictionNode
+        :rtype: tuple
+        """
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.identity() in {Identity.Role, Identity.Attribute}
+        f3 = lambda x: x.identity() is Identity.Concept
+
+        # Attribute range restrictions only serve to compose DataPropertyRange axioms
+        # (see OWLOntologyExporterWorker.getRangeRestriction), hence they have no conversion.
+        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        if not operand:
+            raise DiagramMalformedError(node, 'missing operand(s)')
+        if operand.identity() is Identity.Role:
+            ope = self.inverse(self.convert(operand))
+            filler = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f3))
+            ce = self.convert(filler) if filler else ('Class', 'owl:Thing')
+            return self.getRestriction(node, 'Object', ope, ce)
+        return None
+
+    def getRestriction(self, node, kind, pe, filler):
+        """
+        Build and returns a OWL 2 restriction on the given property expression and filler.
+        :type node: T <= DomainRestrictionNode|RangeRestrictionNode
+        :type kind: str
+        :type pe: tuple
+        :type filler: tuple
+        :rtype: tuple
+        """
+        restriction = node.restriction()
+        if restriction is Restriction.Self and kind == 'Object':
+            return 'ObjectHasSelf', pe
+        if restriction is Restriction.Exists:
+            return '{0}SomeValuesFrom'.format(kind), pe, filler
+        if restriction is Restriction.Forall:
+            return '{0}AllValuesFrom'.format(kind), pe, filler
+        if restriction is Restriction.Cardinality:
+            cardinalities = set()
+            min_cardinality = node.cardinality('min')
+            max_cardinality = node.cardinality('max')
+            if min_cardinality:
+                cardinalities.add(('{0}MinCardinality'.format(kind), min_cardinality, pe, filler))
+            if max_cardinality is not None:
+                cardinalities.add(('{0}MaxCardinality'.format(kind), max_cardinality, pe, filler))
+            if not cardinalities:
+                raise DiagramMalformedError(node, 'missing cardinality')
+            if len(cardinalities) > 1:
+                return '{0}IntersectionOf'.format(kind), frozenset(cardinalities)
+            return first(cardinalities)
+        raise DiagramMalformedError(node, 'unsupported restriction (%s)' % restriction)
+
+    def getRole(self, node):
+        """
+        Build and returns a OWL 2 role using the given graphol node.
+        :type node: RoleNode
+        :rtype: tuple
+        """
+        if node.special() is Special.Top:
+            return 'ObjectProperty', 'owl:topObjectProperty'
+        if node.special() is Special.Bottom:
+            return 'ObjectProperty', 'owl:bottomObjectProperty'
+        return 'ObjectProperty', self.iri(node)
+
+    def getRoleChain(self, node):
+        """
+        Build and returns the chain of object property expressions of the given graphol node.
+        :type node: RoleChainNode
+        :rtype: tuple
+        """
+        if not node.inputs:
+            raise DiagramMalformedError(node, 'missing operand(s)')
+        collection = []
+        for operand in [node.diagram.edge(i).other(node) for i in node.inputs]:
+            if operand.type() not in {Item.RoleNode, Item.RoleInverseNode}:
+                raise DiagramMalformedError(node, 'unsupported operand (%s)' % operand)
+            collection.append(self.convert(operand))
+        return 'ObjectPropertyChain', tuple(collection)
+
+    def getRoleInverse(self, node):
+        """
+        Build and returns a OWL 2 role inverse using the given graphol node.
+        :type node: RoleInverseNode
+        :rtype: tuple
+        """
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.type() is Item.RoleNode
+        operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+        if not operand:
+            raise DiagramMalformedError(node, 'missing operand')
+        return self.inverse(self.convert(operand))
+
+    def getUnion(self, node):
+        """
+        Build and returns a OWL 2 union using the given graphol node.
+        :type node: T <= UnionNode|DisjointUnionNode
+        :rtype: tuple
+        """
+        return self.getNaryExpression(node, 'UnionOf')
+
+    def getValueDomain(self, node):
+        """
+        Build and returns a OWL 2 datatype using the given graphol node.
+        :type node: ValueDomainNode
+        :rtype: tuple
+        """
+        return 'Datatype', node.datatype.value
+
+    #############################################
+    #   AXIOMS GENERATION
+    #################################
+
+    def createAnnotationAssertionAxiom(self, node):
+        """
+        Generate a OWL 2 annotation axiom.
+        :type node: AbstractNode
+        """
+        if OWLAxiom.Annotation in self.axiomsList:
+            meta = self.project.meta(node.type(), node.text())
+            if meta and not isEmpty(meta.get(K_DESCRIPTION, '')):
+                literal = ('Literal', OWLAnnotationText(meta.get(K_DESCRIPTION, '')), Datatype.string.value)
+                self.addAxiom(('AnnotationAssertion', 'rdfs:comment', self.convert(node)[1], literal))
+
+    def createClassAssertionAxiom(self, edge):
+        """
+        Generate a OWL 2 ClassAssertion axiom.
+        :type edge: MembershipEdge
+        """
+        if OWLAxiom.ClassAssertion in self.axiomsList:
+            self.addAxiom(('ClassAssertion', self.convert(edge.target), self.convert(edge.source)))
+
+    def createDataPropertyAssertionAxiom(self, edge):
+        """
+        Generate a OWL 2 DataPropertyAssertion axiom.
+        :type edge: MembershipEdge
+        """
+        if OWLAxiom.DataPropertyAssertion in self.axiomsList:
+            self.addAxiom(('DataPropertyAssertion', self.convert(edge.target)) + self.convert(edge.source))
+
+    def createDataPropertyAxiom(self, node):
+        """
+        Generate OWL 2 Data Property specific axioms.
+        :type node: AttributeNode
+        """
+        if OWLAxiom.FunctionalDataProperty in self.axiomsList:
+            if node.isFunctional():
+                self.addAxiom(('FunctionalDataProperty', self.convert(node)))
+
+    def createDeclarationAxiom(self, node):
+        """
+        Generate a OWL 2 Declaration axiom.
+        :type node: AbstractNode
+        """
+        if OWLAxiom.Declaration in self.axiomsList:
+            self.addAxiom(('Declaration', self.convert(node)))
+
+    def createDisjointClassesAxiom(self, node):
+        """
+        Generate a OWL 2 DisjointClasses axiom.
+        :type node: T <= ComplementNode|DisjointUnionNode
+        """
+        if OWLAxiom.DisjointClasses in self.axiomsList:
+            if node.type() is Item.DisjointUnionNode:
+                operands = node.incomingNodes(lambda x: x.type() is Item.InputEdge)
+                self.addAxiom(('DisjointClasses', frozenset(self.convert(x) for x in operands)))
+            elif node.type() is Item.ComplementNode:
+                operand = first(node.incomingNodes(lambda x: x.type() is Item.InputEdge))
+                conversionA = self.convert(operand)
+                for included in node.adjacentNodes(lambda x: x.type() in {Item.InclusionEdge, Item.EquivalenceEdge}):
+                    self.addAxiom(('DisjointClasses', frozenset((conversionA, self.convert(included)))))
+
+    def createDisjointDataPropertiesAxiom(self, edge):
+        """
+        Generate a OWL 2 DisjointDataProperties axiom.
+        :type edge: InclusionEdge
+        """
+        if OWLAxiom.DisjointDataProperties in self.axiomsList:
+            collection = frozenset((self.convert(edge.source), self.convert(edge.target)))
+            self.addAxiom(('DisjointDataProperties', collection))
+
+    def createDisjointObjectPropertiesAxiom(self, edge):
+        """
+        Generate a OWL 2 DisjointObjectProperties axiom.
+        :type edge: InclusionEdge
+        """
+        if OWLAxiom.DisjointObjectProperties in self.axiomsList:
+            collection = frozenset((self.convert(edge.source), self.convert(edge.target)))
+            self.addAxiom(('DisjointObjectProperties', collection))
+
+    def createEquivalentClassesAxiom(self, edge):
+        """
+        Generate a OWL 2 EquivalentClasses axiom.
+        :type edge: EquivalenceEdge
+        """
+        if OWLAxiom.EquivalentClasses in self.axiomsList:
+            if self.normalize:
+                f1 = lambda x: x.type() is Item.InputEdge
+                f2 = lambda x: x.identity() is Identity.Concept
+                for source, target in ((edge.source, edge.target), (edge.target, edge.source)):
+                    if source.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
+                        if not source.isRestrictionQualified() and source.restriction() is Restriction.Exists:
+                            continue
+                    if source.type() in {Item.DisjointUnionNode, Item.UnionNode}:
+                        for operand in source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                            self.addAxiom(('SubClassOf', self.convert(operand), self.convert(target)))
+                    elif edge.target.type() is Item.IntersectionNode:
+                        for operand in target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                            self.addAxiom(('SubClassOf', self.convert(source), self.convert(operand)))
+                    else:
+                        self.addAxiom(('SubClassOf', self.convert(source), self.convert(target)))
+            else:
+                collection = frozenset((self.convert(edge.source), self.convert(edge.target)))
+                self.addAxiom(('EquivalentClasses', collection))
+
+    def createEquivalentDataPropertiesAxiom(self, edge):
+        """
+        Generate a OWL 2 EquivalentDataProperties axiom.
+        :type edge: EquivalenceEdge
+        """
+        if OWLAxiom.EquivalentDataProperties in self.axiomsList:
+            if self.normalize:
+                for source, target in ((edge.source, edge.target), (edge.target, edge.source)):
+                    self.addAxiom(('SubDataPropertyOf', self.convert(source), self.convert(target)))
+            else:
+                collection = frozenset((self.convert(edge.source), self.convert(edge.target)))
+                self.addAxiom(('EquivalentDataProperties', collection))
+
+    def createEquivalentObjectPropertiesAxiom(self, edge):
+        """
+        Generate a OWL 2 EquivalentObjectProperties axiom.
+        :type edge: EquivalenceEdge
+        """
+        if OWLAxiom.EquivalentObjectProperties in self.axiomsList:
+            if self.normalize:
+                for source, target in ((edge.source, edge.target), (edge.target, edge.source)):
+                    self.addAxiom(('SubObjectPropertyOf', self.convert(source), self.convert(target)))
+            else:
+                collection = frozenset((self.convert(edge.source), self.convert(edge.target)))
+                self.addAxiom(('EquivalentObjectProperties', collection))
+
+    def createInverseObjectPropertiesAxiom(self, edge):
+        """
+        Generate a OWL 2 InverseObjectProperties axiom.
+        :type edge: EquivalenceEdge
+        """
+        if OWLAxiom.InverseObjectProperties in self.axiomsList:
+            f1 = lambda x: x.type() is Item.InputEdge
+            f2 = lambda x: x.type() is Item.RoleNode
+            if edge.source.type() is Item.RoleInverseNode:
+                forward = edge.target
+                inverse = first(edge.source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+            else:
+                forward = edge.source
+                inverse = first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+            self.addAxiom(('InverseObjectProperties', self.convert(forward), self.convert(inverse)))
+
+    def createNegativeDataPropertyAssertionAxiom(self, edge):
+        """
+        Generate a OWL 2 NegativeDataPropertyAssertion axiom.
+        :type edge: MembershipEdge
+        """
+        if OWLAxiom.NegativeDataPropertyAssertion in self.axiomsList:
+            f1 = lambda x: x.type() is Item.InputEdge
+            f2 = lambda x: x.identity() is Identity.Attribute
+            conversion = self.convert(first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)))
+            self.addAxiom(('NegativeDataPropertyAssertion', conversion) + self.convert(edge.source))
+
+    def createNegativeObjectPropertyAssertionAxiom(self, edge):
+        """
+        Generate a OWL 2 NegativeObjectPropertyAssertion axiom.
+        :type edge: MembershipEdge
+        """
+        if OWLAxiom.NegativeObjectPropertyAssertion in self.axiomsList:
+            f1 = lambda x: x.type() is Item.InputEdge
+            f2 = lambda x: x.identity() is Identity.Role
+            conversion = self.convert(first(edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2)))
+            self.addAxiom(('NegativeObjectPropertyAssertion', conversion) + self.convert(edge.source))
+
+    def createObjectPropertyAxiom(self, node):
+        """
+        Generate OWL 2 ObjectProperty specific axioms.
+        :type node: RoleNode
+        """
+        for axiom, check in ((OWLAxiom.FunctionalObjectProperty, node.isFunctional),
+                             (OWLAxiom.InverseFunctionalObjectProperty, node.isInverseFunctional),
+                             (OWLAxiom.AsymmetricObjectProperty, node.isAsymmetric),
+                             (OWLAxiom.IrreflexiveObjectProperty, node.isIrreflexive),
+                             (OWLAxiom.ReflexiveObjectProperty, node.isReflexive),
+                             (OWLAxiom.SymmetricObjectProperty, node.isSymmetric),
+                             (OWLAxiom.TransitiveObjectProperty, node.isTransitive)):
+            if axiom in self.axiomsList and check():
+                self.addAxiom((axiom.value, self.convert(node)))
+
+    def createObjectPropertyAssertionAxiom(self, edge):
+        """
+        Generate a OWL 2 ObjectPropertyAssertion axiom.
+        :type edge: MembershipEdge
+        """
+        if OWLAxiom.ObjectPropertyAssertion in self.axiomsList:
+            self.addAxiom(('ObjectPropertyAssertion', self.convert(edge.target)) + self.convert(edge.source))
+
+    def createPropertyDomainAxiom(self, node):
+        """
+        Generate OWL 2 ObjectPropertyDomain and DataPropertyDomain axioms.
+        :type node: DomainRestrictionNode
+        """
+        self.createPropertyRestrictionAxiom(node, 'Domain', Identity.Concept, Identity.Concept)
+
+    def createPropertyRangeAxiom(self, node):
+        """
+        Generate OWL 2 ObjectPropertyRange and DataPropertyRange axioms.
+        :type node: RangeRestrictionNode
+        """
+        self.createPropertyRestrictionAxiom(node, 'Range', Identity.Concept, Identity.ValueDomain)
+
+    def createPropertyRestrictionAxiom(self, node, kind, objectFiller, dataFiller):
+        """
+        Generate the OWL 2 property domain (or range) axioms expressed by the given restriction node.
+        :type node: T <= DomainRestrictionNode|RangeRestrictionNode
+        :type kind: str
+        :type objectFiller: Identity
+        :type dataFiller: Identity
+        """
+        if not node.isRestrictionQualified() and node.restriction() is Restriction.Exists:
+            f1 = lambda x: x.type() is Item.InputEdge
+            f3 = lambda x: x.type() is Item.InclusionEdge
+            f4 = lambda x: x.type() is Item.EquivalenceEdge
+            for prefix, identity, filler in (('Object', Identity.Role, objectFiller),
+                                             ('Data', Identity.Attribute, dataFiller)):
+                axiom = OWLAxiom.valueOf('{0}Property{1}'.format(prefix, kind))
+                if axiom in self.axiomsList:
+                    f2 = lambda x: x.identity() is identity
+                    f5 = lambda x: x.identity() is filler
+                    operand = first(node.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2))
+                    if operand:
+                        for other in node.outgoingNodes(f3, f5) | node.adjacentNodes(f4, f5):
+                            self.addAxiom((axiom.value, self.convert(operand), self.convert(other)))
+
+    def createSubclassOfAxiom(self, edge):
+        """
+        Generate a OWL 2 SubclassOf axiom.
+        :type edge: InclusionEdge
+        """
+        if OWLAxiom.SubClassOf in self.axiomsList:
+            if Item.ComplementNode in {edge.source.type(), edge.target.type()}:
+                # Translated as DisjointClasses (see createDisjointClassesAxiom).
+                return
+            if edge.source.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
+                # Translated as property domain/range (see createPropertyRestrictionAxiom).
+                if not edge.source.isRestrictionQualified() and edge.source.restriction() is Restriction.Exists:
+                    return
+            f1 = lambda x: x.type() is Item.InputEdge
+            f2 = lambda x: x.identity() is Identity.Concept
+            if edge.source.type() in {Item.DisjointUnionNode, Item.UnionNode} and self.normalize:
+                for operand in edge.source.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                    self.addAxiom(('SubClassOf', self.convert(operand), self.convert(edge.target)))
+            elif edge.target.type() is Item.IntersectionNode and self.normalize:
+                for operand in edge.target.incomingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                    self.addAxiom(('SubClassOf', self.convert(edge.source), self.convert(operand)))
+            else:
+                self.addAxiom(('SubClassOf', self.convert(edge.source), self.convert(edge.target)))
+
+    def createSubDataPropertyOfAxiom(self, edge):
+        """
+        Generate a OWL 2 SubDataPropertyOf axiom.
+        :type edge: InclusionEdge
+        """
+        if OWLAxiom.SubDataPropertyOf in self.axiomsList:
+            self.addAxiom(('SubDataPropertyOf', self.convert(edge.source), self.convert(edge.target)))
+
+    def createSubObjectPropertyOfAxiom(self, edge):
+        """
+        Generate a OWL 2 SubObjectPropertyOf axiom.
+        :type edge: InclusionEdge
+        """
+        if OWLAxiom.SubObjectPropertyOf in self.axiomsList:
+            self.addAxiom(('SubObjectPropertyOf', self.convert(edge.source), self.convert(edge.target)))
+
+    def createSubPropertyChainOfAxiom(self, edge):
+        """
+        Generate a OWL 2 SubPropertyChainOf axiom.
+        :type edge: InclusionEdge
+        """
+        if OWLAxiom.SubObjectPropertyOf in self.axiomsList:
+            self.addAxiom(('SubObjectPropertyOf', self.convert(edge.source), self.convert(edge.target)))
+
+
+def OWLFunctionalSyntax(expression):
+    """
+    Render the given intermediate form of an OWL 2 axiom (or expression) in OWL 2 functional syntax.
+    Unordered operands are sorted, so that equal axioms are always rendered in the same way.
+    :type expression: T <= tuple|frozenset|str|int
+    :rtype: str
+    """
+    if isinstance(expression, frozenset):
+        return ' '.join(sorted(OWLFunctionalSyntax(x) for x in expression))
+    if isinstance(expression, tuple):
+        if expression[0] in {'Class', 'DataProperty', 'Datatype', 'NamedIndividual', 'ObjectProperty'}:
+            return expression[1]
+        if expression[0] == 'Literal':
+            return '"{0}"^^{1}'.format(expression[1], expression[2])
+        if expression[0] == 'Declaration':
+            return 'Declaration({0}({1}))'.format(expression[1][0], expression[1][1])
+        if expression[0] == 'ObjectPropertyChain':
+            return 'ObjectPropertyChain({0})'.format(' '.join(OWLFunctionalSyntax(x) for x in expression[1]))
+        return '{0}({1})'.format(expression[0], ' '.join(OWLFunctionalSyntax(x) for x in expression[1:]))
+    return str(expression)
\ No newline at end of file
@@ -90,12 +90,16 @@ class CommandItemsRemove(QtWidgets.QUndoCommand):
     """
     This command is used to remove multiple items from a diagram.
     """
+    ItemFootprint = 2048
+
     def __init__(self, diagram, items):
         """
         Initialize the command.
         :type diagram: Diagram
         :type items: T <= tuple|list|set
         """
+        self.caches = dict()
+        self.compacted = False
         self.diagram = diagram
         self.nodes = {item for item in items if item.isNode()}
         self.edges = {item for item in items if item.isEdge()}
@@ -121,8 +125,36 @@ class CommandItemsRemove(QtWidgets.QUndoCommand):
 
         super().__init__(name)
 
+    def compact(self):
+        """
+        Release the render caches of the removed items (they are restored when the items are added back).
+        NOTE: the items themselves are kept since older commands in the history may still reference them.
+        """
+        if not self.compacted:
+            self.compacted = True
+            for item in self.nodes | self.edges:
+                if item.scene() is None:
+                    for i in [item] + item.childItems():
+                        if i not in self.caches and i.cacheMode() != QtWidgets.QGraphicsItem.NoCache:
+                            self.caches[i] = i.cacheMode()
+                            i.setCacheMode(QtWidgets.QGraphicsItem.NoCache)
+
+    def footprint(self):
+        """
+        Returns an estimate of the memory (in bytes) used by this command payload.
+        :rtype: int
+        """
+        size = 0
+        for item in self.nodes | self.edges:
+            size += CommandItemsRemove.ItemFootprint
+            if item.cacheMode() != QtWidgets.QGraphicsItem.NoCache:
+                rect = item.boundingRect()
+                size += int(rect.width() * rect.height()) * 4
+        return size
+
     def redo(self):
         """redo the command"""
+        self.compacted = False
         # Remove the edges.
         for edge in self.edges:
             edge.source.removeEdge(edge)
@@ -143,6 +175,11 @@ class CommandItemsRemove(QtWidgets.QUndoCommand):
 
     def undo(self):
         """undo the command"""
+        # Restore render caches released by compact().
+        for item, mode in self.caches.items():
+            item.setCacheMode(mode)
+        self.caches.clear()
+        self.compacted = False
         # Add back the nodes.
         for node in self.nodes:
             self.diagram.addItem(node)
@@ -211,96 +248,57 @@ class CommandComposeAxiom(QtWidgets.QUndoCommand):
         self.diagram.sgnUpdated.emit()
 
 
-class CommandItemsTranslate(QtWidgets.QUndoCommand):
+class CommandItemsTransform(QtWidgets.QUndoCommand):
     """
-    This command is used to translate items.
+    This command is used to apply a geometric transformation to diagram elements.
+    The geometry of the elements before and after the transformation is stored in snapshots (see DiagramGeometry).
     """
-    def __init__(self, diagram, items, moveX, moveY, name=None):
+    def __init__(self, diagram, undo, redo, name=None):
         """
         Initialize the command.
         :type diagram: Diagram
-        :type items: T <= tuple|list|set
-        :type moveX: float
-        :type moveY: float
+        :type undo: DiagramGeometry
+        :type redo: DiagramGeometry
         :type name: str
         """
-        super().__init__(name or 'move {0} item(s)'.format(len(items)))
+        super().__init__(name or 'transform {0} item(s)'.format(len(redo.nodes) + len(redo.edges)))
         self.diagram = diagram
-        self.items = items
-        self.moveX = moveX
-        self.moveY = moveY
+        self.data = {'redo': redo, 'undo': undo}
+
+    def compact(self):
+        """
+        Compress the geometry snapshots of the command (they are expanded back upon undo/redo).
+        """
+        self.data['redo'].compact()
+        self.data['undo'].compact()
+
+    def footprint(self):
+        """
+        Returns an estimate of the memory (in bytes) used by this command payload.
+        :rtype: int
+        """
+        return self.data['redo'].footprint() + self.data['undo'].footprint()
 
     def redo(self):
         """redo the command"""
-        moveX = self.moveX
-        moveY = self.moveY
-        for item in self.items:
-            item.moveBy(moveX, moveY)
-        for item in self.items:
-            if item.isEdge():
-                item.updateEdge()
-        self.diagram.sgnUpdated.emit()
+        self.diagram.setGeometry(self.data['redo'])
 
     def undo(self):
         """undo the command"""
-        moveX = -self.moveX
-        moveY = -self.moveY
-        for item in self.items:
-            item.moveBy(moveX, moveY)
-        for item in self.items:
-            if item.isEdge():
-                item.updateEdge()
-        self.diagram.sgnUpdated.emit()
+        self.diagram.setGeometry(self.data['undo'])
 
 
-class CommandSnapItemsToGrid(QtWidgets.QUndoCommand):
+class CommandSnapItemsToGrid(CommandItemsTransform):
     """
     This command is used to snap diagram elements to the grid.
     """
-    def __init__(self, diagram, data, name=None):
+    def __init__(self, diagram, undo, redo, name=None):
         """
         Initialize the command.
         :type diagram: Diagram
-        :type data: dict
+        :type undo: DiagramGeometry
+        :type redo: DiagramGeometry
         :type name: str
         """
-        num = len(data['undo']['nodes']) + len(data['redo']['edges'])
-        super().__init__(name or 'snap {0} item(s) to the grid'.format(num))
-        self.diagram = diagram
-        self.data = data
-
-    def redo(self):
-        """redo the command"""
-        edges = set()
-        # Snap the nodes.
-        for node in self.data['redo']['nodes']:
-            node.anchors = self.data['redo']['nodes'][node]['anchors']
-            node.setPos(self.data['redo']['nodes'][node]['pos'])
-            edges |= node.edges
-        # Snap the edges.
-        for edge in self.data['redo']['edges']:
-            edge.breakpoints = self.data['redo']['edges'][edge]['breakpoints']
-            edges.add(edge)
-        # Update all the edges.
-        for edge in edges:
-            edge.updateEdge()
-        # Emit updated signal.
-        self.diagram.sgnUpdated.emit()
-
-    def undo(self):
-        """undo the command"""
-        edges = set()
-        # Un-snap the nodes.
-        for node in self.data['undo']['nodes']:
-            node.anchors = self.data['undo']['nodes'][node]['anchors']
-            node.setPos(self.data['undo']['nodes'][node]['pos'])
-            edges |= node.edges
-        # Un-snap the edges.
-        for edge in self.data['undo']['edges']:
-            edge.breakpoints = self.data['undo']['edges'][edge]['breakpoints']
-            edges.add(edge)
-        # Update all the edges.
-        for edge in edges:
-            edge.updateEdge()
-        # Emit updated signal.
-        self.diagram.sgnUpdated.emit()
\ No newline at end of file
+        num = len(redo.nodes) + len(redo.edges)
+        super().__init__(diagram, undo, redo, name or 'snap {0} item(s) to the grid'.format(num))
\ No newline at end of file
@@ -111,16 +111,12 @@ class CommandDiagramRename(QtWidgets.QUndoCommand):
 
     def redo(self):
         """redo the command"""
-        self.project.removeDiagram(self.diagram)
-        self.diagram.name = self.redo
-        self.project.addDiagram(self.diagram)
+        self.project.renameDiagram(self.diagram, self.redo)
         self.project.sgnUpdated.emit()
 
     def undo(self):
         """undo the command"""
-        self.project.removeDiagram(self.diagram)
-        self.diagram.name = self.undo
-        self.project.addDiagram(self.diagram)
+        self.project.renameDiagram(self.diagram, self.undo)
         self.project.sgnUpdated.emit()
 
 
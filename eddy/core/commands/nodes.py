@@ -163,7 +163,11 @@ class CommandNodeRezize(QtWidgets.QUndoCommand):
 class CommandNodeMove(QtWidgets.QUndoCommand):
     """
     This command is used to move nodes (1 or more).
+    Positions are stored in geometry snapshots (see DiagramGeometry) which are applied using Diagram.setGeometry(),
+    and consecutive moves of the same nodes are merged.
     """
+    Id = 1
+
     def __init__(self, diagram, undo, redo):
         """
         Initialize the command.
@@ -172,67 +176,58 @@ class CommandNodeMove(QtWidgets.QUndoCommand):
         :type redo: dict
         """
         self._diagram = diagram
-        self._edges = set()
-        self._redo = redo
-        self._undo = undo
-        
-        for node in self._redo['nodes']:
-            self._edges |= node.edges
+        self._redo = diagram.moveGeometry(redo)
+        self._undo = diagram.moveGeometry(undo)
 
-        if len(self._redo['nodes']) != 1:
-            name = 'move {0} nodes'.format(len(self._redo['nodes']))
+        if len(self._redo.nodes) != 1:
+            name = 'move {0} nodes'.format(len(self._redo.nodes))
         else:
-            name = 'move {0}'.format(first(self._redo['nodes'].keys()).name)
+            name = 'move {0}'.format(first(self._redo.nodes).name)
 
         super().__init__(name)
 
+    def compact(self):
+        """
+        Compress the geometry snapshots of the command (they are expanded back upon undo/redo).
+        """
+        self._redo.compact()
+        self._undo.compact()
+
+    def footprint(self):
+        """
+        Returns an estimate of the memory (in bytes) used by this command payload.
+        :rtype: int
+        """
+        return self._redo.footprint() + self._undo.footprint()
+
+    def id(self):
+        """
+        Returns the id identifying this command type (used to merge consecutive moves).
+        :rtype: int
+        """
+        return CommandNodeMove.Id
+
+    def mergeWith(self, command):
+        """
+        Merge the given command into this one if they both move the same nodes.
+        :type command: CommandNodeMove
+        :rtype: bool
+        """
+        if command._diagram is not self._diagram or \
+            command._redo.nodes != self._redo.nodes or \
+                command._redo.anchors != self._redo.anchors or \
+                    command._redo.edges != self._redo.edges:
+            return False
+        self._redo = command._redo
+        return True
+
     def redo(self):
         """redo the command"""
-        # Turn off caching.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.NoCache)
-        # Update edges breakpoints.
-        for edge, breakpoints in self._redo['edges'].items():
-            for i in range(len(breakpoints)):
-                edge.breakpoints[i] = breakpoints[i]
-        # Update nodes positions.
-        for node, data in self._redo['nodes'].items():
-            node.setPos(data['pos'])
-            # Update edge anchors.
-            for edge, pos in data['anchors'].items():
-                node.setAnchor(edge, pos)
-        # Update edges.
-        for edge in self._edges:
-            edge.updateEdge()
-        # Turn on caching.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.DeviceCoordinateCache)
-        # Emit updated signal.
-        self._diagram.sgnUpdated.emit()
+        self._diagram.setGeometry(self._redo)
 
     def undo(self):
         """undo the command"""
-        # Turn off caching.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.NoCache)
-        # Update edges breakpoints.
-        for edge, breakpoints in self._undo['edges'].items():
-            for i in range(len(breakpoints)):
-                edge.breakpoints[i] = breakpoints[i]
-        # Update nodes positions.
-        for node, data in self._undo['nodes'].items():
-            node.setPos(data['pos'])
-            # Update edge anchors.
-            for edge, pos in data['anchors'].items():
-                node.setAnchor(edge, pos)
-        # Update edges.
-        for edge in self._edges:
-            edge.updateEdge()
-        # Turn caching ON.
-        for edge in self._edges:
-            edge.setCacheMode(AbstractItem.DeviceCoordinateCache)
-        # Emit updated signal.
-        self._diagram.sgnUpdated.emit()
+        self._diagram.setGeometry(self._undo)
 
 
 class CommandNodeSwitchTo(QtWidgets.QUndoCommand):
@@ -35,7 +35,74 @@
 
 from PyQt5 import QtWidgets
 
-from eddy.core.datatypes.graphol import Item
+from eddy.core.datatypes.graphol import Identity, Item
+
+
+class CommandProjectRenamePredicates(QtWidgets.QUndoCommand):
+    """
+    This command is used to rename many predicate nodes of a project at once.
+    """
+    def __init__(self, project, renames, name=None):
+        """
+        Initialize the command.
+        :type project: Project
+        :type renames: dict
+        :type name: str
+        """
+        super().__init__(name or 'rename {0} predicate nodes'.format(len(renames)))
+        self._project = project
+        self._undo = {node: node.text() for node in renames}
+        self._redo = dict(renames)
+        self._metas = {}
+        for node, text in renames.items():
+            for key in ((node.type(), node.text()), (node.type(), text)):
+                if key not in self._metas:
+                    self._metas[key] = dict(project.meta(*key))
+
+    def rename(self, renames):
+        """
+        Rename the given predicate nodes and refresh the state of the affected items.
+        :type renames: dict
+        """
+        renamed = self._project.renamePredicates(renames)
+
+        # UPDATE PREDICATE NODE STATE TO REFLECT THE CHANGES
+        keys = {(node.type(), text) for node, text in renamed.items()}
+        keys |= {(node.type(), node.text()) for node in renamed}
+        nodes = set()
+        for item, text in keys:
+            nodes |= self._project.predicates(item, text)
+        for node in nodes:
+            node.updateNode()
+
+        # IDENTITFY NEIGHBOURS
+        f1 = lambda x: x.type() is Item.InputEdge
+        f2 = lambda x: x.type() in {Item.EnumerationNode, Item.PropertyAssertionNode}
+        f3 = lambda x: x.type() is Item.MembershipEdge
+        f4 = lambda x: Identity.Neutral in x.identities()
+        for node in (x for x in renamed if x.type() is Item.IndividualNode):
+            for target in node.outgoingNodes(filter_on_edges=f1, filter_on_nodes=f2):
+                node.diagram.sgnNodeIdentification.emit(target)
+            for target in node.outgoingNodes(filter_on_edges=f3, filter_on_nodes=f4):
+                node.diagram.sgnNodeIdentification.emit(target)
+
+        # EMIT UPDATED SIGNAL
+        for diagram in {node.diagram for node in renamed}:
+            diagram.sgnUpdated.emit()
+
+    def redo(self):
+        """redo the command"""
+        self.rename(self._redo)
+
+    def undo(self):
+        """undo the command"""
+        self.rename(self._undo)
+        # RESTORE THE METADATA OF BOTH THE PREVIOUS AND THE NEW NAMES
+        for (item, name), meta in self._metas.items():
+            if meta:
+                self._project.setMeta(item, name, dict(meta))
+            elif self._project.meta(item, name):
+                self._project.unsetMeta(item, name)
 
 
 class CommandProjectSetIRI(QtWidgets.QUndoCommand):
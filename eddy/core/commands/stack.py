@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+from eddy.core.functions.signals import connect
+
+
+class UndoStack(QtWidgets.QUndoStack):
+    """
+    Extension of QtWidgets.QUndoStack which keeps the memory used by the undo history within a budget.
+    Commands may implement the following methods, which are looked up by name:
+
+    * footprint: returns an estimate (in bytes) of the memory used by the command payload.
+    * compact: compresses or releases the part of the command payload which can be rebuilt upon undo/redo.
+
+    The footprint of each command is cached and only the commands around the index are measured again
+    whenever the index changes: commands are compacted as soon as they get CompactAfter steps away from
+    the index, and so are the closest ones (starting from the farthest) whenever the estimated footprint
+    of the history exceeds the budget. Additionally to built-in signals, this class emits:
+
+    * sgnFootprintChanged: whenever the estimated footprint of the history changes.
+    """
+    CompactAfter = 32
+    DefaultFootprint = 256
+
+    sgnFootprintChanged = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent=None, budget=0):
+        """
+        Initialize the undo stack.
+        :type parent: QObject
+        :type budget: int
+        """
+        super().__init__(parent)
+        self.budget = budget
+        self.compacted = []
+        self.current = 0
+        self.size = 0
+        self.sizes = []
+        connect(self.indexChanged, self.onIndexChanged)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(int)
+    def onIndexChanged(self, _):
+        """
+        Executed whenever the index of the undo stack changes.
+        """
+        self.refresh()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def clear(self):
+        """
+        Clear the undo stack by deleting all the commands in it.
+        """
+        super().clear()
+        self.refresh()
+
+    def compactAt(self, i):
+        """
+        Compact the command at the given position in the history and update its footprint.
+        :type i: int
+        """
+        if not self.compacted[i]:
+            command = self.command(i)
+            self.compactCommand(command)
+            footprint = self.footprintOf(command)
+            self.size += footprint - self.sizes[i]
+            self.sizes[i] = footprint
+            self.compacted[i] = True
+
+    @classmethod
+    def compactCommand(cls, command):
+        """
+        Compact the given command (and its children, if the command is a macro).
+        :type command: QUndoCommand
+        """
+        if hasattr(command, 'compact'):
+            command.compact()
+        for i in range(command.childCount()):
+            cls.compactCommand(command.child(i))
+
+    def distance(self, i):
+        """
+        Returns the number of undo/redo steps needed to reach the command at the given position.
+        :type i: int
+        :rtype: int
+        """
+        index = self.index()
+        return index - i - 1 if i < index else i - index
+
+    def footprint(self):
+        """
+        Returns the estimated footprint (in bytes) of the undo history.
+        :rtype: int
+        """
+        return self.size
+
+    @classmethod
+    def footprintOf(cls, command):
+        """
+        Returns the estimated footprint (in bytes) of the given command (and its children).
+        :type command: QUndoCommand
+        :rtype: int
+        """
+        size = command.footprint() if hasattr(command, 'footprint') else cls.DefaultFootprint
+        for i in range(command.childCount()):
+            size += cls.footprintOf(command.child(i))
+        return size
+
+    def refresh(self):
+        """
+        Compact the commands in the history according to the current index and budget, and update its footprint.
+        Only the commands whose position or distance from the index changed since the last refresh are visited.
+        """
+        size = self.size
+        count = self.count()
+        index = self.index()
+        low = min(self.current, index)
+        high = max(self.current, index)
+        # DROP COMMANDS DELETED FROM THE HISTORY
+        if len(self.sizes) > count:
+            self.size -= sum(self.sizes[count:])
+            del self.sizes[count:]
+            del self.compacted[count:]
+        # MEASURE COMMANDS WHICH HAVE BEEN PUSHED, MERGED, UNDONE OR REDONE
+        for i in range(max(low - 1, 0), min(high + 1, count)):
+            footprint = self.footprintOf(self.command(i))
+            if i < len(self.sizes):
+                self.size += footprint - self.sizes[i]
+                self.sizes[i] = footprint
+                self.compacted[i] = False
+            else:
+                self.size += footprint
+                self.sizes.append(footprint)
+                self.compacted.append(False)
+        # COMPACT COMMANDS WHICH CROSSED THE DISTANCE THRESHOLD
+        for start, stop in ((low - UndoStack.CompactAfter - 1, high - UndoStack.CompactAfter + 1),
+                            (low + UndoStack.CompactAfter - 1, high + UndoStack.CompactAfter + 1)):
+            for i in range(max(start, 0), min(stop, count)):
+                if self.distance(i) >= UndoStack.CompactAfter:
+                    self.compactAt(i)
+        # COMPACT COMMANDS CLOSE TO THE INDEX UNTIL THE BUDGET IS MET
+        if 0 < self.budget < self.size:
+            window = range(max(index - UndoStack.CompactAfter, 0), min(index + UndoStack.CompactAfter, count))
+            for i in sorted(window, key=self.distance, reverse=True):
+                if self.size <= self.budget:
+                    break
+                self.compactAt(i)
+        self.current = index
+        if size != self.size:
+            self.sgnFootprintChanged.emit(self.size)
+
+    def setBudget(self, budget):
+        """
+        Set the memory budget (in bytes) of the undo history (0 means no budget).
+        :type budget: int
+        """
+        self.budget = budget
+        self.refresh()
\ No newline at end of file
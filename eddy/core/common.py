@@ -33,8 +33,6 @@
 ##########################################################################
 
 
-import time
-
 from PyQt5 import QtCore
 
 from eddy.core.datatypes.owl import OWLProfile
@@ -48,7 +46,7 @@ from eddy.core.functions.misc import isEmpty
 from eddy.core.functions.signals import connect
 from eddy.core.output import getLogger
 from eddy.core.profiles.common import AbstractProfile
-from eddy.core.worker import AbstractWorker
+from eddy.core.worker import AbstractWorker, TaskScheduler
 
 from eddy.ui.notification import Notification
 
@@ -1286,7 +1284,9 @@ class HasProfileSystem(object):
 
 class HasThreadingSystem(object):
     """
-    Mixin which adds the ability to easily start and stop Qt threads.
+    Mixin which adds the ability to easily start and stop background workers.
+    Workers are executed as named tasks by the shared TaskScheduler, hence the number of threads used to run
+    them is bounded by the scheduler queues, no matter how many workers are started.
     """
     def __init__(self, **kwargs):
         """
@@ -1294,114 +1294,96 @@ class HasThreadingSystem(object):
         :type kwargs: dict
         """
         super().__init__(**kwargs)
-        self._threads = {}
-        self._started = {}
-        self._workers = {}
+        self._tasks = {}
 
     #############################################
-    #   SLOTS
+    #   PROPERTIES
     #################################
 
-    @QtCore.pyqtSlot()
-    def onQThreadFinished(self):
+    @property
+    def scheduler(self):
         """
-        Executed when a QThread finish it's job.
+        Returns the scheduler used to execute the workers.
+        :rtype: TaskScheduler
         """
-        self.stopThread(self.sender())
+        return TaskScheduler.instance()
 
     #############################################
     #   INTERFACE
     #################################
 
-    def startThread(self, name, worker):
+    def startThread(self, name, worker, queue=TaskScheduler.DefaultQueue, priority=0):
         """
-        Start a thread using the given worker.
+        Start the given worker in the given scheduler queue, returning True if the worker has been scheduled.
         :type name: str
         :type worker: QtCore.QObject
+        :type queue: str
+        :type priority: int
+        :rtype: bool
         """
         if not isinstance(worker, AbstractWorker):
             raise ValueError('worker class must be subclass of eddy.core.threading.AbstractWorker')
-        if name not in self._threads and name not in self._workers:
-            #LOGGER.debug("Requested threaded execution of worker instance: %s", worker.__class__.__name__)
-            # START THE WORKER THREAD
-            qthread = QtCore.QThread()
-            qthread.setObjectName(name)
-            #LOGGER.debug("Moving worker '%s' in a new thread '%s'", worker.__class__.__name__, name)
-            worker.moveToThread(qthread)
-            connect(qthread.finished, self.onQThreadFinished)
-            connect(qthread.finished, qthread.deleteLater)
-            connect(worker.finished, qthread.quit)
-            connect(worker.finished, worker.deleteLater)
-            connect(qthread.started, worker.run)
-            #LOGGER.debug("Starting thread: %s", name)
-            qthread.start()
-            # STORE LOCALLY
-            self._started[name] = time.monotonic()
-            self._threads[name] = qthread
-            self._workers[name] = worker
-
-    def stopRunningThreads(self):
-        """
-        Stops all the running threads.
+        if self.task(name) is None:
+            task = self.scheduler.submit('{0}:{1}'.format(id(self), name), worker, queue, priority)
+            if task:
+                self._tasks[name] = task
+                return True
+        return False
+
+    def stopRunningThreads(self, msecs=2000):
+        """
+        Stops all the running threads, waiting at most the given amount of milliseconds for them to terminate.
+        :type msecs: int
         """
         LOGGER.debug('Terminating running thread(s)...')
-        for name in [name for name in self._threads.keys()]:
+        for name in [name for name in self._tasks.keys()]:
             self.stopThread(name)
+        if not self.scheduler.waitForDone(msecs):
+            LOGGER.warning('Thread shutdown could not be completed within %sms', msecs)
+
+    def stopThread(self, name):
+        """
+        Stop a running thread (cancelling its worker).
+        :type name: str
+        """
+        task = self._tasks.pop(name, None)
+        if task and not task.isDone():
+            self.scheduler.cancel(task.name)
 
-    def stopThread(self, name_or_qthread):
-        """
-        Stop a running thread.
-        :type name_or_qthread: T <= str | QThread
-        """
-        if name_or_qthread:
-            name = name_or_qthread
-            if not isinstance(name, str):
-                name = name_or_qthread.objectName()
-            if name in self._threads:
-                try:
-                    #LOGGER.debug("Terminate thread: %s (runtime=%.2fms)", name, time.monotonic() - self._started[name])
-                    qthread = self._threads[name]
-                    qthread.quit()
-                    if not qthread.wait(2000):
-                        qthread.terminate()
-                        qthread.wait()
-                except Exception as e:
-                    LOGGER.exception('Thread shutdown could not be completed: %s', e)
-                del self._threads[name]
-            if name in self._workers:
-                del self._workers[name]
-            if name in self._started:
-                del self._started[name]
-
-    def thread(self, name):
-        """
-        Returns the reference to a running QThread.
+    def task(self, name):
+        """
+        Returns the task executing the worker with the given name (if not completed yet).
         :type name: str
-        :rtype: QtCore.QThread
+        :rtype: Task
         """
-        return self._threads.get(name, None)
+        task = self._tasks.get(name, None)
+        if task and task.isDone():
+            del self._tasks[name]
+            return None
+        return task
 
-    def threads(self):
+    def tasks(self):
         """
-        Returns a list of QThread instances in the form (name, QThread).
+        Returns a list of running tasks in the form (name, Task).
         :rtype: list
         """
-        return [(name, qthread) for name, qthread in self._threads.items()]
+        return [(name, task) for name, task in list(self._tasks.items()) if self.task(name)]
 
     def worker(self, name):
         """
-        Returns the reference to a worker which is running in a QThread.
+        Returns the reference to a worker which is running in a task.
         :type name: str
         :rtype: AbstractWorker
         """
-        return self._workers.get(name, None)
+        task = self.task(name)
+        return task.worker if task else None
 
     def workers(self):
         """
         Returns a list of AbstractWorker instances in the form (name, AbstractWorker).
         :rtype: list
         """
-        return [(name, worker) for name, worker in self._workers.items()]
+        return [(name, task.worker) for name, task in self.tasks()]
 
 
 class HasNotificationSystem(object):
@@ -54,6 +54,8 @@ class Enum_(Enum):
         if isinstance(value, Enum_):
             return value
         if value:
+            if value in cls._value2member_map_:
+                return cls._value2member_map_[value]
             for x in cls:
                 if x.value.strip() == value.strip():
                     return x
@@ -33,6 +33,14 @@
 ##########################################################################
 
 
+import math
+import sys
+import uuid
+import zlib
+
+from array import array
+from collections import defaultdict
+
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
@@ -43,12 +51,15 @@ from eddy.core.commands.nodes import CommandNodeMove
 from eddy.core.commands.labels import CommandLabelMove
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.misc import DiagramMode
-from eddy.core.functions.graph import bfs
-from eddy.core.functions.misc import snap, partition, first
+from eddy.core.functions.geometry import packPoints, unpackPoints
+from eddy.core.functions.graph import identify
+from eddy.core.functions.misc import snap, snapF, first
 from eddy.core.functions.signals import connect
 from eddy.core.generators import GUID
+from eddy.core.items.common import AbstractItem
 from eddy.core.items.factory import ItemFactory
 from eddy.core.output import getLogger
+from eddy.core.trace import traced
 
 
 LOGGER = getLogger()
@@ -65,6 +76,9 @@ class Diagram(QtWidgets.QGraphicsScene):
     * sgnModeChanged: whenever the Diagram operational mode (or its parameter) changes.
     * sgnUpdated: whenever the Diagram has been updated in any of its parts.
     """
+    BspTreeMaxDepth = 16
+    BulkThreshold = 100
+    BspTreeMinDepth = 5
     GridSize = 10
     KeyMoveFactor = 10
     MinSize = 2000
@@ -86,13 +100,17 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         super().__init__(parent)
 
+        self.bulkItems = None
+        self.extent = QtCore.QRectF()
         self.factory = ItemFactory(self)
         self.guid = GUID(self)
+        self.id = uuid.uuid4().hex
         self.mode = DiagramMode.Idle
         self.modeParam = Item.Undefined
         self.name = name
         self.pasteX = Clipboard.PasteOffsetX
         self.pasteY = Clipboard.PasteOffsetY
+        self.selectionIndex = defaultdict(set)
 
         self.mo_Node = None
         self.mp_Data = None
@@ -329,10 +347,10 @@ class Diagram(QtWidgets.QGraphicsScene):
                     edge.updateEdge(target=mousePos)
 
                     previousNode = self.mo_Node
-                    if previousNode:
+                    currentNode = first(self.items(mousePos, edges=False, skip={edge.source}))
+                    if previousNode and previousNode is not currentNode:
                         previousNode.updateNode(selected=False)
 
-                    currentNode = first(self.items(mousePos, edges=False, skip={edge.source}))
                     if currentNode:
                         self.mo_Node = currentNode
                         pvr = self.project.profile.checkEdge(edge.source, edge, currentNode)
@@ -512,36 +530,13 @@ class Diagram(QtWidgets.QGraphicsScene):
     #################################
 
     @QtCore.pyqtSlot('QGraphicsItem')
+    @traced(category='identification')
     def doNodeIdentification(self, node):
         """
         Perform node identification.
         :type node: AbstractNode
         """
-        if Identity.Neutral in node.identities():
-
-            func = lambda x: Identity.Neutral in x.identities()
-            collection = bfs(source=node, filter_on_visit=func)
-            generators = partition(func, collection)
-            excluded = set()
-            strong = set(generators[1])
-            weak = set(generators[0])
-
-            for node in weak:
-                identification = node.identify()
-                if identification:
-                    strong = set.union(strong, identification[0])
-                    strong = set.difference(strong, identification[1])
-                    excluded = set.union(excluded, identification[2])
-
-            computed = Identity.Neutral
-            identities = set(x.identity() for x in strong)
-            if identities:
-                computed = first(identities)
-                if len(identities) > 1:
-                    computed = Identity.Unknown
-
-            for node in weak - strong - excluded:
-                node.setIdentity(computed)
+        identify(node)
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def onItemAdded(self, _, item):
@@ -581,8 +576,38 @@ class Diagram(QtWidgets.QGraphicsScene):
         :type item: AbstractItem
         """
         super().addItem(item)
-        if item.isNode():
-            item.updateNode()
+        if self.bulkItems is not None:
+            self.bulkItems.append(item)
+        else:
+            if item.isNode() or item.isEdge():
+                self.updateExtent(item.sceneBoundingRect())
+            if item.isNode():
+                item.updateNode()
+            if item.isSelected():
+                self.updateSelection(item, True)
+
+    def beginBulkLoad(self):
+        """
+        Enter the bulk load mode, to be used when adding a large number of items at once (i.e: on project load).
+        While in bulk load mode the scene spatial index is disabled, scene notifications are suppressed
+        and the refresh of the items added to the diagram is deferred until endBulkLoad() is called.
+        """
+        if self.bulkItems is None:
+            self.bulkItems = []
+            self.extent = None
+            self.blockSignals(True)
+            self.setItemIndexMethod(Diagram.NoIndex)
+
+    @classmethod
+    def bspTreeDepthForCount(cls, count):
+        """
+        Returns the depth of the BSP tree index suitable for a diagram containing the given amount of items.
+        The depth is chosen so that each leaf of the tree contains only a handful of items.
+        :type count: int
+        :rtype: int
+        """
+        depth = math.ceil(math.log2(max(count, 1) / 4)) if count > 4 else 0
+        return max(cls.BspTreeMinDepth, min(depth, cls.BspTreeMaxDepth))
 
     @staticmethod
     def completeMove(moveData, offset=QtCore.QPointF(0, 0)):
@@ -616,6 +641,49 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return self.project.edges(self)
 
+    def endBulkLoad(self):
+        """
+        Leave the bulk load mode, rebuilding the scene spatial index and refreshing the items added in the meantime.
+        The Z value of the edges added or updated in the meantime is computed again once the index has been rebuilt.
+        """
+        if self.bulkItems is not None:
+            items = self.bulkItems
+            self.bulkItems = None
+            self.setItemIndexMethod(Diagram.BspTreeIndex)
+            self.setBspTreeDepth(self.bspTreeDepthForCount(len(super().items())))
+            self.blockSignals(False)
+            edges = set()
+            for item in items:
+                if item.isNode():
+                    item.updateNode()
+                elif item.isEdge():
+                    edges.add(item)
+                if item.isSelected():
+                    self.updateSelection(item, True)
+            for edge in edges:
+                edge.updateZValue()
+
+    def geometry(self, nodes=None, edges=None):
+        """
+        Returns a snapshot of the geometry of the given nodes and edges (see DiagramGeometry).
+        When no node is given all the nodes in the diagram are included, and when no edge is
+        given the edges connecting two of the included nodes are included.
+        :type nodes: T <= list|tuple|set
+        :type edges: T <= list|tuple|set
+        :rtype: DiagramGeometry
+        """
+        nodes = set(self.nodes() if nodes is None else nodes)
+        if edges is None:
+            edges = {edge for node in nodes for edge in node.edges if edge.other(node) in nodes}
+        return DiagramGeometry(nodes, edges)
+
+    def isBulkLoading(self):
+        """
+        Returns True if the diagram is in bulk load mode, False otherwise.
+        :rtype: bool
+        """
+        return self.bulkItems is not None
+
     def isEdgeAdd(self):
         """
         Returns True if an edge insertion is currently in progress, False otherwise.
@@ -677,6 +745,15 @@ class Diagram(QtWidgets.QGraphicsScene):
                     x not in kwargs.get('skip', set())
         ], key=lambda i: i.zValue(), reverse=True)
 
+    @staticmethod
+    def moveGeometry(moveData):
+        """
+        Returns the geometry snapshot (see DiagramGeometry) described by the given movement data.
+        :type moveData: dict
+        :rtype: DiagramGeometry
+        """
+        return DiagramGeometry.fromMoveData(moveData)
+
     def nodes(self):
         """
         Returns a collection with all the nodes in the diagram.
@@ -692,6 +769,24 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return self.project.node(self, nid)
 
+    def removeItem(self, item):
+        """
+        Remove an item from the Diagram.
+        :type item: AbstractItem
+        """
+        super().removeItem(item)
+        self.updateSelection(item, False)
+        if item.isNode() or item.isEdge():
+            self.updateExtent(None, item.sceneBoundingRect())
+
+    def selectionCount(self, filter_on_items=lambda x: True):
+        """
+        Returns the number of selected nodes and edges whose type matches the given filter.
+        :type filter_on_items: callable
+        :rtype: int
+        """
+        return sum(len(v) for k, v in self.selectionIndex.items() if filter_on_items(k))
+
     def selectedEdges(self, filter_on_edges=lambda x: True):
         """
         Returns the edges selected in the diagram.
@@ -716,6 +811,46 @@ class Diagram(QtWidgets.QGraphicsScene):
         """
         return [x for x in super().selectedItems() if x.isNode() and filter_on_nodes(x)]
 
+    def setGeometry(self, geometry):
+        """
+        Apply the given geometry snapshot (see DiagramGeometry) to the diagram in a single pass.
+        Every edge attached to the involved nodes is refreshed once, and the diagram is put in bulk load mode
+        when many items are involved, so that the scene index is rebuilt once rather than once per edge:
+        in that case the Z value of the edges is updated once the index has been rebuilt.
+        :type geometry: DiagramGeometry
+        """
+        geometry.expand()
+        edges = {edge for edge, _ in geometry.edges}
+        for node in geometry.nodes:
+            edges |= node.edges
+        bulk = len(geometry.nodes) + len(geometry.edges) >= Diagram.BulkThreshold and not self.isBulkLoading()
+        if bulk:
+            self.beginBulkLoad()
+        # Turn off caching.
+        for edge in edges:
+            edge.setCacheMode(AbstractItem.NoCache)
+        # Update nodes positions.
+        for node, pos in zip(geometry.nodes, unpackPoints(geometry.positionData)):
+            node.setPos(pos)
+        # Update edge anchors.
+        for (node, edge), pos in zip(geometry.anchors, unpackPoints(geometry.anchorData)):
+            node.setAnchor(edge, pos)
+        # Update edges breakpoints.
+        start = 0
+        for edge, count in geometry.edges:
+            edge.breakpoints = unpackPoints(geometry.breakpointData, start, start + count)
+            start += count
+        # Update edges.
+        for edge in edges:
+            edge.updateEdge()
+        # Turn on caching.
+        for edge in edges:
+            edge.setCacheMode(AbstractItem.DeviceCoordinateCache)
+        if bulk:
+            self.endBulkLoad()
+        # Emit updated signal.
+        self.sgnUpdated.emit()
+
     def setMode(self, mode, param=None):
         """
         Set the operational mode.
@@ -755,23 +890,266 @@ class Diagram(QtWidgets.QGraphicsScene):
                         moveData['edges'][edge] = edge.breakpoints[:]
         return moveData
 
+    def updateExtent(self, rect, previous=None):
+        """
+        Update the cached extent of the diagram (see visibleRect()) after an item changed its geometry.
+        The extent grows to include the given rectangle, and it is discarded (to be recomputed on demand)
+        whenever the previous geometry of the item reached its border, since the extent may have shrunk.
+        :type rect: QRectF
+        :type previous: QRectF
+        """
+        extent = self.extent
+        if extent is not None:
+            if previous is not None and not (
+                extent.left() < previous.left() and previous.right() < extent.right() and
+                extent.top() < previous.top() and previous.bottom() < extent.bottom()):
+                self.extent = None
+            elif rect is not None:
+                self.extent = extent | rect
+
+    def updateSelection(self, item, selected):
+        """
+        Update the selection index after the selection state of the given item changed.
+        :type item: AbstractItem
+        :type selected: bool
+        """
+        if item.isNode() or item.isEdge():
+            if selected:
+                self.selectionIndex[item.type()].add(item)
+            else:
+                self.selectionIndex[item.type()].discard(item)
+
     # noinspection PyTypeChecker
     def visibleRect(self, margin=0):
         """
         Returns a rectangle matching the area of visible items.
+        The area is kept up to date while items are added, moved and removed (see updateExtent()),
+        and the items are scanned only when it has been discarded.
         :type margin: float
         :rtype: QtCore.QRectF
         """
-        items = self.items()
-        if items:
-            x = set()
-            y = set()
-            for item in items:
-                b = item.mapRectToScene(item.boundingRect())
-                x.update({b.left(), b.right()})
-                y.update({b.top(), b.bottom()})
-            return QtCore.QRectF(QtCore.QPointF(min(x) - margin, min(y) - margin), QtCore.QPointF(max(x) + margin, max(y) + margin))
-        return QtCore.QRectF()
+        if self.extent is None:
+            extent = QtCore.QRectF()
+            for item in super().items():
+                if item.isNode() or item.isEdge():
+                    extent |= item.sceneBoundingRect()
+            self.extent = extent
+        rect = self.extent
+        if rect.isNull():
+            return QtCore.QRectF()
+        return rect.adjusted(-margin, -margin, margin, margin)
+
+
+class DiagramGeometry(object):
+    """
+    Snapshot of the geometry of a collection of diagram nodes and edges.
+    Node positions, edge anchors and edge breakpoints are stored in flat arrays of coordinates (see packPoints()),
+    so that transformations are applied to all of them in a single pass without creating any QPointF.
+    The snapshot is applied back to the diagram using Diagram.setGeometry(). Snapshots kept for a long time
+    (i.e: in the undo history) can be compressed using compact(): they are expanded back when needed.
+    """
+    def __init__(self, nodes, edges):
+        """
+        Initialize the geometry snapshot.
+        :type nodes: T <= list|tuple|set
+        :type edges: T <= list|tuple|set
+        """
+        self.nodes = tuple(sorted(nodes, key=lambda x: x.id))
+        self.anchors = tuple((node, edge) for node in self.nodes \
+            for edge in sorted(node.anchors, key=lambda x: x.id))
+        self.edges = tuple((edge, len(edge.breakpoints)) for edge in sorted(edges, key=lambda x: x.id))
+        index = {node: i for i, node in enumerate(self.nodes)}
+        self.owners = array('l', [index[node] for node, _ in self.anchors])
+        self.packed = None
+        self.positionData = packPoints([node.pos() for node in self.nodes])
+        self.anchorData = packPoints([node.anchors[edge] for node, edge in self.anchors])
+        self.breakpointData = packPoints([p for edge, _ in self.edges for p in edge.breakpoints])
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def align(self, alignment):
+        """
+        Align the nodes to the given side (or center) of the area they occupy.
+        :type alignment: AlignmentFlag
+        :rtype: DiagramGeometry
+        """
+        self.expand()
+        if alignment in {QtCore.Qt.AlignLeft, QtCore.Qt.AlignHCenter, QtCore.Qt.AlignRight}:
+            axis = 0
+            bounds = [(r.left(), r.right()) for r in (node.boundingRect() for node in self.nodes)]
+        elif alignment in {QtCore.Qt.AlignTop, QtCore.Qt.AlignVCenter, QtCore.Qt.AlignBottom}:
+            axis = 1
+            bounds = [(r.top(), r.bottom()) for r in (node.boundingRect() for node in self.nodes)]
+        else:
+            raise ValueError('unsupported alignment: {0}'.format(alignment))
+        if self.nodes:
+            before = array('d', self.positionData)
+            values = self.positionData[axis::2]
+            lower = min(v + b[0] for v, b in zip(values, bounds))
+            upper = max(v + b[1] for v, b in zip(values, bounds))
+            if alignment in {QtCore.Qt.AlignLeft, QtCore.Qt.AlignTop}:
+                values = [lower - b[0] for b in bounds]
+            elif alignment in {QtCore.Qt.AlignRight, QtCore.Qt.AlignBottom}:
+                values = [upper - b[1] for b in bounds]
+            else:
+                values = [(lower + upper - b[0] - b[1]) / 2 for b in bounds]
+            self.positionData[axis::2] = array('d', values)
+            self.moveAnchors(before)
+        return self
+
+    def changed(self, other):
+        """
+        Returns the nodes and the edges whose geometry differs in the given snapshot of the same items.
+        :type other: DiagramGeometry
+        :rtype: tuple
+        """
+        self.expand()
+        other.expand()
+        nodes = [node for i, node in enumerate(self.nodes) \
+            if self.positionData[i * 2:i * 2 + 2] != other.positionData[i * 2:i * 2 + 2]]
+        edges = []
+        start = 0
+        for edge, count in self.edges:
+            if self.breakpointData[start * 2:(start + count) * 2] != other.breakpointData[start * 2:(start + count) * 2]:
+                edges.append(edge)
+            start += count
+        return nodes, edges
+
+    def compact(self):
+        """
+        Compress the coordinate arrays of the snapshot, releasing the arrays until expand() is called.
+        """
+        if self.packed is None:
+            data = (self.positionData, self.anchorData, self.breakpointData)
+            self.packed = zlib.compress(b''.join(x.tobytes() for x in data)), tuple(len(x) for x in data)
+            self.positionData = self.anchorData = self.breakpointData = None
+
+    def copy(self):
+        """
+        Returns a copy of this snapshot which can be transformed independently.
+        :rtype: DiagramGeometry
+        """
+        self.expand()
+        geometry = DiagramGeometry.__new__(DiagramGeometry)
+        geometry.nodes = self.nodes
+        geometry.anchors = self.anchors
+        geometry.edges = self.edges
+        geometry.owners = self.owners
+        geometry.packed = None
+        geometry.positionData = array('d', self.positionData)
+        geometry.anchorData = array('d', self.anchorData)
+        geometry.breakpointData = array('d', self.breakpointData)
+        return geometry
+
+    def expand(self):
+        """
+        Restore the coordinate arrays of a snapshot compressed using compact().
+        """
+        if self.packed is not None:
+            packed, sizes = self.packed
+            data = array('d')
+            data.frombytes(zlib.decompress(packed))
+            self.positionData = data[:sizes[0]]
+            self.anchorData = data[sizes[0]:sizes[0] + sizes[1]]
+            self.breakpointData = data[sizes[0] + sizes[1]:]
+            self.packed = None
+
+    def footprint(self):
+        """
+        Returns an estimate of the memory (in bytes) used by this snapshot.
+        :rtype: int
+        """
+        if self.packed is not None:
+            data = (self.packed[0],)
+        else:
+            data = (self.positionData, self.anchorData, self.breakpointData)
+        return sum(map(sys.getsizeof, (self.nodes, self.anchors, self.edges, self.owners) + data))
+
+    @classmethod
+    def fromMoveData(cls, data):
+        """
+        Returns the geometry snapshot described by the given movement data (see Diagram.setupMove()).
+        :type data: dict
+        :rtype: DiagramGeometry
+        """
+        geometry = cls.__new__(cls)
+        geometry.nodes = tuple(sorted(data['nodes'], key=lambda x: x.id))
+        geometry.anchors = tuple((node, edge) for node in geometry.nodes \
+            for edge in sorted(data['nodes'][node]['anchors'], key=lambda x: x.id))
+        geometry.edges = tuple((edge, len(data['edges'][edge])) for edge in sorted(data['edges'], key=lambda x: x.id))
+        index = {node: i for i, node in enumerate(geometry.nodes)}
+        geometry.owners = array('l', [index[node] for node, _ in geometry.anchors])
+        geometry.packed = None
+        geometry.positionData = packPoints([data['nodes'][node]['pos'] for node in geometry.nodes])
+        geometry.anchorData = packPoints([data['nodes'][node]['anchors'][edge] for node, edge in geometry.anchors])
+        geometry.breakpointData = packPoints([p for edge, _ in geometry.edges for p in data['edges'][edge]])
+        return geometry
+
+    def scale(self, factor, origin=None):
+        """
+        Scale the distances between the items by the given factor, with respect to the given origin.
+        If no origin is given the center of the area occupied by the nodes is used.
+        Nodes keep their size: their anchors are moved together with them.
+        :type factor: float
+        :type origin: QPointF
+        :rtype: DiagramGeometry
+        """
+        self.expand()
+        if origin is None:
+            xs = self.positionData[0::2] or array('d', [0.0])
+            ys = self.positionData[1::2] or array('d', [0.0])
+            origin = QtCore.QPointF((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+        ox = origin.x()
+        oy = origin.y()
+        before = array('d', self.positionData)
+        for data in (self.positionData, self.breakpointData):
+            data[0::2] = array('d', [ox + (x - ox) * factor for x in data[0::2]])
+            data[1::2] = array('d', [oy + (y - oy) * factor for y in data[1::2]])
+        self.moveAnchors(before)
+        return self
+
+    def snap(self, size):
+        """
+        Snap node positions and edge breakpoints to a grid of the given size.
+        :type size: float
+        :rtype: DiagramGeometry
+        """
+        self.expand()
+        before = array('d', self.positionData)
+        self.positionData = array('d', [snapF(v, size) for v in self.positionData])
+        self.breakpointData = array('d', [snapF(v, size) for v in self.breakpointData])
+        self.moveAnchors(before)
+        return self
+
+    def translate(self, dx, dy):
+        """
+        Translate all the items by the given offset.
+        :type dx: float
+        :type dy: float
+        :rtype: DiagramGeometry
+        """
+        self.expand()
+        for data in (self.positionData, self.anchorData, self.breakpointData):
+            data[0::2] = array('d', [x + dx for x in data[0::2]])
+            data[1::2] = array('d', [y + dy for y in data[1::2]])
+        return self
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def moveAnchors(self, before):
+        """
+        Move each edge anchor by the offset of the node it belongs to, given the node positions before the change.
+        :type before: array
+        """
+        positions = self.positionData
+        anchors = self.anchorData
+        for i, j in enumerate(self.owners):
+            anchors[i * 2] += positions[j * 2] - before[j * 2]
+            anchors[i * 2 + 1] += positions[j * 2 + 1] - before[j * 2 + 1]
 
 
 class DiagramMalformedError(RuntimeError):
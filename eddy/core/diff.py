@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import sys
+
+from argparse import ArgumentParser
+
+from PyQt5 import QtCore
+
+from eddy.core.analysis import Analysis, ProjectAnalysis
+from eddy.core.axioms import OWLFunctionalSyntax
+from eddy.core.graph import Graph
+from eddy.core.output import getLogger
+from eddy.core.trace import traced
+from eddy.core.worker import AbstractWorker
+
+
+LOGGER = getLogger()
+
+
+class AxiomDiff(object):
+    """
+    Compare two versions of a project at the level of the generated OWL 2 axioms.
+    Both versions are translated headlessly (see eddy.core.axioms.OWLAxiomTranslator) into sets of
+    hashable axioms, so that added and removed axioms are computed with two set differences, in time
+    linear in the number of axioms, regardless of any layout change between the two versions.
+    """
+    def __init__(self, old, new, normalize=False):
+        """
+        Initialize the diff.
+        :type old: T <= Project|Graph
+        :type new: T <= Project|Graph
+        :type normalize: bool
+        """
+        self.old = old
+        self.new = new
+        self.normalize = normalize
+        self._added = set()
+        self._metadata = {}
+        self._removed = set()
+
+    #############################################
+    #   FACTORY
+    #################################
+
+    @classmethod
+    def fromFiles(cls, old, new, normalize=False):
+        """
+        Build a diff between the given Graphol files.
+        :type old: str
+        :type new: str
+        :type normalize: bool
+        :rtype: AxiomDiff
+        """
+        return cls(Graph.fromFile(old), Graph.fromFile(new), normalize)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def added(self):
+        """
+        Returns the set of axioms which are generated by the new version only.
+        :rtype: set
+        """
+        return self._added
+
+    def axioms(self, project, processes=True):
+        """
+        Returns the set of axioms generated for the given project.
+        :type project: T <= Project|Graph
+        :type processes: bool
+        :rtype: set
+        """
+        analysis = ProjectAnalysis(project, {Analysis.Axioms}, self.normalize)
+        analysis.run(processes)
+        return analysis.axioms()
+
+    @traced(category='analysis')
+    def compute(self, processes=True):
+        """
+        Compute the differences between the two versions of the project.
+        :type processes: bool
+        """
+        old = self.axioms(self.old, processes)
+        new = self.axioms(self.new, processes)
+        self._added = new - old
+        self._removed = old - new
+        self._metadata = {}
+        for item, name in set(self.old.metas()) | set(self.new.metas()):
+            before = self.meta(self.old, item, name)
+            after = self.meta(self.new, item, name)
+            if before != after:
+                self._metadata[(item, name)] = (before, after)
+        LOGGER.debug('Axiom diff: %s added, %s removed, %s predicates with changed metadata',
+                     len(self._added), len(self._removed), len(self._metadata))
+
+    def isEmpty(self):
+        """
+        Returns True if the two versions of the project are equivalent, False otherwise.
+        :rtype: bool
+        """
+        return not self._added and not self._removed and not self._metadata
+
+    @staticmethod
+    def meta(project, item, name):
+        """
+        Returns the metadata of the given predicate, stripped of the unset values.
+        :type project: T <= Project|Graph
+        :type item: Item
+        :type name: str
+        :rtype: dict
+        """
+        return {k: v for k, v in project.meta(item, name).items() if v}
+
+    def metadata(self):
+        """
+        Returns the predicates whose metadata changed, as a dict mapping (item, name)
+        pairs to the (old, new) pair of metadata dictionaries.
+        :rtype: dict
+        """
+        return self._metadata
+
+    def removed(self):
+        """
+        Returns the set of axioms which are generated by the old version only.
+        :rtype: set
+        """
+        return self._removed
+
+    def report(self):
+        """
+        Returns the differences rendered as lines of text: added axioms are prefixed with '+',
+        removed axioms with '-' and predicates whose metadata changed with '~'.
+        :rtype: list
+        """
+        lines = sorted('- {0}'.format(OWLFunctionalSyntax(x)) for x in self._removed)
+        lines.extend(sorted('+ {0}'.format(OWLFunctionalSyntax(x)) for x in self._added))
+        for (item, name), (before, after) in sorted(self._metadata.items(), key=lambda x: (x[0][0].value, x[0][1])):
+            for key in sorted(set(before) | set(after)):
+                if before.get(key) != after.get(key):
+                    lines.append('~ {0} {1}: {2} = {3!r} -> {4!r}'.format(
+                        item.shortName, name, key, before.get(key), after.get(key)))
+        return lines
+
+
+class AxiomDiffWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker which computes an axiom diff in background.
+    Versions given as paths are parsed by the worker, so that large Graphol files are never loaded on the GUI thread.
+    """
+    sgnCompleted = QtCore.pyqtSignal(object)
+    sgnError = QtCore.pyqtSignal(str)
+
+    def __init__(self, old, new, normalize=False):
+        """
+        Initialize the worker.
+        :type old: T <= Graph|str
+        :type new: T <= Graph|str
+        :type normalize: bool
+        """
+        super().__init__()
+        self.old = old
+        self.new = new
+        self.normalize = normalize
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            old, new = (x if isinstance(x, Graph) else Graph.fromFile(x) for x in (self.old, self.new))
+            diff = AxiomDiff(old, new, self.normalize)
+            diff.compute()
+        except Exception as e:
+            LOGGER.exception('Axiom diff could not be completed')
+            self.sgnError.emit(str(e))
+        else:
+            if not self.isCancelled():
+                self.sgnCompleted.emit(diff)
+        finally:
+            self.finished.emit()
+
+
+def main(args=None):
+    """
+    Compare two Graphol files from the command line, printing the differences on the standard output.
+    The exit status is 0 if the two files are equivalent, 1 if they differ and 2 in case of error.
+    :type args: list
+    :rtype: int
+    """
+    parser = ArgumentParser(description='Compare two Graphol projects at the level of OWL 2 axioms')
+    parser.add_argument('old', help='path to the old version of the Graphol file')
+    parser.add_argument('new', help='path to the new version of the Graphol file')
+    parser.add_argument('--normalize', dest='normalize', action='store_true', default=False)
+    parser.add_argument('--serial', dest='serial', action='store_true', default=False)
+    options = parser.parse_args(args)
+
+    try:
+        diff = AxiomDiff.fromFiles(options.old, options.new, options.normalize)
+        diff.compute(processes=not options.serial)
+    except Exception as e:
+        sys.stderr.write('{0}\n'.format(e))
+        return 2
+    for line in diff.report():
+        sys.stdout.write('{0}\n'.format(line))
+    return 0 if diff.isEmpty() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import json
+import os
+import re
+import tempfile
+import zipfile
+from collections import deque
+
+from PyQt5 import QtCore
+
+from eddy.core.datatypes.system import File
+from eddy.core.exporters.common import AbstractProjectExporter
+from eddy.core.functions.fsystem import fwrite, mkdir, isdir
+from eddy.core.functions.path import expandPath
+from eddy.core.functions.signals import connect
+from eddy.core.output import getLogger
+from eddy.core.worker import AbstractWorker
+
+
+LOGGER = getLogger()
+
+
+class BatchDiagramExporter(AbstractProjectExporter):
+    """
+    Extends AbstractProjectExporter with facilities to export all the diagrams of a project using
+    every registered diagram exporter (or only those matching the given file types).
+    Each export is prepared in the main thread (see AbstractDiagramExporter.prepare()) and completed
+    (serialization, rasterization, I/O) by a BatchExportWorker (up to 'threads' workers at the same time):
+    the next export is prepared as soon as a worker completes, so that the main thread is never blocked.
+    The generated files are described by an 'index.json' file and are written either in a directory or
+    in a ZIP archive: sgnFinished is emitted once they are all written.
+    """
+    IndexName = 'index.json'
+    MaxThreads = max(QtCore.QThread.idealThreadCount(), 1)
+
+    sgnFinished = QtCore.pyqtSignal()
+    sgnProgress = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, project, session=None, filetypes=None, threads=None):
+        """
+        Initialize the batch exporter.
+        :type project: Project
+        :type session: Session
+        :type filetypes: T <= list|tuple|set
+        :type threads: int
+        """
+        super().__init__(project, session)
+        self.archive = None
+        self.completed = False
+        self.count = 0
+        self.directory = None
+        self.errors = []
+        self.filetypes = filetypes
+        self.index = []
+        self.pending = deque()
+        self.staging = None
+        self.threads = threads or self.MaxThreads
+        self.total = 0
+        self.workers = {}
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(int, list)
+    def onWorkerCompleted(self, job, files):
+        """
+        Executed when a worker completes the export of a diagram.
+        :type job: int
+        :type files: list
+        """
+        entry, filetype = self.workers.pop(job)
+        entry['files'][filetype.name] = files
+        self.next()
+
+    @QtCore.pyqtSlot(int, Exception)
+    def onWorkerErrored(self, job, exception):
+        """
+        Executed when a worker fails to export a diagram.
+        :type job: int
+        :type exception: Exception
+        """
+        entry, filetype = self.workers.pop(job)
+        LOGGER.error('Failed to export diagram %s to %s: %s', entry['diagram'], filetype.value, exception)
+        self.errors.append((entry['diagram'], filetype, exception))
+        self.next()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def export(self, directory):
+        """
+        Start the export of all the diagrams of the project in the given directory.
+        :type directory: str
+        """
+        directory = expandPath(directory)
+        if not isdir(directory):
+            mkdir(directory)
+
+        exporters = self.session.diagramExporters()
+        if self.filetypes is not None:
+            exporters = [x for x in exporters if x.filetype() in self.filetypes]
+
+        self.completed = False
+        self.count = 0
+        self.directory = directory
+        self.errors = []
+        self.index = []
+        self.pending.clear()
+        names = set()
+        for diagram in sorted(self.project.diagrams(), key=lambda x: x.name.lower()):
+            name = self.uniqueFilename(diagram.name, names)
+            names.add(name.lower())
+            entry = {'diagram': diagram.name, 'nodes': len(diagram.nodes()), 'edges': len(diagram.edges()), 'files': {}}
+            for exporter in exporters:
+                filepath = os.path.join(directory, '{0}{1}'.format(name, exporter.filetype().extension))
+                self.pending.append((entry, diagram, exporter, filepath))
+            self.index.append(entry)
+        self.total = len(self.pending)
+
+        LOGGER.info('Exporting %s diagrams of project %s to %s', len(self.index), self.project.name, directory)
+        self.next()
+
+    @staticmethod
+    def filename(name):
+        """
+        Returns a file name (without extension) for the given diagram name.
+        :type name: str
+        :rtype: str
+        """
+        return re.sub(r'[\\/:*?"<>|\s]+', '_', name.strip()) or 'diagram'
+
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.Zip
+
+    def finish(self):
+        """
+        Write the index of the generated files (and the ZIP archive, if requested), notifying connected objects.
+        """
+        for entry in self.index:
+            for k, v in entry['files'].items():
+                entry['files'][k] = [os.path.relpath(x, self.directory) for x in v]
+        fwrite(json.dumps({'project': self.project.name, 'diagrams': self.index}, indent=2),
+               os.path.join(self.directory, self.IndexName))
+        if self.archive:
+            with zipfile.ZipFile(self.archive, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for root, _, files in os.walk(self.directory):
+                    for name in sorted(files):
+                        filepath = os.path.join(root, name)
+                        archive.write(filepath, os.path.relpath(filepath, self.directory))
+            self.staging.cleanup()
+            self.staging = None
+        LOGGER.info('Exported %s diagrams of project %s to %s', len(self.index), self.project.name,
+                    self.archive or self.directory)
+        self.completed = True
+        self.sgnFinished.emit()
+
+    def next(self):
+        """
+        Prepare pending exports, handing them to workers, and finish the export once all of them are completed.
+        """
+        while self.pending and len(self.workers) < self.threads:
+            entry, diagram, exporter, filepath = self.pending.popleft()
+            filetype = exporter.filetype()
+            try:
+                func = exporter(diagram, self.session).prepare(filepath)
+            except Exception as e:
+                LOGGER.exception('Failed to export diagram %s to %s', diagram.name, filepath)
+                self.errors.append((diagram.name, filetype, e))
+            else:
+                if func is None:
+                    entry['files'][filetype.name] = [filepath]
+                else:
+                    self.count += 1
+                    worker = BatchExportWorker(self.count, func)
+                    connect(worker.sgnCompleted, self.onWorkerCompleted)
+                    connect(worker.sgnErrored, self.onWorkerErrored)
+                    self.workers[self.count] = (entry, filetype)
+                    if not self.session.startThread('BatchExport:{0}:{1}'.format(id(self), self.count), worker):
+                        # THE WORKER COULD NOT BE SCHEDULED: RECORD THE FAILURE SO THE EXPORT DOES NOT WAIT FOR IT
+                        del self.workers[self.count]
+                        LOGGER.error('Failed to export diagram %s to %s: worker not scheduled', diagram.name, filepath)
+                        self.errors.append((diagram.name, filetype, RuntimeError('could not schedule the export worker')))
+        self.sgnProgress.emit(self.total - len(self.pending) - len(self.workers), self.total)
+        if not self.completed and not self.pending and not self.workers:
+            self.finish()
+
+    def run(self, path):
+        """
+        Export all the diagrams of the project in the given path: if the path identifies
+        a ZIP archive the generated files are stored in the archive, otherwise they are
+        written in the directory identified by the path.
+        :type path: str
+        """
+        path = expandPath(path)
+        if path.endswith(File.Zip.extension):
+            self.archive = path
+            self.staging = tempfile.TemporaryDirectory()
+            self.export(self.staging.name)
+        else:
+            self.archive = None
+            self.export(path)
+
+    @classmethod
+    def uniqueFilename(cls, name, used):
+        """
+        Returns a file name (without extension) for the given diagram name which is not in the given
+        set of (lowercase) file names, appending a numeric suffix to the sanitized name if needed.
+        :type name: str
+        :type used: set
+        :rtype: str
+        """
+        filename = cls.filename(name)
+        unique = filename
+        i = 0
+        while unique.lower() in used:
+            i += 1
+            unique = '{0}_{1}'.format(filename, i)
+        return unique
+
+
+class BatchExportWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker that completes a diagram export outside of the main thread.
+    """
+    sgnCompleted = QtCore.pyqtSignal(int, list)
+    sgnErrored = QtCore.pyqtSignal(int, Exception)
+
+    def __init__(self, job, func):
+        """
+        Initialize the batch export worker.
+        :type job: int
+        :type func: callable
+        """
+        super().__init__()
+        self.func = func
+        self.job = job
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            files = self.func()
+        except Exception as e:
+            self.sgnErrored.emit(self.job, e)
+        else:
+            self.sgnCompleted.emit(self.job, files)
+        finally:
+            self.func = None
+            self.finished.emit()
\ No newline at end of file
@@ -113,6 +113,18 @@ class AbstractDiagramExporter(AbstractExporter):
         """
         pass
 
+    def prepare(self, path):
+        """
+        Prepare the export of the diagram in the main thread, returning a callable which completes it.
+        The callable is executed outside of the main thread (see BatchDiagramExporter), hence it must not
+        access the diagram or its items, and it returns the list of generated files. Exporters which cannot
+        split the export perform it entirely here (without any user interaction) and return None.
+        :type path: str
+        :rtype: callable
+        """
+        self.run(path)
+        return None
+
     @abstractmethod
     def run(self, path):
         """
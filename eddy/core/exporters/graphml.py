@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+from functools import partial
+
 from PyQt5 import QtCore
 from PyQt5 import QtXml
 
@@ -639,7 +641,7 @@ class GraphMLDiagramExporter(AbstractDiagramExporter):
         polyLineEdge.appendChild(lineStyle)
         polyLineEdge.appendChild(arrows)
         if label:
-            polyLineEdge.appendChild(label)
+            polyLineEdge.appendChild(edgeLabel)
         polyLineEdge.appendChild(bendStyle)
 
         #############################################
@@ -700,21 +702,11 @@ class GraphMLDiagramExporter(AbstractDiagramExporter):
     #   INTERFACE
     #################################
 
-    @classmethod
-    def filetype(cls):
-        """
-        Returns the type of the file that will be used for the export.
-        :return: File
+    def createDocument(self):
         """
-        return File.GraphML
-
-    def run(self, path):
+        Generate the GraphML document of the diagram.
+        :rtype: QDomDocument
         """
-        Perform GraphML document generation.
-        :type path: str
-        """
-        LOGGER.info('Exporting diagram %s to %s', self.diagram.name, path)
-
         # 1) CREATE THE DOCUMENT
         self.document = QtXml.QDomDocument()
         instruction = self.document.createProcessingInstruction('xml', 'version="1.0" encoding="UTF-8"')
@@ -777,5 +769,39 @@ class GraphMLDiagramExporter(AbstractDiagramExporter):
         self.document.appendChild(root)
         root.appendChild(graph)
 
-        # 8) GENERATE THE FILE
-        fwrite(self.document.toString(2), path)
\ No newline at end of file
+        return self.document
+
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.GraphML
+
+    def prepare(self, path):
+        """
+        Generate the GraphML document, returning a callable which serializes it in the given path.
+        :type path: str
+        :rtype: callable
+        """
+        LOGGER.info('Exporting diagram %s to %s', self.diagram.name, path)
+        return partial(self.writeDocument, self.createDocument(), path)
+
+    def run(self, path):
+        """
+        Perform GraphML document generation.
+        :type path: str
+        """
+        self.prepare(path)()
+
+    @staticmethod
+    def writeDocument(document, path):
+        """
+        Serialize the given GraphML document in the given path, returning the list of generated files.
+        :type document: QDomDocument
+        :type path: str
+        :rtype: list
+        """
+        fwrite(document.toString(2), path)
+        return [path]
\ No newline at end of file
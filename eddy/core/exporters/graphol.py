@@ -48,6 +48,7 @@ from eddy.core.project import K_DESCRIPTION, K_URL
 from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
 from eddy.core.project import K_ASYMMETRIC, K_IRREFLEXIVE, K_REFLEXIVE
 from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
+from eddy.core.trace import Tracer, traced
 
 
 LOGGER = getLogger()
@@ -448,6 +449,7 @@ class GrapholProjectExporter(AbstractProjectExporter):
     #   MAIN EXPORT
     #################################
 
+    @traced(category='save')
     def createDiagrams(self):
         """
         Create the 'diagrams' element in the QDomDocument.
@@ -467,6 +469,7 @@ class GrapholProjectExporter(AbstractProjectExporter):
             section.appendChild(subsection)
         self.document.documentElement().appendChild(section)
 
+    @traced(category='save')
     def createDomDocument(self):
         """
         Create the QDomDocument where to store project information.
@@ -478,6 +481,7 @@ class GrapholProjectExporter(AbstractProjectExporter):
         graphol.setAttribute('version', '2')
         self.document.appendChild(graphol)
 
+    @traced(category='save')
     def createOntology(self):
         """
         Create the 'ontology' element in the QDomDocument.
@@ -500,6 +504,7 @@ class GrapholProjectExporter(AbstractProjectExporter):
         section.appendChild(profile)
         self.document.documentElement().appendChild(section)
 
+    @traced(category='save')
     def createPredicatesMeta(self):
         """
         Create the 'predicates' element in the QDomDocument.
@@ -511,6 +516,7 @@ class GrapholProjectExporter(AbstractProjectExporter):
             section.appendChild(meta)
         self.document.documentElement().appendChild(section)
 
+    @traced(category='save')
     def createProjectFile(self):
         """
         Serialize a previously created QDomDocument to disk.
@@ -541,8 +547,9 @@ class GrapholProjectExporter(AbstractProjectExporter):
         """
         Perform Project export to disk.
         """
-        self.createDomDocument()
-        self.createOntology()
-        self.createPredicatesMeta()
-        self.createDiagrams()
-        self.createProjectFile()
\ No newline at end of file
+        with Tracer.span('GrapholProjectExporter.run', 'save', project=self.project.name):
+            self.createDomDocument()
+            self.createOntology()
+            self.createPredicatesMeta()
+            self.createDiagrams()
+            self.createProjectFile()
\ No newline at end of file
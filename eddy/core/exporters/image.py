@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import math
+
+from functools import partial
+
+from PyQt5 import QtCore
+
+from eddy import APPNAME, ORGANIZATION
+from eddy.core.datatypes.system import File
+from eddy.core.exporters.common import AbstractDiagramExporter
+from eddy.core.exporters.tiles import tiles, DiagramSnapshot
+from eddy.core.functions.misc import rstrip
+from eddy.core.output import getLogger
+
+
+LOGGER = getLogger()
+
+
+class PngDiagramExporter(AbstractDiagramExporter):
+    """
+    Extends AbstractDiagramExporter with facilities to export the structure of Graphol diagrams in PNG format.
+    Diagrams whose image exceeds the tile size are exported as a set of tiles named after
+    the given path (e.g: diagram_0_1.png is the tile in the first row and second column).
+    Tiles are rasterized concurrently (see DiagramSnapshot.render()).
+    """
+    DefaultResolution = 150
+    TileSize = 4096
+
+    def __init__(self, diagram, session=None, resolution=None, tileSize=None):
+        """
+        Initialize the Png Exporter.
+        :type session: Session
+        :type resolution: int
+        :type tileSize: int
+        """
+        super().__init__(diagram, session)
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+        self.resolution = resolution or settings.value('export/png/resolution', self.DefaultResolution, int)
+        self.tileSize = tileSize or self.TileSize
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.Png
+
+    def prepare(self, path):
+        """
+        Take a snapshot of the diagram, returning a callable which rasterizes it in the given path.
+        :type path: str
+        :rtype: callable
+        """
+        LOGGER.info('Exporting diagram %s to %s', self.diagram.name, path)
+        return partial(self.writeSnapshot, DiagramSnapshot(self.diagram), path, 1)
+
+    def run(self, path):
+        """
+        Perform PNG image generation, returning the list of generated files.
+        :type path: str
+        :rtype: list
+        """
+        LOGGER.info('Exporting diagram %s to %s', self.diagram.name, path)
+        return self.writeSnapshot(DiagramSnapshot(self.diagram), path)
+
+    def writeSnapshot(self, snapshot, path, threads=None):
+        """
+        Rasterize the given snapshot in the given path, returning the list of generated files.
+        :type snapshot: DiagramSnapshot
+        :type path: str
+        :type threads: int
+        :rtype: list
+        """
+        if snapshot.isEmpty():
+            return []
+        # DIAGRAM COORDINATES ARE EXPRESSED IN POINTS
+        scale = self.resolution / 72
+        size = self.tileSize / scale
+        rects = tiles(snapshot.rect, size, size)
+        cols = max(int(math.ceil(snapshot.rect.width() / size)), 1)
+        root = rstrip(path, File.Png.extension)
+        collection = []
+        for i, (rect, image) in enumerate(snapshot.render(rects, scale, threads)):
+            filepath = path if len(rects) == 1 else '{0}_{1}_{2}{3}'.format(root, i // cols, i % cols, File.Png.extension)
+            image.setDotsPerMeterX(round(self.resolution / 0.0254))
+            image.setDotsPerMeterY(round(self.resolution / 0.0254))
+            if not image.save(filepath, 'PNG'):
+                raise IOError('could not write {0}'.format(filepath))
+            collection.append(filepath)
+        return collection
\ No newline at end of file
@@ -42,6 +42,7 @@ from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 
 from eddy import APPNAME, BUG_TRACKER, ORGANIZATION
+from eddy.core.axioms import ExpressionIndex
 from eddy.core.common import HasThreadingSystem, HasWidgetSystem
 from eddy.core.datatypes.qt import Font
 from eddy.core.datatypes.graphol import Item, Identity, Special, Restriction
@@ -57,6 +58,7 @@ from eddy.core.functions.owl import OWLFunctionalDocumentFilter
 from eddy.core.functions.path import expandPath, openPath
 from eddy.core.functions.signals import connect
 from eddy.core.output import getLogger
+from eddy.core.trace import Tracer, traced
 from eddy.core.project import K_DESCRIPTION
 from eddy.core.worker import AbstractWorker
 
@@ -138,7 +140,9 @@ class OWLOntologyExporter(AbstractOntologyExporter, HasThreadingSystem):
             worker = SyntaxValidationWorker(0, self.items, self.project)
             connect(worker.sgnCompleted, self.onSyntaxCheckCompleted)
             connect(worker.sgnSyntaxError, self.onSyntaxCheckErrored)
-            self.startThread('syntaxCheck', worker)
+            if not self.startThread('syntaxCheck', worker):
+                LOGGER.warning('Syntax check already running: OWL 2 export of %s discarded', self.project.name)
+                self.progress.close()
 
 
 class OWLOntologyExporterDialog(QtWidgets.QDialog, HasThreadingSystem, HasWidgetSystem):
@@ -505,8 +509,10 @@ class OWLOntologyExporterWorker(AbstractWorker):
 
         self._axioms = set()
         self._converted = dict()
+        self._expressions = dict()
 
         self.df = None
+        self.index = ExpressionIndex()
         self.man = None
         self.num = 0
         self.max = len(self.project.nodes()) * 2 + len(self.project.edges())
@@ -534,47 +540,51 @@ class OWLOntologyExporterWorker(AbstractWorker):
     def convert(self, node):
         """
         Build and returns the OWL 2 conversion of the given node.
+        Structurally equal expressions (see ExpressionIndex) are converted only once and shared.
         :type node: AbstractNode
         :rtype: OWLObject
         """
-        if node.diagram.name not in self._converted:
-            self._converted[node.diagram.name] = dict()
-        if node not in self._converted[node.diagram.name]:
-            if node.type() is Item.ConceptNode:
-                self._converted[node.diagram.name][node.id] = self.getConcept(node)
-            elif node.type() is Item.AttributeNode:
-                self._converted[node.diagram.name][node.id] = self.getAttribute(node)
-            elif node.type() is Item.RoleNode:
-                self._converted[node.diagram.name][node.id] = self.getRole(node)
-            elif node.type() is Item.ValueDomainNode:
-                self._converted[node.diagram.name][node.id] = self.getValueDomain(node)
-            elif node.type() is Item.IndividualNode:
-                self._converted[node.diagram.name][node.id] = self.getIndividual(node)
-            elif node.type() is Item.FacetNode:
-                self._converted[node.diagram.name][node.id] = self.getFacet(node)
-            elif node.type() is Item.RoleInverseNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleInverse(node)
-            elif node.type() is Item.RoleChainNode:
-                self._converted[node.diagram.name][node.id] = self.getRoleChain(node)
-            elif node.type() is Item.ComplementNode:
-                self._converted[node.diagram.name][node.id] = self.getComplement(node)
-            elif node.type() is Item.EnumerationNode:
-                self._converted[node.diagram.name][node.id] = self.getEnumeration(node)
-            elif node.type() is Item.IntersectionNode:
-                self._converted[node.diagram.name][node.id] = self.getIntersection(node)
-            elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
-                self._converted[node.diagram.name][node.id] = self.getUnion(node)
-            elif node.type() is Item.DatatypeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDatatypeRestriction(node)
-            elif node.type() is Item.PropertyAssertionNode:
-                self._converted[node.diagram.name][node.id] = self.getPropertyAssertion(node)
-            elif node.type() is Item.DomainRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getDomainRestriction(node)
-            elif node.type() is Item.RangeRestrictionNode:
-                self._converted[node.diagram.name][node.id] = self.getRangeRestriction(node)
-            else:
-                raise ValueError('no conversion available for node %s' % node)
-        return self._converted[node.diagram.name][node.id]
+        if node.diagram.id not in self._converted:
+            self._converted[node.diagram.id] = dict()
+        if node.id not in self._converted[node.diagram.id]:
+            eid = self.index.id(node)
+            if eid not in self._expressions:
+                if node.type() is Item.ConceptNode:
+                    self._expressions[eid] = self.getConcept(node)
+                elif node.type() is Item.AttributeNode:
+                    self._expressions[eid] = self.getAttribute(node)
+                elif node.type() is Item.RoleNode:
+                    self._expressions[eid] = self.getRole(node)
+                elif node.type() is Item.ValueDomainNode:
+                    self._expressions[eid] = self.getValueDomain(node)
+                elif node.type() is Item.IndividualNode:
+                    self._expressions[eid] = self.getIndividual(node)
+                elif node.type() is Item.FacetNode:
+                    self._expressions[eid] = self.getFacet(node)
+                elif node.type() is Item.RoleInverseNode:
+                    self._expressions[eid] = self.getRoleInverse(node)
+                elif node.type() is Item.RoleChainNode:
+                    self._expressions[eid] = self.getRoleChain(node)
+                elif node.type() is Item.ComplementNode:
+                    self._expressions[eid] = self.getComplement(node)
+                elif node.type() is Item.EnumerationNode:
+                    self._expressions[eid] = self.getEnumeration(node)
+                elif node.type() is Item.IntersectionNode:
+                    self._expressions[eid] = self.getIntersection(node)
+                elif node.type() in {Item.UnionNode, Item.DisjointUnionNode}:
+                    self._expressions[eid] = self.getUnion(node)
+                elif node.type() is Item.DatatypeRestrictionNode:
+                    self._expressions[eid] = self.getDatatypeRestriction(node)
+                elif node.type() is Item.PropertyAssertionNode:
+                    self._expressions[eid] = self.getPropertyAssertion(node)
+                elif node.type() is Item.DomainRestrictionNode:
+                    self._expressions[eid] = self.getDomainRestriction(node)
+                elif node.type() is Item.RangeRestrictionNode:
+                    self._expressions[eid] = self.getRangeRestriction(node)
+                else:
+                    raise ValueError('no conversion available for node %s' % node)
+            self._converted[node.diagram.id][node.id] = self._expressions[eid]
+        return self._converted[node.diagram.id][node.id]
 
     def converted(self):
         """
@@ -1522,6 +1532,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
     #################################
 
     @QtCore.pyqtSlot()
+    @traced(category='export')
     def run(self):
         """
         Main worker.
@@ -1546,6 +1557,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
             cast(self.PrefixManager, self.pm)
 
             LOGGER.debug('Initialized OWL 2 Ontology: %s', ontologyIRI)
+            Tracer.instant('OWL 2 ontology initialized', 'export')
 
             #############################################
             # NODES PRE-PROCESSING
@@ -1555,7 +1567,9 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 self.convert(node)
                 self.step(+1)
 
-            LOGGER.debug('Pre-processed %s nodes into OWL 2 expressions', len(self.converted()))
+            LOGGER.debug('Pre-processed %s nodes into %s distinct OWL 2 expressions',
+                         sum(len(x) for x in self.converted().values()), len(self._expressions))
+            Tracer.counter('OWL 2 export', 'export', expressions=len(self._expressions), axioms=0)
 
             #############################################
             # AXIOMS FROM NODES
@@ -1585,6 +1599,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from nodes (axioms = %s)', len(self.axioms()))
+            Tracer.counter('OWL 2 export', 'export', expressions=len(self._expressions), axioms=len(self.axioms()))
 
             #############################################
             # AXIOMS FROM EDGES
@@ -1672,6 +1687,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 self.step(+1)
 
             LOGGER.debug('Generated OWL 2 axioms from edges (axioms = %s)', len(self.axioms()))
+            Tracer.counter('OWL 2 export', 'export', expressions=len(self._expressions), axioms=len(self.axioms()))
 
             #############################################
             # APPLY GENERATED AXIOMS
@@ -1702,6 +1718,7 @@ class OWLOntologyExporterWorker(AbstractWorker):
                 raise TypeError('unsupported syntax (%s)' % self.syntax)
 
             LOGGER.debug('Serializing the OWL 2 Ontology in %s', self.syntax.value)
+            Tracer.instant('OWL 2 ontology serialization', 'export', syntax=self.syntax.value)
 
             # COPY PREFIXES
             ontoFormat = DocumentFormat()
@@ -37,9 +37,11 @@ from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtPrintSupport
 
+from eddy import APPNAME, ORGANIZATION
 from eddy.core.datatypes.system import File
 from eddy.core.exporters.common import AbstractDiagramExporter
-from eddy.core.items.common import AbstractItem
+from eddy.core.exporters.common import AbstractProjectExporter
+from eddy.core.exporters.tiles import tiles, UncachedRendering
 from eddy.core.functions.path import openPath
 from eddy.core.output import getLogger
 
@@ -47,16 +49,140 @@ from eddy.core.output import getLogger
 LOGGER = getLogger()
 
 
+class PdfWriter(object):
+    """
+    Write the structure of Graphol diagrams in a PDF document.
+    Every diagram is rendered on a single page, unless it exceeds the given page size (by default the
+    maximum page size allowed by the PDF format), in which case it's rendered on multiple pages (tiles).
+    Pages are rendered one by one using vector graphics, so the memory needed by the export does not
+    depend on the size of the diagrams.
+    """
+    MaxPageSize = 14400
+
+    def __init__(self, path, pageSize=None, resolution=None):
+        """
+        Initialize the PDF writer.
+        :type path: str
+        :type pageSize: QSizeF
+        :type resolution: int
+        """
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+        self.pages = 0
+        self.pageSize = pageSize or QtCore.QSizeF(self.MaxPageSize, self.MaxPageSize)
+        self.painter = QtGui.QPainter()
+        self.path = path
+        self.printer = QtPrintSupport.QPrinter(QtPrintSupport.QPrinter.HighResolution)
+        self.printer.setOutputFormat(QtPrintSupport.QPrinter.PdfFormat)
+        self.printer.setOutputFileName(path)
+        self.printer.setPaperSize(QtPrintSupport.QPrinter.Custom)
+        self.printer.setResolution(resolution or settings.value('export/pdf/resolution', self.printer.resolution(), int))
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def close(self):
+        """
+        Complete the PDF document.
+        :rtype: bool
+        """
+        if self.painter.isActive():
+            return self.painter.end()
+        return False
+
+    def write(self, diagram):
+        """
+        Render the given diagram in the PDF document, returning the number of generated pages.
+        :type diagram: Diagram
+        :rtype: int
+        """
+        shape = diagram.visibleRect(margin=20)
+        if not shape:
+            return 0
+        width = min(self.pageSize.width(), self.MaxPageSize)
+        height = min(self.pageSize.height(), self.MaxPageSize)
+        rects = tiles(shape, width, height)
+        LOGGER.info('Exporting diagram %s to %s (%s pages)', diagram.name, self.path, len(rects))
+        with UncachedRendering(diagram):
+            for rect in rects:
+                # CHANGES TO THE PAGE SIZE ARE APPLIED TO THE NEXT PAGE
+                self.printer.setPageSize(QtGui.QPageSize(rect.size(), QtGui.QPageSize.Point))
+                if not self.painter.isActive():
+                    if not self.painter.begin(self.printer):
+                        return 0
+                else:
+                    self.printer.newPage()
+                diagram.render(self.painter, source=rect)
+                self.pages += 1
+        return len(rects)
+
+
 class PdfDiagramExporter(AbstractDiagramExporter):
     """
     Extends AbstractDiagramExporter with facilities to export the structure of Graphol diagrams in PDF format.
     """
-    def __init__(self, diagram, session=None):
+    def __init__(self, diagram, session=None, pageSize=None, resolution=None):
         """
         Initialize the Pdf Exporter.
         :type session: Session
+        :type pageSize: QSizeF
+        :type resolution: int
         """
         super().__init__(diagram, session)
+        self.pageSize = pageSize
+        self.resolution = resolution
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @classmethod
+    def filetype(cls):
+        """
+        Returns the type of the file that will be used for the export.
+        :return: File
+        """
+        return File.Pdf
+
+    def prepare(self, path):
+        """
+        Perform PDF document generation without opening the document.
+        The diagram is rendered in the main thread, so there is nothing left to be completed.
+        :type path: str
+        :rtype: callable
+        """
+        writer = PdfWriter(path, self.pageSize, self.resolution)
+        writer.write(self.diagram)
+        writer.close()
+        return None
+
+    def run(self, path):
+        """
+        Perform PDF document generation.
+        :type path: str
+        """
+        writer = PdfWriter(path, self.pageSize, self.resolution)
+        writer.write(self.diagram)
+        if writer.close():
+            # OPEN THE DOCUMENT
+            openPath(path)
+
+
+class PdfProjectExporter(AbstractProjectExporter):
+    """
+    Extends AbstractProjectExporter with facilities to export all the diagrams of a project in a single PDF document.
+    """
+    def __init__(self, project, session=None, pageSize=None, resolution=None):
+        """
+        Initialize the Pdf Exporter.
+        :type project: Project
+        :type session: Session
+        :type pageSize: QSizeF
+        :type resolution: int
+        """
+        super().__init__(project, session)
+        self.pageSize = pageSize
+        self.resolution = resolution
 
     #############################################
     #   INTERFACE
@@ -75,27 +201,9 @@ class PdfDiagramExporter(AbstractDiagramExporter):
         Perform PDF document generation.
         :type path: str
         """
-        shape = self.diagram.visibleRect(margin=20)
-        if shape:
-            LOGGER.info('Exporting diagram %s to %s', self.diagram.name, path)
-            printer = QtPrintSupport.QPrinter(QtPrintSupport.QPrinter.HighResolution)
-            printer.setOutputFormat(QtPrintSupport.QPrinter.PdfFormat)
-            printer.setOutputFileName(path)
-            printer.setPaperSize(QtPrintSupport.QPrinter.Custom)
-            printer.setPageSize(QtGui.QPageSize(QtCore.QSizeF(shape.width(), shape.height()), QtGui.QPageSize.Point))
-            painter = QtGui.QPainter()
-            if painter.begin(printer):
-                # TURN CACHING OFF
-                for item in self.diagram.items():
-                    if item.isNode() or item.isEdge():
-                        item.setCacheMode(AbstractItem.NoCache)
-                # RENDER THE DIAGRAM IN THE PAINTER
-                self.diagram.render(painter, source=shape)
-                # TURN CACHING ON
-                for item in self.diagram.items():
-                    if item.isNode() or item.isEdge():
-                        item.setCacheMode(AbstractItem.DeviceCoordinateCache)
-                # COMPLETE THE EXPORT
-                painter.end()
-                # OPEN THE DOCUMENT
-                openPath(path)
\ No newline at end of file
+        writer = PdfWriter(path, self.pageSize, self.resolution)
+        for diagram in sorted(self.project.diagrams(), key=lambda x: x.name.lower()):
+            writer.write(diagram)
+        if writer.close():
+            # OPEN THE DOCUMENT
+            openPath(path)
\ No newline at end of file
@@ -37,7 +37,7 @@ from PyQt5 import QtGui
 from PyQt5 import QtPrintSupport
 
 from eddy.core.exporters.common import AbstractDiagramExporter
-from eddy.core.items.common import AbstractItem
+from eddy.core.exporters.tiles import UncachedRendering
 
 
 class PrinterDiagramExporter(AbstractDiagramExporter):
@@ -76,15 +76,8 @@ class PrinterDiagramExporter(AbstractDiagramExporter):
             if dialog.exec_() == QtPrintSupport.QPrintDialog.Accepted:
                 painter = QtGui.QPainter()
                 if painter.begin(printer):
-                    # TURN CACHING OFF
-                    for item in self.diagram.items():
-                        if item.isNode() or item.isEdge():
-                            item.setCacheMode(AbstractItem.NoCache)
                     # RENDER THE DIAGRAM IN THE PAINTER
-                    self.diagram.render(painter, source=shape)
-                    # TURN CACHING ON
-                    for item in self.diagram.items():
-                        if item.isNode() or item.isEdge():
-                            item.setCacheMode(AbstractItem.DeviceCoordinateCache)
+                    with UncachedRendering(self.diagram):
+                        self.diagram.render(painter, source=shape)
                     # COMPLETE THE PRINT
                     painter.end()
\ No newline at end of file
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import math
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
+from eddy.core.items.common import AbstractItem
+
+
+def tiles(rect, width, height):
+    """
+    Split the given rectangle in tiles having at most the given size (row by row).
+    :type rect: QRectF
+    :type width: float
+    :type height: float
+    :rtype: list
+    """
+    rows = max(int(math.ceil(rect.height() / height)), 1)
+    cols = max(int(math.ceil(rect.width() / width)), 1)
+    collection = []
+    for row in range(rows):
+        for col in range(cols):
+            x = rect.left() + col * width
+            y = rect.top() + row * height
+            w = min(width, rect.right() - x)
+            h = min(height, rect.bottom() - y)
+            collection.append(QtCore.QRectF(x, y, w, h))
+    return collection
+
+
+class DiagramSnapshot(object):
+    """
+    Vector snapshot of the visible area of a diagram.
+    The diagram is rendered once (in the main thread) into a QPicture whose serialized content can then be
+    replayed on any paint device: since painting on QImage is thread-safe, tiles of the snapshot can be
+    rasterized concurrently by TileRenderer instances running in a thread pool.
+    """
+    def __init__(self, diagram, margin=20):
+        """
+        Initialize the snapshot.
+        :type diagram: Diagram
+        :type margin: int
+        """
+        self.data = QtCore.QByteArray()
+        self.rect = diagram.visibleRect(margin=margin)
+        if self.rect:
+            picture = QtGui.QPicture()
+            painter = QtGui.QPainter()
+            if painter.begin(picture):
+                with UncachedRendering(diagram):
+                    target = QtCore.QRectF(0, 0, self.rect.width(), self.rect.height())
+                    diagram.render(painter, target=target, source=self.rect)
+                painter.end()
+            buffer = QtCore.QBuffer(self.data)
+            buffer.open(QtCore.QIODevice.WriteOnly)
+            picture.save(buffer)
+            buffer.close()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def isEmpty(self):
+        """
+        Returns True if the snapshot contains nothing to render, False otherwise.
+        :rtype: bool
+        """
+        return not self.rect
+
+    def picture(self):
+        """
+        Returns a new QPicture replaying the snapshot (QPicture instances must not be shared across threads).
+        :rtype: QPicture
+        """
+        picture = QtGui.QPicture()
+        buffer = QtCore.QBuffer(self.data)
+        buffer.open(QtCore.QIODevice.ReadOnly)
+        picture.load(buffer)
+        buffer.close()
+        return picture
+
+    def render(self, rects, scale=1.0, threads=None):
+        """
+        Rasterize the given tiles of the snapshot, returning a generator of (rect, QImage) in the given order.
+        Tiles are rendered concurrently, but at most 'threads' images are kept in memory at the same time.
+        :type rects: list
+        :type scale: float
+        :type threads: int
+        :rtype: generator
+        """
+        pool = QtCore.QThreadPool()
+        pool.setMaxThreadCount(threads or TileRenderer.MaxThreads)
+        batch = pool.maxThreadCount()
+        for i in range(0, len(rects), batch):
+            renderers = [TileRenderer(self, rect, scale) for rect in rects[i:i + batch]]
+            for renderer in renderers:
+                pool.start(renderer)
+            pool.waitForDone()
+            for renderer in renderers:
+                yield renderer.rect, renderer.image
+
+
+class TileRenderer(QtCore.QRunnable):
+    """
+    Extends QRunnable to rasterize a single tile of a DiagramSnapshot onto a QImage.
+    """
+    MaxThreads = max(QtCore.QThread.idealThreadCount(), 1)
+
+    def __init__(self, snapshot, rect, scale=1.0):
+        """
+        Initialize the tile renderer.
+        :type snapshot: DiagramSnapshot
+        :type rect: QRectF
+        :type scale: float
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.image = None
+        self.rect = rect
+        self.scale = scale
+        self.snapshot = snapshot
+
+    def run(self):
+        """
+        Main worker.
+        """
+        width = max(int(math.ceil(self.rect.width() * self.scale)), 1)
+        height = max(int(math.ceil(self.rect.height() * self.scale)), 1)
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.white)
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.TextAntialiasing)
+        painter.scale(self.scale, self.scale)
+        painter.translate(self.snapshot.rect.topLeft() - self.rect.topLeft())
+        painter.drawPicture(0, 0, self.snapshot.picture())
+        painter.end()
+        self.image = image
+
+
+class UncachedRendering(object):
+    """
+    Context manager which disables the cache of the items of a diagram while it is being rendered on a device
+    other than the screen: cached items would otherwise be painted as pixmaps. The previous cache modes are
+    restored on exit.
+    """
+    def __init__(self, diagram):
+        """
+        Initialize the context manager.
+        :type diagram: Diagram
+        """
+        self.diagram = diagram
+        self.modes = dict()
+
+    def __enter__(self):
+        """
+        Disable the cache of the diagram items.
+        :rtype: Diagram
+        """
+        for item in self.diagram.items():
+            if item.isNode() or item.isEdge():
+                if item.cacheMode() != AbstractItem.NoCache:
+                    self.modes[item] = item.cacheMode()
+                    item.setCacheMode(AbstractItem.NoCache)
+        return self.diagram
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Restore the cache of the diagram items.
+        """
+        for item, mode in self.modes.items():
+            item.setCacheMode(mode)
+        self.modes.clear()
\ No newline at end of file
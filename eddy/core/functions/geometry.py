@@ -35,6 +35,8 @@
 
 import math
 
+from array import array
+
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 
@@ -103,6 +105,33 @@ def midpoint(p1, p2):
     return QtCore.QPointF(((p1.x() + p2.x()) / 2), ((p1.y() + p2.y()) / 2))
 
 
+def packPoints(points):
+    """
+    Pack the given points into a flat array of coordinates (x1, y1, x2, y2, ...).
+    The array is much cheaper to keep in memory than the equivalent list of QPointF.
+    :type points: T <= list|tuple
+    :rtype: array
+    """
+    packed = array('d')
+    for p in points:
+        packed.append(p.x())
+        packed.append(p.y())
+    return packed
+
+
+def unpackPoints(packed, start=0, stop=None):
+    """
+    Returns the list of points stored in the given array of coordinates (see packPoints()).
+    The optional start and stop parameters are point indexes, not coordinate indexes.
+    :type packed: array
+    :type start: int
+    :type stop: int
+    :rtype: list
+    """
+    stop = len(packed) // 2 if stop is None else stop
+    return [QtCore.QPointF(packed[i], packed[i + 1]) for i in range(start * 2, stop * 2, 2)]
+
+
 def projection(line, p):
     """
     Calculate the projection of the given point on the given line.
@@ -33,7 +33,36 @@
 ##########################################################################
 
 
-from collections import deque
+from collections import deque, OrderedDict
+
+from eddy.core.datatypes.graphol import Identity, Item
+from eddy.core.functions.misc import first, partition
+
+
+K_EXPRESSION = 'expression'
+K_INPUT = 'input'
+K_OPERATOR = 'operator'
+
+# Filters on edges and on nodes defining each of the closures tracked by the
+# closure() function: the keys are the ones used to store the computed closures
+# in the closures dictionary of the nodes belonging to them.
+CLOSURES = {
+    # Neutral nodes connected through any edge but membership ones.
+    K_EXPRESSION: (
+        lambda x: x.type() is not Item.MembershipEdge,
+        lambda x: x.identity() is Identity.Neutral,
+    ),
+    # Neutral nodes connected through input edges.
+    K_INPUT: (
+        lambda x: x.type() is Item.InputEdge,
+        lambda x: x.identity() is Identity.Neutral,
+    ),
+    # Nodes which may assume a neutral identity connected through input, inclusion and equivalence edges.
+    K_OPERATOR: (
+        lambda x: x.type() in {Item.InputEdge, Item.InclusionEdge, Item.EquivalenceEdge},
+        lambda x: Identity.Neutral in x.identities(),
+    ),
+}
 
 
 def bfs(source, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True, filter_on_visit=lambda x: True):
@@ -116,4 +145,91 @@ def dfs(source, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True,
             visited.add(node)
             if filter_on_visit(node):
                 extend([n for n in [e.other(node) for e in node.edges if filter_on_edges(e)] if n not in visited and filter_on_nodes(n)])
-    return visited
\ No newline at end of file
+    return visited
+
+
+def closure(source, key, exclude=None):
+    """
+    Returns the nodes visited by a BFS starting from the given source and using the filters
+    registered in CLOSURES under the given key, optionally ignoring the given edge.
+    Because the filters are symmetric, the visited nodes form a connected component which is
+    the same no matter which of its nodes the search starts from: the component is therefore
+    computed once, stored in the closures dictionary of all its nodes, and served from there
+    to all the subsequent lookups until invalidate() is called on one of its nodes.
+    NOTE: the returned tuple is shared among all the nodes of the component and MUST NOT be modified.
+    :type source: AbstractNode
+    :type key: str
+    :type exclude: AbstractEdge
+    :rtype: tuple
+    """
+    filter_on_edges, filter_on_nodes = CLOSURES[key]
+    if not filter_on_nodes(source):
+        # The source node is not part of any component, so
+        # there is nothing to share with the other nodes.
+        return tuple(bfs(source=source,
+            filter_on_edges=lambda x: x is not exclude and filter_on_edges(x),
+            filter_on_nodes=filter_on_nodes))
+    component = source.closures.get(key)
+    if component is None:
+        nodes = tuple(OrderedDict.fromkeys(bfs(source, filter_on_edges, filter_on_nodes)))
+        component = (nodes, frozenset(nodes))
+        for node in nodes:
+            node.closures[key] = component
+    if exclude is not None and exclude.source in component[1] and exclude.target in component[1] and \
+        filter_on_edges(exclude) and exclude in exclude.source.edges:
+        # The excluded edge is part of the component and removing it may split the
+        # component in two, so perform the search without making use of the cache.
+        return tuple(bfs(source=source,
+            filter_on_edges=lambda x: x is not exclude and filter_on_edges(x),
+            filter_on_nodes=filter_on_nodes))
+    return component[0]
+
+
+def identify(node):
+    """
+    Perform the identification of the neutral nodes connected to the given one.
+    Starting from the given node, the function collects all the nodes reachable through
+    nodes which may assume a neutral identity (WEAK nodes), computes the identity of those
+    nodes which are able to identify themselves, and assigns to the remaining WEAK nodes
+    the identity inherited from the identified ones (STRONG nodes).
+    :type node: AbstractNode
+    """
+    if Identity.Neutral in node.identities():
+
+        func = lambda x: Identity.Neutral in x.identities()
+        collection = bfs(source=node, filter_on_visit=func)
+        generators = partition(func, collection)
+        excluded = set()
+        strong = set(generators[1])
+        weak = set(generators[0])
+
+        for node in weak:
+            identification = node.identify()
+            if identification:
+                strong = set.union(strong, identification[0])
+                strong = set.difference(strong, identification[1])
+                excluded = set.union(excluded, identification[2])
+
+        computed = Identity.Neutral
+        identities = set(x.identity() for x in strong)
+        if identities:
+            computed = first(identities)
+            if len(identities) > 1:
+                computed = Identity.Unknown
+
+        for node in weak - strong - excluded:
+            node.setIdentity(computed)
+
+
+def invalidate(*nodes):
+    """
+    Discard the closures computed by closure() which include any of the given nodes.
+    This needs to be called whenever an edge is attached to or detached from a node,
+    and whenever the identity of a node changes (in which case also the closures of
+    the adjacent nodes must be discarded since the node may enter or leave them).
+    :type nodes: list
+    """
+    for node in nodes:
+        for key, component in list(node.closures.items()):
+            for member in component[0]:
+                member.closures.pop(key, None)
\ No newline at end of file
@@ -0,0 +1,796 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from xml.etree import ElementTree
+
+from eddy.core.datatypes.graphol import Item, Identity
+from eddy.core.datatypes.owl import Facet, OWLProfile
+from eddy.core.datatypes.system import File
+from eddy.core.functions.fsystem import fexists
+from eddy.core.functions.graph import identify
+from eddy.core.functions.misc import rstrip
+from eddy.core.functions.owl import OWLText
+from eddy.core.functions.path import expandPath
+from eddy.core.items.factory import ItemFactory
+from eddy.core.items.nodes.common.base import AbstractNode
+from eddy.core.output import getLogger
+from eddy.core.profiles.owl2 import OWL2Profile
+from eddy.core.profiles.owl2ql import OWL2QLProfile
+from eddy.core.profiles.owl2rl import OWL2RLProfile
+from eddy.core.project import K_ASYMMETRIC, K_DESCRIPTION, K_FUNCTIONAL
+from eddy.core.project import K_INVERSE_FUNCTIONAL, K_IRREFLEXIVE, K_REFLEXIVE
+from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE, K_URL
+from eddy.core.project import ProjectNotFoundError, ProjectNotValidError, ProjectVersionError
+from eddy.core.regex import RE_FACET
+from eddy.core.trace import traced
+
+
+LOGGER = getLogger()
+
+
+class Graph(object):
+    """
+    Headless representation of a Graphol project.
+    The graph holds the ontology information, the predicate metadata and, for each diagram,
+    compact node and edge records exposing the same interface of the graphical items used by
+    the validation rules and by the OWL 2 translator: this allows batch processing of large
+    projects without constructing QGraphicsItems and QGraphicsScenes.
+    """
+    ItemFromXml = {
+        'attribute': Item.AttributeNode,
+        'complement': Item.ComplementNode,
+        'concept': Item.ConceptNode,
+        'datatype-restriction': Item.DatatypeRestrictionNode,
+        'disjoint-union': Item.DisjointUnionNode,
+        'domain-restriction': Item.DomainRestrictionNode,
+        'enumeration': Item.EnumerationNode,
+        'facet': Item.FacetNode,
+        'individual': Item.IndividualNode,
+        'intersection': Item.IntersectionNode,
+        'property-assertion': Item.PropertyAssertionNode,
+        'range-restriction': Item.RangeRestrictionNode,
+        'role': Item.RoleNode,
+        'role-chain': Item.RoleChainNode,
+        'role-inverse': Item.RoleInverseNode,
+        'union': Item.UnionNode,
+        'value-domain': Item.ValueDomainNode,
+        'inclusion': Item.InclusionEdge,
+        'equivalence': Item.EquivalenceEdge,
+        'input': Item.InputEdge,
+        'membership': Item.MembershipEdge,
+    }
+    Profiles = {
+        OWLProfile.OWL2: OWL2Profile,
+        OWLProfile.OWL2QL: OWL2QLProfile,
+        OWLProfile.OWL2RL: OWL2RLProfile,
+    }
+
+    def __init__(self, name, prefix, iri, version='1.0', profile=OWLProfile.OWL2):
+        """
+        Initialize the graph.
+        :type name: str
+        :type prefix: str
+        :type iri: str
+        :type version: str
+        :type profile: T <= OWLProfile|str
+        """
+        self.name = name
+        self.prefix = prefix
+        self.iri = iri
+        self.version = version
+        self.profile = self.Profiles.get(OWLProfile.valueOf(profile), OWL2Profile)()
+        self._diagrams = []
+        self._meta = {}
+
+    #############################################
+    #   FACTORY
+    #################################
+
+    @classmethod
+    @traced(category='load')
+    def fromFile(cls, path):
+        """
+        Build a graph by parsing the given Graphol (v2) file.
+        :type path: str
+        :rtype: Graph
+        """
+        path = expandPath(path)
+        if not fexists(path):
+            raise ProjectNotFoundError('missing project ontology: %s' % path)
+        if File.forPath(path) is not File.Graphol:
+            raise ProjectNotValidError('invalid project ontology supplied: %s' % path)
+        try:
+            root = ElementTree.parse(path).getroot()
+        except ElementTree.ParseError as e:
+            raise ProjectNotValidError('invalid project ontology supplied: %s (%s)' % (path, e))
+        version = int(root.get('version', '2'))
+        if version != 2:
+            raise ProjectVersionError('project version mismatch: %s != 2' % version)
+
+        ontology = root.find('ontology')
+        parse = lambda tag, default: ontology.findtext(tag) or default if ontology is not None else default
+        graph = cls(name=parse('name', rstrip(path, File.Graphol.extension)),
+                    prefix=parse('prefix', 'NULL'),
+                    iri=parse('iri', 'NULL'),
+                    version=parse('version', '1.0'),
+                    profile=parse('profile', 'OWL 2'))
+
+        for e in root.iterfind('predicates/predicate'):
+            item = cls.ItemFromXml.get(e.get('type'))
+            if item:
+                meta = {K_DESCRIPTION: e.findtext(K_DESCRIPTION, ''), K_URL: e.findtext(K_URL, '')}
+                for key in (K_FUNCTIONAL, K_INVERSE_FUNCTIONAL, K_ASYMMETRIC, K_IRREFLEXIVE,
+                            K_REFLEXIVE, K_SYMMETRIC, K_TRANSITIVE):
+                    value = e.findtext(key)
+                    if value is not None:
+                        meta[key] = bool(int(value))
+                graph.setMeta(item, e.get('name'), meta)
+
+        for i, e in enumerate(root.iterfind('diagrams/diagram'), 1):
+            diagram = GraphDiagram(e.get('name', 'diagram_{0}'.format(i)), graph)
+            for sube in e.iterfind('node'):
+                item = cls.ItemFromXml.get(sube.get('type', '').lower().strip())
+                if item:
+                    inputs = sube.get('inputs', '').strip()
+                    node = GraphNode(diagram, sube.get('id'), item, sube.findtext('label', ''),
+                                     inputs.split(',') if inputs else None)
+                    diagram.addItem(node)
+                else:
+                    LOGGER.warning('Failed to create node %s', sube.get('id'))
+            for sube in e.iterfind('edge'):
+                item = cls.ItemFromXml.get(sube.get('type', '').lower().strip())
+                source = diagram.node(sube.get('source'))
+                target = diagram.node(sube.get('target'))
+                if item and source and target:
+                    edge = GraphEdge(diagram, sube.get('id'), item, source, target)
+                    diagram.addItem(edge)
+                    source.edges.append(edge)
+                    target.edges.append(edge)
+                else:
+                    LOGGER.warning('Failed to create edge %s', sube.get('id'))
+            graph.addDiagram(diagram)
+
+        graph.identify()
+        return graph
+
+    @classmethod
+    def fromProject(cls, project):
+        """
+        Build a graph out of a snapshot of the given project.
+        Identities are copied over from the project items, hence no identification is performed.
+        :type project: Project
+        :rtype: Graph
+        """
+        graph = cls(name=project.name, prefix=project.prefix, iri=project.iri,
+                    version=project.version, profile=project.profile.type())
+        for item, name in project.metas():
+            graph.setMeta(item, name, dict(project.meta(item, name)))
+        for d in project.diagrams():
+            diagram = GraphDiagram(d.name, graph)
+            for n in d.nodes():
+                inputs = getattr(n, 'inputs', None)
+                node = GraphNode(diagram, n.id, n.type(), n.text(), list(inputs) if inputs else None)
+                node._identity = n.identity()
+                diagram.addItem(node)
+            for e in d.edges():
+                source = diagram.node(e.source.id)
+                target = diagram.node(e.target.id)
+                edge = GraphEdge(diagram, e.id, e.type(), source, target)
+                diagram.addItem(edge)
+                source.edges.append(edge)
+                target.edges.append(edge)
+            graph.addDiagram(diagram)
+        return graph
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addDiagram(self, diagram):
+        """
+        Add the given diagram to the graph.
+        :type diagram: GraphDiagram
+        """
+        self._diagrams.append(diagram)
+
+    def diagram(self, name):
+        """
+        Returns the diagram matching the given name or None if no diagram is found.
+        :type name: str
+        :rtype: GraphDiagram
+        """
+        for diagram in self._diagrams:
+            if diagram.name == name:
+                return diagram
+        return None
+
+    def diagrams(self):
+        """
+        Returns the list of diagrams in the graph.
+        :rtype: list
+        """
+        return list(self._diagrams)
+
+    def edges(self):
+        """
+        Returns the list of edges in the graph.
+        :rtype: list
+        """
+        return [e for d in self._diagrams for e in d.edges()]
+
+    @traced(category='identification')
+    def identify(self):
+        """
+        Run the identification algorithm on all the nodes which may assume a neutral identity.
+        """
+        for node in self.nodes():
+            if Identity.Neutral in node.identities():
+                identify(node)
+
+    def isEmpty(self):
+        """
+        Returns True if the graph contains no node, False otherwise.
+        :rtype: bool
+        """
+        return not any(d.nodes() for d in self._diagrams)
+
+    def meta(self, item, name):
+        """
+        Returns metadata for the given predicate, expressed as pair (item, name).
+        :type item: Item
+        :type name: str
+        :rtype: dict
+        """
+        return self._meta.get((item, OWLText(name)), dict())
+
+    def metas(self, *types):
+        """
+        Returns a collection of pairs 'item', 'name' for all the predicates with metadata.
+        :type types: list
+        :rtype: list
+        """
+        return [k for k in self._meta if not types or k[0] in types]
+
+    def nodes(self):
+        """
+        Returns the list of nodes in the graph.
+        :rtype: list
+        """
+        return [n for d in self._diagrams for n in d.nodes()]
+
+    def predicates(self, item=None, name=None, diagram=None):
+        """
+        Returns a collection of predicate nodes belonging to the given diagram.
+        If no diagram is supplied the lookup is performed across the whole graph.
+        :type item: Item
+        :type name: str
+        :type diagram: GraphDiagram
+        :rtype: set
+        """
+        return {n for n in (diagram.nodes() if diagram else self.nodes()) if n.isPredicate() and
+                (not item or n.type() is item) and (not name or n.text() == name)}
+
+    def setMeta(self, item, name, meta):
+        """
+        Set metadata for the given predicate, expressed as pair (item, name).
+        :type item: Item
+        :type name: str
+        :type meta: dict
+        """
+        self._meta[(item, OWLText(name))] = meta
+
+    def split(self):
+        """
+        Returns a list of graphs, one for each diagram of this graph, sharing its ontology information.
+        :rtype: list
+        """
+        state = self.__getstate__()
+        graphs = []
+        for diagram in state['diagrams']:
+            graph = Graph.__new__(Graph)
+            graph.__setstate__(dict(state, diagrams=[diagram]))
+            graphs.append(graph)
+        return graphs
+
+    @traced(category='validation')
+    def validate(self):
+        """
+        Validate all the nodes and edges of the graph against its profile.
+        Returns the list of failed validation results.
+        :rtype: list
+        """
+        errors = []
+        profile = self.profile
+        profile.reset()
+        for edge in self.edges():
+            pvr = profile.checkEdge(edge.source, edge, edge.target)
+            if not pvr.isValid():
+                errors.append(pvr)
+        for node in self.nodes():
+            pvr = profile.checkNode(node)
+            if not pvr.isValid():
+                errors.append(pvr)
+        profile.reset()
+        return errors
+
+    def __getstate__(self):
+        """
+        Returns the state of the graph used for pickling: node and edge records are flattened into
+        tuples so that the graph can be shipped to other processes (see eddy.core.analysis).
+        :rtype: dict
+        """
+        return {
+            'name': self.name,
+            'prefix': self.prefix,
+            'iri': self.iri,
+            'version': self.version,
+            'profile': self.profile.type(),
+            'meta': self._meta,
+            'diagrams': [(d.name,
+                [(n.id, n.type(), n.text(), n.inputs, n._identity) for n in d.nodes()],
+                [(e.id, e.type(), e.source.id, e.target.id) for e in d.edges()]) for d in self._diagrams],
+        }
+
+    def __setstate__(self, state):
+        """
+        Restore the graph from the given state.
+        :type state: dict
+        """
+        self.__init__(state['name'], state['prefix'], state['iri'], state['version'], state['profile'])
+        self._meta = state['meta']
+        for name, nodes, edges in state['diagrams']:
+            diagram = GraphDiagram(name, self)
+            for nid, item, text, inputs, identity in nodes:
+                node = GraphNode(diagram, nid, item, text, inputs)
+                node._identity = identity
+                diagram.addItem(node)
+            for eid, item, source, target in edges:
+                source = diagram.node(source)
+                target = diagram.node(target)
+                edge = GraphEdge(diagram, eid, item, source, target)
+                diagram.addItem(edge)
+                source.edges.append(edge)
+                target.edges.append(edge)
+            self.addDiagram(diagram)
+
+
+class GraphDiagram(object):
+    """
+    Headless representation of a Graphol diagram.
+    """
+    __slots__ = ('name', 'project', '_edges', '_nodes')
+
+    def __init__(self, name, project):
+        """
+        Initialize the diagram.
+        :type name: str
+        :type project: Graph
+        """
+        self.name = name
+        self.project = project
+        self._edges = {}
+        self._nodes = {}
+
+    def addItem(self, item):
+        """
+        Add the given record to the diagram.
+        :type item: T <= GraphNode|GraphEdge
+        """
+        if item.isNode():
+            self._nodes[item.id] = item
+        else:
+            self._edges[item.id] = item
+
+    def edge(self, eid):
+        """
+        Returns the edge matching the given id or None if no edge is found.
+        :type eid: str
+        :rtype: GraphEdge
+        """
+        return self._edges.get(eid)
+
+    def edges(self):
+        """
+        Returns the list of edges in the diagram.
+        :rtype: list
+        """
+        return list(self._edges.values())
+
+    def node(self, nid):
+        """
+        Returns the node matching the given id or None if no node is found.
+        :type nid: str
+        :rtype: GraphNode
+        """
+        return self._nodes.get(nid)
+
+    def nodes(self):
+        """
+        Returns the list of nodes in the diagram.
+        :rtype: list
+        """
+        return list(self._nodes.values())
+
+    def __repr__(self):
+        """
+        Returns repr(self).
+        """
+        return 'GraphDiagram:{0}'.format(self.name)
+
+
+class GraphItem(object):
+    """
+    Base class for all the headless graph records.
+    """
+    __slots__ = ('diagram', 'id', '_type')
+
+    def __init__(self, diagram, id, item):
+        """
+        Initialize the record.
+        :type diagram: GraphDiagram
+        :type id: str
+        :type item: Item
+        """
+        self.diagram = diagram
+        self.id = id
+        self._type = item
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def name(self):
+        """
+        Returns the item readable name.
+        :rtype: str
+        """
+        return self._type.realName
+
+    @property
+    def project(self):
+        """
+        Returns the graph this record belongs to.
+        :rtype: Graph
+        """
+        return self.diagram.project
+
+    @property
+    def shortName(self):
+        """
+        Returns the item readable short name.
+        :rtype: str
+        """
+        return self._type.shortName
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def isEdge(self):
+        """
+        Returns True if this record represents an edge, False otherwise.
+        :rtype: bool
+        """
+        return Item.InclusionEdge <= self._type <= Item.MembershipEdge
+
+    def isNode(self):
+        """
+        Returns True if this record represents a node, False otherwise.
+        :rtype: bool
+        """
+        return Item.ConceptNode <= self._type < Item.InclusionEdge
+
+    def type(self):
+        """
+        Returns the type of the item this record represents.
+        :rtype: Item
+        """
+        return self._type
+
+    def __repr__(self):
+        """
+        Returns repr(self).
+        """
+        return '{0}:{1}'.format(self._type.name, self.id)
+
+
+class GraphEdge(GraphItem):
+    """
+    Headless representation of a Graphol edge.
+    """
+    __slots__ = ('source', 'target')
+
+    def __init__(self, diagram, id, item, source, target):
+        """
+        Initialize the edge.
+        :type diagram: GraphDiagram
+        :type id: str
+        :type item: Item
+        :type source: GraphNode
+        :type target: GraphNode
+        """
+        super().__init__(diagram, id, item)
+        self.source = source
+        self.target = target
+
+    def other(self, node):
+        """
+        Returns the opposite endpoint of the given node.
+        :type node: GraphNode
+        :rtype: GraphNode
+        """
+        return self.target if node is self.source else self.source
+
+
+class GraphNode(GraphItem):
+    """
+    Headless representation of a Graphol node.
+    Node semantics (identification, restriction parsing, datatype and metadata lookup, ...)
+    are borrowed from the graphical item class of the same type, whose methods only rely on
+    the interface replicated by this record.
+    """
+    __slots__ = ('closures', 'edges', 'inputs', '_identity', '_text')
+
+    Classes = {x: ItemFactory.classForItem(x) for x in Item if Item.ConceptNode <= x <= Item.FacetNode}
+
+    def __init__(self, diagram, id, item, text='', inputs=None):
+        """
+        Initialize the node.
+        :type diagram: GraphDiagram
+        :type id: str
+        :type item: Item
+        :type text: str
+        :type inputs: list
+        """
+        super().__init__(diagram, id, item)
+        self.closures = {}
+        self.edges = []
+        self.inputs = inputs
+        self._identity = Identity.Neutral
+        self._text = text
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def datatype(self):
+        """
+        Returns the datatype associated with this node.
+        :rtype: Datatype
+        """
+        return self.Classes[self._type].datatype.fget(self)
+
+    @property
+    def facet(self):
+        """
+        Returns the facet associated with this node.
+        :rtype: Facet
+        """
+        match = RE_FACET.match(self._text)
+        if match:
+            return Facet.valueOf(match.group('facet')) or Facet.length
+        return Facet.length
+
+    @property
+    def identityName(self):
+        """
+        Returns the name of the identity of this node (i.e: Concept, Role, ...).
+        :rtype: str
+        """
+        return self.identity().value
+
+    @property
+    def value(self):
+        """
+        Returns the value associated with this node.
+        :rtype: str
+        """
+        if self._type is Item.FacetNode:
+            match = RE_FACET.match(self._text)
+            return match.group('value') if match else ''
+        return self.Classes[self._type].value.fget(self)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def adjacentNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
+        """
+        Returns the set of adjacent nodes.
+        :type filter_on_edges: callable
+        :type filter_on_nodes: callable
+        :rtype: set
+        """
+        return {x for x in [e.other(self) for e in self.edges if filter_on_edges(e)] if filter_on_nodes(x)}
+
+    def cardinality(self, *args):
+        """
+        Returns the cardinality of the node.
+        :rtype: T <= dict|int
+        """
+        return self.Classes[self._type].cardinality(self, *args)
+
+    def identities(self):
+        """
+        Returns the set of identities supported by this node.
+        :rtype: set
+        """
+        return self.Classes[self._type].Identities
+
+    def identify(self):
+        """
+        Perform the node identification step for the current node.
+        :rtype: tuple
+        """
+        return self.Classes[self._type].identify(self)
+
+    def identity(self):
+        """
+        Returns the identity of the current node.
+        :rtype: Identity
+        """
+        func = self.Classes[self._type].identity
+        if func is AbstractNode.identity:
+            return self._identity
+        return func(self)
+
+    def incomingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
+        """
+        Returns the set of incoming nodes.
+        :type filter_on_edges: callable
+        :type filter_on_nodes: callable
+        :rtype: set
+        """
+        return {x for x in [e.other(self) for e in self.edges \
+                    if (e.target is self or e._type is Item.EquivalenceEdge) \
+                        and filter_on_edges(e)] if filter_on_nodes(x)}
+
+    def isAsymmetric(self):
+        """
+        Returns True if the predicate represented by this node is asymmetric, else False.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isAsymmetric(self)
+
+    def isConstructor(self):
+        """
+        Returns True if this node is a contructor node, False otherwise.
+        :rtype: bool
+        """
+        return Item.DomainRestrictionNode <= self._type <= Item.FacetNode
+
+    def isFunctional(self):
+        """
+        Returns True if the predicate represented by this node is functional, else False.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isFunctional(self)
+
+    def isInverseFunctional(self):
+        """
+        Returns True if the predicate represented by this node is inverse functional, else False.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isInverseFunctional(self)
+
+    def isIrreflexive(self):
+        """
+        Returns True if the predicate represented by this node is irreflexive, else False.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isIrreflexive(self)
+
+    def isMeta(self):
+        """
+        Returns True iff we should memorize metadata for this item, False otherwise.
+        :rtype: bool
+        """
+        return AbstractNode.isMeta(self)
+
+    def isPredicate(self):
+        """
+        Returns True if this node is a predicate node, False otherwise.
+        :rtype: bool
+        """
+        return AbstractNode.isPredicate(self)
+
+    def isReflexive(self):
+        """
+        Returns True if the predicate represented by this node is reflexive, else False.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isReflexive(self)
+
+    def isRestrictionQualified(self):
+        """
+        Returns True if this node expresses a qualified restriction, False otherwise.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isRestrictionQualified(self)
+
+    def isSymmetric(self):
+        """
+        Returns True if the predicate represented by this node is symmetric, else False.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isSymmetric(self)
+
+    def isTransitive(self):
+        """
+        Returns True if the predicate represented by this node is transitive, else False.
+        :rtype: bool
+        """
+        return self.Classes[self._type].isTransitive(self)
+
+    def outgoingNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
+        """
+        Returns the set of outgoing nodes.
+        :type filter_on_edges: callable
+        :type filter_on_nodes: callable
+        :rtype: set
+        """
+        return {x for x in [e.other(self) for e in self.edges \
+                    if (e.source is self or e._type is Item.EquivalenceEdge) \
+                        and filter_on_edges(e)] if filter_on_nodes(x)}
+
+    def restriction(self):
+        """
+        Returns the restriction type of the node.
+        :rtype: Restriction
+        """
+        return self.Classes[self._type].restriction(self)
+
+    def setIdentity(self, identity):
+        """
+        Set the identity of the current node.
+        :type identity: Identity
+        """
+        self.Classes[self._type].setIdentity(self, identity)
+
+    def special(self):
+        """
+        Returns the special type of this node.
+        :rtype: Special
+        """
+        return self.Classes[self._type].special(self)
+
+    def text(self):
+        """
+        Returns the label text.
+        :rtype: str
+        """
+        return self._text
\ No newline at end of file
@@ -154,6 +154,23 @@ class AbstractItem(QtWidgets.QGraphicsItem, DiagramItemMixin):
         item = self.type()
         return item.shortName
 
+    #############################################
+    #   EVENTS
+    #################################
+
+    def itemChange(self, change, value):
+        """
+        Executed whenever the item change state.
+        :type change: GraphicsItemChange
+        :type value: QVariant
+        :rtype: QVariant
+        """
+        if change == AbstractItem.ItemSelectedHasChanged:
+            diagram = self.diagram
+            if diagram:
+                diagram.updateSelection(self, value)
+        return super().itemChange(change, value)
+
     #############################################
     #   INTERFACE
     #################################
@@ -71,6 +71,7 @@ class AbstractEdge(AbstractItem):
 
         self.anchors = {} # {AbstractNode: Polygon}
         self.breakpoints = breakpoints or [] # [QtCore.QPointF]
+        self.extentRect = None # QtCore.QRectF
         self.handles = [] # [Polygon]
         self.head = Polygon(QtGui.QPolygonF())
         self.path = Polygon(QtGui.QPainterPath())
@@ -310,9 +311,36 @@ class AbstractEdge(AbstractItem):
             polygon.setPen(bpPen)
         self.selection.setBrush(selectionBrush)
 
+        ## EXTENT --> NB: THE DIAGRAM TRACKS THE AREA COVERED BY ITS ITEMS
+        diagram = self.diagram
+        if diagram:
+            rect = self.sceneBoundingRect()
+            diagram.updateExtent(rect, self.extentRect)
+            self.extentRect = rect
+
         ## Z-VALUE (DEPTH)
+        self.updateZValue()
+
+        ## FORCE CACHE REGENERATION
+        self.setCacheMode(AbstractItem.NoCache)
+        self.setCacheMode(AbstractItem.DeviceCoordinateCache)
+
+    def updateZValue(self):
+        """
+        Update the Z value of the edge so that it is drawn above the items it collides with.
+        NB: the scene index is disabled while the diagram is in bulk load mode, so only the endpoints
+        are taken into account: the edge is then refreshed again by Diagram.endBulkLoad().
+        """
+        source = self.source
+        target = self.target
+        diagram = self.diagram
+        if diagram and diagram.isBulkLoading():
+            diagram.bulkItems.append(self)
+            colliding = []
+        else:
+            colliding = self.collidingItems()
         try:
-            zValue = max(*(x.zValue() for x in self.collidingItems())) + 0.1
+            zValue = max(*(x.zValue() for x in colliding)) + 0.1
         except TypeError:
             zValue = source.zValue() + 0.1
             if source.label:
@@ -323,10 +351,6 @@ class AbstractEdge(AbstractItem):
                     zValue = max(zValue, target.label.zValue())
         self.setZValue(zValue)
 
-        ## FORCE CACHE REGENERATION
-        self.setCacheMode(AbstractItem.NoCache)
-        self.setCacheMode(AbstractItem.DeviceCoordinateCache)
-
     #############################################
     #   EVENTS
     #################################
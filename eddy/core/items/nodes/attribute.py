@@ -39,7 +39,7 @@ from PyQt5 import QtGui
 from eddy.core.datatypes.graphol import Identity, Item, Special
 from eddy.core.datatypes.owl import OWLProfile
 from eddy.core.items.common import Polygon
-from eddy.core.items.nodes.common.base import AbstractNode
+from eddy.core.items.nodes.common.base import AbstractNode, NodeStyle
 from eddy.core.items.nodes.common.label import NodeLabel
 from eddy.core.project import K_FUNCTIONAL
 
@@ -246,13 +246,8 @@ class AttributeNode(AbstractNode):
         self.fpolygon.setGeometry(path1.subtracted(path2))
 
         # FUNCTIONAL POLYGON (PEN & BRUSH)
-        pen = QtGui.QPen(QtCore.Qt.NoPen)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if functional:
-            pen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            brush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
-        self.fpolygon.setPen(pen)
-        self.fpolygon.setBrush(brush)
+        self.fpolygon.setPen(NodeStyle.FunctionalPen if functional else NodeStyle.NoPen)
+        self.fpolygon.setBrush(NodeStyle.FunctionalBrush if functional else NodeStyle.NoBrush)
 
         # SELECTION + BACKGROUND + CACHE REFRESH
         super().updateNode(**kwargs)
@@ -263,6 +258,13 @@ class AttributeNode(AbstractNode):
         """
         self.label.updatePos(*args, **kwargs)
 
+    def visualState(self):
+        """
+        Returns a snapshot of everything affecting the rendering of this node.
+        :rtype: tuple
+        """
+        return super().visualState() + (self.fpolygon.brush(), self.fpolygon.pen())
+
     def width(self):
         """
         Returns the width of the shape.
@@ -41,9 +41,51 @@ from PyQt5 import QtGui
 from eddy.core.commands.nodes import CommandNodeRezize
 from eddy.core.datatypes.graphol import Item, Identity
 from eddy.core.datatypes.misc import DiagramMode
+from eddy.core.functions.graph import invalidate
 from eddy.core.items.common import AbstractItem, Polygon
 
 
+class NodeStyle(object):
+    """
+    Registry of the pens and brushes used to render the state of diagram nodes.
+    All the instances are shared among every node in every diagram and MUST NOT be modified.
+    """
+    NoBrush = QtGui.QBrush(QtCore.Qt.NoBrush)
+    NoPen = QtGui.QPen(QtCore.Qt.NoPen)
+
+    SelectionBrush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
+    ValidBrush = QtGui.QBrush(QtGui.QColor(43, 173, 63, 160))
+    InvalidBrush = QtGui.QBrush(QtGui.QColor(179, 12, 12, 160))
+
+    HandleBrush = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
+    HandlePen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+
+    FunctionalBrush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
+    FunctionalPen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+    InverseFunctionalBrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
+    InverseFunctionalPen = FunctionalPen
+
+    @classmethod
+    def selectionBrush(cls, selected):
+        """
+        Returns the brush used to paint the selection area of a node.
+        :type selected: bool
+        :rtype: QtGui.QBrush
+        """
+        return cls.SelectionBrush if selected else cls.NoBrush
+
+    @classmethod
+    def validationBrush(cls, valid):
+        """
+        Returns the brush used to paint the syntax validation background of a node.
+        :type valid: bool
+        :rtype: QtGui.QBrush
+        """
+        if valid is None:
+            return cls.NoBrush
+        return cls.ValidBrush if valid else cls.InvalidBrush
+
+
 class AbstractNode(AbstractItem):
     """
     Base class for all the diagram nodes.
@@ -62,6 +104,7 @@ class AbstractNode(AbstractItem):
         self._identity = Identity.Neutral
 
         self.anchors = dict()
+        self.closures = dict()
         self.edges = set()
 
         self.background = None # BACKGROUND POLYGON
@@ -69,6 +112,8 @@ class AbstractNode(AbstractItem):
         self.polygon = None # MAIN POLYGON
         self.label = None # ATTACHED LABEL
 
+        self._visualState = None
+
         self.setAcceptHoverEvents(True)
         self.setCacheMode(AbstractItem.DeviceCoordinateCache)
         self.setFlag(AbstractItem.ItemIsSelectable, True)
@@ -96,6 +141,7 @@ class AbstractNode(AbstractItem):
         :type edge: AbstractEdge
         """
         self.edges.add(edge)
+        invalidate(edge.source, edge.target)
 
     def adjacentNodes(self, filter_on_edges=lambda x: True, filter_on_nodes=lambda x: True):
         """
@@ -292,12 +338,28 @@ class AbstractNode(AbstractItem):
         """
         return self.mapToScene(self.center())
 
+    def redraw(self):
+        """
+        Schedule a repaint of the node if its visual state changed since the last redraw.
+        Since the node renders through a device coordinate cache, every repaint regenerates
+        the cached pixmap: nodes whose appearance did not change keep it untouched.
+        """
+        state = self.visualState()
+        if state != self._visualState:
+            diagram = self.diagram
+            if diagram and self._visualState and state[0] != self._visualState[0]:
+                previous = self.mapRectToScene(QtCore.QRectF(*self._visualState[0]))
+                diagram.updateExtent(self.sceneBoundingRect(), previous)
+            self._visualState = state
+            self.update(self.boundingRect())
+
     def removeEdge(self, edge):
         """
         Remove the given edge from the current node.
         :type edge: AbstractEdge
         """
         self.edges.discard(edge)
+        invalidate(edge.source, edge.target)
 
     def setAnchor(self, edge, pos):
         """
@@ -328,7 +390,9 @@ class AbstractNode(AbstractItem):
         """
         if identity not in self.identities():
             identity = Identity.Unknown
-        self._identity = identity
+        if identity is not self._identity:
+            self._identity = identity
+            invalidate(self, *(e.other(self) for e in self.edges))
 
     def setPen(self, pen):
         """
@@ -349,7 +413,11 @@ class AbstractNode(AbstractItem):
             pos = QtCore.QPointF(__args[0], __args[1])
         else:
             raise TypeError('too many arguments; expected {0}, got {1}'.format(2, len(__args)))
+        previous = self.sceneBoundingRect()
         super().setPos(pos + super().pos() - self.pos())
+        diagram = self.diagram
+        if diagram:
+            diagram.updateExtent(self.sceneBoundingRect(), previous)
 
     def updateEdges(self):
         """
@@ -365,25 +433,13 @@ class AbstractNode(AbstractItem):
         :type valid: bool
         """
         # ITEM SELECTION (BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if selected:
-            brush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
-        self.selection.setBrush(brush)
+        self.selection.setBrush(NodeStyle.selectionBrush(selected))
 
         # SYNTAX VALIDATION (BACKGROUND BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if valid is not None:
-            brush = QtGui.QBrush(QtGui.QColor(179, 12, 12, 160))
-            if valid:
-                brush = QtGui.QBrush(QtGui.QColor(43, 173, 63, 160))
-        self.background.setBrush(brush)
-
-        # FORCE CACHE REGENERATION
-        self.setCacheMode(AbstractItem.NoCache)
-        self.setCacheMode(AbstractItem.DeviceCoordinateCache)
+        self.background.setBrush(NodeStyle.validationBrush(valid))
 
-        # SCHEDULE REPAINT
-        self.update(self.boundingRect())
+        # SCHEDULE REPAINT (IF NEEDED)
+        self.redraw()
 
     @abstractmethod
     def updateTextPos(self, *args, **kwargs):
@@ -392,6 +448,20 @@ class AbstractNode(AbstractItem):
         """
         pass
 
+    def visualState(self):
+        """
+        Returns a snapshot of everything affecting the rendering of this node.
+        Nodes painting additional shapes MUST extend the snapshot with their pens and brushes.
+        :rtype: tuple
+        """
+        return (
+            self.boundingRect().getRect(),
+            self.selection.brush(),
+            self.background.brush(),
+            self.polygon.brush(),
+            self.polygon.pen(),
+        )
+
     @abstractmethod
     def width(self):
         """
@@ -535,32 +605,16 @@ class AbstractResizableNode(AbstractNode):
         self.handles[self.HandleBR].setGeometry(QtCore.QRectF(b.right() - 8, b.bottom() - 8, 8, 8))
 
         # RESIZE HANDLES (PEN + BRUSH)
-        brush = [QtGui.QBrush(QtCore.Qt.NoBrush)] * 8
-        pen = [QtGui.QPen(QtCore.Qt.NoPen)] * 8
-        if selected:
-            if handle is None:
-                brush = [QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))] * 8
-                pen = [QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)] * 8
-            else:
-                for i in range(8):
-                    if i == handle:
-                        brush[i] = QtGui.QBrush(QtGui.QColor(66, 165, 245, 255))
-                        pen[i] = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.0, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
         for i in range(8):
-            self.handles[i].setBrush(brush[i])
-            self.handles[i].setPen(pen[i])
+            visible = selected and (handle is None or handle == i)
+            self.handles[i].setBrush(NodeStyle.HandleBrush if visible else NodeStyle.NoBrush)
+            self.handles[i].setPen(NodeStyle.HandlePen if visible else NodeStyle.NoPen)
 
         # ITEM SELECTION (BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if selected and handle is None:
-            brush = QtGui.QBrush(QtGui.QColor(248, 255, 72, 255))
-        self.selection.setBrush(brush)
+        self.selection.setBrush(NodeStyle.selectionBrush(selected and handle is None))
 
         # SYNTAX VALIDATION (BACKGROUND BRUSH)
-        brush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if valid is not None:
-            brush = QtGui.QBrush(QtGui.QColor(43, 173, 63, 160)) if valid else QtGui.QBrush(QtGui.QColor(179, 12, 12, 160))
-        self.background.setBrush(brush)
+        self.background.setBrush(NodeStyle.validationBrush(valid))
 
         # ANCHOR POINTS (POSITION) -> NB: SHAPE IS IN THE EDGES
         if anchors is not None:
@@ -573,12 +627,17 @@ class AbstractResizableNode(AbstractNode):
                     newPos = self.intersection(QtCore.QLineF(newPos, self.pos()))
                 self.setAnchor(edge, newPos)
 
-        # FORCE CACHE REGENERATION
-        self.setCacheMode(AbstractItem.NoCache)
-        self.setCacheMode(AbstractItem.DeviceCoordinateCache)
+        # SCHEDULE REPAINT (IF NEEDED)
+        self.redraw()
 
-        # SCHEDULE REPAINT
-        self.update(self.boundingRect())
+    def visualState(self):
+        """
+        Returns a snapshot of everything affecting the rendering of this node, resize handles included.
+        :rtype: tuple
+        """
+        return super().visualState() + \
+            tuple(x.brush() for x in self.handles) + \
+            tuple(x.pen() for x in self.handles)
 
     #############################################
     #   EVENTS
@@ -396,6 +396,16 @@ class FacetNode(AbstractNode):
         self.labelA.updatePos()
         self.labelB.updatePos()
 
+    def visualState(self):
+        """
+        Returns a snapshot of everything affecting the rendering of this node.
+        :rtype: tuple
+        """
+        return super().visualState() + (
+            self.polygonA.brush(), self.polygonA.pen(),
+            self.polygonB.brush(), self.polygonB.pen(),
+        )
+
     def width(self):
         """
         Returns the width of the shape.
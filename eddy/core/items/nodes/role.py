@@ -40,7 +40,7 @@ from eddy.core.datatypes.graphol import Item, Special, Identity
 from eddy.core.datatypes.owl import OWLProfile
 from eddy.core.functions.misc import snapF
 from eddy.core.items.common import Polygon
-from eddy.core.items.nodes.common.base import AbstractResizableNode
+from eddy.core.items.nodes.common.base import AbstractResizableNode, NodeStyle
 from eddy.core.items.nodes.common.label import NodeLabel
 from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
 from eddy.core.project import K_ASYMMETRIC, K_IRREFLEXIVE, K_REFLEXIVE
@@ -750,18 +750,12 @@ class RoleNode(AbstractResizableNode):
             ipolygon = ipolygon.subtracted(path)
 
         # FUNCTIONAL POLYGON (PEN + BRUSH)
-        fpen = QtGui.QPen(QtCore.Qt.NoPen)
-        fbrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if functional:
-            fpen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            fbrush = QtGui.QBrush(QtGui.QColor(252, 252, 252, 255))
+        fpen = NodeStyle.FunctionalPen if functional else NodeStyle.NoPen
+        fbrush = NodeStyle.FunctionalBrush if functional else NodeStyle.NoBrush
 
         # INVERSE FUNCTIONAL POLYGON (PEN + BRUSH)
-        ipen = QtGui.QPen(QtCore.Qt.NoPen)
-        ibrush = QtGui.QBrush(QtCore.Qt.NoBrush)
-        if inverseFunctional:
-            ipen = QtGui.QPen(QtGui.QBrush(QtGui.QColor(0, 0, 0, 255)), 1.1, QtCore.Qt.SolidLine, QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
-            ibrush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 255))
+        ipen = NodeStyle.InverseFunctionalPen if inverseFunctional else NodeStyle.NoPen
+        ibrush = NodeStyle.InverseFunctionalBrush if inverseFunctional else NodeStyle.NoBrush
 
         self.fpolygon.setPen(fpen)
         self.fpolygon.setBrush(fbrush)
@@ -779,6 +773,16 @@ class RoleNode(AbstractResizableNode):
         """
         self.label.updatePos(*args, **kwargs)
 
+    def visualState(self):
+        """
+        Returns a snapshot of everything affecting the rendering of this node.
+        :rtype: tuple
+        """
+        return super().visualState() + (
+            self.fpolygon.brush(), self.fpolygon.pen(),
+            self.ipolygon.brush(), self.ipolygon.pen(),
+        )
+
     def width(self):
         """
         Returns the width of the shape.
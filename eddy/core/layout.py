@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import math
+
+from PyQt5 import QtCore
+
+from eddy.core.commands.common import CommandItemsTransform
+from eddy.core.datatypes.graphol import Item
+from eddy.core.diagram import Diagram
+from eddy.core.functions.geometry import packPoints, unpackPoints
+from eddy.core.functions.misc import snap
+from eddy.core.functions.signals import connect
+from eddy.core.output import getLogger
+from eddy.core.trace import traced
+from eddy.core.worker import AbstractWorker, TaskScheduler
+
+
+LOGGER = getLogger()
+
+
+class ForceDirectedLayout(object):
+    """
+    Multilevel force directed layout engine working on flat arrays of coordinates.
+    The graph is repeatedly coarsened by collapsing pairs of adjacent nodes, the coarsest graph is laid out first
+    and each layout is then interpolated onto the next finer graph and refined (see Walshaw, A Multilevel Algorithm
+    for Force-Directed Graph Drawing), which unfolds large graphs with a few iterations per level. Each iteration
+    is a Fruchterman-Reingold step where repulsion is only computed between nodes lying in neighbouring cells of
+    a uniform grid, hence it runs in time linear in the number of nodes and edges. Since the engine does not
+    reference any graphical item it can be safely executed on a worker thread.
+    """
+    Coarsest = 20
+    Golden = math.pi * (3 - math.sqrt(5))
+
+    def __init__(self, positions, radiuses, edges, fixed=None, spacing=160.0, iterations=50):
+        """
+        Initialize the layout.
+        :type positions: array
+        :type radiuses: T <= array|list
+        :type edges: list
+        :type fixed: set
+        :type spacing: float
+        :type iterations: int
+        """
+        self.coarse = None
+        self.edges = edges
+        self.fixed = fixed or set()
+        self.iterations = iterations
+        self.parents = None
+        self.radiuses = list(radiuses)
+        self.spacing = spacing
+        self.xs = list(positions[0::2])
+        self.ys = list(positions[1::2])
+        # SPRINGS ATTACHED TO HUBS ARE WEAKENED, OTHERWISE HUBS WOULD CRUSH THEIR NEIGHBOURHOOD
+        degrees = [0] * len(self.xs)
+        for i, j, _ in edges:
+            degrees[i] += 1
+            degrees[j] += 1
+        self.weights = [min(1.0, 2 / math.sqrt(degrees[i] * degrees[j])) for i, j, _ in edges]
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def coarsen(self):
+        """
+        Returns a coarser layout where pairs of adjacent movable nodes are collapsed into a single node,
+        or None if the graph can't be significantly coarsened anymore.
+        :rtype: ForceDirectedLayout
+        """
+        n = len(self.xs)
+        adjacency = [[] for _ in range(n)]
+        for i, j, _ in self.edges:
+            adjacency[i].append(j)
+            adjacency[j].append(i)
+        parents = [-1] * n
+        groups = []
+        # VISIT LOW DEGREE NODES FIRST SO THAT LEAVES GET COLLAPSED INTO THEIR NEIGHBOURS
+        for i in sorted(range(n), key=lambda x: len(adjacency[x])):
+            if parents[i] < 0:
+                group = [i]
+                if i not in self.fixed:
+                    candidates = [j for j in adjacency[i] if parents[j] < 0 and j != i and j not in self.fixed]
+                    if candidates:
+                        group.append(min(candidates, key=lambda x: len(adjacency[x])))
+                    elif len(adjacency[i]) == 1 and adjacency[i][0] not in self.fixed:
+                        # LEAVES OF HUBS WHICH HAVE ALREADY BEEN MATCHED ARE COLLAPSED INTO THE HUB GROUP
+                        groups[parents[adjacency[i][0]]].append(i)
+                        parents[i] = parents[adjacency[i][0]]
+                        continue
+                for j in group:
+                    parents[j] = len(groups)
+                groups.append(group)
+        if len(groups) > 0.8 * n:
+            return None
+        positions = packPoints([])
+        radiuses = []
+        for group in groups:
+            positions.append(sum(self.xs[i] for i in group) / len(group))
+            positions.append(sum(self.ys[i] for i in group) / len(group))
+            radiuses.append(math.sqrt(sum(self.radiuses[i] ** 2 for i in group)))
+        lengths = {}
+        for i, j, length in self.edges:
+            p, q = sorted((parents[i], parents[j]))
+            if p != q:
+                lengths[(p, q)] = min(length, lengths.get((p, q), length))
+        edges = [(p, q, length) for (p, q), length in lengths.items()]
+        fixed = {parents[i] for i in self.fixed}
+        self.coarse = ForceDirectedLayout(positions, radiuses, edges, fixed, self.spacing, self.iterations)
+        self.parents = parents
+        return self.coarse
+
+    def expand(self):
+        """
+        Scale the layout around its center when most of the nodes overlap their nearest neighbour,
+        which happens when the springs compress the layout more than the short range repulsion can balance.
+        """
+        xs, ys, rs = self.xs, self.ys, self.radiuses
+        n = len(xs)
+        margin = 0.1 * self.spacing
+        size = 2 * max(rs, default=0) + margin
+        cells = {}
+        for i in range(n):
+            cells.setdefault((int(xs[i] // size), int(ys[i] // size)), []).append(i)
+        ratios = [1.0] * n
+        for (cx, cy), cell in cells.items():
+            for i in cell:
+                for ox in (-1, 0, 1):
+                    for oy in (-1, 0, 1):
+                        for j in cells.get((cx + ox, cy + oy), ()):
+                            if i != j:
+                                d = math.hypot(xs[i] - xs[j], ys[i] - ys[j])
+                                ratios[i] = max(ratios[i], (rs[i] + rs[j] + margin) / max(d, 1e-3))
+        scale = min(sorted(ratios)[n // 2], 3.0)
+        if scale > 1.0:
+            cx = sum(xs) / n
+            cy = sum(ys) / n
+            self.xs = [cx + (x - cx) * scale for x in xs]
+            self.ys = [cy + (y - cy) * scale for y in ys]
+
+    def interpolate(self):
+        """
+        Place the movable nodes around the position of the node they have been collapsed into in the coarser layout.
+        """
+        ranks = {}
+        for i, p in enumerate(self.parents):
+            if i not in self.fixed:
+                j = ranks[p] = ranks.get(p, -1) + 1
+                radius = self.spacing * 0.5 * math.sqrt(j)
+                self.xs[i] = self.coarse.xs[p] + radius * math.cos(i * self.Golden)
+                self.ys[i] = self.coarse.ys[p] + radius * math.sin(i * self.Golden)
+
+    def positions(self):
+        """
+        Returns the positions computed by the layout as a flat array of coordinates.
+        :rtype: array
+        """
+        positions = packPoints([])
+        for x, y in zip(self.xs, self.ys):
+            positions.append(x)
+            positions.append(y)
+        return positions
+
+    def run(self, callback=None):
+        """
+        Run the layout, returning the computed positions.
+        The optional callback is invoked after each iteration with the number of iterations performed and
+        the total number of iterations: if it returns True the layout is interrupted.
+        :type callback: callable
+        :rtype: array
+        """
+        movable = [i for i in range(len(self.xs)) if i not in self.fixed]
+        if movable:
+            cx = sum(self.xs[i] for i in movable) / len(movable)
+            cy = sum(self.ys[i] for i in movable) / len(movable)
+            self.spread()
+            levels = [self]
+            while len(levels[-1].xs) > self.Coarsest and levels[-1].coarsen():
+                levels.append(levels[-1].coarse)
+            total = self.iterations * len(levels)
+            for level, layout in enumerate(reversed(levels)):
+                if level:
+                    layout.interpolate()
+                # LINEAR COOLING: REFINEMENTS START COLDER SINCE THE COARSER LAYOUT IS ALREADY UNFOLDED
+                temperature = self.spacing if not level else self.spacing / 2
+                for i in range(self.iterations):
+                    layout.step(temperature * (1 - 0.95 * i / self.iterations))
+                    if callback and callback(level * self.iterations + i + 1, total):
+                        return self.positions()
+            if not self.fixed:
+                self.expand()
+                # KEEP THE LAYOUT CENTERED WHERE THE NODES USED TO BE
+                dx = cx - sum(self.xs) / len(self.xs)
+                dy = cy - sum(self.ys) / len(self.ys)
+                self.xs = [x + dx for x in self.xs]
+                self.ys = [y + dy for y in self.ys]
+            self.separate()
+        return self.positions()
+
+    def separate(self, passes=20):
+        """
+        Remove the residual overlaps by pushing apart the nodes whose circles intersect.
+        Each pass moves both nodes of each overlapping pair by half of the overlap (or just the movable
+        one by the whole overlap): passes are performed until no overlap is left or the limit is reached.
+        :type passes: int
+        """
+        xs, ys, rs = self.xs, self.ys, self.radiuses
+        n = len(xs)
+        margin = 0.1 * self.spacing
+        size = 2 * max(rs, default=0) + margin
+        for _ in range(passes):
+            cells = {}
+            for i in range(n):
+                cells.setdefault((int(xs[i] // size), int(ys[i] // size)), []).append(i)
+            moves = {}
+            for (cx, cy), cell in cells.items():
+                for ox, oy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+                    other = cell if ox == oy == 0 else cells.get((cx + ox, cy + oy))
+                    if other is None:
+                        continue
+                    for a, i in enumerate(cell):
+                        for j in (other[a + 1:] if other is cell else other):
+                            dx = xs[i] - xs[j]
+                            dy = ys[i] - ys[j]
+                            d = math.sqrt(dx * dx + dy * dy)
+                            overlap = rs[i] + rs[j] + margin - d
+                            if overlap > 0 and (i not in self.fixed or j not in self.fixed):
+                                if d < 1e-3:
+                                    dx, dy, d = math.cos(i), math.sin(i), 1.0
+                                share = overlap / d / (1 if i in self.fixed or j in self.fixed else 2)
+                                if i not in self.fixed:
+                                    mx, my = moves.get(i, (0.0, 0.0))
+                                    moves[i] = (mx + dx * share, my + dy * share)
+                                if j not in self.fixed:
+                                    mx, my = moves.get(j, (0.0, 0.0))
+                                    moves[j] = (mx - dx * share, my - dy * share)
+            if not moves:
+                break
+            for i, (mx, my) in moves.items():
+                xs[i] += mx
+                ys[i] += my
+
+    def spread(self):
+        """
+        Spread nodes sharing the same position on a spiral around it, so that they can be told apart.
+        """
+        groups = {}
+        for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+            groups.setdefault((round(x), round(y)), []).append(i)
+        for group in (g for g in groups.values() if len(g) > 1):
+            for j, i in enumerate((i for i in group if i not in self.fixed), 1):
+                radius = self.spacing * 0.5 * math.sqrt(j)
+                self.xs[i] += radius * math.cos(j * self.Golden)
+                self.ys[i] += radius * math.sin(j * self.Golden)
+
+    def step(self, temperature):
+        """
+        Perform a single iteration of the layout, limiting the displacement of each node to the given temperature.
+        :type temperature: float
+        """
+        xs, ys, rs = self.xs, self.ys, self.radiuses
+        n = len(xs)
+        k2 = self.spacing * self.spacing
+        gap = 0.1 * self.spacing
+        size = self.spacing + 2 * max(rs, default=0)
+        cutoff2 = size * size
+        fx = [0.0] * n
+        fy = [0.0] * n
+
+        # REPULSION BETWEEN NODES IN THE SAME OR IN NEIGHBOURING CELLS (EACH PAIR OF CELLS IS VISITED ONCE)
+        cells = {}
+        for i in range(n):
+            cells.setdefault((int(xs[i] // size), int(ys[i] // size)), []).append(i)
+        for (cx, cy), cell in cells.items():
+            for ox, oy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+                other = cell if ox == oy == 0 else cells.get((cx + ox, cy + oy))
+                if other is None:
+                    continue
+                for a, i in enumerate(cell):
+                    xi, yi, ri = xs[i], ys[i], rs[i]
+                    fxi = fyi = 0.0
+                    for j in (other[a + 1:] if other is cell else other):
+                        dx = xi - xs[j]
+                        dy = yi - ys[j]
+                        d2 = dx * dx + dy * dy
+                        if d2 < cutoff2:
+                            if d2 < 1e-6:
+                                dx, dy, d2 = 0.1 * (i - j), 0.1, 0.01 * ((i - j) ** 2 + 1)
+                            d = math.sqrt(d2)
+                            # NODES ARE MEASURED FROM THEIR BORDER SO THAT LARGE NODES DO NOT OVERLAP
+                            g = d - ri - rs[j]
+                            f = k2 / (d * (g if g > gap else gap))
+                            fxi += dx * f
+                            fyi += dy * f
+                            fx[j] -= dx * f
+                            fy[j] -= dy * f
+                    fx[i] += fxi
+                    fy[i] += fyi
+
+        # ATTRACTION ALONG EDGES: LOGARITHMIC SPRINGS KEEP LONG EDGES FROM COLLAPSING THE LAYOUT
+        for (i, j, length), weight in zip(self.edges, self.weights):
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            d = math.sqrt(dx * dx + dy * dy) or 1e-3
+            f = weight * self.spacing * math.log(d / length) / d
+            fx[i] -= dx * f
+            fy[i] -= dy * f
+            fx[j] += dx * f
+            fy[j] += dy * f
+
+        # DISPLACEMENT
+        for i in range(n):
+            if i not in self.fixed:
+                f = math.sqrt(fx[i] * fx[i] + fy[i] * fy[i])
+                if f > 0:
+                    f = min(f, temperature) / f
+                    xs[i] += fx[i] * f
+                    ys[i] += fy[i] * f
+
+
+class AutoLayoutWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker which runs a ForceDirectedLayout in background.
+    """
+    sgnCompleted = QtCore.pyqtSignal(object)
+
+    def __init__(self, layout):
+        """
+        Initialize the worker.
+        :type layout: ForceDirectedLayout
+        """
+        super().__init__()
+        self.layout = layout
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            positions = self.layout.run(self.onIteration)
+            if not self.isCancelled():
+                self.sgnCompleted.emit(positions)
+        except Exception:
+            LOGGER.exception('Automatic layout could not be completed')
+        finally:
+            self.finished.emit()
+
+    def onIteration(self, i, total):
+        """
+        Executed after each iteration of the layout.
+        :type i: int
+        :type total: int
+        :rtype: bool
+        """
+        if i % 10 == 0 or i == total:
+            self.progress.emit(i, total)
+        return self.isCancelled()
+
+
+class AutoLayout(QtCore.QObject):
+    """
+    Arrange the nodes of a diagram using a multilevel force directed layout.
+    Positions, sizes and connections of the nodes are copied into flat arrays on the calling thread, the layout is
+    computed on those arrays (possibly on a worker thread) and the result is applied to the diagram as a single
+    undoable CommandItemsTransform (which, differently from node moves, is never merged with other commands). Input edges are given a shorter rest length than the other edges, so that Graphol
+    operators stay close to their operands, and nodes which are not being arranged are kept in place.
+    """
+    InputLengthFactor = 0.5
+    sgnCompleted = QtCore.pyqtSignal()
+    sgnProgress = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, diagram, nodes=None, spacing=160.0, iterations=50, parent=None):
+        """
+        Initialize the layout.
+        :type diagram: Diagram
+        :type nodes: T <= list|set|tuple
+        :type spacing: float
+        :type iterations: int
+        :type parent: QObject
+        """
+        super().__init__(parent)
+        self.diagram = diagram
+        self.nodes = diagram.nodes() if nodes is None else nodes
+        self.iterations = iterations
+        self.spacing = spacing
+        self.snapshot = None
+        self.task = None
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(object)
+    def onLayoutCompleted(self, positions):
+        """
+        Executed when the layout has been computed on the worker thread.
+        :type positions: array
+        """
+        self.task = None
+        self.apply(positions)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def apply(self, positions):
+        """
+        Apply the given positions to the diagram nodes pushing a single CommandItemsTransform on the undo stack.
+        Nodes which have been removed from the diagram while the layout was being computed are left untouched.
+        :type positions: array
+        """
+        nodes, count = self.snapshot
+        snapToGrid = self.diagram.session.action('toggle_grid').isChecked()
+        undo = {'nodes': {}, 'edges': {}}
+        redo = {'nodes': {}, 'edges': {}}
+        deltas = {}
+        for node, pos in zip(nodes[:count], unpackPoints(positions)):
+            if node.diagram is self.diagram:
+                pos = snap(pos, Diagram.GridSize, snapToGrid)
+                delta = pos - node.pos()
+                deltas[node] = delta
+                undo['nodes'][node] = {'anchors': dict(node.anchors), 'pos': node.pos()}
+                redo['nodes'][node] = {'anchors': {e: p + delta for e, p in node.anchors.items()}, 'pos': pos}
+        for node in deltas:
+            for edge in node.edges:
+                if edge not in undo['edges'] and edge.source in deltas and edge.target in deltas:
+                    delta = (deltas[edge.source] + deltas[edge.target]) / 2
+                    undo['edges'][edge] = edge.breakpoints[:]
+                    redo['edges'][edge] = [p + delta for p in edge.breakpoints]
+        if redo['nodes']:
+            self.diagram.session.undostack.push(CommandItemsTransform(self.diagram,
+                self.diagram.moveGeometry(undo), self.diagram.moveGeometry(redo),
+                'auto layout {0} nodes'.format(len(redo['nodes']))))
+        self.sgnCompleted.emit()
+
+    def cancel(self):
+        """
+        Cancel the running layout.
+        """
+        if self.task:
+            TaskScheduler.instance().cancel(self.task.name)
+
+    def createLayout(self):
+        """
+        Snapshot the diagram into a ForceDirectedLayout: the nodes to arrange come first, followed
+        by their neighbours, which are taken into account by the layout but never moved.
+        :rtype: ForceDirectedLayout
+        """
+        nodes = list(self.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        count = len(nodes)
+        edges = []
+        for node in list(nodes):
+            for edge in node.edges:
+                for other in (edge.source, edge.target):
+                    if other not in index:
+                        index[other] = len(nodes)
+                        nodes.append(other)
+        for edge in {e for node in nodes[:count] for e in node.edges}:
+            length = self.spacing
+            if edge.type() is Item.InputEdge:
+                length *= self.InputLengthFactor
+            if edge.source is not edge.target:
+                edges.append((index[edge.source], index[edge.target], length))
+        self.snapshot = (nodes, count)
+        positions = packPoints([n.pos() for n in nodes])
+        radiuses = [math.hypot(n.width(), n.height()) / 2 for n in nodes]
+        return ForceDirectedLayout(positions, radiuses, edges, set(range(count, len(nodes))),
+                                   self.spacing, self.iterations)
+
+    @traced(category='layout')
+    def run(self):
+        """
+        Compute and apply the layout synchronously.
+        """
+        layout = self.createLayout()
+        self.apply(layout.run(lambda i, total: self.sgnProgress.emit(i, total)))
+
+    def start(self):
+        """
+        Compute the layout in background, applying it once completed.
+        :rtype: bool
+        """
+        worker = AutoLayoutWorker(self.createLayout())
+        connect(worker.sgnCompleted, self.onLayoutCompleted)
+        connect(worker.progress, self.sgnProgress)
+        self.task = TaskScheduler.instance().submit('layout:{0}'.format(id(self)), worker)
+        return self.task is not None
\ No newline at end of file
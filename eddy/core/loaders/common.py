@@ -137,6 +137,8 @@ class AbstractOntologyLoader(AbstractLoader):
         :type session: Session
         """
         super().__init__(path, session)
+        self.document = None
+        self.plan = None
         self.project = project
 
     #############################################
@@ -156,6 +158,8 @@ class AbstractOntologyLoader(AbstractLoader):
     def run(self):
         """
         Perform the load of the ontology and the merge with the current project.
+        If the QDomDocument ('document') or the metadata merge plan ('plan') have already
+        been computed (i.e: by an OntologyImportWorker), they are used as they are.
         """
         pass
 
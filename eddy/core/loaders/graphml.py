@@ -34,11 +34,11 @@
 
 
 import itertools
+import math
 import os
 
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
-from PyQt5 import QtXml
 
 from eddy.core.datatypes.graphol import Item, Identity, Restriction
 from eddy.core.datatypes.system import File
@@ -47,20 +47,265 @@ from eddy.core.diagram import DiagramNotFoundError
 from eddy.core.diagram import DiagramNotValidError
 from eddy.core.diagram import DiagramParseError
 from eddy.core.functions.fsystem import fexists
-from eddy.core.functions.fsystem import fread
 from eddy.core.functions.misc import snapF, isEmpty, rstrip, snap
 from eddy.core.functions.signals import connect
 from eddy.core.loaders.common import AbstractOntologyLoader
 from eddy.core.output import getLogger
 from eddy.core.project import Project, ProjectMergeWorker
+from eddy.core.spatial import SpatialIndex
 
 
 LOGGER = getLogger()
 
 
+class GraphMLDocument(object):
+    """
+    Lightweight representation of a yEd GraphML document.
+    The document is built by streaming the file with a QXmlStreamReader, retaining only the
+    information needed to construct Graphol items (geometries, labels, shapes and arrows):
+    no DOM tree is kept in memory, and no scene item is created while parsing, so that
+    the document can be safely generated outside of the main thread.
+    """
+    def __init__(self):
+        """
+        Initialize the document.
+        """
+        self.edges = list()
+        self.keys = dict()
+        self.nodes = list()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @classmethod
+    def fromFile(cls, path):
+        """
+        Build a GraphMLDocument by streaming the GraphML file at the given path.
+        :type path: str
+        :rtype: GraphMLDocument
+        """
+        if not fexists(path):
+            raise DiagramNotFoundError('diagram not found: {0}'.format(path))
+        file = QtCore.QFile(path)
+        if not file.open(QtCore.QIODevice.ReadOnly):
+            raise DiagramNotValidError('could not open diagram {0}: {1}'.format(path, file.errorString()))
+        try:
+            reader = QtCore.QXmlStreamReader(file)
+            document = cls()
+            document.read(reader)
+            if reader.hasError():
+                raise DiagramNotValidError('could not parse diagram from {0}: {1}'.format(path, reader.errorString()))
+            return document
+        finally:
+            file.close()
+
+    def read(self, reader):
+        """
+        Read the GraphML document from the given stream reader.
+        :type reader: QXmlStreamReader
+        """
+        if reader.readNextStartElement():
+            while reader.readNextStartElement():
+                if reader.name() == 'key':
+                    attributes = reader.attributes()
+                    if attributes.value('yfiles.type') in {'nodegraphics', 'edgegraphics'}:
+                        self.keys[attributes.value('yfiles.type')] = attributes.value('id')
+                    reader.skipCurrentElement()
+                elif reader.name() == 'graph':
+                    while reader.readNextStartElement():
+                        if reader.name() == 'node':
+                            self.nodes.append(GraphMLNode.read(reader))
+                        elif reader.name() == 'edge':
+                            self.edges.append(GraphMLEdge.read(reader))
+                        else:
+                            reader.skipCurrentElement()
+                else:
+                    reader.skipCurrentElement()
+
+
+class GraphMLNode(object):
+    """
+    Record holding the graphical information of a GraphML node.
+    """
+    __slots__ = ('configuration', 'fill', 'geometry', 'id', 'key', 'kind', 'label', 'shape')
+
+    def __init__(self, id):
+        """
+        Initialize the record.
+        :type id: str
+        """
+        self.configuration = ''
+        self.fill = None
+        self.geometry = None
+        self.id = id
+        self.key = None
+        self.kind = None
+        self.label = None
+        self.shape = None
+
+    @classmethod
+    def read(cls, reader):
+        """
+        Read a GraphML node record from the given stream reader (positioned on the 'node' element).
+        :type reader: QXmlStreamReader
+        :rtype: GraphMLNode
+        """
+        record = cls(reader.attributes().value('id'))
+        while reader.readNextStartElement():
+            if reader.name() == 'data' and record.kind is None:
+                key = reader.attributes().value('key')
+                while reader.readNextStartElement():
+                    if reader.name() in {'GenericNode', 'ShapeNode', 'UMLNoteNode'} and record.kind is None:
+                        record.key = key
+                        record.kind = reader.name()
+                        record.configuration = reader.attributes().value('configuration')
+                        while reader.readNextStartElement():
+                            name = reader.name()
+                            attributes = reader.attributes()
+                            if name == 'Geometry' and record.geometry is None:
+                                record.geometry = tuple(float(attributes.value(x)) for x in ('x', 'y', 'width', 'height'))
+                                reader.skipCurrentElement()
+                            elif name == 'Fill' and record.fill is None:
+                                record.fill = attributes.value('color')
+                                reader.skipCurrentElement()
+                            elif name == 'Shape' and record.shape is None:
+                                record.shape = attributes.value('type')
+                                reader.skipCurrentElement()
+                            elif name == 'NodeLabel' and record.label is None:
+                                geometry = tuple(attributes.value(x) for x in ('x', 'y', 'width', 'height'))
+                                text = reader.readElementText(QtCore.QXmlStreamReader.IncludeChildElements)
+                                record.label = (text,) + geometry
+                            else:
+                                reader.skipCurrentElement()
+                    else:
+                        reader.skipCurrentElement()
+            else:
+                reader.skipCurrentElement()
+        return record
+
+    def labelText(self):
+        """
+        Returns the text of the label of the node (empty string if the node has no label).
+        :rtype: str
+        """
+        return self.label[0] if self.label else ''
+
+    def pos(self):
+        """
+        Returns the position of the node properly translating it from yEd coordinate system.
+        :rtype: QPointF
+        """
+        # yEd uses the TOP-LEFT corner as (0,0) coordinate => we need to translate our
+        # position (0,0), which is instead at the center of the shape, so that the TOP-LEFT
+        # corner of the shape in yEd matches the TOP-LEFT corner of the shape in Eddy.
+        # We additionally snap the position to the grid so that items stay perfectly aligned.
+        x, y, w, h = self.geometry
+        return snap(QtCore.QPointF(x, y) + QtCore.QPointF(w / 2, h / 2), Diagram.GridSize)
+
+    def rect(self):
+        """
+        Returns the area covered by the node (and its label), translated in the Eddy coordinate system.
+        :rtype: QRectF
+        """
+        w, h = self.geometry[2:]
+        rect = QtCore.QRectF(-w / 2, -h / 2, w, h)
+        pos = self.textPos()
+        if pos is not None:
+            w, h = float(self.label[3]), float(self.label[4])
+            rect |= QtCore.QRectF(pos.x() - w / 2, pos.y() - h / 2, w, h)
+        return rect.translated(self.pos())
+
+    def textPos(self):
+        """
+        Returns the position of the node label relative to the node, translated from yEd coordinate system.
+        :rtype: QPointF
+        """
+        if not self.label or isEmpty(self.label[1]):
+            return None
+        x1, y1, w1, h1 = (float(x) for x in self.label[1:])
+        w2, h2 = self.geometry[2:]
+        return QtCore.QPointF(x1, y1) - QtCore.QPointF(w2 / 2, h2 / 2) + QtCore.QPointF(w1 / 2, h1 / 2)
+
+
+class GraphMLEdge(object):
+    """
+    Record holding the graphical information of a GraphML edge.
+    """
+    __slots__ = ('arrows', 'id', 'key', 'label', 'line', 'path', 'points', 'source', 'target')
+
+    def __init__(self, id, source, target):
+        """
+        Initialize the record.
+        :type id: str
+        :type source: str
+        :type target: str
+        """
+        self.arrows = ('', '')
+        self.id = id
+        self.key = None
+        self.label = None
+        self.line = None
+        self.path = ('0', '0', '0', '0')
+        self.points = list()
+        self.source = source
+        self.target = target
+
+    @classmethod
+    def read(cls, reader):
+        """
+        Read a GraphML edge record from the given stream reader (positioned on the 'edge' element).
+        :type reader: QXmlStreamReader
+        :rtype: GraphMLEdge
+        """
+        attributes = reader.attributes()
+        record = cls(attributes.value('id'), attributes.value('source'), attributes.value('target'))
+        while reader.readNextStartElement():
+            if reader.name() == 'data' and record.key is None:
+                key = reader.attributes().value('key')
+                while reader.readNextStartElement():
+                    if reader.name() == 'PolyLineEdge' and record.key is None:
+                        record.key = key
+                        while reader.readNextStartElement():
+                            name = reader.name()
+                            attributes = reader.attributes()
+                            if name == 'Path':
+                                record.path = tuple(attributes.value(x) for x in ('sx', 'sy', 'tx', 'ty'))
+                                while reader.readNextStartElement():
+                                    if reader.name() == 'Point':
+                                        attributes = reader.attributes()
+                                        record.points.append((float(attributes.value('x')), float(attributes.value('y'))))
+                                    reader.skipCurrentElement()
+                            elif name == 'LineStyle' and record.line is None:
+                                record.line = attributes.value('type')
+                                reader.skipCurrentElement()
+                            elif name == 'Arrows':
+                                record.arrows = (attributes.value('source'), attributes.value('target'))
+                                reader.skipCurrentElement()
+                            elif name == 'EdgeLabel' and record.label is None:
+                                record.label = reader.readElementText(QtCore.QXmlStreamReader.IncludeChildElements)
+                            else:
+                                reader.skipCurrentElement()
+                    else:
+                        reader.skipCurrentElement()
+            else:
+                reader.skipCurrentElement()
+        return record
+
+    def breakpoints(self):
+        """
+        Returns the breakpoints of the edge, snapped to the grid.
+        :rtype: list
+        """
+        return [QtCore.QPointF(snapF(x, Diagram.GridSize), snapF(y, Diagram.GridSize)) for x, y in self.points]
+
+
 class GraphMLOntologyLoader(AbstractOntologyLoader):
     """
     Extends AbstractOntologyLoader with facilities to load ontologies from GraphML file format.
+    The GraphML file is streamed into a GraphMLDocument (see GraphMLDocument.fromFile()), from which
+    the bounding box of the diagram is computed before creating any item, so that every item is
+    created directly at its final position within a diagram of the right size.
     """
     def __init__(self, path, project, session):
         """
@@ -75,8 +320,8 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         self.edges = dict()
         self.nodes = dict()
         self.diagram = None
-        self.document = None
         self.nproject = None
+        self.offset = QtCore.QPointF(0, 0)
 
         self.importFuncForItem = {
             Item.AttributeNode: self.importAttributeNode,
@@ -105,200 +350,188 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
     #   NODES
     #################################
 
-    def importAttributeNode(self, element):
+    def importAttributeNode(self, record):
         """
-        Build an Attribute node using the given QDomElement.
-        :type element: QDomElement
+        Build an Attribute node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: AttributeNode
         """
-        return self.importNodeFromGenericNode(Item.AttributeNode, element)
+        return self.importNodeFromGenericNode(Item.AttributeNode, record)
 
-    def importComplementNode(self, element):
+    def importComplementNode(self, record):
         """
-        Build a Complement node using the given QDomElement.
-        :type element: QDomElement
+        Build a Complement node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: ComplementNode
         """
-        return self.importNodeFromShapeNode(Item.ComplementNode, element)
+        return self.importNodeFromShapeNode(Item.ComplementNode, record)
 
-    def importConceptNode(self, element):
+    def importConceptNode(self, record):
         """
-        Build a Concept node using the given QDomElement.
-        :type element: QDomElement
+        Build a Concept node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: ConceptNode
         """
-        return self.importNodeFromGenericNode(Item.ConceptNode, element)
+        return self.importNodeFromGenericNode(Item.ConceptNode, record)
 
-    def importDatatypeRestrictionNode(self, element):
+    def importDatatypeRestrictionNode(self, record):
         """
-        Build a DatatypeRestriction node using the given QDomElement.
-        :type element: QDomElement
+        Build a DatatypeRestriction node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: DatatypeRestrictionNode
         """
-        return self.importNodeFromShapeNode(Item.DatatypeRestrictionNode, element)
+        return self.importNodeFromShapeNode(Item.DatatypeRestrictionNode, record)
 
-    def importDisjointUnionNode(self, element):
+    def importDisjointUnionNode(self, record):
         """
-        Build a DisjointUnion node using the given QDomElement.
-        :type element: QDomElement
+        Build a DisjointUnion node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: DisjointUnionNode
         """
-        return self.importNodeFromShapeNode(Item.DisjointUnionNode, element)
+        return self.importNodeFromShapeNode(Item.DisjointUnionNode, record)
 
-    def importDomainRestrictionNode(self, element):
+    def importDomainRestrictionNode(self, record):
         """
-        Build a DomainRestriction node using the given QDomElement.
-        :type element: QDomElement
+        Build a DomainRestriction node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: DomainRestrictionNode
         """
-        return self.importNodeFromShapeNode(Item.DomainRestrictionNode, element)
+        return self.importNodeFromShapeNode(Item.DomainRestrictionNode, record)
 
-    def importEnumerationNode(self, element):
+    def importEnumerationNode(self, record):
         """
-        Build an Enumeration node using the given QDomElement.
-        :type element: QDomElement
+        Build an Enumeration node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: EnumerationNode
         """
-        return self.importNodeFromShapeNode(Item.EnumerationNode, element)
+        return self.importNodeFromShapeNode(Item.EnumerationNode, record)
 
-    def importFacetNode(self, element):
+    def importFacetNode(self, record):
         """
-        Build a FacetNode node using the given QDomElement.
-        :type element: QDomElement
+        Build a FacetNode node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: FacetNode
         """
-        data = element.firstChildElement('data')
-        while not data.isNull():
-            if data.attribute('key', '') == self.keys['node_key']:
-                noteNode = data.firstChildElement('y:UMLNoteNode')
-                geometry = noteNode.firstChildElement('y:Geometry')
-                nodeLabel = noteNode.firstChildElement('y:NodeLabel')
-                h = float(geometry.attribute('height'))
-                w = float(geometry.attribute('width'))
-                kwargs = {'id': element.attribute('id'), 'height': h, 'width': w}
-                node = self.diagram.factory.create(Item.FacetNode, **kwargs)
-                node.setPos(self.parsePos(geometry))
-                node.setText(nodeLabel.text())
-                return node
-            data = data.nextSiblingElement('data')
+        if record.kind == 'UMLNoteNode':
+            h = record.geometry[3]
+            w = record.geometry[2]
+            kwargs = {'id': record.id, 'height': h, 'width': w}
+            node = self.diagram.factory.create(Item.FacetNode, **kwargs)
+            node.setPos(record.pos() + self.offset)
+            node.setText(record.labelText())
+            return node
         return None
 
-    def importIndividualNode(self, element):
+    def importIndividualNode(self, record):
         """
-        Build an Individual node using the given QDomElement.
-        :type element: QDomElement
+        Build an Individual node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: IndividualNode
         """
-        return self.importNodeFromShapeNode(Item.IndividualNode, element)
+        return self.importNodeFromShapeNode(Item.IndividualNode, record)
 
-    def importIntersectionNode(self, element):
+    def importIntersectionNode(self, record):
         """
-        Build an Intersection node using the given QDomElement.
-        :type element: QDomElement
+        Build an Intersection node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: IntersectionNode
         """
-        return self.importNodeFromShapeNode(Item.IntersectionNode, element)
+        return self.importNodeFromShapeNode(Item.IntersectionNode, record)
 
-    def importRangeRestrictionNode(self, element):
+    def importRangeRestrictionNode(self, record):
         """
-        Build a RangeRestriction node using the given QDomElement.
-        :type element: QDomElement
+        Build a RangeRestriction node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: RangeRestrictionNode
         """
-        return self.importNodeFromShapeNode(Item.RangeRestrictionNode, element)
+        return self.importNodeFromShapeNode(Item.RangeRestrictionNode, record)
 
-    def importRoleNode(self, element):
+    def importRoleNode(self, record):
         """
-        Build a Role node using the given QDomElement.
-        :type element: QDomElement
+        Build a Role node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: RoleNode
         """
-        return self.importNodeFromGenericNode(Item.RoleNode, element)
+        return self.importNodeFromGenericNode(Item.RoleNode, record)
 
-    def importRoleChainNode(self, element):
+    def importRoleChainNode(self, record):
         """
-        Build a RoleChain node using the given QDomElement.
-        :type element: QDomElement
+        Build a RoleChain node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: RoleChainNode
         """
-        return self.importNodeFromShapeNode(Item.RoleChainNode, element)
+        return self.importNodeFromShapeNode(Item.RoleChainNode, record)
 
-    def importRoleInverseNode(self, element):
+    def importRoleInverseNode(self, record):
         """
-        Build a RoleInverse node using the given QDomElement.
-        :type element: QDomElement
+        Build a RoleInverse node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: RoleInverseNode
         """
-        return self.importNodeFromShapeNode(Item.RoleInverseNode, element)
+        return self.importNodeFromShapeNode(Item.RoleInverseNode, record)
 
-    def importValueDomainNode(self, element):
+    def importValueDomainNode(self, record):
         """
-        Build a Value-Domain node using the given QDomElement.
-        :type element: QDomElement
+        Build a Value-Domain node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: ValueDomainNode
         """
-        return self.importNodeFromShapeNode(Item.ValueDomainNode, element)
+        return self.importNodeFromShapeNode(Item.ValueDomainNode, record)
 
-    def importUnionNode(self, element):
+    def importUnionNode(self, record):
         """
-        Build a Union node using the given QDomElement.
-        :type element: QDomElement
+        Build a Union node using the given GraphML record.
+        :type record: GraphMLNode
         :rtype: UnionNode
         """
-        return self.importNodeFromShapeNode(Item.UnionNode, element)
+        return self.importNodeFromShapeNode(Item.UnionNode, record)
 
     #############################################
     #   EDGES
     #################################
 
-    def importEquivalenceEdge(self, element):
+    def importEquivalenceEdge(self, record):
         """
-        Build an Equivalence edge using the given QDomElement.
-        :type element: QDomElement
+        Build an Equivalence edge using the given GraphML record.
+        :type record: GraphMLEdge
         :rtype: EquivalenceEdge
         """
-        edge = self.importEdgeFromGenericEdge(Item.EquivalenceEdge, element)
+        edge = self.importEdgeFromGenericEdge(Item.EquivalenceEdge, record)
         if edge:
             edge.updateEdge()
         return edge
 
-    def importInclusionEdge(self, element):
+    def importInclusionEdge(self, record):
         """
-        Build an Inclusion edge using the given QDomElement.
-        :type element: QDomElement
+        Build an Inclusion edge using the given GraphML record.
+        :type record: GraphMLEdge
         :rtype: InclusionEdge
         """
-        data = element.firstChildElement('data')
-        while not data.isNull():
-            if data.attribute('key', '') == self.keys['edge_key']:
-                polyLineEdge = data.firstChildElement('y:PolyLineEdge')
-                arrows = polyLineEdge.firstChildElement('y:Arrows')
-                if arrows.attribute('source', '') == 'standard' and arrows.attribute('target', '') == 'standard':
-                    return self.importEquivalenceEdge(element)
-            data = data.nextSiblingElement('data')
-        edge = self.importEdgeFromGenericEdge(Item.InclusionEdge, element)
+        if record.arrows == ('standard', 'standard'):
+            return self.importEquivalenceEdge(record)
+        edge = self.importEdgeFromGenericEdge(Item.InclusionEdge, record)
         if edge:
             edge.updateEdge()
         return edge
 
-    def importInputEdge(self, element):
+    def importInputEdge(self, record):
         """
-        Build an Input edge using the given QDomElement.
-        :type element: QDomElement
+        Build an Input edge using the given GraphML record.
+        :type record: GraphMLEdge
         :rtype: InputEdge
         """
-        edge = self.importEdgeFromGenericEdge(Item.InputEdge, element)
+        edge = self.importEdgeFromGenericEdge(Item.InputEdge, record)
         if edge:
             edge.updateEdge()
         return edge
 
-    def importMembershipEdge(self, element):
+    def importMembershipEdge(self, record):
         """
-        Build a Membership edge using the given QDomElement.
-        :type element: QDomElement
+        Build a Membership edge using the given GraphML record.
+        :type record: GraphMLEdge
         :rtype: InputEdge
         """
-        edge = self.importEdgeFromGenericEdge(Item.MembershipEdge, element)
+        edge = self.importEdgeFromGenericEdge(Item.MembershipEdge, record)
         if edge:
             edge.updateEdge()
         return edge
@@ -307,240 +540,191 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
     #   AUXILIARY METHODS
     #################################
 
-    def importEdgeFromGenericEdge(self, item, element):
+    def importEdgeFromGenericEdge(self, item, record):
         """
-        Build an edge using the given item type and QDomElement.
+        Build an edge using the given item type and GraphML record.
         :type item: Item
-        :type element: QDomElement
+        :type record: GraphMLEdge
         raise DiagramParseError: If one of the endpoints of the edge is not available.
         :rtype: AbstractEdge
         """
-        data = element.firstChildElement('data')
-        while not data.isNull():
-
-            if data.attribute('key', '') == self.keys['edge_key']:
+        if record.key == self.keys['edge_key']:
 
-                if not element.attribute('source') in self.nodes:
-                    raise DiagramParseError('missing source node (%s)' % element.attribute('source'))
-                if not element.attribute('target') in self.nodes:
-                    raise DiagramParseError('missing target node (%s)' % element.attribute('target'))
+            if not record.source in self.nodes:
+                raise DiagramParseError('missing source node (%s)' % record.source)
+            if not record.target in self.nodes:
+                raise DiagramParseError('missing target node (%s)' % record.target)
 
-                source = self.nodes[element.attribute('source')]
-                target = self.nodes[element.attribute('target')]
+            source = self.nodes[record.source]
+            target = self.nodes[record.target]
 
-                if source is target:
-                    raise DiagramParseError('detected loop between nodes %s and %s' % (source.id, target.id))
+            if source is target:
+                raise DiagramParseError('detected loop between nodes %s and %s' % (source.id, target.id))
 
-                points = []
-                polyLineEdge = data.firstChildElement('y:PolyLineEdge')
-                path = polyLineEdge.firstChildElement('y:Path')
-                collection = path.elementsByTagName('y:Point')
-                for i in range(0, collection.count()):
-                    point = collection.at(i).toElement()
-                    pos = QtCore.QPointF(float(point.attribute('x')), float(point.attribute('y')))
-                    pos = QtCore.QPointF(snapF(pos.x(), Diagram.GridSize), snapF(pos.y(), Diagram.GridSize))
-                    points.append(pos)
-
-                kwargs = {'id': element.attribute('id'), 'source': source, 'target': target, 'breakpoints': points}
-                edge = self.diagram.factory.create(item, **kwargs)
-                edge.source.setAnchor(edge, self.parseAnchorPos(edge, edge.source, path.attribute('sx'), path.attribute('sy')))
-                edge.target.setAnchor(edge, self.parseAnchorPos(edge, edge.target, path.attribute('tx'), path.attribute('ty')))
-                edge.source.addEdge(edge)
-                edge.target.addEdge(edge)
-                return edge
-
-            data = data.nextSiblingElement('data')
+            points = [p + self.offset for p in record.breakpoints()]
+            kwargs = {'id': record.id, 'source': source, 'target': target, 'breakpoints': points}
+            edge = self.diagram.factory.create(item, **kwargs)
+            sx, sy, tx, ty = record.path
+            edge.source.setAnchor(edge, self.parseAnchorPos(edge, edge.source, sx, sy))
+            edge.target.setAnchor(edge, self.parseAnchorPos(edge, edge.target, tx, ty))
+            edge.source.addEdge(edge)
+            edge.target.addEdge(edge)
+            return edge
 
         return None
 
-    def importNodeFromGenericNode(self, item, element):
+    def importNodeFromGenericNode(self, item, record):
         """
-        Build a node using the given item type and QDomElement.
+        Build a node using the given item type and GraphML record.
         :type item: Item
-        :type element: QDomElement
+        :type record: GraphMLNode
         :rtype: AbstractNode
         """
-        data = element.firstChildElement('data')
-        while not data.isNull():
-            if data.attribute('key', '') == self.keys['node_key']:
-                genericNode = data.firstChildElement('y:GenericNode')
-                geometry = genericNode.firstChildElement('y:Geometry')
-                nodeLabel = genericNode.firstChildElement('y:NodeLabel')
-                h = float(geometry.attribute('height'))
-                w = float(geometry.attribute('width'))
-                kwargs = {'id': element.attribute('id'), 'height': h, 'width': w}
-                node = self.diagram.factory.create(item, **kwargs)
-                node.setPos(self.parsePos(geometry))
-                node.setText(nodeLabel.text())
-                node.setTextPos(self.parseLabelPos(geometry, nodeLabel))
-                return node
-            data = data.nextSiblingElement('data')
+        if record.kind == 'GenericNode':
+            h = record.geometry[3]
+            w = record.geometry[2]
+            kwargs = {'id': record.id, 'height': h, 'width': w}
+            node = self.diagram.factory.create(item, **kwargs)
+            node.setPos(record.pos() + self.offset)
+            node.setText(record.labelText())
+            pos = record.textPos()
+            if pos is not None:
+                node.setTextPos(pos)
+            return node
         return None
 
-    def importNodeFromShapeNode(self, item, element):
+    def importNodeFromShapeNode(self, item, record):
         """
-        Build a node using the given item type and QDomElement.
+        Build a node using the given item type and GraphML record.
         :type item: Item
-        :type element: QDomElement
+        :type record: GraphMLNode
         :rtype: AbstractNode
         """
-        data = element.firstChildElement('data')
-        while not data.isNull():
-            if data.attribute('key', '') == self.keys['node_key']:
-                shapeNode = data.firstChildElement('y:ShapeNode')
-                geometry = shapeNode.firstChildElement('y:Geometry')
-                h = float(geometry.attribute('height'))
-                w = float(geometry.attribute('width'))
-                kwargs = {'id': element.attribute('id'), 'height': h, 'width': w}
-                node = self.diagram.factory.create(item, **kwargs)
-                node.setPos(self.parsePos(geometry))
-                # For the following items we also import the label.
-                # Other operator nodes have fixed label so it's pointless.
-                if item in {Item.DomainRestrictionNode, Item.RangeRestrictionNode, Item.ValueDomainNode, Item.IndividualNode}:
-                    nodeLabel = shapeNode.firstChildElement('y:NodeLabel')
-                    node.setText(nodeLabel.text())
-                    if not isEmpty(nodeLabel.text()):
-                        # If the node label is empty do not set the position.
-                        # This is needed because domain restriction and range restriction nodes
-                        # usually do not have any label in gephol documents built with yEd.
-                        node.setTextPos(self.parseLabelPos(geometry, nodeLabel))
-                return node
-            data = data.nextSiblingElement('data')
+        if record.kind == 'ShapeNode':
+            h = record.geometry[3]
+            w = record.geometry[2]
+            kwargs = {'id': record.id, 'height': h, 'width': w}
+            node = self.diagram.factory.create(item, **kwargs)
+            node.setPos(record.pos() + self.offset)
+            # For the following items we also import the label.
+            # Other operator nodes have fixed label so it's pointless.
+            if item in {Item.DomainRestrictionNode, Item.RangeRestrictionNode, Item.ValueDomainNode, Item.IndividualNode}:
+                node.setText(record.labelText())
+                if not isEmpty(record.labelText()):
+                    # If the node label is empty do not set the position.
+                    # This is needed because domain restriction and range restriction nodes
+                    # usually do not have any label in gephol documents built with yEd.
+                    pos = record.textPos()
+                    if pos is not None:
+                        node.setTextPos(pos)
+            return node
         return None
 
-    def importPredicateMetaFromElement(self, element):
+    def importPredicateMetaFromRecord(self, record):
         """
-        Import predicate metadata from the given element.
-        :type element: QDomElement
+        Import predicate metadata from the given GraphML edge record.
+        :type record: GraphMLEdge
         """
-        if self.itemFromXmlNode(element) is Item.InputEdge:
+        if self.itemFromRecord(record) is Item.InputEdge:
 
             try:
-                edge = self.edges[element.attribute('id')]
+                edge = self.edges[record.id]
             except KeyError:
-                LOGGER.warning('Failed to import [inverse]Functionality due to missing edge: %s', element.attribute('id'))
+                LOGGER.warning('Failed to import [inverse]Functionality due to missing edge: %s', record.id)
             else:
-                data = element.firstChildElement('data')
-                while not data.isNull():
-                    if data.attribute('key', '') == self.keys['edge_key']:
-                        polyLineEdge = data.firstChildElement('y:PolyLineEdge')
-                        arrows = polyLineEdge.firstChildElement('y:Arrows')
-                        if 't_shape' in {arrows.attribute('source', ''), arrows.attribute('target', '')}:
-                            # When we detect a t_shape source or target arrow on an input edge
-                            # we set the functionality on the connected predicate node. We should
-                            # be setting the functionality only on the predicate identified in the
-                            # source node, however in the graphol palette for yEd there is a bugged
-                            # functionality edge, in which the target arrow is a t_shape, a and the
-                            # source is a white_diamond. Because the input edge on one of the endpoints
-                            # has a domain/range restriction node, we can easily establish on which
-                            # endpoint we have to check the functionality attribute, since only one of the
-                            # endpoints can be a predicate node (because inputs target only constructors).
-                            if edge.source.type() in {Item.AttributeNode, Item.RoleNode}:
-                                pnode = edge.source
-                                cnode = edge.target
-                            else:
-                                pnode = edge.target
-                                cnode = edge.source
-                            # Functionality is for both Role and Attribute nodes.
-                            if cnode.type() is Item.DomainRestrictionNode:
-                                pnode.setFunctional(True)
-                            # Inverse functionality is just for Role nodes.
-                            if pnode.type() is Item.RoleNode:
-                                if cnode.type() is Item.RangeRestrictionNode:
-                                    pnode.setInverseFunctional(True)
-                    data = data.nextSiblingElement('data')
-
-    def itemFromXmlNode(self, element):
-        """
-        Returns the item matching the given Graphml node.
-        :type element: QDomElement
+                if 't_shape' in record.arrows:
+                    # When we detect a t_shape source or target arrow on an input edge
+                    # we set the functionality on the connected predicate node. We should
+                    # be setting the functionality only on the predicate identified in the
+                    # source node, however in the graphol palette for yEd there is a bugged
+                    # functionality edge, in which the target arrow is a t_shape, a and the
+                    # source is a white_diamond. Because the input edge on one of the endpoints
+                    # has a domain/range restriction node, we can easily establish on which
+                    # endpoint we have to check the functionality attribute, since only one of the
+                    # endpoints can be a predicate node (because inputs target only constructors).
+                    if edge.source.type() in {Item.AttributeNode, Item.RoleNode}:
+                        pnode = edge.source
+                        cnode = edge.target
+                    else:
+                        pnode = edge.target
+                        cnode = edge.source
+                    # Functionality is for both Role and Attribute nodes.
+                    if cnode.type() is Item.DomainRestrictionNode:
+                        pnode.setFunctional(True)
+                    # Inverse functionality is just for Role nodes.
+                    if pnode.type() is Item.RoleNode:
+                        if cnode.type() is Item.RangeRestrictionNode:
+                            pnode.setInverseFunctional(True)
+
+    def itemFromRecord(self, record):
+        """
+        Returns the item matching the given GraphML record.
+        :type record: T <= GraphMLNode|GraphMLEdge
         :rtype: Item
         """
-        data = element.firstChildElement('data')
-        while not data.isNull():
-
-            # NODE
-            if data.attribute('key', '') == self.keys['node_key']:
-                # GENERIC NODE
-                genericNode = data.firstChildElement('y:GenericNode')
-                if not genericNode.isNull():
-                    configuration = genericNode.attribute('configuration', '')
-                    if configuration == 'com.yworks.entityRelationship.small_entity':
-                        return Item.ConceptNode
-                    if configuration == 'com.yworks.entityRelationship.attribute':
-                        return Item.AttributeNode
-                    if configuration == 'com.yworks.entityRelationship.relationship':
-                        return Item.RoleNode
-
-                # SHAPE NODE
-                shapeNode = data.firstChildElement('y:ShapeNode')
-                if not shapeNode.isNull():
-                    shape = shapeNode.firstChildElement('y:Shape')
-                    if not shape.isNull():
-                        shapeType = shape.attribute('type', '')
-                        if shapeType == 'octagon':
-                            return Item.IndividualNode
-                        if shapeType == 'roundrectangle':
-                            return Item.ValueDomainNode
-                        if shapeType == 'hexagon':
-                            # We need to identify DisjointUnion from the color and not by
-                            # checking the empty label because in some ontologies created
-                            # under yEd another operator node has been copied over and the
-                            # background color has been changed while keeping the label.
-                            fill = shapeNode.firstChildElement('y:Fill')
-                            if not fill.isNull():
-                                color = fill.attribute('color', '')
-                                if color == '#000000':
-                                    return Item.DisjointUnionNode
-                            nodeLabel = shapeNode.firstChildElement('y:NodeLabel')
-                            if not nodeLabel.isNull():
-                                nodeText = nodeLabel.text().strip()
-                                if nodeText == 'and':
-                                    return Item.IntersectionNode
-                                if nodeText == 'or':
-                                    return Item.UnionNode
-                                if nodeText == 'not':
-                                    return Item.ComplementNode
-                                if nodeText == 'oneOf':
-                                    return Item.EnumerationNode
-                                if nodeText == 'chain':
-                                    return Item.RoleChainNode
-                                if nodeText == 'inv':
-                                    return Item.RoleInverseNode
-                                if nodeText == 'data':
-                                    return Item.DatatypeRestrictionNode
-
-                        if shapeType == 'rectangle':
-                            fill = shapeNode.firstChildElement('y:Fill')
-                            if not fill.isNull():
-                                color = fill.attribute('color', '')
-                                if color == '#000000':
-                                    return Item.RangeRestrictionNode
-                                return Item.DomainRestrictionNode
-
-                # UML NOTE NODE
-                noteNode = data.firstChildElement('y:UMLNoteNode')
-                if not noteNode.isNull():
-                    return Item.FacetNode
-
-            # EDGE
-            if data.attribute('key', '') == self.keys['edge_key']:
-                polyLineEdge = data.firstChildElement('y:PolyLineEdge')
-                if not polyLineEdge.isNull():
-                    lineStyle = polyLineEdge.firstChildElement('y:LineStyle')
-                    if not lineStyle.isNull():
-                        lineType = lineStyle.attribute('type', '')
-                        if lineType == 'line':
-                            edgeLabel = polyLineEdge.firstChildElement('y:EdgeLabel')
-                            if not edgeLabel.isNull():
-                                edgeText = edgeLabel.text().strip()
-                                if edgeText == 'instanceOf':
-                                    return Item.MembershipEdge
-                            return Item.InclusionEdge
-                        if lineType == 'dashed':
-                            return Item.InputEdge
-
-            data = data.nextSiblingElement('data')
+        # NODE
+        if isinstance(record, GraphMLNode) and record.key == self.keys['node_key']:
+            # GENERIC NODE
+            if record.kind == 'GenericNode':
+                configuration = record.configuration
+                if configuration == 'com.yworks.entityRelationship.small_entity':
+                    return Item.ConceptNode
+                if configuration == 'com.yworks.entityRelationship.attribute':
+                    return Item.AttributeNode
+                if configuration == 'com.yworks.entityRelationship.relationship':
+                    return Item.RoleNode
+
+            # SHAPE NODE
+            if record.kind == 'ShapeNode':
+                shapeType = record.shape
+                if shapeType == 'octagon':
+                    return Item.IndividualNode
+                if shapeType == 'roundrectangle':
+                    return Item.ValueDomainNode
+                if shapeType == 'hexagon':
+                    # We need to identify DisjointUnion from the color and not by
+                    # checking the empty label because in some ontologies created
+                    # under yEd another operator node has been copied over and the
+                    # background color has been changed while keeping the label.
+                    if record.fill == '#000000':
+                        return Item.DisjointUnionNode
+                    if record.label is not None:
+                        nodeText = record.labelText().strip()
+                        if nodeText == 'and':
+                            return Item.IntersectionNode
+                        if nodeText == 'or':
+                            return Item.UnionNode
+                        if nodeText == 'not':
+                            return Item.ComplementNode
+                        if nodeText == 'oneOf':
+                            return Item.EnumerationNode
+                        if nodeText == 'chain':
+                            return Item.RoleChainNode
+                        if nodeText == 'inv':
+                            return Item.RoleInverseNode
+                        if nodeText == 'data':
+                            return Item.DatatypeRestrictionNode
+
+                if shapeType == 'rectangle':
+                    if record.fill is not None:
+                        if record.fill == '#000000':
+                            return Item.RangeRestrictionNode
+                        return Item.DomainRestrictionNode
+
+            # UML NOTE NODE
+            if record.kind == 'UMLNoteNode':
+                return Item.FacetNode
+
+        # EDGE
+        if isinstance(record, GraphMLEdge) and record.key == self.keys['edge_key']:
+            lineType = record.line
+            if lineType == 'line':
+                if record.label is not None:
+                    if record.label.strip() == 'instanceOf':
+                        return Item.MembershipEdge
+                return Item.InclusionEdge
+            if lineType == 'dashed':
+                return Item.InputEdge
 
         return None
 
@@ -561,138 +745,110 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         return node.anchor(edge)
 
     @staticmethod
-    def parseLabelPos(geometry, label):
-        """
-        Parse the node label position properly translating it from yEd coordinate system.
-        :type geometry: QDomElement
-        :type label: QDomElement
-        :rtype: QtCore.QPointF
-        """
-        x1 = float(label.attribute('x'))
-        y1 = float(label.attribute('y'))
-        w1 = float(label.attribute('width'))
-        h1 = float(label.attribute('height'))
-        w2 = float(geometry.attribute('width'))
-        h2 = float(geometry.attribute('height'))
-        return QtCore.QPointF(x1, y1) - QtCore.QPointF(w2 / 2, h2 / 2) + QtCore.QPointF(w1 / 2, h1 / 2)
-
-    @staticmethod
-    def parsePos(geometry):
-        """
-        Parse the position of the node properly translating it from yEd coordinate system.
-        :type geometry: QDomElement
-        :rtype: QtCore.QPointF
-        """
-        # yEd uses the TOP-LEFT corner as (0,0) coordinate => we need to translate our
-        # position (0,0), which is instead at the center of the shape, so that the TOP-LEFT
-        # corner of the shape in yEd matches the TOP-LEFT corner of the shape in Eddy.
-        # We additionally snap the position to the grid so that items stay perfectly aligned.
-        x = float(geometry.attribute('x'))
-        y = float(geometry.attribute('y'))
-        w = float(geometry.attribute('width'))
-        h = float(geometry.attribute('height'))
-        return snap(QtCore.QPointF(x, y) + QtCore.QPointF(w / 2, h / 2), Diagram.GridSize)
-
-    @staticmethod
-    def optimizeLabelPos(node):
+    def optimizeLabelPos(node, index):
         """
         Perform updates on the position of the label of the given Domain o Range restriction node.
         This is due to yEd not using the label to denote the 'exists' restriction and because Eddy
         adds the label automatically, it may overlap some other elements hence we try to give it
         some more visibility by moving it around the node till it overlaps less stuff.
+        Overlaps are detected using the given spatial index rather than querying the diagram.
         :type node: T <= DomainRestrictionNode|RangeRestrictionNode
+        :type index: SpatialIndex
         """
         if node.type() in {Item.DomainRestrictionNode, Item.RangeRestrictionNode}:
             if node.restriction() is Restriction.Exists:
-                if not node.label.isMoved() and node.label.collidingItems():
+                rect = node.label.sceneBoundingRect()
+                if not node.label.isMoved() and index.intersects(rect, exclude=node.label):
                     x = [-30, -15, 0, 15, 30]
                     y = [0, 12, 22, 32, 44]
-                    pos = node.label.pos()
                     for offset_x, offset_y in itertools.product(x, y):
-                        node.label.setPos(pos + QtCore.QPointF(offset_x, offset_y))
-                        if not node.label.collidingItems():
+                        if not index.intersects(rect.translated(offset_x, offset_y), exclude=node.label):
+                            index.remove(rect, node.label)
+                            index.insert(rect.translated(offset_x, offset_y), node.label)
+                            node.label.setPos(node.label.pos() + QtCore.QPointF(offset_x, offset_y))
                             break
-                    else:
-                        node.label.setPos(pos)
 
     #############################################
     #   MAIN IMPORT
     #################################
 
-    def createDomDocument(self):
+    def createDocument(self):
         """
-        Create the QDomDocument from where to parse information.
+        Create the GraphMLDocument from where to parse information.
         """
-        QtWidgets.QApplication.processEvents()
-
         LOGGER.info('Loading diagram: %s', self.path)
-
-        if not fexists(self.path):
-            raise DiagramNotFoundError('diagram not found: {0}'.format(self.path))
-
-        self.document = QtXml.QDomDocument()
-        if not self.document.setContent(fread(self.path)):
-            raise DiagramNotValidError('could not parse diagram from {0}'.format(self.path))
+        self.document = GraphMLDocument.fromFile(self.path)
 
     def createDiagram(self):
         """
         Creates a diagram and reverse the content of the GraphML document in it.
         """
-        LOGGER.debug('Initializing empty diagram with size: %s', Diagram.MaxSize)
+        QtWidgets.QApplication.processEvents()
+
+        ## COMPUTE THE DIAGRAM GEOMETRY
+        nodes = []
+        rect = QtCore.QRectF()
+        for record in self.document.nodes:
+            item = self.itemFromRecord(record)
+            if item and record.geometry:
+                nodes.append((record, item))
+                rect |= record.rect()
+            else:
+                LOGGER.warning('Failed to create node %s: could not identify item for XML node', record.id)
+        for record in self.document.edges:
+            for x, y in record.points:
+                rect |= QtCore.QRectF(x - 1, y - 1, 2, 2)
+        self.offset = QtCore.QPointF(
+            snapF(-(rect.left() + rect.right()) / 2, Diagram.GridSize),
+            snapF(-(rect.top() + rect.bottom()) / 2, Diagram.GridSize))
+        rect = rect.translated(self.offset).adjusted(-20, -20, 20, 20)
+        size = int(max(rect.width(), rect.height(), Diagram.MinSize))
+
+        LOGGER.debug('Initializing empty diagram with size: %s', size)
         name = os.path.basename(self.path)
         name = rstrip(name, File.GraphML.extension)
-        self.diagram = Diagram.create(name, Diagram.MaxSize, self.nproject)
+        self.diagram = Diagram.create(name, size, self.nproject)
+        self.diagram.beginBulkLoad()
 
-        root = self.document.documentElement()
-        graph = root.firstChildElement('graph')
-        e = graph.firstChildElement('node')
-        while not e.isNull():
+        for record, item in nodes:
             try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(e)
-                if not item:
-                    raise DiagramParseError('could not identify item for XML node')
                 func = self.importFuncForItem[item]
-                node = func(e)
+                node = func(record)
                 if not node:
                     raise DiagramParseError('could not generate item for XML node')
             except DiagramParseError as err:
-                LOGGER.warning('Failed to create node %s: %s', e.attribute('id'), err)
+                LOGGER.warning('Failed to create node %s: %s', record.id, err)
             except Exception:
-                LOGGER.exception('Failed to create node %s', e.attribute('id'))
+                LOGGER.exception('Failed to create node %s', record.id)
             else:
                 self.diagram.addItem(node)
                 self.diagram.guid.update(node.id)
                 self.nodes[node.id] = node
-            finally:
-                e = e.nextSiblingElement('node')
 
         LOGGER.debug('Loaded nodes: %s', len(self.nodes))
 
-        e = graph.firstChildElement('edge')
-        while not e.isNull():
+        for record in self.document.edges:
             try:
-                QtWidgets.QApplication.processEvents()
-                item = self.itemFromXmlNode(e)
+                item = self.itemFromRecord(record)
                 if not item:
                     raise DiagramParseError('could not identify item for XML node')
                 func = self.importFuncForItem[item]
-                edge = func(e)
+                edge = func(record)
                 if not edge:
                     raise DiagramParseError('could not generate item for XML node')
             except DiagramParseError as err:
-                LOGGER.warning('Failed to create edge %s: %s', e.attribute('id'), err)
+                LOGGER.warning('Failed to create edge %s: %s', record.id, err)
             except Exception:
-                LOGGER.exception('Failed to create edge %s', e.attribute('id'))
+                LOGGER.exception('Failed to create edge %s', record.id)
             else:
                 self.diagram.addItem(edge)
                 self.diagram.guid.update(edge.id)
                 self.edges[edge.id] = edge
-            finally:
-                e = e.nextSiblingElement('edge')
 
         LOGGER.debug('Loaded edges: %s', len(self.edges))
 
+        self.diagram.endBulkLoad()
+
         nodes = [n for n in self.nodes.values() if Identity.Neutral in n.identities()]
         if nodes:
             LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
@@ -703,7 +859,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
 
         connect(self.diagram.sgnItemAdded, self.nproject.doAddItem)
         connect(self.diagram.sgnItemRemoved, self.nproject.doRemoveItem)
-        connect(self.diagram.selectionChanged, self.session.doUpdateState)
+        connect(self.diagram.selectionChanged, self.session.onDiagramSelectionChanged)
 
         self.nproject.addDiagram(self.diagram)
 
@@ -725,13 +881,8 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         """
         Import predicate metadata into the new project.
         """
-        r = self.document.documentElement()
-        g = r.firstChildElement('graph')
-        e = g.firstChildElement('edge')
-        while not e.isNull():
-            QtWidgets.QApplication.processEvents()
-            self.importPredicateMetaFromElement(e)
-            e = e.nextSiblingElement('edge')
+        for record in self.document.edges:
+            self.importPredicateMetaFromRecord(record)
 
         LOGGER.debug('Loaded predicate metadata from original diagram: %s', self.path)
 
@@ -739,44 +890,37 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         """
         Perform geometrical optimizations on the loaded diagram.
         """
-        ## CENTER THE DIAGRAM
-        R1 = self.diagram.sceneRect()
-        R2 = self.diagram.visibleRect(margin=0)
-        moveX = snapF(((R1.right() - R2.right()) - (R2.left() - R1.left())) / 2, Diagram.GridSize)
-        moveY = snapF(((R1.bottom() - R2.bottom()) - (R2.top() - R1.top())) / 2, Diagram.GridSize)
-        if moveX or moveY:
-            collection = [x for x in self.diagram.items() if x.isNode() or x.isEdge()]
-            for item in collection:
-                QtWidgets.QApplication.processEvents()
-                item.moveBy(moveX, moveY)
-            for item in collection:
-                QtWidgets.QApplication.processEvents()
-                item.updateEdgeOrNode()
-        ## RESIZE THE DIAGRAM
-        R3 = self.diagram.visibleRect(margin=20)
-        size = int(max(R3.width(), R3.height(), Diagram.MinSize))
-        self.diagram.setSceneRect(QtCore.QRectF(-size / 2, -size / 2, size, size))
-        LOGGER.debug('Diagram resized: %s -> %s', Diagram.MaxSize, size)
+        QtWidgets.QApplication.processEvents()
+        ## INDEX THE AREA COVERED BY DIAGRAM ELEMENTS
+        index = SpatialIndex()
+        for node in self.nodes.values():
+            index.insert(node.sceneBoundingRect(), node)
+            if node.label and node.label.isVisible():
+                index.insert(node.label.sceneBoundingRect(), node.label)
+        for edge in self.edges.values():
+            # Edges are indexed by sampling their path: this is way more accurate than using
+            # the bounding rect of the whole edge, which is huge for diagonal edges.
+            points = [edge.source.anchor(edge)] + edge.breakpoints + [edge.target.anchor(edge)]
+            for p1, p2 in zip(points[:-1], points[1:]):
+                line = QtCore.QLineF(p1, p2)
+                for i in range(int(math.ceil(line.length() / 10)) + 1):
+                    p = line.pointAt(min(i * 10 / line.length(), 1.0)) if line.length() else p1
+                    index.insert(QtCore.QRectF(p.x() - 1, p.y() - 1, 2, 2), edge)
+            if getattr(edge, 'label', None) and edge.label.isVisible():
+                index.insert(edge.label.sceneBoundingRect(), edge.label)
         ## OPTIMIZE NODE LABEL POSITIONS
-        for node in self.diagram.nodes():
-            QtWidgets.QApplication.processEvents()
-            self.optimizeLabelPos(node)
-        LOGGER.debug('Performed geometrical optimization on %s nodes', len(self.diagram.nodes()))
+        for node in self.nodes.values():
+            self.optimizeLabelPos(node, index)
+        LOGGER.debug('Performed geometrical optimization on %s nodes', len(self.nodes))
 
     def parseDocumentMeta(self):
         """
-        Read metadata from the open QDomDocument, necessary to parse the GraphML diagram structure.
+        Read metadata from the GraphML document, necessary to parse the GraphML diagram structure.
         """
-        QtWidgets.QApplication.processEvents()
-
-        root = self.document.documentElement()
-        key = root.firstChildElement('key')
-        while not key.isNull():
-            if key.attribute('yfiles.type', '') == 'nodegraphics':
-                self.keys['node_key'] = key.attribute('id')
-            if key.attribute('yfiles.type', '') == 'edgegraphics':
-                self.keys['edge_key'] = key.attribute('id')
-            key = key.nextSiblingElement('key')
+        if 'nodegraphics' in self.document.keys:
+            self.keys['node_key'] = self.document.keys['nodegraphics']
+        if 'edgegraphics' in self.document.keys:
+            self.keys['edge_key'] = self.document.keys['edgegraphics']
 
         if not 'node_key' in self.keys:
             raise DiagramNotValidError('could not parse node keys from {0}'.format(self.path))
@@ -790,7 +934,7 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         """
         Merge the loaded project with the one currently loaded in Eddy session.
         """
-        worker = ProjectMergeWorker(self.project, self.nproject, self.session)
+        worker = ProjectMergeWorker(self.project, self.nproject, self.session, self.plan)
         worker.run()
 
     def projectRender(self):
@@ -817,7 +961,8 @@ class GraphMLOntologyLoader(AbstractOntologyLoader):
         """
         Perform ontology import from GraphML file format and merge it with the current project.
         """
-        self.createDomDocument()
+        if self.document is None:
+            self.createDocument()
         self.parseDocumentMeta()
         self.createProject()
         self.createDiagram()
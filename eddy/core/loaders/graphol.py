@@ -67,6 +67,7 @@ from eddy.core.project import K_DESCRIPTION, K_URL
 from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
 from eddy.core.project import K_ASYMMETRIC, K_IRREFLEXIVE, K_REFLEXIVE
 from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
+from eddy.core.trace import Tracer, traced
 
 
 LOGGER = getLogger()
@@ -519,6 +520,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
         name = os.path.basename(self.path)
         name = rstrip(name, File.Graphol.extension)
         self.diagram = Diagram.create(name, size, self.project)
+        self.diagram.beginBulkLoad()
 
         #############################################
         # LOAD NODES
@@ -559,12 +561,19 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
                 self.diagram.addItem(edge)
                 self.diagram.guid.update(edge.id)
                 self.edges[edge.id] = edge
-                edge.updateEdge()
             finally:
                 element = element.nextSiblingElement('edge')
 
         LOGGER.debug('Loaded edges: %s', len(self.edges))
 
+        #############################################
+        # REBUILD THE SCENE INDEX
+        #################################
+
+        self.diagram.endBulkLoad()
+        for edge in self.edges.values():
+            edge.updateEdge()
+
         #############################################
         # IDENTIFY NODES
         #################################
@@ -581,7 +590,7 @@ class GrapholDiagramLoader_v1(AbstractDiagramLoader):
 
         connect(self.diagram.sgnItemAdded, self.project.doAddItem)
         connect(self.diagram.sgnItemRemoved, self.project.doRemoveItem)
-        connect(self.diagram.selectionChanged, self.session.doUpdateState)
+        connect(self.diagram.selectionChanged, self.session.onDiagramSelectionChanged)
 
         LOGGER.debug('Diagram created: %s', self.diagram.name)
 
@@ -1288,6 +1297,7 @@ class GrapholLoaderMixin_v2(object):
     #   ONTOLOGY DIAGRAMS : MAIN IMPORT
     #################################
 
+    @traced(category='load')
     def importDiagram(self, e, i):
         """
         Create a diagram from the given QDomElement.
@@ -1302,6 +1312,7 @@ class GrapholLoaderMixin_v2(object):
         ## CREATE NEW DIAGRAM
         LOGGER.info('Loading diagram: %s', name)
         diagram = Diagram.create(name, size, self.nproject)
+        diagram.beginBulkLoad()
         self.buffer[diagram.name] = dict()
         ## LOAD DIAGRAM NODES
         sube = e.firstChildElement('node')
@@ -1335,16 +1346,19 @@ class GrapholLoaderMixin_v2(object):
                 self.buffer[diagram.name][edge.id] = edge
             finally:
                 sube = sube.nextSiblingElement('edge')
+        ## REBUILD THE SCENE INDEX
+        diagram.endBulkLoad()
         ## IDENTIFY NEUTRAL NODES
         nodes = [x for x in diagram.items(edges=False) if Identity.Neutral in x.identities()]
         if nodes:
             LOGGER.debug('Running identification algorithm for %s nodes', len(nodes))
-            for node in nodes:
-                diagram.sgnNodeIdentification.emit(node)
+            with Tracer.span('identification', 'load', diagram=diagram.name, nodes=len(nodes)):
+                for node in nodes:
+                    diagram.sgnNodeIdentification.emit(node)
         ## CONFIGURE DIAGRAM SIGNALS
         connect(diagram.sgnItemAdded, self.nproject.doAddItem)
         connect(diagram.sgnItemRemoved, self.nproject.doRemoveItem)
-        connect(diagram.selectionChanged, self.session.doUpdateState)
+        connect(diagram.selectionChanged, self.session.onDiagramSelectionChanged)
         ## RETURN GENERATED DIAGRAM
         return diagram
 
@@ -1384,6 +1398,7 @@ class GrapholLoaderMixin_v2(object):
     #   MAIN IMPORT
     #################################
 
+    @traced(category='load')
     def createDiagrams(self):
         """
         Create ontology diagrams by parsing the 'diagrams' section of the QDomDocument.
@@ -1392,10 +1407,16 @@ class GrapholLoaderMixin_v2(object):
         section = self.document.documentElement().firstChildElement('diagrams')
         element = section.firstChildElement('diagram')
         while not element.isNull():
-            self.nproject.addDiagram(self.importDiagram(element, counter))
+            diagram = self.importDiagram(element, counter)
+            name = self.nproject.uniqueName(diagram.name)
+            if name != diagram.name:
+                LOGGER.warning('Diagram name "%s" already in use, renaming diagram to "%s"', diagram.name, name)
+                diagram.name = name
+            self.nproject.addDiagram(diagram)
             element = element.nextSiblingElement('diagram')
             counter += 1
 
+    @traced(category='load')
     def createDomDocument(self):
         """
         Create the QDomDocument from where to parse Project information.
@@ -1410,6 +1431,7 @@ class GrapholLoaderMixin_v2(object):
         if version != 2:
             raise ProjectVersionError('project version mismatch: %s != 2' % version)
 
+    @traced(category='load')
     def createPredicatesMeta(self):
         """
         Create ontology predicate metadata by parsing the 'predicates' section of the QDomDocument.
@@ -1423,6 +1445,7 @@ class GrapholLoaderMixin_v2(object):
                 self.nproject.setMeta(meta[0], meta[1], meta[2])
             element = element.nextSiblingElement('predicate')
 
+    @traced(category='load')
     def createProject(self):
         """
         Create the Project by reading data from the parsed QDomDocument.
@@ -1459,6 +1482,7 @@ class GrapholLoaderMixin_v2(object):
 
         LOGGER.info('Loaded ontology: %s...', self.nproject.name)
 
+    @traced(category='load')
     def projectRender(self):
         """
         Render all the elements in the Project ontology.
@@ -1484,7 +1508,7 @@ class GrapholOntologyLoader_v2(AbstractOntologyLoader, GrapholLoaderMixin_v2):
         """
         Merge the loaded project with the one currently loaded in Eddy session.
         """
-        worker = ProjectMergeWorker(self.project, self.nproject, self.session)
+        worker = ProjectMergeWorker(self.project, self.nproject, self.session, self.plan)
         worker.run()
 
     #############################################
@@ -1499,11 +1523,13 @@ class GrapholOntologyLoader_v2(AbstractOntologyLoader, GrapholLoaderMixin_v2):
         """
         return File.Graphol
 
+    @traced(category='load')
     def run(self):
         """
         Perform ontology import from Graphol file format and merge the loaded ontology with the current project.
         """
-        self.createDomDocument()
+        if self.document is None:
+            self.createDomDocument()
         self.createProject()
         self.createDiagrams()
         self.createPredicatesMeta()
@@ -1553,6 +1579,7 @@ class GrapholProjectLoader_v2(AbstractProjectLoader, GrapholLoaderMixin_v2):
         """
         return File.Graphol
 
+    @traced(category='load')
     def run(self):
         """
         Perform project import.
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from collections import deque
+
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+
+from eddy.core.datatypes.system import File
+from eddy.core.functions.fsystem import fexists, fread
+from eddy.core.functions.owl import OWLText
+from eddy.core.functions.signals import connect
+from eddy.core.graph import Graph
+from eddy.core.loaders.graphml import GraphMLDocument
+from eddy.core.output import getLogger
+from eddy.core.project import K_ASYMMETRIC, K_DESCRIPTION, K_FUNCTIONAL
+from eddy.core.project import K_INVERSE_FUNCTIONAL, K_IRREFLEXIVE, K_REFLEXIVE
+from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE, K_URL
+from eddy.core.project import ProjectMergeWorker
+from eddy.core.project import ProjectNotFoundError
+from eddy.core.project import ProjectNotValidError
+from eddy.core.worker import AbstractWorker
+
+
+LOGGER = getLogger()
+
+
+class OntologyImporter(QtCore.QObject):
+    """
+    Extends QObject with facilities to import multiple ontology files in the current project.
+    Files are parsed concurrently, each one by an OntologyImportWorker running in its own thread (up to
+    MaxThreads workers at the same time), while the construction of the diagrams and the merge with the
+    current project, which need to happen in the main thread, are performed as soon as the parsing of each
+    file completes, following the order in which files have been supplied.
+    """
+    MaxThreads = max(QtCore.QThread.idealThreadCount(), 1)
+
+    sgnFinished = QtCore.pyqtSignal()
+    sgnProgress = QtCore.pyqtSignal(int, int)
+    sgnStarted = QtCore.pyqtSignal(str)
+
+    def __init__(self, filetype, paths, project, session):
+        """
+        Initialize the ontology importer.
+        :type filetype: File
+        :type paths: list
+        :type project: Project
+        :type session: Session
+        """
+        super().__init__(session)
+        self.cancelled = False
+        self.errors = list()
+        self.filetype = filetype
+        self.completed = False
+        self.index = 0
+        self.merging = False
+        self.metas = dict()
+        self.paths = list(paths)
+        self.pending = deque(self.paths)
+        self.predicates = set()
+        self.project = project
+        self.results = dict()
+        self.touched = set()
+        self.workers = dict()
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def session(self):
+        """
+        Returns the reference to the active session (alias for OntologyImporter.parent()).
+        :rtype: Session
+        """
+        return self.parent()
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(str, object, object, object)
+    def onWorkerCompleted(self, path, document, metas, plan):
+        """
+        Executed when a worker completes the parsing of an ontology file.
+        :type path: str
+        :type document: T <= QDomDocument|GraphMLDocument
+        :type metas: dict
+        :type plan: tuple
+        """
+        self.workers.pop(path, None)
+        if not self.cancelled:
+            self.results[path] = (document, metas, plan)
+            self.next()
+
+    @QtCore.pyqtSlot(str, Exception)
+    def onWorkerErrored(self, path, exception):
+        """
+        Executed when a worker fails to parse an ontology file.
+        :type path: str
+        :type exception: Exception
+        """
+        self.workers.pop(path, None)
+        if not self.cancelled:
+            self.results[path] = exception
+            self.next()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def cancel(self):
+        """
+        Cancel the import: files whose merge is not yet started are discarded.
+        """
+        if not self.cancelled:
+            LOGGER.info('Ontology import cancelled: %s file(s) discarded', len(self.paths) - self.index)
+            self.cancelled = True
+            self.pending.clear()
+            self.results.clear()
+            for worker in self.workers.values():
+                worker.cancel()
+            if not self.merging:
+                self.finish()
+
+    def finish(self):
+        """
+        Terminate the import, notifying connected objects.
+        """
+        if not self.completed:
+            self.completed = True
+            self.sgnFinished.emit()
+
+    def merge(self, path, result):
+        """
+        Construct the diagrams of the given parsed file and merge them with the current project.
+        :type path: str
+        :type result: T <= tuple|Exception
+        """
+        if isinstance(result, Exception):
+            LOGGER.error('Failed to parse ontology %s: %s', path, result)
+            self.errors.append((path, result))
+            return
+        document, metas, plan = result
+        self.sgnStarted.emit(path)
+        try:
+            loader = self.session.createOntologyLoader(self.filetype, path, self.project, self.session)
+            loader.document = document
+            loader.plan = self.refreshPlan(metas, plan)
+            loader.run()
+        except Exception as e:
+            LOGGER.exception('Failed to import ontology %s', path)
+            self.errors.append((path, e))
+        else:
+            self.touched.update((x.type(), OWLText(x.text())) for x in loader.nproject.predicates())
+            self.touched.update(loader.nproject.metas())
+
+    def next(self):
+        """
+        Start pending workers and merge, in order, the files whose parsing is completed.
+        """
+        while self.pending and len(self.workers) < self.MaxThreads:
+            path = self.pending.popleft()
+            worker = OntologyImportWorker(self.filetype, path, self.predicates, self.metas)
+            connect(worker.sgnCompleted, self.onWorkerCompleted)
+            connect(worker.sgnErrored, self.onWorkerErrored)
+            self.workers[path] = worker
+            if not self.session.startThread('OntologyImport:{0}:{1}'.format(id(self), path), worker):
+                # THE WORKER COULD NOT BE SCHEDULED: RECORD THE FAILURE SO THE IMPORT DOES NOT WAIT FOR IT
+                self.workers.pop(path, None)
+                self.results[path] = RuntimeError('could not schedule the import worker')
+        # Loaders process pending events while constructing diagrams, hence this may be re-entered
+        # from within a merge: in that case we just start new workers and let the outer call merge.
+        if not self.merging:
+            self.merging = True
+            try:
+                while not self.cancelled and self.index < len(self.paths) and self.paths[self.index] in self.results:
+                    path = self.paths[self.index]
+                    self.merge(path, self.results.pop(path))
+                    self.index += 1
+                    self.sgnProgress.emit(self.index, len(self.paths))
+            finally:
+                self.merging = False
+            if self.cancelled or self.index == len(self.paths):
+                self.finish()
+
+    def refreshPlan(self, metas, plan):
+        """
+        Refresh the given metadata merge plan by classifying again the predicates which have been
+        affected by the files merged since the plan has been computed (i.e: within the same import).
+        :type metas: dict
+        :type plan: tuple
+        :rtype: tuple
+        """
+        if plan is None:
+            return None
+        importing = {k: v for k, v in metas.items() if k in self.touched}
+        if not importing:
+            return plan
+        predicates = {k for k in importing if self.project.predicates(*k)}
+        current = {k: self.project.meta(*k) for k in predicates}
+        unbound, conflicts = ProjectMergeWorker.classifyMeta(predicates, current, importing)
+        return (plan[0] - importing.keys()) | unbound, (plan[1] - importing.keys()) | conflicts
+
+    def start(self):
+        """
+        Start the import.
+        """
+        LOGGER.info('Importing %s ontology file(s) using %s thread(s)', len(self.paths), self.MaxThreads)
+        self.predicates = {(x.type(), OWLText(x.text())) for x in self.project.predicates()}
+        self.metas = {k: dict(self.project.meta(*k)) for k in self.project.metas()}
+        self.next()
+
+
+class OntologyImportWorker(AbstractWorker):
+    """
+    Extends AbstractWorker providing a worker that parses an ontology file outside of the main thread.
+    The worker produces the document used later on to construct the diagrams (a GraphMLDocument streamed
+    from the file for GraphML files, a QDomDocument otherwise) and, for Graphol files, the predicates
+    metadata read from the same document, which are used to precompute the merge plan of the predicates
+    metadata against a snapshot of the current project (see ProjectMergeWorker.classifyMeta).
+    """
+    sgnCompleted = QtCore.pyqtSignal(str, object, object, object)
+    sgnErrored = QtCore.pyqtSignal(str, Exception)
+
+    def __init__(self, filetype, path, predicates, metas):
+        """
+        Initialize the ontology import worker.
+        :type filetype: File
+        :type path: str
+        :type predicates: set
+        :type metas: dict
+        """
+        super().__init__()
+        self.filetype = filetype
+        self.metas = metas
+        self.path = path
+        self.predicates = predicates
+
+    @staticmethod
+    def importMeta(document):
+        """
+        Returns the predicates metadata stored in the given Graphol document, in the same format used by
+        Graph.meta(), as a dict mapping each pair (item, name) to the metadata of the predicate.
+        :type document: QDomDocument
+        :rtype: dict
+        """
+        metas = {}
+        section = document.documentElement().firstChildElement('predicates')
+        e = section.firstChildElement('predicate')
+        while not e.isNull():
+            item = Graph.ItemFromXml.get(e.attribute('type'))
+            if item:
+                meta = {K_DESCRIPTION: e.firstChildElement(K_DESCRIPTION).text(),
+                        K_URL: e.firstChildElement(K_URL).text()}
+                for key in (K_FUNCTIONAL, K_INVERSE_FUNCTIONAL, K_ASYMMETRIC, K_IRREFLEXIVE,
+                            K_REFLEXIVE, K_SYMMETRIC, K_TRANSITIVE):
+                    value = e.firstChildElement(key)
+                    if not value.isNull():
+                        meta[key] = bool(int(value.text()))
+                metas[(item, OWLText(e.attribute('name')))] = meta
+            e = e.nextSiblingElement('predicate')
+        return metas
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        """
+        Main worker.
+        """
+        try:
+            if not fexists(self.path):
+                raise ProjectNotFoundError('missing ontology: %s' % self.path)
+            if self.filetype is File.GraphML:
+                document = GraphMLDocument.fromFile(self.path)
+            else:
+                document = QtXml.QDomDocument()
+                if not document.setContent(fread(self.path)):
+                    raise ProjectNotValidError('invalid ontology supplied: %s' % self.path)
+            metas = plan = None
+            if self.filetype is File.Graphol and not self.cancelled:
+                metas = self.importMeta(document)
+                plan = ProjectMergeWorker.classifyMeta(self.predicates, self.metas, metas)
+        except Exception as e:
+            if not self.cancelled:
+                self.sgnErrored.emit(self.path, e)
+        else:
+            if not self.cancelled:
+                self.sgnCompleted.emit(self.path, document, metas, plan)
+        finally:
+            self.finished.emit()
\ No newline at end of file
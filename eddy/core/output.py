@@ -33,32 +33,178 @@
 ##########################################################################
 
 
-import io
+import os
 import sys
+import time
 import logging
 
+from collections import deque, namedtuple
+from logging.handlers import RotatingFileHandler
 from math import ceil, floor
 from eddy import APPNAME
 
 
+OutputRecord = namedtuple('OutputRecord', 'sequence created levelno levelname message')
+
+
+class OutputBuffer(logging.Handler):
+    """
+    Logging handler which stores records in a bounded in-memory ring buffer.
+    Records are kept as lightweight OutputRecord tuples and once the buffer reaches its capacity the
+    oldest ones are discarded. Each record is assigned a progressive sequence number so that viewers
+    can tell how many records have been discarded. Records can be mirrored on a rotating file on disk.
+    """
+    DefaultCapacity = 10000
+    DefaultFileBackups = 3
+    DefaultFileSize = 1048576
+
+    def __init__(self, capacity=DefaultCapacity, level=logging.NOTSET):
+        """
+        Initialize the output buffer.
+        :type capacity: int
+        :type level: int
+        """
+        super().__init__(level)
+        self.file = None
+        self.records = deque(maxlen=capacity)
+        self.sequence = 0
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def capacity(self):
+        """
+        Returns the maximum number of records kept in the buffer.
+        :rtype: int
+        """
+        return self.records.maxlen
+
+    def clear(self):
+        """
+        Remove all the records from the buffer.
+        """
+        self.acquire()
+        try:
+            self.records.clear()
+        finally:
+            self.release()
+
+    def close(self):
+        """
+        Close the handler, together with the rotating file if any.
+        """
+        self.setFile(None)
+        super().close()
+
+    def discarded(self):
+        """
+        Returns the number of records discarded because the buffer was full.
+        :rtype: int
+        """
+        return self.sequence - len(self.records)
+
+    def emit(self, record):
+        """
+        Store the given record in the buffer.
+        :type record: LogRecord
+        """
+        try:
+            message = record.getMessage()
+            if record.exc_info and not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            if record.exc_text:
+                message = '{0}\n{1}'.format(message, record.exc_text)
+            self.sequence += 1
+            self.records.append(OutputRecord(self.sequence, record.created, record.levelno, record.levelname, message))
+            if self.file:
+                self.file.handle(record)
+        except Exception:
+            self.handleError(record)
+
+    @staticmethod
+    def formatRecord(record):
+        """
+        Returns the given record formatted as a log line.
+        :type record: OutputRecord
+        :rtype: str
+        """
+        created = time.strftime('%Y/%m/%d %H:%M:%S', time.localtime(record.created))
+        return '{0} {1} {2}'.format(created, record.levelname, record.message)
+
+    def setCapacity(self, capacity):
+        """
+        Set the maximum number of records kept in the buffer, discarding the oldest ones if needed.
+        :type capacity: int
+        """
+        self.acquire()
+        try:
+            self.records = deque(self.records, maxlen=max(capacity, 1))
+        finally:
+            self.release()
+
+    def setFile(self, path, size=DefaultFileSize, backups=DefaultFileBackups):
+        """
+        Mirror the records on the file at the given path, rotating it when it reaches the given size.
+        If None is supplied as path, records will be kept in memory only.
+        :type path: str
+        :type size: int
+        :type backups: int
+        """
+        self.acquire()
+        try:
+            if self.file:
+                self.file.close()
+                self.file = None
+            if path:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self.file = RotatingFileHandler(path, maxBytes=size, backupCount=backups, encoding='utf-8', delay=True)
+                self.file.setFormatter(self.formatter)
+        finally:
+            self.release()
+
+    def setFormatter(self, fmt):
+        """
+        Set the formatter used to write records on the rotating file.
+        :type fmt: Formatter
+        """
+        super().setFormatter(fmt)
+        if self.file:
+            self.file.setFormatter(fmt)
+
+    def snapshot(self, level=logging.NOTSET):
+        """
+        Returns a list with the records currently in the buffer having at least the given level.
+        :type level: int
+        :rtype: list
+        """
+        self.acquire()
+        try:
+            if level <= logging.NOTSET:
+                return list(self.records)
+            return [x for x in self.records if x.levelno >= level]
+        finally:
+            self.release()
+
+
 class OutputHandler(logging.Logger):
     """
     Custom logging output handler class.
     """
+    Buffer = OutputBuffer()
     HeadLength = 92
-    Stream = io.StringIO()
 
     #############################################
     #   AUXILIARY METHODS
     #################################
 
     @classmethod
-    def getDefaultStream(cls):
+    def getDefaultBuffer(cls):
         """
-        Returns the default stream for this logger class.
-        :rtype: StringIO
+        Returns the default in-memory buffer for this logger class.
+        :rtype: OutputBuffer
         """
-        return OutputHandler.Stream
+        return OutputHandler.Buffer
 
     #############################################
     #   LOGGING METHODS
@@ -118,8 +264,8 @@ def getLogger(name=APPNAME):
     if not name in __output:
         # CREATE A FORMATTER
         formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s', '%Y/%m/%d %H:%M:%S')
-        # IN-MEMORY STREAM HANDLER
-        handler = logging.StreamHandler(OutputHandler.getDefaultStream())
+        # IN-MEMORY BUFFER HANDLER
+        handler = OutputHandler.getDefaultBuffer()
         handler.setFormatter(formatter)
         logger = logging.getLogger(name)
         logger.setLevel(logging.DEBUG)
@@ -53,6 +53,7 @@ from eddy.core.functions.fsystem import fcopy, fexists, fread, fremove
 from eddy.core.functions.fsystem import isdir, mkdir, rmdir
 from eddy.core.functions.path import expandPath, isSubPath
 from eddy.core.output import getLogger
+from eddy.core.trace import Tracer
 
 
 LOGGER = getLogger()
@@ -426,7 +427,8 @@ class PluginManager(QtCore.QObject):
             if plugin_id not in pluginsLoadedSet:
                 try:
                     LOGGER.info('Loading plugin: %s v%s', plugin_name, plugin_version)
-                    plugin = self.create(entry[1], entry[0])
+                    with Tracer.span('PluginManager.create', 'plugin', plugin=plugin_id):
+                        plugin = self.create(entry[1], entry[0])
                 except Exception:
                     LOGGER.exception('Failed to load plugin: %s v%s', plugin_name, plugin_version)
                 else:
@@ -544,7 +546,8 @@ class PluginManager(QtCore.QObject):
         """
         LOGGER.info('Starting plugin: %s v%s', plugin.name(), plugin.version())
         try:
-            plugin.start()
+            with Tracer.span('PluginManager.start', 'plugin', plugin=plugin.id()):
+                plugin.start()
         except Exception:
             LOGGER.exception('An error occurred while starting plugin: %s v%s', plugin.name(), plugin.version())
             return False
@@ -39,6 +39,7 @@ from PyQt5 import QtCore
 
 from eddy.core.profiles.rules.common import ProfileEdgeRule
 from eddy.core.profiles.rules.common import ProfileNodeRule
+from eddy.core.trace import traced
 
 
 class AbstractProfile(QtCore.QObject):
@@ -97,6 +98,7 @@ class AbstractProfile(QtCore.QObject):
         if issubclass(rule, ProfileNodeRule):
             self._nodeRules.append(rule(*args, **kwargs))
 
+    @traced(category='validation')
     def checkEdge(self, source, edge, target):
         """
         Perform the validation of the given triple (source -> edge -> target):
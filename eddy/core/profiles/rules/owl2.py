@@ -35,7 +35,7 @@
 
 from eddy.core.datatypes.graphol import Identity, Item, Restriction
 from eddy.core.datatypes.owl import Facet
-from eddy.core.functions.graph import bfs
+from eddy.core.functions.graph import closure, K_EXPRESSION, K_INPUT
 from eddy.core.functions.misc import first
 from eddy.core.profiles.common import ProfileError
 from eddy.core.profiles.rules.common import ProfileEdgeRule
@@ -202,9 +202,7 @@ class InclusionBetweenRoleExpressionAndComplementNodeRule(ProfileEdgeRule):
                             # Here we target a Complement node which is still Neutral, but it may be connected
                             # to many other Neutral nodes (operators), therefore we must inspect all the nodes
                             # attached to this target node and see if they admits the Role identity.
-                            f1 = lambda x: x is not edge and x.type() is not Item.MembershipEdge
-                            f2 = lambda x: x.identity() is Identity.Neutral
-                            for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                            for node in closure(target, K_EXPRESSION, exclude=edge):
                                 if Identity.Role not in node.identities():
                                     raise ProfileError('Detected unsupported operator sequence on {}'.format(node.name))
 
@@ -232,9 +230,7 @@ class InclusionBetweenAttributeExpressionAndComplementNodeRule(ProfileEdgeRule):
                             # Here we target a Complement node which is still Neutral, but it may be connected
                             # to many other Neutral nodes (operators), therefore we must inspect all the nodes
                             # attached to this target node and see if they admits the Attribute identity.
-                            f1 = lambda x: x is not edge and x.type() is not Item.MembershipEdge
-                            f2 = lambda x: x.identity() is Identity.Neutral
-                            for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                            for node in closure(target, K_EXPRESSION, exclude=edge):
                                 if Identity.Attribute not in node.identities():
                                     raise ProfileError('Detected unsupported operator sequence on {}'.format(node.name))
 
@@ -312,11 +308,9 @@ class InputToComplementNodeRule(ProfileEdgeRule):
                     # the nodes in this chain, whose souce node is a range restriction node, in which
                     # case our chain will assume the value-domain identity and will then generate a
                     # DataPropertyRange axiom.
-                    f1 = lambda x: x.type() is Item.InputEdge and x is not edge
-                    f2 = lambda x: x.identity() is Identity.Neutral
                     f3 = lambda x: x.type() is Item.InclusionEdge
                     f4 = lambda x: x.type() is Item.InclusionEdge and x.source.type() is not Item.RangeRestrictionNode
-                    for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                    for node in closure(target, K_INPUT, exclude=edge):
                         if node.outgoingNodes(filter_on_edges=f3) or node.incomingNodes(filter_on_edges=f4):
                             raise ProfileError('Type mismatch: inclusion between value-domain expressions')
 
@@ -360,11 +354,9 @@ class InputToIntersectionOrUnionNodeRule(ProfileEdgeRule):
                     # the nodes in this chain, whose souce node is a range restriction node, in which
                     # case our chain will assume the value-domain identity and will then generate a
                     # DataPropertyRange axiom.
-                    f1 = lambda x: x.type() is Item.InputEdge and x is not edge
-                    f2 = lambda x: x.identity() is Identity.Neutral
                     f3 = lambda x: x.type() is Item.InclusionEdge
                     f4 = lambda x: x.type() is Item.InclusionEdge and x.source.type() is not Item.RangeRestrictionNode
-                    for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                    for node in closure(target, K_INPUT, exclude=edge):
                         if node.outgoingNodes(filter_on_edges=f3) or node.incomingNodes(filter_on_edges=f4):
                             raise ProfileError('Type mismatch: inclusion between value-domain expressions')
 
@@ -859,9 +851,7 @@ class MembershipFromRoleInstanceRule(ProfileEdgeRule):
                         # Here we target a Neutral node which is attached to something (either with
                         # inputs or outputs), therefore we must inspect all the nodes attached to this
                         # target node which are still Neutral and see if they admits the Role identity.
-                        f1 = lambda x: x is not edge and x.type() is not Item.MembershipEdge
-                        f2 = lambda x: x.identity() is Identity.Neutral
-                        for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                        for node in closure(target, K_EXPRESSION, exclude=edge):
                             if Identity.Role not in node.identities():
                                 raise ProfileError('Detected unsupported operator sequence on {}'.format(node.name))
 
@@ -891,9 +881,7 @@ class MembershipFromAttributeInstanceRule(ProfileEdgeRule):
                         # Here we target a Neutral node which is attached to something (either with
                         # inputs or outputs), therefore we must inspect all the nodes attached to this
                         # target node which are still Neutral and see if they admits the Attribute identity.
-                        f1 = lambda x: x is not edge and x.type() is not Item.MembershipEdge
-                        f2 = lambda x: x.identity() is Identity.Neutral
-                        for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                        for node in closure(target, K_EXPRESSION, exclude=edge):
                             if Identity.Attribute not in node.identities():
                                 raise ProfileError('Detected unsupported operator sequence on {}'.format(node.name))
 
@@ -930,9 +918,7 @@ class MembershipFromNeutralPropertyAssertionRule(ProfileEdgeRule):
                             # inputs or outputs), therefore we must inspect all the nodes attached to this
                             # target node which are still Neutral and see if they all share an identity among
                             # Role and Attribute.
-                            f1 = lambda x: x is not edge and x.type() is not Item.MembershipEdge
-                            f2 = lambda x: x.identity() is Identity.Neutral
-                            for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                            for node in closure(target, K_EXPRESSION, exclude=edge):
                                 if not {Identity.Attribute, Identity.Role} & node.identities():
                                     raise ProfileError('Detected unsupported operator sequence on {}'.format(node.name))
 
@@ -35,7 +35,7 @@
 
 from eddy.core.datatypes.graphol import Item, Identity, Special
 from eddy.core.datatypes.owl import Datatype, OWLProfile
-from eddy.core.functions.graph import bfs
+from eddy.core.functions.graph import closure, K_OPERATOR
 from eddy.core.profiles.common import ProfileError
 from eddy.core.profiles.rules.common import ProfileNodeRule
 from eddy.core.profiles.rules.common import ProfileEdgeRule
@@ -148,9 +148,7 @@ class InputValueDomainToIntersectionNodeRule(ProfileEdgeRule):
         if edge.type() is Item.InputEdge:
             if target.type() is Item.IntersectionNode:
                 if source.identity() is Identity.ValueDomain:
-                    f1 = lambda x: x.type() in {Item.InputEdge, Item.InclusionEdge, Item.EquivalenceEdge}
-                    f2 = lambda x: Identity.Neutral in x.identities()
-                    for node in bfs(source=target, filter_on_edges=f1, filter_on_nodes=f2):
+                    for node in closure(target, K_OPERATOR):
                         if node.type() is Item.ComplementNode:
                             # We found a complement node along the path, so any input to this intersection node,
                             # would cause the complement node to identify itself as a value-domain, but in OWL 2 QL
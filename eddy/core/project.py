@@ -55,6 +55,7 @@ K_DIAGRAM = 'diagrams'
 K_EDGE = 'edges'
 K_ITEMS = 'items'
 K_META = 'meta'
+K_NAMES = 'names'
 K_NODE = 'nodes'
 K_PREDICATE = 'predicates'
 K_TYPE = 'types'
@@ -89,18 +90,22 @@ class Project(QtCore.QObject):
 
     * sgnDiagramAdded: whenever a Diagram is added to the Project.
     * sgnDiagramRemoved: whenever a Diagram is removed from the Project.
+    * sgnDiagramRenamed: whenever a Diagram is renamed (with the Diagram previous name).
     * sgnItemAdded: whenever an item is added to the Project.
     * sgnItemRemoved: whenever an item is removed from the Project.
     * sgnMetaAdded: whenever predicate metadata are added to the Project.
     * sgnMetaRemoved: whenever predicate metadata are removed from the Project.
+    * sgnPredicatesRenamed: whenever predicate nodes are renamed (with a node -> previous text dict).
     * sgnUpdated: whenever the Project is updated in any of its parts.
     """
     sgnDiagramAdded = QtCore.pyqtSignal('QGraphicsScene')
     sgnDiagramRemoved = QtCore.pyqtSignal('QGraphicsScene')
+    sgnDiagramRenamed = QtCore.pyqtSignal('QGraphicsScene', str)
     sgnItemAdded = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
     sgnItemRemoved = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
     sgnMetaAdded = QtCore.pyqtSignal(Item, str)
     sgnMetaRemoved = QtCore.pyqtSignal(Item, str)
+    sgnPredicatesRenamed = QtCore.pyqtSignal(dict)
     sgnUpdated = QtCore.pyqtSignal()
 
     def __init__(self, **kwargs):
@@ -136,17 +141,22 @@ class Project(QtCore.QObject):
     def addDiagram(self, diagram):
         """
         Add the given diagram to the Project, together with all its items.
+        Returns False if the diagram is already in the Project or if its name is already in use
+        by another diagram of the Project (see uniqueName()).
         :type diagram: Diagram
+        :rtype: bool
         """
-        if self.index.addDiagram(diagram):
-            self.sgnDiagramAdded.emit(diagram)
-            for item in diagram.items():
-                if item.isNode() or item.isEdge():
-                    diagram.sgnItemAdded.emit(diagram, item)
+        if not self.index.addDiagram(diagram):
+            return False
+        self.sgnDiagramAdded.emit(diagram)
+        for item in diagram.items():
+            if item.isNode() or item.isEdge():
+                diagram.sgnItemAdded.emit(diagram, item)
+        return True
 
     def diagram(self, did):
         """
-        Returns the diagram matching the given id or None if no diagram is found.
+        Returns the diagram matching the given id (or name) or None if no diagram is found.
         :type did: str
         :rtype: Diagram
         """
@@ -268,6 +278,41 @@ class Project(QtCore.QObject):
         """
         return self.index.predicates(item, name, diagram)
 
+    def renameDiagram(self, diagram, name):
+        """
+        Rename the given diagram.
+        Returns False if the given name is already in use by another diagram of the Project.
+        :type diagram: Diagram
+        :type name: str
+        :rtype: bool
+        """
+        previous = diagram.name
+        if not self.index.renameDiagram(diagram, name):
+            return False
+        if previous != name:
+            self.sgnDiagramRenamed.emit(diagram, previous)
+        return True
+
+    def renamePredicates(self, renames):
+        """
+        Rename the given predicate nodes, expressed as a dict mapping each node to its new text.
+        Differently from removing each node from the index and adding it back with its new text,
+        the index is re-keyed in a single pass and a single sgnPredicatesRenamed signal is emitted.
+        Metadata of predicates whose occurrences are all renamed are moved under the new name.
+        Returns a dict mapping the renamed nodes to their previous text.
+        :type renames: dict
+        :rtype: dict
+        """
+        renamed = dict()
+        for node, text in renames.items():
+            if node.text() != text:
+                renamed[node] = node.text()
+                node.setText(text)
+        if renamed:
+            self.index.renamePredicates(renamed)
+            self.sgnPredicatesRenamed.emit(renamed)
+        return renamed
+
     def removeDiagram(self, diagram):
         """
         Remove the given diagram from the project index, together with all its items.
@@ -288,6 +333,15 @@ class Project(QtCore.QObject):
         if self.index.setMeta(item, name, meta):
             self.sgnMetaAdded.emit(item, name)
 
+    def uniqueName(self, name, reserved=None):
+        """
+        Returns a diagram name, derived from the given one, which is not in use by any diagram of the Project.
+        :type name: str
+        :type reserved: set
+        :rtype: str
+        """
+        return self.index.uniqueName(name, reserved)
+
     def unsetMeta(self, item, name):
         """
         Remove metadata for the given predicate type/name combination.
@@ -332,9 +386,11 @@ class ProjectIndex(dict):
         Initialize the Project Index.
         """
         super().__init__(self)
+        self.occurrences = dict()
         self[K_DIAGRAM] = dict()
         self[K_EDGE] = dict()
         self[K_ITEMS] = dict()
+        self[K_NAMES] = dict()
         self[K_NODE] = dict()
         self[K_PREDICATE] = dict()
         self[K_TYPE] = dict()
@@ -342,11 +398,14 @@ class ProjectIndex(dict):
     def addDiagram(self, diagram):
         """
         Add the given diagram to the Project index.
+        Diagrams are indexed using their immutable id: the name of the diagram is indexed separately
+        and the diagram is not added if its name is already in use by another diagram.
         :type diagram: Diagram
         :rtype: bool
         """
-        if diagram.name not in self[K_DIAGRAM]:
-            self[K_DIAGRAM][diagram.name] = diagram
+        if diagram.id not in self[K_DIAGRAM] and diagram.name not in self[K_NAMES]:
+            self[K_DIAGRAM][diagram.id] = diagram
+            self[K_NAMES][diagram.name] = diagram
             return True
         return False
 
@@ -358,45 +417,45 @@ class ProjectIndex(dict):
         :rtype: bool
         """
         i = item.type()
-        if diagram.name not in self[K_ITEMS]:
-            self[K_ITEMS][diagram.name] = dict()
-        if item.id not in self[K_ITEMS][diagram.name]:
-            self[K_ITEMS][diagram.name][item.id] = item
-            if diagram.name not in self[K_TYPE]:
-                self[K_TYPE][diagram.name] = dict()
-            if i not in self[K_TYPE][diagram.name]:
-                self[K_TYPE][diagram.name][i] = set()
-            self[K_TYPE][diagram.name][i] |= {item}
+        if diagram.id not in self[K_ITEMS]:
+            self[K_ITEMS][diagram.id] = dict()
+        if item.id not in self[K_ITEMS][diagram.id]:
+            self[K_ITEMS][diagram.id][item.id] = item
+            if diagram.id not in self[K_TYPE]:
+                self[K_TYPE][diagram.id] = dict()
+            if i not in self[K_TYPE][diagram.id]:
+                self[K_TYPE][diagram.id][i] = set()
+            self[K_TYPE][diagram.id][i] |= {item}
             if item.isNode():
-                if diagram.name not in self[K_NODE]:
-                    self[K_NODE][diagram.name] = dict()
-                self[K_NODE][diagram.name][item.id] = item
+                if diagram.id not in self[K_NODE]:
+                    self[K_NODE][diagram.id] = dict()
+                self[K_NODE][diagram.id][item.id] = item
                 if item.isPredicate():
                     k = OWLText(item.text())
                     if i not in self[K_PREDICATE]:
                         self[K_PREDICATE][i] = dict()
                     if k not in self[K_PREDICATE][i]:
                         self[K_PREDICATE][i][k] = {K_NODE: dict()}
-                    if diagram.name not in self[K_PREDICATE][i][k][K_NODE]:
-                        self[K_PREDICATE][i][k][K_NODE][diagram.name] = set()
-                    self[K_PREDICATE][i][k][K_NODE][diagram.name] |= {item}
+                    if diagram.id not in self[K_PREDICATE][i][k][K_NODE]:
+                        self[K_PREDICATE][i][k][K_NODE][diagram.id] = set()
+                    self[K_PREDICATE][i][k][K_NODE][diagram.id] |= {item}
             if item.isEdge():
-                if diagram.name not in self[K_EDGE]:
-                    self[K_EDGE][diagram.name] = dict()
-                self[K_EDGE][diagram.name][item.id] = item
+                if diagram.id not in self[K_EDGE]:
+                    self[K_EDGE][diagram.id] = dict()
+                self[K_EDGE][diagram.id][item.id] = item
             return True
         return False
 
     def diagram(self, did):
         """
-        Retrieves a diagram given its id.
+        Retrieves a diagram given its id or its name.
         :type did: str
         :rtype: Diagram
         """
         try:
             return self[K_DIAGRAM][did]
         except KeyError:
-            return None
+            return self[K_NAMES].get(did, None)
 
     def diagrams(self):
         """
@@ -413,7 +472,7 @@ class ProjectIndex(dict):
         :rtype: AbstractEdge
         """
         try:
-            return self[K_EDGE][diagram.name][eid]
+            return self[K_EDGE][diagram.id][eid]
         except KeyError:
             return None
 
@@ -427,7 +486,7 @@ class ProjectIndex(dict):
         try:
             if not diagram:
                 return set.union(*(set(self[K_EDGE][i].values()) for i in self[K_EDGE]))
-            return set(self[K_EDGE][diagram.name].values())
+            return set(self[K_EDGE][diagram.id].values())
         except (KeyError, TypeError):
             return set()
 
@@ -449,7 +508,7 @@ class ProjectIndex(dict):
         :rtype: AbstractItem
         """
         try:
-            return self[K_ITEMS][diagram.name][iid]
+            return self[K_ITEMS][diagram.id][iid]
         except KeyError:
             return None
 
@@ -465,7 +524,7 @@ class ProjectIndex(dict):
             subdict = self[K_TYPE]
             if not diagram:
                 return len(set.union(*(subdict[i][item] for i in subdict if item in subdict[i])))
-            return len(subdict[diagram.name][item])
+            return len(subdict[diagram.id][item])
         except (KeyError, TypeError):
             return 0
 
@@ -479,7 +538,7 @@ class ProjectIndex(dict):
         try:
             if not diagram:
                 return set.union(*(set(self[K_ITEMS][i].values()) for i in self[K_ITEMS]))
-            return set(self[K_ITEMS][diagram.name].values())
+            return set(self[K_ITEMS][diagram.id].values())
         except (KeyError, TypeError):
             return set()
 
@@ -515,7 +574,7 @@ class ProjectIndex(dict):
         :rtype: AbstractNode
         """
         try:
-            return self[K_EDGE][diagram.name][nid]
+            return self[K_NODE][diagram.id][nid]
         except KeyError:
             return None
 
@@ -529,7 +588,7 @@ class ProjectIndex(dict):
         try:
             if not diagram:
                 return set.union(*(set(self[K_NODE][i].values()) for i in self[K_NODE]))
-            return set(self[K_NODE][diagram.name].values())
+            return set(self[K_NODE][diagram.id].values())
         except (KeyError, TypeError):
             return set()
 
@@ -545,7 +604,7 @@ class ProjectIndex(dict):
             subdict = self[K_PREDICATE]
             if not diagram:
                 return len(subdict[item])
-            return len({i for i in subdict[item] if diagram.name in subdict[item][i][K_NODE]})
+            return len({i for i in subdict[item] if diagram.id in subdict[item][i][K_NODE]})
         except (KeyError, TypeError):
             return 0
     
@@ -569,7 +628,7 @@ class ProjectIndex(dict):
                 else:
                     for i in self[K_PREDICATE]:
                         for j in self[K_PREDICATE][i]:
-                            collection.update(self[K_PREDICATE][i][j][K_NODE][diagram.name])
+                            collection.update(self[K_PREDICATE][i][j][K_NODE][diagram.id])
                 return collection
 
             if item and not name:
@@ -579,7 +638,7 @@ class ProjectIndex(dict):
                         collection.update(*self[K_PREDICATE][item][i][K_NODE].values())
                 else:
                     for i in self[K_PREDICATE][item]:
-                        collection.update(self[K_PREDICATE][item][i][K_NODE][diagram.name])
+                        collection.update(self[K_PREDICATE][item][i][K_NODE][diagram.id])
                 return collection
 
             if not item and name:
@@ -590,14 +649,14 @@ class ProjectIndex(dict):
                         collection.update(*self[K_PREDICATE][i][name][K_NODE].values())
                 else:
                     for i in self[K_PREDICATE]:
-                        collection.update(self[K_PREDICATE][i][name][K_NODE][diagram.name])
+                        collection.update(self[K_PREDICATE][i][name][K_NODE][diagram.id])
                 return collection
 
             if item and name:
                 name = OWLText(name)
                 if not diagram:
                     return set.union(*self[K_PREDICATE][item][name][K_NODE].values())
-                return self[K_PREDICATE][item][name][K_NODE][diagram.name]
+                return self[K_PREDICATE][item][name][K_NODE][diagram.id]
 
         except KeyError:
             return set()
@@ -608,8 +667,10 @@ class ProjectIndex(dict):
         :type diagram: Diagram
         :rtype: bool
         """
-        if diagram.name in self[K_DIAGRAM]:
-            del self[K_DIAGRAM][diagram.name]
+        if diagram.id in self[K_DIAGRAM]:
+            del self[K_DIAGRAM][diagram.id]
+            if self[K_NAMES].get(diagram.name) is diagram:
+                del self[K_NAMES][diagram.name]
             return True
         return False
 
@@ -621,45 +682,111 @@ class ProjectIndex(dict):
         :rtype: bool
         """
         i = item.type()
-        if diagram.name in self[K_ITEMS]:
-            if item.id in self[K_ITEMS][diagram.name]:
-                del self[K_ITEMS][diagram.name][item.id]
-                if not self[K_ITEMS][diagram.name]:
-                    del self[K_ITEMS][diagram.name]
-            if diagram.name in self[K_TYPE]:
-                if i in self[K_TYPE][diagram.name]:
-                    self[K_TYPE][diagram.name][i] -= {item}
-                    if not self[K_TYPE][diagram.name][i]:
-                        del self[K_TYPE][diagram.name][i]
-                        if not self[K_TYPE][diagram.name]:
-                            del self[K_TYPE][diagram.name]
+        if diagram.id in self[K_ITEMS]:
+            if item.id in self[K_ITEMS][diagram.id]:
+                del self[K_ITEMS][diagram.id][item.id]
+                if not self[K_ITEMS][diagram.id]:
+                    del self[K_ITEMS][diagram.id]
+            if diagram.id in self[K_TYPE]:
+                if i in self[K_TYPE][diagram.id]:
+                    self[K_TYPE][diagram.id][i] -= {item}
+                    if not self[K_TYPE][diagram.id][i]:
+                        del self[K_TYPE][diagram.id][i]
+                        if not self[K_TYPE][diagram.id]:
+                            del self[K_TYPE][diagram.id]
             if item.isNode():
-                if diagram.name in self[K_NODE]:
-                    if item.id in self[K_NODE][diagram.name]:
-                        del self[K_NODE][diagram.name][item.id]
-                        if not self[K_NODE][diagram.name]:
-                            del self[K_NODE][diagram.name]
+                if diagram.id in self[K_NODE]:
+                    if item.id in self[K_NODE][diagram.id]:
+                        del self[K_NODE][diagram.id][item.id]
+                        if not self[K_NODE][diagram.id]:
+                            del self[K_NODE][diagram.id]
                 if item.isPredicate():
                     k = OWLText(item.text())
                     if i in self[K_PREDICATE]:
                         if k in self[K_PREDICATE][i]:
-                            if diagram.name in self[K_PREDICATE][i][k][K_NODE]:
-                                self[K_PREDICATE][i][k][K_NODE][diagram.name] -= {item}
-                                if not self[K_PREDICATE][i][k][K_NODE][diagram.name]:
-                                    del self[K_PREDICATE][i][k][K_NODE][diagram.name]
+                            if diagram.id in self[K_PREDICATE][i][k][K_NODE]:
+                                self[K_PREDICATE][i][k][K_NODE][diagram.id] -= {item}
+                                if not self[K_PREDICATE][i][k][K_NODE][diagram.id]:
+                                    del self[K_PREDICATE][i][k][K_NODE][diagram.id]
                                     if not self[K_PREDICATE][i][k][K_NODE]:
                                         del self[K_PREDICATE][i][k]
                                         if not self[K_PREDICATE][i]:
                                             del self[K_PREDICATE][i]
             if item.isEdge():
-                if diagram.name in self[K_EDGE]:
-                    if item.id in self[K_EDGE][diagram.name]:
-                        del self[K_EDGE][diagram.name][item.id]
-                        if not self[K_EDGE][diagram.name]:
-                            del self[K_EDGE][diagram.name]
+                if diagram.id in self[K_EDGE]:
+                    if item.id in self[K_EDGE][diagram.id]:
+                        del self[K_EDGE][diagram.id][item.id]
+                        if not self[K_EDGE][diagram.id]:
+                            del self[K_EDGE][diagram.id]
             return True
         return False
                 
+    def renameDiagram(self, diagram, name):
+        """
+        Rename the given diagram: since diagrams are indexed using their id, only the name index is updated.
+        Returns False if the given name is already in use by another diagram.
+        :type diagram: Diagram
+        :type name: str
+        :rtype: bool
+        """
+        if self[K_NAMES].get(name, diagram) is not diagram:
+            return False
+        if self[K_NAMES].get(diagram.name) is diagram:
+            del self[K_NAMES][diagram.name]
+            self[K_NAMES][name] = diagram
+        diagram.name = name
+        return True
+
+    def renamePredicates(self, renamed):
+        """
+        Move the given predicate nodes, whose text has already been changed, under their new
+        name in the Project index. The renamed nodes are supplied as a dict mapping each node
+        to its previous text. Metadata of predicates whose nodes are all renamed are moved
+        under the new name, while they are kept if only some of the nodes are renamed.
+        When the new name already has metadata the two are merged, keeping the existing values.
+        :type renamed: dict
+        """
+        moves = dict()
+        for node, text in renamed.items():
+            i = node.type()
+            k1 = OWLText(text)
+            k2 = OWLText(node.text())
+            if k1 != k2 and k1 in self[K_PREDICATE].get(i, {}):
+                moves.setdefault((i, k1), []).append((node, k2))
+
+        # DETACH METADATA BEFORE MOVING NODES AROUND
+        metas = dict()
+        for (i, k1), nodes in moves.items():
+            entry = self[K_PREDICATE][i][k1]
+            total = sum(len(x) for x in entry[K_NODE].values())
+            metas[(i, k1)] = entry.pop(K_META, None), total == len(nodes), nodes[0][1]
+
+        # MOVE NODES UNDER THEIR NEW NAME
+        for (i, k1), nodes in moves.items():
+            for node, k2 in nodes:
+                d = node.diagram.id
+                source = self[K_PREDICATE][i][k1][K_NODE]
+                if d in source:
+                    source[d] -= {node}
+                    if not source[d]:
+                        del source[d]
+                if k2 not in self[K_PREDICATE][i]:
+                    self[K_PREDICATE][i][k2] = {K_NODE: dict()}
+                if d not in self[K_PREDICATE][i][k2][K_NODE]:
+                    self[K_PREDICATE][i][k2][K_NODE][d] = set()
+                self[K_PREDICATE][i][k2][K_NODE][d] |= {node}
+
+        # REATTACH METADATA AND DROP PREDICATES WITH NO NODES LEFT
+        for (i, k1), (meta, moved, k2) in metas.items():
+            if meta:
+                entry = self[K_PREDICATE][i][k2 if moved else k1]
+                merged = dict(meta)
+                merged.update(entry.get(K_META) or {})
+                entry[K_META] = merged
+        for i, k1 in moves:
+            if not self[K_PREDICATE][i][k1][K_NODE]:
+                del self[K_PREDICATE][i][k1]
+
     def setMeta(self, item, name, meta):
         """
         Set metadata for the given predicate type/name combination.
@@ -676,6 +803,26 @@ class ProjectIndex(dict):
         else:
             return True
 
+    def uniqueName(self, name, reserved=None):
+        """
+        Returns a diagram name, derived from the given one, which is not in use by any diagram in the Project index,
+        nor contained in the given set of reserved names (i.e: names picked for diagrams not added yet).
+        The last suffix assigned to each name is remembered, so that repeated collisions on the same name
+        (i.e: when importing the same ontology multiple times) do not need to probe all the suffixes already in use.
+        :type name: str
+        :type reserved: set
+        :rtype: str
+        """
+        reserved = reserved or set()
+        unique = name
+        occurrence = self.occurrences.get(name, 0)
+        while unique in self[K_NAMES] or unique in reserved:
+            occurrence += 1
+            unique = '{0}_{1}'.format(name, occurrence)
+        if occurrence:
+            self.occurrences[name] = occurrence
+        return unique
+
     def unsetMeta(self, item, name):
         """
         Unset metadata for the given predicate type/name combination.
@@ -696,17 +843,19 @@ class ProjectMergeWorker(QtCore.QObject):
     """
     Extends QObject with facilities to merge the content of 2 distinct projects.
     """
-    def __init__(self, project, other, session):
+    def __init__(self, project, other, session, plan=None):
         """
         Initialize the project merge worker.
         :type project: Project
         :type other: Project
         :type session: Session
+        :type plan: tuple
         """
         super().__init__(session)
         self.commands = list()
         self.project = project
         self.other = other
+        self.plan = plan
 
     #############################################
     #   PROPERTIES
@@ -724,20 +873,45 @@ class ProjectMergeWorker(QtCore.QObject):
     #   INTERFACE
     #################################
 
+    @staticmethod
+    def classifyMeta(predicates, current, importing):
+        """
+        Classify the predicate metadata being imported with respect to the metadata of the current project.
+        Returns a pair of sets (unbound, conflicts): the first one holds the predicates having no occurrence
+        in the current project, whose metadata can be imported straight away, while the second one holds the
+        predicates whose metadata differ from the current ones. Predicates appearing in neither of the sets
+        carry the same metadata in both projects. Because the classification operates on plain snapshots
+        of the projects, it can be safely computed outside of the main thread.
+        :type predicates: set
+        :type current: dict
+        :type importing: dict
+        :rtype: tuple
+        """
+        unbound = set()
+        conflicts = set()
+        for key, meta in importing.items():
+            if key not in predicates:
+                unbound.add(key)
+            elif current.get(key, dict()) != meta:
+                conflicts.add(key)
+        return unbound, conflicts
+
     def mergeDiagrams(self):
         """
         Perform the merge of the diagrams by importing all the diagrams in the 'other' project in the loaded one.
         """
+        reserved = set()
         for diagram in self.other.diagrams():
             # We may be in the situation in which we are importing a diagram with name 'X'
             # even though we already have a diagram 'X' in our project. Because we do not
-            # want to overwrite diagrams, we perform a rename of the diagram being imported,
-            # to be sure to have a unique diagram name, in the current project namespace.
-            occurrence = 1
-            name = diagram.name
-            while self.project.diagram(diagram.name):
-                diagram.name = '{0}_{1}'.format(name, occurrence)
-                occurrence += 1
+            # want to overwrite diagrams, the diagram being imported is given a unique name
+            # in the current project namespace, also avoiding names picked for the other
+            # diagrams being imported, since those are added only when the commands run.
+            name = self.project.uniqueName(diagram.name, reserved)
+            if name != diagram.name:
+                LOGGER.info('Importing diagram "%s" as "%s": name already in use', diagram.name, name)
+                diagram.name = name
+            reserved.add(name)
             ## SWITCH SIGNAL SLOTS
             disconnect(diagram.sgnItemAdded, self.other.doAddItem)
             disconnect(diagram.sgnItemRemoved, self.other.doRemoveItem)
@@ -753,23 +927,29 @@ class ProjectMergeWorker(QtCore.QObject):
         conflicts = dict()
         resolutions = dict()
 
+        if self.plan is None:
+            importing = {(item, name): self.other.meta(item, name) for item, name in self.other.metas()}
+            predicates = {key for key in importing if self.project.predicates(*key)}
+            current = {key: self.project.meta(*key) for key in predicates}
+            self.plan = self.classifyMeta(predicates, current, importing)
+
+        unbound, conflicting = self.plan
         for item, name in self.other.metas():
-            if not self.project.predicates(item, name):
+            if (item, name) in unbound:
                 ## NO PREDICATE => NO CONFLICT
                 undo = self.project.meta(item, name).copy()
                 redo = self.other.meta(item, name).copy()
                 self.commands.append(CommandNodeSetMeta(self.project, item, name, undo, redo))
-            else:
-                ## CHECK FOR POSSIBLE CONFLICTS
+            elif (item, name) in conflicting:
+                ## COLLECT CONFLICTS
                 metac = self.project.meta(item, name)
                 metai = self.other.meta(item, name)
-                if metac != metai:
-                    if item not in conflicts:
-                        conflicts[item] = dict()
-                    conflicts[item][name] = {K_CURRENT: metac.copy(), K_IMPORTING: metai.copy()}
-                    if item not in resolutions:
-                        resolutions[item] = dict()
-                    resolutions[item][name] = metac.copy()
+                if item not in conflicts:
+                    conflicts[item] = dict()
+                conflicts[item][name] = {K_CURRENT: metac.copy(), K_IMPORTING: metai.copy()}
+                if item not in resolutions:
+                    resolutions[item] = dict()
+                resolutions[item][name] = metac.copy()
 
         ## RESOLVE CONFLICTS
         aconflicts = []
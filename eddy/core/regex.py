@@ -49,4 +49,5 @@ RE_OWL_ONTOLOGY_FUNCTIONAL_TAG = re.compile("""^Ontology\s*\(.*$""") # identify
 RE_OWL_ONTOLOGY_MANCHESTER_TAG = re.compile("""^Ontology:\s*.*$""") # identify OWL ontology tag in Mancherster OWL
 RE_OWL_ONTOLOGY_TURTLE_TAG = re.compile("""^.*owl:Ontology.*$""") # identify OWL ontology tag in Turtle OWL
 RE_VALUE = re.compile("""^"(?P<value>.*)"\^\^(?P<datatype>.*)$""") # tokenize string into literal + datatype
-RE_VALUE_RESTRICTION = re.compile("""^(?P<facet>.*)\s*"(?P<value>.*)"\^\^(?P<datatype>.*)$""") # tokenize value restriction
\ No newline at end of file
+RE_VALUE_RESTRICTION = re.compile("""^(?P<facet>.*)\s*"(?P<value>.*)"\^\^(?P<datatype>.*)$""") # tokenize value restriction
+RE_WORD = re.compile("""\w+""") # tokenize text into words
\ No newline at end of file
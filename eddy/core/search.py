@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+
+from PyQt5 import QtCore
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.owl import OWLText
+from eddy.core.functions.signals import connect, disconnect
+from eddy.core.project import K_DESCRIPTION
+from eddy.core.regex import RE_WORD
+
+
+class PredicateSearchIndex(QtCore.QObject):
+    """
+    Extends QtCore.QObject implementing a search index over the predicates of a project.
+    Predicates are identified by the pair (item, name), where name is the OWL text of the
+    predicate, and they can be looked up by name (exact, prefix, infix and fuzzy matching)
+    and by the words of their description. The index is built once from the project and
+    then kept up to date using the signals emitted by the project itself:
+
+    * predicate names are stored in a sorted list (prefix lookup by bisection)
+    * name trigrams are mapped to the predicates containing them (infix and fuzzy lookup)
+    * description words are stored in a sorted list mapping them to the described predicates
+    """
+    ScoreExact = 1.0
+    ScorePrefix = 0.8
+    ScoreWordPrefix = 0.7
+    ScoreInfix = 0.6
+    ScoreDescription = 0.4
+    ScoreFuzzy = 0.3
+
+    FuzzyCandidates = 10
+    FuzzyThreshold = 0.4
+
+    def __init__(self, project, parent=None):
+        """
+        Initialize the search index.
+        :type project: Project
+        :type parent: QtCore.QObject
+        """
+        super().__init__(parent)
+        self.project = project
+        self.descriptions = dict()
+        self.grams = defaultdict(set)
+        self.names = []
+        self.occurrences = Counter()
+        self.wordIndex = defaultdict(set)
+        self.words = []
+        self.reset()
+        connect(self.project.sgnItemAdded, self.doAddItem)
+        connect(self.project.sgnItemRemoved, self.doRemoveItem)
+        connect(self.project.sgnMetaAdded, self.doUpdateMeta)
+        connect(self.project.sgnMetaRemoved, self.doUpdateMeta)
+        connect(self.project.sgnPredicatesRenamed, self.doRenamePredicates)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def doAddItem(self, diagram, item):
+        """
+        Executed whenever an item is added to the project.
+        :type diagram: Diagram
+        :type item: AbstractItem
+        """
+        if item.isNode() and item.isPredicate():
+            self.addKey(self.keyFor(item))
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def doRemoveItem(self, diagram, item):
+        """
+        Executed whenever an item is removed from the project.
+        :type diagram: Diagram
+        :type item: AbstractItem
+        """
+        if item.isNode() and item.isPredicate():
+            self.removeKey(self.keyFor(item))
+
+    @QtCore.pyqtSlot(dict)
+    def doRenamePredicates(self, renamed):
+        """
+        Executed whenever predicate nodes are renamed in the project.
+        :type renamed: dict
+        """
+        keys = set()
+        for node, text in renamed.items():
+            key = self.keyFor(node)
+            self.removeKey((node.type(), OWLText(text)))
+            self.addKey(key)
+            keys.add(key)
+        # METADATA MAY HAVE BEEN MOVED UNDER THE NEW NAMES
+        for key in keys & self.occurrences.keys():
+            self.unindexDescription(key)
+            self.indexDescription(key)
+
+    @QtCore.pyqtSlot(Item, str)
+    def doUpdateMeta(self, item, name):
+        """
+        Executed whenever the metadata of a predicate are added or removed.
+        :type item: Item
+        :type name: str
+        """
+        key = (item, OWLText(name))
+        if key in self.occurrences:
+            self.unindexDescription(key)
+            self.indexDescription(key)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addKey(self, key):
+        """
+        Record an occurrence of the predicate identified by the given key.
+        :type key: tuple
+        """
+        self.occurrences[key] += 1
+        if self.occurrences[key] == 1:
+            insort(self.names, (key[1].lower(), key[1], key[0]))
+            for gram in self.trigrams(key[1]):
+                self.grams[gram].add(key)
+            self.indexDescription(key)
+
+    def dispose(self):
+        """
+        Disconnect the index from the project.
+        """
+        disconnect(self.project.sgnItemAdded, self.doAddItem)
+        disconnect(self.project.sgnItemRemoved, self.doRemoveItem)
+        disconnect(self.project.sgnMetaAdded, self.doUpdateMeta)
+        disconnect(self.project.sgnMetaRemoved, self.doUpdateMeta)
+        disconnect(self.project.sgnPredicatesRenamed, self.doRenamePredicates)
+
+    def indexDescription(self, key):
+        """
+        Index the words of the description of the predicate identified by the given key.
+        :type key: tuple
+        """
+        words = self.wordsFor(key)
+        if words:
+            self.descriptions[key] = words
+            for word in words:
+                if not self.wordIndex[word]:
+                    insort(self.words, word)
+                self.wordIndex[word].add(key)
+
+    @staticmethod
+    def keyFor(node):
+        """
+        Returns the key identifying the predicate of the given node.
+        :type node: AbstractNode
+        :rtype: tuple
+        """
+        return node.type(), OWLText(node.text())
+
+    @staticmethod
+    def ranked(scores, limit):
+        """
+        Returns the given scored predicates as a list of at most 'limit' triples (item, name, score),
+        sorted by decreasing score and then alphabetically.
+        :type scores: dict
+        :type limit: int
+        :rtype: list
+        """
+        results = sorted(scores.items(), key=lambda x: (-x[1], x[0][1].lower(), x[0][1]))
+        return [(k[0], k[1], v) for k, v in results[:limit]]
+
+    def removeKey(self, key):
+        """
+        Discard an occurrence of the predicate identified by the given key.
+        :type key: tuple
+        """
+        if key in self.occurrences:
+            self.occurrences[key] -= 1
+            if self.occurrences[key] <= 0:
+                del self.occurrences[key]
+                entry = (key[1].lower(), key[1], key[0])
+                index = bisect_left(self.names, entry)
+                if index < len(self.names) and self.names[index] == entry:
+                    del self.names[index]
+                for gram in self.trigrams(key[1]):
+                    self.grams[gram].discard(key)
+                    if not self.grams[gram]:
+                        del self.grams[gram]
+                self.unindexDescription(key)
+
+    def reset(self):
+        """
+        Rebuild the index from scratch using the content of the project.
+        """
+        self.descriptions = dict()
+        self.grams = defaultdict(set)
+        self.occurrences = Counter(self.keyFor(x) for x in self.project.predicates())
+        self.wordIndex = defaultdict(set)
+        for key in self.occurrences:
+            for gram in self.trigrams(key[1]):
+                self.grams[gram].add(key)
+            words = self.wordsFor(key)
+            if words:
+                self.descriptions[key] = words
+                for word in words:
+                    self.wordIndex[word].add(key)
+        self.names = sorted((key[1].lower(), key[1], key[0]) for key in self.occurrences)
+        self.words = sorted(self.wordIndex)
+
+    def search(self, text, limit=50, fuzzy=True):
+        """
+        Search the predicates matching the given text, returning at most 'limit' results as
+        triples (item, name, score) sorted by decreasing score. Predicates whose name matches
+        the text exactly score the most, followed by those whose name starts with the text,
+        those having a word of the name (underscore or camel case separated) starting with the
+        text, those whose name contains the text, those whose description contains words
+        starting with all the words of the text and finally (if 'fuzzy' is True) those whose
+        name is similar to the text according to the number of shared trigrams.
+        :type text: str
+        :type limit: int
+        :type fuzzy: bool
+        :rtype: list
+        """
+        query = OWLText(text.strip()).lower()
+        if not query:
+            return []
+
+        scores = dict()
+
+        def score(k, value):
+            if value > scores.get(k, 0):
+                scores[k] = value
+
+        # EXACT AND PREFIX MATCHES: SINCE NAMES ARE SORTED, IF WE
+        # COLLECT ENOUGH OF THEM THERE IS NO NEED TO LOOK ANY FURTHER
+        index = bisect_left(self.names, (query,))
+        while index < len(self.names) and self.names[index][0].startswith(query):
+            lower, name, item = self.names[index]
+            score((item, name), self.ScoreExact if lower == query else self.ScorePrefix)
+            if len(scores) >= limit:
+                return self.ranked(scores, limit)
+            index += 1
+
+        # INFIX MATCHES
+        grams = self.trigrams(query)
+        if grams:
+            postings = sorted((self.grams.get(x, set()) for x in grams), key=len)
+            for key in set.intersection(*postings):
+                name = key[1]
+                position = name.lower().find(query)
+                if position > 0:
+                    if name[position - 1] == '_' or name[position].isupper() and name[position - 1].islower():
+                        score(key, self.ScoreWordPrefix)
+                    else:
+                        score(key, self.ScoreInfix)
+
+        # DESCRIPTION MATCHES
+        tokens = {x.lower() for x in RE_WORD.findall(text)}
+        if tokens and self.words:
+            matches = None
+            for token in sorted(tokens, key=len, reverse=True):
+                keys = set()
+                index = bisect_left(self.words, token)
+                while index < len(self.words) and self.words[index].startswith(token):
+                    keys |= self.wordIndex[self.words[index]]
+                    index += 1
+                matches = keys if matches is None else matches & keys
+                if not matches:
+                    break
+            for key in matches or ():
+                score(key, self.ScoreDescription)
+
+        # FUZZY MATCHES
+        if fuzzy and grams and len(scores) < limit:
+            counter = Counter()
+            for gram in grams:
+                counter.update(self.grams.get(gram, ()))
+            # ONLY THE CANDIDATES SHARING MOST TRIGRAMS WITH THE QUERY ARE CONSIDERED: A PREDICATE
+            # CAN'T BE SIMILAR ENOUGH TO THE QUERY UNLESS IT SHARES AT LEAST 'THRESHOLD' TRIGRAMS
+            threshold = self.FuzzyThreshold * len(grams) / (2 - self.FuzzyThreshold)
+            for key, shared in counter.most_common(limit * self.FuzzyCandidates):
+                if shared < threshold:
+                    break
+                if key not in scores:
+                    similarity = 2 * shared / (len(grams) + max(len(key[1]) - 2, 1))
+                    if similarity >= self.FuzzyThreshold:
+                        score(key, self.ScoreFuzzy * similarity)
+
+        return self.ranked(scores, limit)
+
+    @staticmethod
+    def trigrams(text):
+        """
+        Returns the set of lowercase trigrams of the given text.
+        :type text: str
+        :rtype: set
+        """
+        text = text.lower()
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def unindexDescription(self, key):
+        """
+        Remove the words of the description of the predicate identified by the given key from the index.
+        :type key: tuple
+        """
+        for word in self.descriptions.pop(key, ()):
+            self.wordIndex[word].discard(key)
+            if not self.wordIndex[word]:
+                del self.wordIndex[word]
+                index = bisect_left(self.words, word)
+                if index < len(self.words) and self.words[index] == word:
+                    del self.words[index]
+
+    def wordsFor(self, key):
+        """
+        Returns the set of lowercase words in the description of the predicate identified by the given key.
+        :type key: tuple
+        :rtype: set
+        """
+        meta = self.project.meta(key[0], key[1])
+        return {x.lower() for x in RE_WORD.findall(meta.get(K_DESCRIPTION, ''))}
\ No newline at end of file
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import math
+
+from collections import defaultdict
+
+
+class SpatialIndex(object):
+    """
+    Uniform grid index of rectangles, used to answer intersection queries without
+    asking the diagram for colliding items (which requires items to be in the scene
+    and the scene index to be up to date).
+    """
+    def __init__(self, size=100):
+        """
+        Initialize the index.
+        :type size: int
+        """
+        self.cells = defaultdict(list)
+        self.size = size
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def cellsFor(self, rect):
+        """
+        Returns the keys of the cells covered by the given rectangle.
+        :type rect: QRectF
+        :rtype: generator
+        """
+        size = self.size
+        for i in range(math.floor(rect.left() / size), math.floor(rect.right() / size) + 1):
+            for j in range(math.floor(rect.top() / size), math.floor(rect.bottom() / size) + 1):
+                yield i, j
+
+    def insert(self, rect, owner):
+        """
+        Insert the given rectangle in the index.
+        :type rect: QRectF
+        :type owner: object
+        """
+        for cell in self.cellsFor(rect):
+            self.cells[cell].append((rect, owner))
+
+    def intersects(self, rect, exclude=None):
+        """
+        Returns True if the given rectangle intersects any rectangle in the index, excluding those owned by the given object.
+        :type rect: QRectF
+        :type exclude: object
+        :rtype: bool
+        """
+        cells = self.cells
+        for cell in self.cellsFor(rect):
+            if cell in cells:
+                for other, owner in cells[cell]:
+                    if owner is not exclude and rect.intersects(other):
+                        return True
+        return False
+
+    def remove(self, rect, owner):
+        """
+        Remove the given rectangle from the index.
+        :type rect: QRectF
+        :type owner: object
+        """
+        for cell in self.cellsFor(rect):
+            if cell in self.cells:
+                self.cells[cell] = [x for x in self.cells[cell] if x[1] is not owner or x[0] != rect]
\ No newline at end of file
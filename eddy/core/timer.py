@@ -103,4 +103,40 @@ class PausableTimer(QtCore.QTimer):
         """
         Start the timer.
         """
-        super().start(*args, **kwargs)
\ No newline at end of file
+        super().start(*args, **kwargs)
+
+
+class CoalescingTimer(QtCore.QTimer):
+    """
+    Extends QtCore.QTimer coalescing multiple schedule requests into a single timeout.
+    Requests issued while the timer is already pending are merged into the pending one,
+    so connected slots run at most once per interval (once per event loop iteration
+    when the interval is zero, which is the default).
+    """
+    def __init__(self, parent=None, interval=0):
+        """
+        Initialize the timer.
+        :type parent: QObject
+        :type interval: int
+        """
+        super().__init__(parent)
+        self.setInterval(interval)
+        self.setSingleShot(True)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def isPending(self):
+        """
+        Tells whether a timeout is scheduled.
+        :rtype: bool
+        """
+        return self.isActive()
+
+    def schedule(self):
+        """
+        Schedule a timeout, unless one is already pending.
+        """
+        if not self.isActive():
+            self.start()
\ No newline at end of file
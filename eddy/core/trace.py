@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import json
+import os
+import threading
+import time
+
+from functools import wraps
+
+
+class Span(object):
+    """
+    Context manager recording a complete event (a named duration) in the trace.
+    """
+    __slots__ = ('args', 'category', 'name', 'start')
+
+    def __init__(self, name, category, args):
+        """
+        Initialize the span.
+        :type name: str
+        :type category: str
+        :type args: dict
+        """
+        self.args = args
+        self.category = category
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        """
+        Start measuring the span duration.
+        :rtype: Span
+        """
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Stop measuring the span duration and record it in the trace.
+        """
+        end = time.perf_counter()
+        Tracer.record('X', self.name, self.category, self.start, self.args, end - self.start)
+
+
+class NullSpan(object):
+    """
+    Context manager returned when tracing is disabled: it does nothing.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class Tracer(object):
+    """
+    Collect performance trace events (spans, counters and instants) in memory and dump
+    them using the Chrome trace event format (to be opened with chrome://tracing or Perfetto).
+    Tracing is disabled by default: when disabled, spans are a shared no-op context manager and
+    counters and instants return right away, so that instrumentation points cost next to nothing.
+    """
+    DefaultLimit = 1000000
+    Null = NullSpan()
+
+    dropped = 0
+    enabled = False
+    events = []
+    limit = DefaultLimit
+    origin = 0.0
+
+    #############################################
+    #   RECORDING
+    #################################
+
+    @classmethod
+    def counter(cls, name, category='eddy', **values):
+        """
+        Record the given counter values.
+        :type name: str
+        :type category: str
+        """
+        if cls.enabled:
+            cls.record('C', name, category, time.perf_counter(), values)
+
+    @classmethod
+    def instant(cls, name, category='eddy', **args):
+        """
+        Record an instant event.
+        :type name: str
+        :type category: str
+        """
+        if cls.enabled:
+            cls.record('i', name, category, time.perf_counter(), args)
+
+    @classmethod
+    def record(cls, phase, name, category, start, args, duration=None):
+        """
+        Store a trace event, unless the maximum number of events has been reached.
+        :type phase: str
+        :type name: str
+        :type category: str
+        :type start: float
+        :type args: dict
+        :type duration: float
+        """
+        if len(cls.events) < cls.limit:
+            cls.events.append((phase, name, category, start, duration, threading.get_ident(), args))
+        else:
+            cls.dropped += 1
+
+    @classmethod
+    def span(cls, name, category='eddy', **args):
+        """
+        Returns a context manager recording the duration of the enclosed block.
+        :type name: str
+        :type category: str
+        :rtype: Span
+        """
+        if cls.enabled:
+            return Span(name, category, args)
+        return cls.Null
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    @classmethod
+    def clear(cls):
+        """
+        Discard all the recorded events.
+        """
+        cls.events = []
+        cls.dropped = 0
+        cls.origin = time.perf_counter()
+
+    @classmethod
+    def dump(cls, path):
+        """
+        Write the recorded events in the given file using the Chrome trace event format.
+        :type path: str
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cls.trace(), f)
+
+    @classmethod
+    def isEnabled(cls):
+        """
+        Tells whether tracing is enabled.
+        :rtype: bool
+        """
+        return cls.enabled
+
+    @classmethod
+    def start(cls, limit=DefaultLimit):
+        """
+        Discard previously recorded events and start tracing.
+        :type limit: int
+        """
+        cls.clear()
+        cls.limit = limit
+        cls.enabled = True
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop tracing (recorded events are kept until the next start).
+        """
+        cls.enabled = False
+
+    @classmethod
+    def trace(cls):
+        """
+        Returns the recorded events as a Chrome trace event format dictionary.
+        :rtype: dict
+        """
+        pid = os.getpid()
+        threads = dict()
+        events = []
+        for phase, name, category, start, duration, thread, args in list(cls.events):
+            tid = threads.setdefault(thread, len(threads) + 1)
+            event = {'name': name, 'cat': category, 'ph': phase, 'pid': pid, 'tid': tid,
+                     'ts': round((start - cls.origin) * 1000000, 3)}
+            if duration is not None:
+                event['dur'] = round(duration * 1000000, 3)
+            if phase == 'i':
+                event['s'] = 't'
+            if args:
+                event['args'] = {k: v if isinstance(v, (int, float, bool)) else str(v) for k, v in args.items()}
+            events.append(event)
+        for thread, tid in threads.items():
+            name = 'MainThread' if thread == threading.main_thread().ident else 'Thread {0}'.format(tid)
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'dropped': cls.dropped}}
+
+
+def traced(name=None, category='eddy'):
+    """
+    Decorator which records a span for each invocation of the decorated function.
+    If no name is supplied the qualified name of the function is used.
+    :type name: str
+    :type category: str
+    :rtype: callable
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(label, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -33,24 +33,318 @@
 ##########################################################################
 
 
+import threading
+
 from abc import ABCMeta, abstractmethod
 
 from PyQt5 import QtCore
 
+from eddy.core.functions.signals import connect
+from eddy.core.output import getLogger
+
+
+LOGGER = getLogger()
+
 
 class AbstractWorker(QtCore.QObject):
     """
     Extends QtCore.QObject providing the base class for all the workers.
     Note that classes inheriting from this one MUST emit the finished signal from
     within the run() method, to properly notify that the worker terminated its job.
+    Long running workers should periodically check isCancelled() to support
+    cooperative cancellation, and may report their advancement using the progress signal.
     """
     __metaclass__  = ABCMeta
 
     finished = QtCore.pyqtSignal()
+    progress = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the worker.
+        """
+        super().__init__(*args, **kwargs)
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Request the cancellation of the worker (the worker is responsible to honour the request).
+        """
+        self.cancelled = True
+
+    def isCancelled(self):
+        """
+        Returns True if the cancellation of the worker has been requested, False otherwise.
+        :rtype: bool
+        """
+        return self.cancelled
 
     @abstractmethod
     def run(self):
         """
         Run the worker.
         """
-        pass
\ No newline at end of file
+        pass
+
+
+class Task(QtCore.QRunnable):
+    """
+    Extends QtCore.QRunnable to execute a worker in a thread of a TaskScheduler queue.
+    When the task terminates it releases itself from the scheduler which submitted it.
+    """
+    def __init__(self, name, worker, queue, scheduler, priority=0):
+        """
+        Initialize the task.
+        :type name: str
+        :type worker: AbstractWorker
+        :type queue: str
+        :type scheduler: TaskScheduler
+        :type priority: int
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.done = False
+        self.lock = threading.Lock()
+        self.name = name
+        self.priority = priority
+        self.queue = queue
+        self.scheduler = scheduler
+        self.started = False
+        self.worker = worker
+
+    def claim(self):
+        """
+        Mark the task as started, returning False if it was already started (or discarded while pending).
+        :rtype: bool
+        """
+        with self.lock:
+            if self.started:
+                return False
+            self.started = True
+            return True
+
+    def isDone(self):
+        """
+        Returns True if the task is completed (or it has been cancelled before being started), False otherwise.
+        :rtype: bool
+        """
+        return self.done
+
+    def run(self):
+        """
+        Main worker.
+        """
+        if not self.claim():
+            # THE TASK HAS BEEN DISCARDED BY THE SCHEDULER WHILE PENDING
+            self.scheduler.release(self)
+            return
+        try:
+            if not self.worker.isCancelled():
+                self.worker.run()
+            else:
+                self.worker.finished.emit()
+        except Exception:
+            LOGGER.exception('Task %s terminated abnormally', self.name)
+            self.worker.finished.emit()
+        finally:
+            self.done = True
+            self.scheduler.release(self)
+
+
+class TaskQueue(object):
+    """
+    A named queue of a TaskScheduler, executing at most a given number of tasks concurrently.
+    The list of tasks is shared with the threads of the pool, hence it must be accessed holding the queue lock.
+    """
+    def __init__(self, name, threads, capacity=0):
+        """
+        Initialize the queue.
+        :type name: str
+        :type threads: int
+        :type capacity: int
+        """
+        self.capacity = capacity
+        self.discarded = set()
+        self.lock = threading.Lock()
+        self.name = name
+        self.pool = QtCore.QThreadPool()
+        self.pool.setMaxThreadCount(threads)
+        self.tasks = []
+
+    def isFull(self):
+        """
+        Returns True if the queue cannot accept more tasks, False otherwise.
+        :rtype: bool
+        """
+        with self.lock:
+            return self.capacity > 0 and len(self.tasks) >= self.capacity
+
+
+class TaskScheduler(QtCore.QObject):
+    """
+    Extends QtCore.QObject providing a pooled scheduler for AbstractWorker instances.
+    Workers are executed as tasks in named queues, each one backed by a QThreadPool which bounds the number of
+    threads used by the queue: pending tasks are started according to their priority, they can be cancelled
+    (pending tasks are discarded, running ones are cancelled cooperatively), and queues with a capacity reject
+    new tasks when saturated. Worker signals are delivered to the objects living in the main thread as usual.
+    """
+    DefaultQueue = 'default'
+    DefaultThreads = max(QtCore.QThread.idealThreadCount(), 2)
+
+    sgnTaskCancelled = QtCore.pyqtSignal(str)
+    sgnTaskFinished = QtCore.pyqtSignal(str)
+    sgnTaskProgress = QtCore.pyqtSignal(str, int, int)
+    sgnTaskSubmitted = QtCore.pyqtSignal(str)
+
+    Instance = None
+
+    def __init__(self, parent=None):
+        """
+        Initialize the scheduler.
+        :type parent: QObject
+        """
+        super().__init__(parent)
+        self.queues = {}
+        self.addQueue(TaskScheduler.DefaultQueue, TaskScheduler.DefaultThreads)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addQueue(self, name, threads=1, capacity=0):
+        """
+        Add a new queue executing at most 'threads' tasks concurrently and holding at most
+        'capacity' tasks (running or pending), with 0 meaning no limit.
+        :type name: str
+        :type threads: int
+        :type capacity: int
+        :rtype: TaskQueue
+        """
+        if name in self.queues:
+            raise ValueError('duplicate task queue: {0}'.format(name))
+        self.queues[name] = TaskQueue(name, threads, capacity)
+        return self.queues[name]
+
+    def cancel(self, name):
+        """
+        Cancel the task with the given name.
+        :type name: str
+        :rtype: bool
+        """
+        task = self.task(name)
+        if task:
+            task.worker.cancel()
+            if task.claim():
+                # THE TASK IS STILL PENDING: DISCARD IT, REMOVING IT FROM THE THREAD POOL IF POSSIBLE
+                # (QThreadPool.tryTake requires Qt 5.9), OTHERWISE KEEP IT UNTIL THE POOL DEQUEUES IT
+                queue = self.queues[task.queue]
+                with queue.lock:
+                    task.done = True
+                    queue.tasks.remove(task)
+                    if not hasattr(queue.pool, 'tryTake') or not queue.pool.tryTake(task):
+                        queue.discarded.add(task)
+                self.sgnTaskCancelled.emit(task.name)
+                task.worker.deleteLater()
+            return True
+        return False
+
+    def cancelAll(self, queue=None):
+        """
+        Cancel all the tasks (of the given queue).
+        :type queue: str
+        """
+        for task in self.tasks(queue):
+            self.cancel(task.name)
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the shared scheduler instance.
+        :rtype: TaskScheduler
+        """
+        if cls.Instance is None:
+            cls.Instance = TaskScheduler()
+        return cls.Instance
+
+    def queue(self, name):
+        """
+        Returns the queue with the given name.
+        :type name: str
+        :rtype: TaskQueue
+        """
+        return self.queues.get(name, None)
+
+    def release(self, task):
+        """
+        Release the given task, removing it from its queue. This is executed by the task itself, from within
+        the thread of the pool running it, as soon as it terminates: finished tasks are thus removed even if
+        the finished signal of their worker is never delivered.
+        :type task: Task
+        """
+        queue = self.queues[task.queue]
+        with queue.lock:
+            queue.discarded.discard(task)
+            released = task in queue.tasks
+            if released:
+                queue.tasks.remove(task)
+        if released:
+            self.sgnTaskFinished.emit(task.name)
+            task.worker.deleteLater()
+
+    def submit(self, name, worker, queue=DefaultQueue, priority=0):
+        """
+        Submit the given worker for execution in the given queue, returning the scheduled task.
+        Returns None if a task with the same name is still running, or if the queue is full.
+        :type name: str
+        :type worker: AbstractWorker
+        :type queue: str
+        :type priority: int
+        :rtype: Task
+        """
+        if not isinstance(worker, AbstractWorker):
+            raise ValueError('worker class must be subclass of eddy.core.worker.AbstractWorker')
+        if queue not in self.queues:
+            raise ValueError('unknown task queue: {0}'.format(queue))
+        if self.task(name):
+            return None
+        if self.queues[queue].isFull():
+            LOGGER.warning('Task %s rejected: queue %s is full', name, queue)
+            return None
+        task = Task(name, worker, queue, self, priority)
+        connect(worker.progress, lambda value, maximum: self.sgnTaskProgress.emit(name, value, maximum))
+        with self.queues[queue].lock:
+            self.queues[queue].tasks.append(task)
+        self.queues[queue].pool.start(task, priority)
+        self.sgnTaskSubmitted.emit(name)
+        return task
+
+    def task(self, name):
+        """
+        Returns the task with the given name (if not completed yet).
+        :type name: str
+        :rtype: Task
+        """
+        for task in self.tasks():
+            if task.name == name:
+                return task
+        return None
+
+    def tasks(self, queue=None):
+        """
+        Returns the list of the tasks not completed yet (in the given queue).
+        :type queue: str
+        :rtype: list
+        """
+        tasks = []
+        for q in [self.queues[queue]] if queue else self.queues.values():
+            with q.lock:
+                tasks.extend(q.tasks)
+        return tasks
+
+    def waitForDone(self, msecs=-1):
+        """
+        Wait for all the tasks to terminate (for at most the given amount of milliseconds in each queue).
+        :type msecs: int
+        :rtype: bool
+        """
+        return all([queue.pool.waitForDone(msecs) for queue in self.queues.values()])
\ No newline at end of file
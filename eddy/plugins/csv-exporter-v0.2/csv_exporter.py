@@ -82,6 +82,8 @@ class CsvExporterPlugin(AbstractPlugin):
 class CsvExporter(AbstractProjectExporter):
     """
     This class can be used to export Graphol projects into CSV format.
+    The exporter only reads predicate nodes and metadata, hence it can also export a headless
+    Graph (see eddy.core.graph), without constructing any graphical item.
     """
     KeyName = 'NAME'
     KeyType = 'TYPE'
@@ -96,7 +98,7 @@ class CsvExporter(AbstractProjectExporter):
     def __init__(self, project, session=None):
         """
         Initialize the CSV exporter.
-        :type project: Project
+        :type project: T <= Project|Graph
         :type session: Session
         """
         super().__init__(project, session)
@@ -34,6 +34,7 @@
 
 
 from abc import ABCMeta, abstractmethod
+from collections import Counter
 from operator import attrgetter
 
 from PyQt5 import QtCore
@@ -56,6 +57,7 @@ from eddy.core.project import K_FUNCTIONAL, K_INVERSE_FUNCTIONAL
 from eddy.core.project import K_ASYMMETRIC, K_IRREFLEXIVE, K_REFLEXIVE
 from eddy.core.project import K_SYMMETRIC, K_TRANSITIVE
 from eddy.core.regex import RE_CAMEL_SPACE
+from eddy.core.timer import CoalescingTimer
 
 from eddy.ui.dock import DockWidget
 from eddy.ui.fields import IntegerField, StringField
@@ -91,49 +93,53 @@ class InfoPlugin(AbstractPlugin):
         """
         Executed whenever a diagram is added to the active project.
         """
-        self.widget('info').stack()
+        self.widget('info').invalidate()
 
     @QtCore.pyqtSlot('QGraphicsScene')
     def onDiagramRemoved(self, diagram):
         """
         Executed whenever a diagram is removed from the active project.
         """
-        self.widget('info').stack()
+        self.widget('info').invalidate()
 
     @QtCore.pyqtSlot()
     def onDiagramSelectionChanged(self):
         """
         Executed whenever the selection of the active diagram changes.
         """
-        self.widget('info').stack()
+        self.widget('info').invalidate()
 
     @QtCore.pyqtSlot()
     def onDiagramUpdated(self):
         """
         Executed whenever the active diagram is updated.
         """
-        self.widget('info').stack()
+        self.widget('info').invalidate()
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def onProjectItemAdded(self, diagram, item):
         """
         Executed whenever a new element is added to the active project.
         """
-        self.widget('info').stack()
+        widget = self.widget('info')
+        widget.infoProject.updateCount(item, +1)
+        widget.invalidate()
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def onProjectItemRemoved(self, diagram, item):
         """
         Executed whenever a new element is removed from the active project.
         """
-        self.widget('info').stack()
+        widget = self.widget('info')
+        widget.infoProject.updateCount(item, -1)
+        widget.invalidate()
 
     @QtCore.pyqtSlot()
     def onProjectUpdated(self):
         """
         Executed whenever the current project is updated.
         """
-        self.widget('info').stack()
+        self.widget('info').invalidate()
 
     @QtCore.pyqtSlot()
     def onSessionReady(self):
@@ -146,7 +152,9 @@ class InfoPlugin(AbstractPlugin):
         connect(self.project.sgnDiagramRemoved, self.onDiagramRemoved)
         connect(self.project.sgnItemAdded, self.onProjectItemAdded)
         connect(self.project.sgnItemRemoved, self.onProjectItemRemoved)
-        self.widget('info').stack()
+        widget = self.widget('info')
+        widget.infoProject.resetCount(self.project)
+        widget.stack()
 
     @QtCore.pyqtSlot(QtWidgets.QMdiSubWindow)
     def onSubWindowActivated(self, subwindow):
@@ -261,6 +269,8 @@ class InfoWidget(QtWidgets.QScrollArea):
 
         self.diagram = None
         self.plugin = plugin
+        self.timer = CoalescingTimer(self)
+        connect(self.timer.timeout, self.stack)
 
         self.stacked = QtWidgets.QStackedWidget(self)
         self.stacked.setContentsMargins(0, 0, 0, 0)
@@ -390,6 +400,14 @@ class InfoWidget(QtWidgets.QScrollArea):
     #   INTERFACE
     #################################
 
+    def invalidate(self):
+        """
+        Mark the content of the widget as outdated: the widget is refreshed
+        once, at the next iteration of the event loop, no matter how many
+        times it gets invalidated in the meantime.
+        """
+        self.timer.schedule()
+
     def redraw(self):
         """
         Redraw the content of the widget.
@@ -416,13 +434,13 @@ class InfoWidget(QtWidgets.QScrollArea):
         """
         Set the current stacked widget.
         """
+        self.timer.stop()
         if self.diagram:
-            selected = self.diagram.selectedItems()
-            if not selected or len(selected) > 1:
+            if self.diagram.selectionCount() != 1:
                 show = self.infoProject
                 show.updateData(self.project)
             else:
-                item = first(selected)
+                item = first(self.diagram.selectedItems())
                 if item.isNode():
                     if item.isPredicate():
                         if item.type() is Item.ValueDomainNode:
@@ -614,6 +632,8 @@ class ProjectInfo(AbstractInfo):
         """
         super().__init__(session, parent)
 
+        self.counter = Counter()
+
         self.versionKey = Key('Version', self)
         self.versionKey.setFont(Font('Roboto', 12))
         self.versionField = String(self)
@@ -763,6 +783,21 @@ class ProjectInfo(AbstractInfo):
     #   INTERFACE
     #################################
 
+    def resetCount(self, project):
+        """
+        Recount the items of the given project by type.
+        :type project: Project
+        """
+        self.counter = Counter(item.type() for item in project.items())
+
+    def updateCount(self, item, delta):
+        """
+        Update the number of items matching the type of the given one by the given delta.
+        :type item: AbstractItem
+        :type delta: int
+        """
+        self.counter[item.type()] += delta
+
     def updateData(self, project):
         """
         Fetch new information and fill the widget with data.
@@ -791,8 +826,8 @@ class ProjectInfo(AbstractInfo):
         self.attributesField.setValue(project.predicateNum(Item.AttributeNode))
         self.conceptsField.setValue(project.predicateNum(Item.ConceptNode))
         self.rolesField.setValue(project.predicateNum(Item.RoleNode))
-        self.inclusionsField.setValue(project.itemNum(Item.InclusionEdge))
-        self.membershipField.setValue(project.itemNum(Item.MembershipEdge))
+        self.inclusionsField.setValue(self.counter[Item.InclusionEdge])
+        self.membershipField.setValue(self.counter[Item.MembershipEdge])
 
 
 class EdgeInfo(AbstractInfo):
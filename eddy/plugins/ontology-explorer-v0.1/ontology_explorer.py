@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+from bisect import bisect_left
+
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
@@ -52,8 +54,6 @@ class OntologyExplorerPlugin(AbstractPlugin):
     """
     This plugin provides the Ontology Explorer widget.
     """
-    sgnFakeItemAdded = QtCore.pyqtSignal('QGraphicsScene', 'QGraphicsItem')
-
     #############################################
     #   SLOTS
     #################################
@@ -68,11 +68,9 @@ class OntologyExplorerPlugin(AbstractPlugin):
         self.debug('Connecting to project: %s', self.project.name)
         connect(self.project.sgnItemAdded, widget.doAddNode)
         connect(self.project.sgnItemRemoved, widget.doRemoveNode)
+        connect(self.project.sgnPredicatesRenamed, widget.doRenameNodes)
         # FILL IN ONTOLOGY EXPLORER WITH DATA
-        connect(self.sgnFakeItemAdded, widget.doAddNode)
-        for node in self.project.nodes():
-            self.sgnFakeItemAdded.emit(node.diagram, node)
-        disconnect(self.sgnFakeItemAdded, widget.doAddNode)
+        widget.model.reset(self.project.nodes())
 
     #############################################
     #   HOOKS
@@ -87,6 +85,7 @@ class OntologyExplorerPlugin(AbstractPlugin):
         self.debug('Disconnecting from project: %s', self.project.name)
         disconnect(self.project.sgnItemAdded, widget.doAddNode)
         disconnect(self.project.sgnItemRemoved, widget.doRemoveNode)
+        disconnect(self.project.sgnPredicatesRenamed, widget.doRenameNodes)
 
         # DISCONNECT FROM ACTIVE SESSION
         self.debug('Disconnecting from active session')
@@ -150,22 +149,15 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
 
         self.plugin = plugin
 
-        self.iconAttribute = QtGui.QIcon(':/icons/18/ic_treeview_attribute')
-        self.iconConcept = QtGui.QIcon(':/icons/18/ic_treeview_concept')
-        self.iconInstance = QtGui.QIcon(':/icons/18/ic_treeview_instance')
-        self.iconRole = QtGui.QIcon(':/icons/18/ic_treeview_role')
-        self.iconValue = QtGui.QIcon(':/icons/18/ic_treeview_value')
-
         self.search = StringField(self)
         self.search.setAcceptDrops(False)
         self.search.setClearButtonEnabled(True)
         self.search.setPlaceholderText('Search...')
         self.search.setFixedHeight(30)
-        self.model = QtGui.QStandardItemModel(self)
+        self.model = OntologyExplorerModel(self)
         self.proxy = QtCore.QSortFilterProxyModel(self)
         self.proxy.setDynamicSortFilter(False)
         self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        self.proxy.setSortCaseSensitivity(QtCore.Qt.CaseSensitive)
         self.proxy.setSourceModel(self.model)
         self.ontoview = OntologyExplorerView(self)
         self.ontoview.setModel(self.proxy)
@@ -247,17 +239,7 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type diagram: QGraphicsScene
         :type node: AbstractItem
         """
-        if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
-            parent = self.parentFor(node)
-            if not parent:
-                parent = QtGui.QStandardItem(self.parentKey(node))
-                parent.setIcon(self.iconFor(node))
-                self.model.appendRow(parent)
-                self.proxy.sort(0, QtCore.Qt.AscendingOrder)
-            child = QtGui.QStandardItem(self.childKey(diagram, node))
-            child.setData(node)
-            parent.appendRow(child)
-            self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+        self.model.addNode(diagram, node)
 
     @QtCore.pyqtSlot(str)
     def doFilterItem(self, key):
@@ -266,7 +248,6 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type key: str
         """
         self.proxy.setFilterFixedString(key)
-        self.proxy.sort(QtCore.Qt.AscendingOrder)
 
     @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
     def doRemoveNode(self, diagram, node):
@@ -275,14 +256,15 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         :type diagram: QGraphicsScene
         :type node: AbstractItem
         """
-        if node.type() in {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}:
-            parent = self.parentFor(node)
-            if parent:
-                child = self.childFor(parent, diagram, node)
-                if child:
-                    parent.removeRow(child.index().row())
-                if not parent.rowCount():
-                    self.model.removeRow(parent.index().row())
+        self.model.removeNode(diagram, node)
+
+    @QtCore.pyqtSlot(dict)
+    def doRenameNodes(self, renamed):
+        """
+        Move the given renamed nodes under their new name in the tree view.
+        :type renamed: dict
+        """
+        self.model.renameNodes(renamed)
 
     @QtCore.pyqtSlot('QModelIndex')
     def onItemDoubleClicked(self, index):
@@ -292,9 +274,9 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         """
         # noinspection PyArgumentList
         if QtWidgets.QApplication.mouseButtons() & QtCore.Qt.LeftButton:
-            item = self.model.itemFromIndex(self.proxy.mapToSource(index))
-            if item and item.data():
-                self.sgnItemDoubleClicked.emit(item.data())
+            node = self.model.node(self.proxy.mapToSource(index))
+            if node:
+                self.sgnItemDoubleClicked.emit(node)
 
     @QtCore.pyqtSlot('QModelIndex')
     def onItemPressed(self, index):
@@ -304,78 +286,14 @@ class OntologyExplorerWidget(QtWidgets.QWidget):
         """
         # noinspection PyArgumentList
         if QtWidgets.QApplication.mouseButtons() & QtCore.Qt.LeftButton:
-            item = self.model.itemFromIndex(self.proxy.mapToSource(index))
-            if item and item.data():
-                self.sgnItemClicked.emit(item.data())
+            node = self.model.node(self.proxy.mapToSource(index))
+            if node:
+                self.sgnItemClicked.emit(node)
 
     #############################################
     #   INTERFACE
     #################################
 
-    def childFor(self, parent, diagram, node):
-        """
-        Search the item representing this node among parent children.
-        :type parent: QtGui.QStandardItem
-        :type diagram: Diagram
-        :type node: AbstractNode
-        """
-        key = self.childKey(diagram, node)
-        for i in range(parent.rowCount()):
-            child = parent.child(i)
-            if child.text() == key:
-                return child
-        return None
-
-    @staticmethod
-    def childKey(diagram, node):
-        """
-        Returns the child key (text) used to place the given node in the treeview.
-        :type diagram: Diagram
-        :type node: AbstractNode
-        :rtype: str
-        """
-        predicate = node.text().replace('\n', '')
-        diagram = rstrip(diagram.name, File.Graphol.extension)
-        return '{0} ({1} - {2})'.format(predicate, diagram, node.id)
-
-    def iconFor(self, node):
-        """
-        Returns the icon for the given node.
-        :type node:
-        """
-        if node.type() is Item.AttributeNode:
-            return self.iconAttribute
-        if node.type() is Item.ConceptNode:
-            return self.iconConcept
-        if node.type() is Item.IndividualNode:
-            if node.identity() is Identity.Individual:
-                return self.iconInstance
-            if node.identity() is Identity.Value:
-                return self.iconValue
-        if node.type() is Item.RoleNode:
-            return self.iconRole
-
-    def parentFor(self, node):
-        """
-        Search the parent element of the given node.
-        :type node: AbstractNode
-        :rtype: QtGui.QStandardItem
-        """
-        for i in self.model.findItems(self.parentKey(node), QtCore.Qt.MatchExactly):
-            n = i.child(0).data()
-            if node.type() is n.type():
-                return i
-        return None
-
-    @staticmethod
-    def parentKey(node):
-        """
-        Returns the parent key (text) used to place the given node in the treeview.
-        :type node: AbstractNode
-        :rtype: str
-        """
-        return node.text().replace('\n', '')
-
     def sizeHint(self):
         """
         Returns the recommended size for this widget.
@@ -402,7 +320,6 @@ class OntologyExplorerView(QtWidgets.QTreeView):
         self.setHorizontalScrollMode(QtWidgets.QTreeView.ScrollPerPixel)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.setSelectionMode(QtWidgets.QTreeView.SingleSelection)
-        self.setSortingEnabled(True)
         self.setWordWrap(True)
 
     #############################################
@@ -447,8 +364,7 @@ class OntologyExplorerView(QtWidgets.QTreeView):
             if index:
                 model = self.model().sourceModel()
                 index = self.model().mapToSource(index)
-                item = model.itemFromIndex(index)
-                node = item.data()
+                node = model.node(index)
                 if node:
                     self.widget.sgnItemRightClicked.emit(node)
                     menu = self.session.mf.create(node.diagram, [node])
@@ -467,4 +383,271 @@ class OntologyExplorerView(QtWidgets.QTreeView):
         :type column: int
         :rtype: int
         """
-        return max(super().sizeHintForColumn(column), self.viewport().width())
\ No newline at end of file
+        return max(super().sizeHintForColumn(column), self.viewport().width())
+
+
+class OntologyExplorerModel(QtCore.QAbstractItemModel):
+    """
+    This class implements the model of the ontology explorer.
+    Top level rows group the occurrences of a predicate, identified by its type and name, while
+    child rows map the predicate nodes. Groups are indexed by key and kept sorted, so that rows can
+    be located by bisection, while the sorted children of each group are only materialized the
+    first time they are needed (e.g. when the group is expanded in the view).
+    """
+    ResetThreshold = 100
+    Types = {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}
+
+    def __init__(self, parent=None):
+        """
+        Initialize the ontology explorer model.
+        :type parent: QtCore.QObject
+        """
+        super().__init__(parent)
+        self.iconAttribute = QtGui.QIcon(':/icons/18/ic_treeview_attribute')
+        self.iconConcept = QtGui.QIcon(':/icons/18/ic_treeview_concept')
+        self.iconInstance = QtGui.QIcon(':/icons/18/ic_treeview_instance')
+        self.iconRole = QtGui.QIcon(':/icons/18/ic_treeview_role')
+        self.iconValue = QtGui.QIcon(':/icons/18/ic_treeview_value')
+        self.groups = []
+        self.groupIndex = dict()
+        self.keys = []
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def addNode(self, diagram, node):
+        """
+        Add the given node to the model.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        """
+        if node.type() in OntologyExplorerModel.Types:
+            key = self.parentKey(node)
+            group = self.groupIndex.get(key)
+            if not group:
+                group = OntologyExplorerGroup(key, self.iconFor(node))
+                row = bisect_left(self.keys, key)
+                self.beginInsertRows(QtCore.QModelIndex(), row, row)
+                self.groups.insert(row, group)
+                self.groupIndex[key] = group
+                self.keys.insert(row, key)
+                self.endInsertRows()
+            if node not in group.nodes:
+                text = self.childKey(diagram, node)
+                children = group.children()
+                row = bisect_left(children, text)
+                self.beginInsertRows(self.createIndex(bisect_left(self.keys, key), 0), row, row)
+                children.insert(row, text)
+                group.nodes[node] = text
+                group.occurrences[text] = node
+                self.endInsertRows()
+
+    @staticmethod
+    def childKey(diagram, node):
+        """
+        Returns the child key (text) used to place the given node in the treeview.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        :rtype: str
+        """
+        predicate = node.text().replace('\n', '')
+        diagram = rstrip(diagram.name, File.Graphol.extension)
+        return '{0} ({1} - {2})'.format(predicate, diagram, node.id)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of columns for the children of the given parent.
+        :type parent: QtCore.QModelIndex
+        :rtype: int
+        """
+        return 1
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data stored under the given role for the item referred to by the index.
+        :type index: QtCore.QModelIndex
+        :type role: int
+        :rtype: object
+        """
+        if index.isValid():
+            group = index.internalPointer()
+            if group is None:
+                group = self.groups[index.row()]
+                if role == QtCore.Qt.DisplayRole:
+                    return group.text
+                if role == QtCore.Qt.DecorationRole:
+                    return group.icon
+            else:
+                text = group.children()[index.row()]
+                if role == QtCore.Qt.DisplayRole:
+                    return text
+                if role == QtCore.Qt.UserRole:
+                    return group.occurrences[text]
+        return None
+
+    def iconFor(self, node):
+        """
+        Returns the icon for the given node.
+        :type node: AbstractNode
+        :rtype: QtGui.QIcon
+        """
+        if node.type() is Item.AttributeNode:
+            return self.iconAttribute
+        if node.type() is Item.ConceptNode:
+            return self.iconConcept
+        if node.type() is Item.IndividualNode:
+            if node.identity() is Identity.Individual:
+                return self.iconInstance
+            if node.identity() is Identity.Value:
+                return self.iconValue
+        if node.type() is Item.RoleNode:
+            return self.iconRole
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        """
+        Returns the index of the item in the model specified by the given row, column and parent index.
+        :type row: int
+        :type column: int
+        :type parent: QtCore.QModelIndex
+        :rtype: QtCore.QModelIndex
+        """
+        if self.hasIndex(row, column, parent):
+            if not parent.isValid():
+                return self.createIndex(row, column)
+            return self.createIndex(row, column, self.groups[parent.row()])
+        return QtCore.QModelIndex()
+
+    def node(self, index):
+        """
+        Returns the node referred to by the given index, or None if the index refers to a group.
+        :type index: QtCore.QModelIndex
+        :rtype: AbstractNode
+        """
+        return self.data(index, QtCore.Qt.UserRole)
+
+    def parent(self, index=None):
+        """
+        Returns the parent of the model item with the given index.
+        :type index: QtCore.QModelIndex
+        :rtype: QtCore.QModelIndex
+        """
+        if index is None:
+            return super().parent()
+        if index.isValid():
+            group = index.internalPointer()
+            if group is not None:
+                return self.createIndex(bisect_left(self.keys, group.key), 0)
+        return QtCore.QModelIndex()
+
+    @staticmethod
+    def parentKey(node):
+        """
+        Returns the parent key used to place the given node in the treeview.
+        :type node: AbstractNode
+        :rtype: tuple
+        """
+        return node.text().replace('\n', ''), node.type()
+
+    def removeNode(self, diagram, node, text=None):
+        """
+        Remove the given node from the model.
+        If the node has been renamed, its previous text must be supplied to locate it.
+        :type diagram: Diagram
+        :type node: AbstractNode
+        :type text: str
+        """
+        if node.type() in OntologyExplorerModel.Types:
+            key = self.parentKey(node) if text is None else (text.replace('\n', ''), node.type())
+            group = self.groupIndex.get(key)
+            if group and node in group.nodes:
+                parent = bisect_left(self.keys, key)
+                if len(group.nodes) == 1:
+                    self.beginRemoveRows(QtCore.QModelIndex(), parent, parent)
+                    del self.groups[parent]
+                    del self.groupIndex[key]
+                    del self.keys[parent]
+                    self.endRemoveRows()
+                else:
+                    text = group.nodes[node]
+                    children = group.children()
+                    row = bisect_left(children, text)
+                    self.beginRemoveRows(self.createIndex(parent, 0), row, row)
+                    del children[row]
+                    del group.nodes[node]
+                    del group.occurrences[text]
+                    self.endRemoveRows()
+
+    def renameNodes(self, renamed):
+        """
+        Move the given renamed nodes, supplied as a dict mapping each node to its previous text,
+        under their new name. Large batches are applied by rebuilding the model in a single pass.
+        :type renamed: dict
+        """
+        if len(renamed) > OntologyExplorerModel.ResetThreshold:
+            self.reset([node for group in self.groups for node in group.nodes])
+        else:
+            for node, text in renamed.items():
+                self.removeNode(node.diagram, node, text)
+                self.addNode(node.diagram, node)
+
+    def reset(self, nodes):
+        """
+        Reset the model so that it contains the given nodes.
+        :type nodes: T <= list | tuple | set
+        """
+        self.beginResetModel()
+        self.groupIndex = dict()
+        for node in nodes:
+            if node.type() in OntologyExplorerModel.Types:
+                key = self.parentKey(node)
+                group = self.groupIndex.get(key)
+                if not group:
+                    group = OntologyExplorerGroup(key, self.iconFor(node))
+                    self.groupIndex[key] = group
+                if node not in group.nodes:
+                    text = self.childKey(node.diagram, node)
+                    group.nodes[node] = text
+                    group.occurrences[text] = node
+        self.keys = sorted(self.groupIndex)
+        self.groups = [self.groupIndex[key] for key in self.keys]
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of rows under the given parent.
+        :type parent: QtCore.QModelIndex
+        :rtype: int
+        """
+        if not parent.isValid():
+            return len(self.groups)
+        if parent.internalPointer() is None:
+            return len(self.groups[parent.row()].nodes)
+        return 0
+
+
+class OntologyExplorerGroup(object):
+    """
+    This class implements a top level row of the ontology explorer model.
+    """
+    def __init__(self, key, icon):
+        """
+        Initialize the group.
+        :type key: tuple
+        :type icon: QtGui.QIcon
+        """
+        self.icon = icon
+        self.key = key
+        self.nodes = dict()
+        self.occurrences = dict()
+        self.text = key[0]
+        self._children = None
+
+    def children(self):
+        """
+        Returns the sorted list of the child keys of this group, building it if needed.
+        :rtype: list
+        """
+        if self._children is None:
+            self._children = sorted(self.occurrences)
+        return self._children
\ No newline at end of file
@@ -39,6 +39,7 @@ from PyQt5 import QtWidgets
 
 from eddy.core.functions.signals import connect, disconnect
 from eddy.core.plugin import AbstractPlugin
+from eddy.core.timer import CoalescingTimer
 
 from eddy.ui.dock import DockWidget
 
@@ -67,13 +68,6 @@ class OverviewPlugin(AbstractPlugin):
     #   SLOTS
     #################################
 
-    @QtCore.pyqtSlot()
-    def onDiagramSelectionChanged(self):
-        """
-        Executed whenever the selection of the active diagram changes.
-        """
-        self.widget('overview').redraw()
-
     @QtCore.pyqtSlot()
     def onDiagramUpdated(self):
         """
@@ -96,11 +90,9 @@ class OverviewPlugin(AbstractPlugin):
                 # diagram, detach signals from the subwindow which 
                 # is going out of focus, before connecting new ones.
                 self.debug('Disconnecting from diagram: %s', widget.diagram.name)
-                disconnect(widget.diagram.selectionChanged, self.onDiagramSelectionChanged)
                 disconnect(widget.diagram.sgnUpdated, self.onDiagramUpdated)
             # Attach the new view/diagram to the overview widget.
             self.debug('Connecting to diagram: %s', subwindow.diagram.name)
-            connect(subwindow.diagram.selectionChanged, self.onDiagramSelectionChanged)
             connect(subwindow.diagram.sgnUpdated, self.onDiagramUpdated)
             widget.setScene(subwindow.diagram)
             widget.setView(subwindow.view)
@@ -113,7 +105,6 @@ class OverviewPlugin(AbstractPlugin):
                 widget = self.widget('overview')
                 if widget.view():
                     self.debug('Disconnecting from diagram: %s', widget.diagram.name)
-                    disconnect(widget.diagram.selectionChanged, self.onDiagramSelectionChanged)
                     disconnect(widget.diagram.sgnUpdated, self.onDiagramUpdated)
                 widget.setScene(None)
                 widget.setView(None)
@@ -131,7 +122,6 @@ class OverviewPlugin(AbstractPlugin):
         widget = self.widget('overview')
         if widget.view():
             self.debug('Disconnecting from diagram: %s', widget.diagram.name)
-            disconnect(widget.diagram.selectionChanged, self.onDiagramSelectionChanged)
             disconnect(widget.diagram.sgnUpdated, self.onDiagramUpdated)
 
         # DISCONNECT FROM ACTIVE SESSION
@@ -183,7 +173,16 @@ class OverviewPlugin(AbstractPlugin):
 class OverviewWidget(QtWidgets.QGraphicsView):
     """
     This class is used to display the active diagram overview.
+    The diagram is rendered into an off-screen pixmap which is painted on the viewport.
+    Items added to and removed from the diagram are collected as dirty regions of the viewport,
+    while updates of the diagram (see Diagram.sgnUpdated) mark the whole viewport as dirty, and
+    the pixmap is brought up to date at most once every RefreshInterval milliseconds: exposing the
+    viewport only paints the cached pixmap, without rendering the diagram again. Note that the
+    widget does not subscribe to QGraphicsScene.changed, since doing so would disable the
+    direct item updates of every view of the diagram, including the main diagram view.
     """
+    RefreshInterval = 100
+
     def __init__(self, plugin):
         """
         Initialize the Overview.
@@ -196,9 +195,15 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         self.setOptimizationFlags(QtWidgets.QGraphicsView.DontAdjustForAntialiasing)
         self.setOptimizationFlags(QtWidgets.QGraphicsView.DontSavePainterState)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.NoViewportUpdate)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.MinimalViewportUpdate)
+        self._dirty = QtGui.QRegion()
+        self._extent = None
         self._mousePressed = False
+        self._pixmap = None
+        self._stale = True
         self._view = None
+        self.timer = CoalescingTimer(self, OverviewWidget.RefreshInterval)
+        connect(self.timer.timeout, self.refresh)
 
     #############################################
     #   PROPERTIES
@@ -253,6 +258,19 @@ class OverviewWidget(QtWidgets.QGraphicsView):
             if self._view:
                 self._mousePressed = False
 
+    def paintEvent(self, paintEvent):
+        """
+        Executed when the viewport needs to be repainted.
+        :type paintEvent: QPaintEvent
+        """
+        viewport = self.viewport()
+        painter = QtGui.QPainter(viewport)
+        if self._pixmap is not None:
+            painter.drawPixmap(0, 0, self._pixmap)
+        else:
+            painter.fillRect(paintEvent.rect(), viewport.palette().brush(viewport.backgroundRole()))
+            self.timer.schedule()
+
     def wheelEvent(self, wheelEvent):
         """
         Turn off wheel event since we don't need to scroll anything.
@@ -260,27 +278,101 @@ class OverviewWidget(QtWidgets.QGraphicsView):
         """
         pass
 
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def onItemAdded(self, _, item):
+        """
+        Executed when an item is added to the inspected diagram.
+        :type item: AbstractItem
+        """
+        self.invalidate(item)
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def onItemRemoved(self, _, item):
+        """
+        Executed when an item is removed from the inspected diagram.
+        :type item: AbstractItem
+        """
+        self.invalidate(item)
+
     #############################################
     #   INTERFACE
     #################################
 
+    def invalidate(self, item):
+        """
+        Mark the area of the given item as dirty, scheduling a refresh of the overview.
+        The extent of the diagram is checked again, since the item may have changed it.
+        :type item: AbstractItem
+        """
+        if item.isNode() or item.isEdge():
+            rect = self.mapFromScene(item.sceneBoundingRect()).boundingRect()
+            self._dirty |= QtGui.QRegion(rect.adjusted(-1, -1, 1, 1))
+            self._stale = True
+            self.timer.schedule()
+
     def redraw(self):
         """
-        Redraw the diagram within the overview.
+        Schedule a full refresh of the overview, recomputing the extent of the diagram.
         """
-        if self._view:
-            polygon = self.diagram.visibleRect(margin=10)
-            if polygon:
-                self.fitInView(polygon, QtCore.Qt.KeepAspectRatio)
+        self._dirty = QtGui.QRegion(self.viewport().rect())
+        self._stale = True
+        self.timer.schedule()
+
+    def refresh(self):
+        """
+        Bring the cached pixmap up to date and repaint the overview.
+        """
+        self.timer.stop()
         viewport = self.viewport()
-        viewport.update()
+        ratio = viewport.devicePixelRatioF()
+        size = viewport.size() * ratio
+        if self._pixmap is None or self._pixmap.size() != size:
+            self._pixmap = QtGui.QPixmap(size)
+            self._pixmap.setDevicePixelRatio(ratio)
+            self._dirty = QtGui.QRegion(viewport.rect())
+            self._extent = None
+            self._stale = True
+        if self._view and self._stale:
+            # THE EXTENT IS CACHED ACROSS REFRESHES AND RECOMPUTED ONLY WHEN THE DIAGRAM
+            # IS UPDATED: IF IT DID NOT CHANGE THE CURRENT TRANSFORMATION IS STILL VALID
+            extent = self.diagram.visibleRect(margin=10)
+            if extent != self._extent:
+                self._extent = extent
+                if extent:
+                    self.fitInView(extent, QtCore.Qt.KeepAspectRatio)
+                self._dirty = QtGui.QRegion(viewport.rect())
+            self._stale = False
+        if not self._dirty.isEmpty():
+            dirty = self._dirty
+            rect = dirty.boundingRect()
+            self._dirty = QtGui.QRegion()
+            painter = QtGui.QPainter(self._pixmap)
+            painter.setClipRegion(dirty)
+            painter.fillRect(rect, viewport.palette().brush(viewport.backgroundRole()))
+            if self._view:
+                self.render(painter, QtCore.QRectF(rect), rect, QtCore.Qt.IgnoreAspectRatio)
+            painter.end()
+            viewport.update(dirty)
 
     def setView(self, view):
         """
         Sets the widget to inspect the given Diagram view.
         :type: view: DiagramView
         """
+        if self._view:
+            disconnect(self.diagram.sgnItemAdded, self.onItemAdded)
+            disconnect(self.diagram.sgnItemRemoved, self.onItemRemoved)
         self._view = view
+        if self._view:
+            connect(self.diagram.sgnItemAdded, self.onItemAdded)
+            connect(self.diagram.sgnItemRemoved, self.onItemRemoved)
+        self._dirty = QtGui.QRegion(self.viewport().rect())
+        self._extent = None
+        self._stale = True
 
     def sizeHint(self):
         """
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.datatypes.qt import Font
+from eddy.core.functions.misc import first
+from eddy.core.functions.signals import connect, disconnect
+from eddy.core.plugin import AbstractPlugin
+from eddy.core.timer import CoalescingTimer
+
+from eddy.ui.dock import DockWidget
+from eddy.ui.fields import StringField
+
+
+class PredicateSearchPlugin(AbstractPlugin):
+    """
+    This plugin provides the Predicate Search widget.
+    """
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def onSessionReady(self):
+        """
+        Executed whenever the main session completes the startup sequence.
+        """
+        widget = self.widget('predicate_search')
+        self.debug('Connecting to project: %s', self.project.name)
+        connect(self.project.sgnItemAdded, widget.onProjectItemChanged)
+        connect(self.project.sgnItemRemoved, widget.onProjectItemChanged)
+        connect(self.project.sgnPredicatesRenamed, widget.onProjectPredicatesRenamed)
+
+    #############################################
+    #   HOOKS
+    #################################
+
+    def dispose(self):
+        """
+        Executed whenever the plugin is going to be destroyed.
+        """
+        # DISCONNECT FROM CURRENT PROJECT
+        widget = self.widget('predicate_search')
+        self.debug('Disconnecting from project: %s', self.project.name)
+        disconnect(self.project.sgnItemAdded, widget.onProjectItemChanged)
+        disconnect(self.project.sgnItemRemoved, widget.onProjectItemChanged)
+        disconnect(self.project.sgnPredicatesRenamed, widget.onProjectPredicatesRenamed)
+
+        # DISCONNECT FROM ACTIVE SESSION
+        self.debug('Disconnecting from active session')
+        disconnect(self.session.sgnReady, self.onSessionReady)
+
+        # REMOVE DOCKING AREA WIDGET MENU ENTRY
+        self.debug('Removing docking area widget toggle from "view" menu')
+        menu = self.session.menu('view')
+        menu.removeAction(self.widget('predicate_search_dock').toggleViewAction())
+
+        # UNINSTALL THE PALETTE DOCK WIDGET
+        self.debug('Uninstalling docking area widget')
+        self.session.removeDockWidget(self.widget('predicate_search_dock'))
+
+    def start(self):
+        """
+        Perform initialization tasks for the plugin.
+        """
+        # INITIALIZE THE WIDGET
+        self.debug('Creating predicate search widget')
+        widget = PredicateSearchWidget(self)
+        widget.setObjectName('predicate_search')
+        self.addWidget(widget)
+
+        # CREATE DOCKING AREA WIDGET
+        self.debug('Creating docking area widget')
+        widget = DockWidget('Predicate Search', QtGui.QIcon(':/icons/18/ic_zoom_black'), self.session)
+        widget.setAllowedAreas(QtCore.Qt.LeftDockWidgetArea|QtCore.Qt.RightDockWidgetArea)
+        widget.setObjectName('predicate_search_dock')
+        widget.setWidget(self.widget('predicate_search'))
+        self.addWidget(widget)
+
+        # CREATE ENTRY IN VIEW MENU
+        self.debug('Creating docking area widget toggle in "view" menu')
+        menu = self.session.menu('view')
+        menu.addAction(self.widget('predicate_search_dock').toggleViewAction())
+
+        # CONFIGURE SIGNALS
+        self.debug('Configuring session specific signals')
+        connect(self.session.sgnReady, self.onSessionReady)
+
+        # INSTALL DOCKING AREA WIDGET
+        self.debug('Installing docking area widget')
+        self.session.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.widget('predicate_search_dock'))
+
+
+class PredicateSearchWidget(QtWidgets.QWidget):
+    """
+    This class implements the widget used to search predicates using the project search index.
+    """
+    ResultLimit = 100
+
+    sgnItemActivated = QtCore.pyqtSignal('QGraphicsItem')
+
+    def __init__(self, plugin):
+        """
+        Initialize the predicate search widget.
+        :type plugin: PredicateSearchPlugin
+        """
+        super().__init__(plugin.session)
+
+        self.plugin = plugin
+
+        self.icons = {
+            Item.AttributeNode: QtGui.QIcon(':/icons/18/ic_treeview_attribute'),
+            Item.ConceptNode: QtGui.QIcon(':/icons/18/ic_treeview_concept'),
+            Item.IndividualNode: QtGui.QIcon(':/icons/18/ic_treeview_instance'),
+            Item.RoleNode: QtGui.QIcon(':/icons/18/ic_treeview_role'),
+            Item.ValueDomainNode: QtGui.QIcon(':/icons/18/ic_treeview_value'),
+        }
+
+        self.search = StringField(self)
+        self.search.setAcceptDrops(False)
+        self.search.setClearButtonEnabled(True)
+        self.search.setPlaceholderText('Search...')
+        self.search.setFixedHeight(30)
+        self.results = QtWidgets.QListWidget(self)
+        self.results.setFont(Font('Roboto', 12))
+        self.results.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.results.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        self.results.setSelectionMode(QtWidgets.QListWidget.SingleSelection)
+        self.timer = CoalescingTimer(self)
+        self.mainLayout = QtWidgets.QVBoxLayout(self)
+        self.mainLayout.setContentsMargins(0, 0, 0, 0)
+        self.mainLayout.addWidget(self.search)
+        self.mainLayout.addWidget(self.results)
+
+        self.setContentsMargins(0, 0, 0, 0)
+        self.setMinimumWidth(216)
+
+        self.setStyleSheet("""
+            QLineEdit,
+            QLineEdit:editable,
+            QLineEdit:hover,
+            QLineEdit:pressed,
+            QLineEdit:focus {
+              border: none;
+              border-radius: 0;
+              background: #FFFFFF;
+              color: #000000;
+              padding: 4px 4px 4px 4px;
+            }
+        """)
+
+        connect(self.results.itemActivated, self.onResultActivated)
+        connect(self.results.itemDoubleClicked, self.onResultActivated)
+        connect(self.search.textChanged, self.doSearch)
+        connect(self.sgnItemActivated, self.session.doFocusItem)
+        connect(self.timer.timeout, self.doSearch)
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def project(self):
+        """
+        Returns the reference to the active project.
+        :rtype: Project
+        """
+        return self.session.project
+
+    @property
+    def session(self):
+        """
+        Returns the reference to the active session.
+        :rtype: Session
+        """
+        return self.plugin.parent()
+
+    #############################################
+    #   EVENTS
+    #################################
+
+    def paintEvent(self, paintEvent):
+        """
+        This is needed for the widget to pick the stylesheet.
+        :type paintEvent: QPaintEvent
+        """
+        option = QtWidgets.QStyleOption()
+        option.initFrom(self)
+        painter = QtGui.QPainter(self)
+        style = self.style()
+        style.drawPrimitive(QtWidgets.QStyle.PE_Widget, option, painter, self)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def doSearch(self):
+        """
+        Query the project search index using the content of the search field.
+        """
+        self.timer.stop()
+        self.results.clear()
+        text = self.search.value()
+        if text and self.session.searchIndex:
+            for item, name, _ in self.session.searchIndex.search(text, PredicateSearchWidget.ResultLimit):
+                result = QtWidgets.QListWidgetItem(self.icons.get(item, QtGui.QIcon()), name)
+                result.setData(QtCore.Qt.UserRole, (item, name))
+                result.setToolTip(item.shortName)
+                self.results.addItem(result)
+
+    @QtCore.pyqtSlot('QGraphicsScene', 'QGraphicsItem')
+    def onProjectItemChanged(self, diagram, item):
+        """
+        Executed whenever an item is added to or removed from the active project.
+        :type diagram: Diagram
+        :type item: AbstractItem
+        """
+        if self.search.value() and item.isNode() and item.isPredicate():
+            self.timer.schedule()
+
+    @QtCore.pyqtSlot(dict)
+    def onProjectPredicatesRenamed(self, renamed):
+        """
+        Executed whenever predicate nodes of the active project are renamed.
+        :type renamed: dict
+        """
+        if self.search.value():
+            self.timer.schedule()
+
+    @QtCore.pyqtSlot(QtWidgets.QListWidgetItem)
+    def onResultActivated(self, result):
+        """
+        Executed when a search result is activated.
+        :type result: QListWidgetItem
+        """
+        item, name = result.data(QtCore.Qt.UserRole)
+        node = first(self.project.predicates(item, name))
+        if node:
+            self.sgnItemActivated.emit(node)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def sizeHint(self):
+        """
+        Returns the recommended size for this widget.
+        :rtype: QtCore.QSize
+        """
+        return QtCore.QSize(216, 266)
\ No newline at end of file
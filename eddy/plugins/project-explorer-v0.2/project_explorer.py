@@ -64,6 +64,7 @@ class ProjectExplorerPlugin(AbstractPlugin):
         self.debug('Connecting to project: %s', self.project.name)
         connect(self.project.sgnDiagramAdded, widget.doAddDiagram)
         connect(self.project.sgnDiagramRemoved, widget.doRemoveDiagram)
+        connect(self.project.sgnDiagramRenamed, widget.doRenameDiagram)
         widget.setProject(self.project)
 
     #############################################
@@ -79,6 +80,7 @@ class ProjectExplorerPlugin(AbstractPlugin):
         self.debug('Disconnecting from project: %s', self.project.name)
         disconnect(self.project.sgnDiagramAdded, widget.doAddDiagram)
         disconnect(self.project.sgnDiagramRemoved, widget.doRemoveDiagram)
+        disconnect(self.project.sgnDiagramRenamed, widget.doRenameDiagram)
 
         # DISCONNECT FROM ACTIVE SESSION
         self.debug('Disconnecting from active session')
@@ -217,6 +219,18 @@ class ProjectExplorerWidget(QtWidgets.QWidget):
         if item:
             self.root.removeRow(item.index().row())
 
+    @QtCore.pyqtSlot('QGraphicsScene', str)
+    def doRenameDiagram(self, diagram, previous):
+        """
+        Rename a diagram in the treeview.
+        :type diagram: Diagram
+        :type previous: str
+        """
+        item = self.findItem(previous)
+        if item:
+            item.setText(diagram.name)
+            self.proxy.sort(0, QtCore.Qt.AscendingOrder)
+
     @QtCore.pyqtSlot('QModelIndex')
     def onItemDoubleClicked(self, index):
         """
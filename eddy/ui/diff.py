@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+
+from eddy.core.common import HasThreadingSystem
+from eddy.core.datatypes.qt import Font
+from eddy.core.diff import AxiomDiffWorker
+from eddy.core.functions.signals import connect
+from eddy.core.graph import Graph
+
+
+class AxiomDiffDialog(QtWidgets.QDialog, HasThreadingSystem):
+    """
+    Extends QtWidgets.QDialog providing a viewer for the axiom level differences between
+    the current project and another version of the same project stored in a Graphol file.
+    """
+    def __init__(self, project, path, parent=None):
+        """
+        Initialize the dialog.
+        :type project: Project
+        :type path: str
+        :type parent: QWidget
+        """
+        super().__init__(parent)
+
+        self.diff = None
+        self.path = path
+        self.project = project
+
+        #############################################
+        # PROGRESS AREA
+        #################################
+
+        self.progressBar = QtWidgets.QProgressBar(self)
+        self.progressBar.setAlignment(QtCore.Qt.AlignHCenter)
+        self.progressBar.setRange(0, 0)
+
+        #############################################
+        # DIFF AREA
+        #################################
+
+        self.model = QtCore.QStringListModel(self)
+        self.diffArea = QtWidgets.QListView(self)
+        self.diffArea.setAttribute(QtCore.Qt.WA_MacShowFocusRect, 0)
+        self.diffArea.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.diffArea.setFont(Font('Roboto Mono', 11))
+        self.diffArea.setLayoutMode(QtWidgets.QListView.Batched)
+        self.diffArea.setMinimumSize(800, 500)
+        self.diffArea.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.diffArea.setUniformItemSizes(True)
+        self.diffArea.setModel(self.model)
+
+        #############################################
+        # CONFIRMATION AREA
+        #################################
+
+        self.summaryLabel = QtWidgets.QLabel(self)
+        self.summaryLabel.setFont(Font('Roboto', 12))
+        self.summaryLabel.setText('Comparing with {0}...'.format(path))
+
+        self.confirmationBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok, QtCore.Qt.Horizontal, self)
+        self.confirmationBox.setContentsMargins(10, 0, 0, 0)
+        self.confirmationBox.setFont(Font('Roboto', 12))
+
+        self.bottomLayout = QtWidgets.QHBoxLayout()
+        self.bottomLayout.setContentsMargins(0, 0, 0, 0)
+        self.bottomLayout.addWidget(self.summaryLabel, 1)
+        self.bottomLayout.addWidget(self.confirmationBox, 0, QtCore.Qt.AlignRight)
+
+        #############################################
+        # SETUP DIALOG LAYOUT
+        #################################
+
+        self.mainLayout = QtWidgets.QVBoxLayout(self)
+        self.mainLayout.setContentsMargins(10, 10, 10, 10)
+        self.mainLayout.addWidget(self.progressBar)
+        self.mainLayout.addWidget(self.diffArea)
+        self.mainLayout.addLayout(self.bottomLayout)
+
+        connect(self.confirmationBox.accepted, self.accept)
+
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
+        self.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
+        self.setWindowTitle('Compare project')
+
+    #############################################
+    #   EVENTS
+    #################################
+
+    def closeEvent(self, closeEvent):
+        """
+        Executed when the dialog is closed.
+        :type closeEvent: QCloseEvent
+        """
+        self.stopThread('axiomDiff')
+        super().closeEvent(closeEvent)
+
+    def showEvent(self, showEvent):
+        """
+        Executed whenever the dialog is shown.
+        :type showEvent: QShowEvent
+        """
+        if self.diff is None:
+            # THE FILE IS THE OLD VERSION: ADDED AXIOMS ARE THE ONES INTRODUCED BY THE CURRENT PROJECT
+            worker = AxiomDiffWorker(self.path, Graph.fromProject(self.project))
+            connect(worker.sgnCompleted, self.onCompleted)
+            connect(worker.sgnError, self.onError)
+            self.startThread('axiomDiff', worker)
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot(object)
+    def onCompleted(self, diff):
+        """
+        Executed when the diff has been computed.
+        :type diff: AxiomDiff
+        """
+        self.diff = diff
+        self.model.setStringList(diff.report())
+        self.progressBar.setVisible(False)
+        if diff.isEmpty():
+            self.summaryLabel.setText('No differences found')
+        else:
+            self.summaryLabel.setText('{0} axioms added, {1} axioms removed, {2} predicates with changed metadata'.format(
+                len(diff.added()), len(diff.removed()), len(diff.metadata())))
+
+    @QtCore.pyqtSlot(str)
+    def onError(self, message):
+        """
+        Executed when the diff could not be computed.
+        :type message: str
+        """
+        self.progressBar.setVisible(False)
+        self.summaryLabel.setText('Comparison failed: {0}'.format(message))
\ No newline at end of file
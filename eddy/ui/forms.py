@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+import re
+
 from abc import ABCMeta
 from operator import attrgetter
 
@@ -41,7 +43,8 @@ from PyQt5 import QtGui
 from PyQt5 import QtWidgets
 
 from eddy.core.commands.labels import CommandLabelChange
-from eddy.core.datatypes.graphol import Identity
+from eddy.core.commands.project import CommandProjectRenamePredicates
+from eddy.core.datatypes.graphol import Identity, Item
 from eddy.core.datatypes.owl import Datatype
 from eddy.core.datatypes.qt import Font
 from eddy.core.functions.misc import isEmpty
@@ -260,11 +263,9 @@ class RefactorNameForm(QtWidgets.QDialog):
         Accepts the rename form and perform refactoring.
         """
         name = self.renameField.value()
-        self.session.undostack.beginMacro('change predicate "{0}" to "{1}"'.format(self.node.text(), name))
-        for node in self.project.predicates(self.node.type(), self.node.text()):
-            command = CommandLabelChange(node.diagram, node, node.text(), name, refactor=True)
-            self.session.undostack.push(command)
-        self.session.undostack.endMacro()
+        nodes = self.project.predicates(self.node.type(), self.node.text())
+        self.session.undostack.push(CommandProjectRenamePredicates(self.project, {x: name for x in nodes},
+            name='change predicate "{0}" to "{1}"'.format(self.node.text(), name)))
         super().accept()
 
     @QtCore.pyqtSlot()
@@ -285,6 +286,207 @@ class RefactorNameForm(QtWidgets.QDialog):
         self.setFixedSize(self.sizeHint())
 
 
+class RefactorNamesForm(QtWidgets.QDialog):
+    """
+    This class implements the form used to rename many predicates at once, either
+    by replacing a common prefix or by substituting a regular expression.
+    """
+    Modes = ('Prefix', 'Regular expression')
+    Types = (
+        ('All predicates', {Item.ConceptNode, Item.RoleNode, Item.AttributeNode, Item.IndividualNode}),
+        ('Concepts', {Item.ConceptNode}),
+        ('Roles', {Item.RoleNode}),
+        ('Attributes', {Item.AttributeNode}),
+        ('Individuals', {Item.IndividualNode}),
+    )
+
+    def __init__(self, session):
+        """
+        Initialize the form dialog.
+        :type session: Session
+        """
+        super().__init__(session)
+
+        #############################################
+        # FORM AREA
+        #################################
+
+        self.typeLabel = QtWidgets.QLabel(self)
+        self.typeLabel.setFont(Font('Roboto', 12))
+        self.typeLabel.setText('Predicates')
+        self.typeField = ComboBox(self)
+        self.typeField.setFixedWidth(200)
+        self.typeField.setFont(Font('Roboto', 12))
+        self.typeField.setScrollEnabled(False)
+        for text, _ in self.Types:
+            self.typeField.addItem(text)
+        connect(self.typeField.currentIndexChanged, self.fieldChanged)
+
+        self.modeLabel = QtWidgets.QLabel(self)
+        self.modeLabel.setFont(Font('Roboto', 12))
+        self.modeLabel.setText('Match')
+        self.modeField = ComboBox(self)
+        self.modeField.setFixedWidth(200)
+        self.modeField.setFont(Font('Roboto', 12))
+        self.modeField.setScrollEnabled(False)
+        for text in self.Modes:
+            self.modeField.addItem(text)
+        connect(self.modeField.currentIndexChanged, self.fieldChanged)
+
+        self.findLabel = QtWidgets.QLabel(self)
+        self.findLabel.setFont(Font('Roboto', 12))
+        self.findLabel.setText('Find')
+        self.findField = StringField(self)
+        self.findField.setFixedWidth(200)
+        self.findField.setFont(Font('Roboto', 12))
+        connect(self.findField.textChanged, self.fieldChanged)
+
+        self.replaceLabel = QtWidgets.QLabel(self)
+        self.replaceLabel.setFont(Font('Roboto', 12))
+        self.replaceLabel.setText('Replace')
+        self.replaceField = StringField(self)
+        self.replaceField.setFixedWidth(200)
+        self.replaceField.setFont(Font('Roboto', 12))
+        connect(self.replaceField.textChanged, self.fieldChanged)
+
+        self.formWidget = QtWidgets.QWidget(self)
+        self.formLayout = QtWidgets.QFormLayout(self.formWidget)
+        self.formLayout.addRow(self.typeLabel, self.typeField)
+        self.formLayout.addRow(self.modeLabel, self.modeField)
+        self.formLayout.addRow(self.findLabel, self.findField)
+        self.formLayout.addRow(self.replaceLabel, self.replaceField)
+
+        #############################################
+        # CONFIRMATION AREA
+        #################################
+
+        self.confirmationBox = QtWidgets.QDialogButtonBox(QtCore.Qt.Horizontal, self)
+        self.confirmationBox.addButton(QtWidgets.QDialogButtonBox.Ok)
+        self.confirmationBox.addButton(QtWidgets.QDialogButtonBox.Cancel)
+        self.confirmationBox.setContentsMargins(10, 0, 10, 10)
+        self.confirmationBox.setFont(Font('Roboto', 12))
+        self.confirmationBox.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(False)
+
+        #############################################
+        # SETUP DIALOG LAYOUT
+        #################################
+
+        self.caption = QtWidgets.QLabel(self)
+        self.caption.setFont(Font('Roboto', 12))
+        self.caption.setContentsMargins(8, 0, 8, 0)
+        self.caption.setVisible(False)
+
+        self.mainLayout = QtWidgets.QVBoxLayout(self)
+        self.mainLayout.setContentsMargins(0, 0, 0, 0)
+        self.mainLayout.addWidget(self.formWidget)
+        self.mainLayout.addWidget(self.caption)
+        self.mainLayout.addWidget(self.confirmationBox, 0, QtCore.Qt.AlignRight)
+
+        self.setFixedSize(self.sizeHint())
+        self.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
+        self.setWindowTitle('Rename predicates')
+
+        connect(self.confirmationBox.accepted, self.accept)
+        connect(self.confirmationBox.rejected, self.reject)
+
+    #############################################
+    #   PROPERTIES
+    #################################
+
+    @property
+    def project(self):
+        """
+        Returns the reference to the active project.
+        :rtype: Project
+        """
+        return self.session.project
+
+    @property
+    def session(self):
+        """
+        Returns the reference to the active session (alias for RefactorNamesForm.parent()).
+        :rtype: Session
+        """
+        return self.parent()
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def renames(self):
+        """
+        Returns a dict mapping each predicate node matched by the form to its new name.
+        Raises re.error if the regular expression supplied in the form is not valid.
+        :rtype: dict
+        """
+        find = self.findField.value()
+        replace = self.replaceField.value()
+        if isEmpty(find):
+            return dict()
+        if self.modeField.currentIndex() == self.Modes.index('Regular expression'):
+            pattern = re.compile(find)
+            substitute = lambda x: pattern.sub(replace, x)
+        else:
+            substitute = lambda x: '{0}{1}'.format(replace, x[len(find):]) if x.startswith(find) else x
+        renames = dict()
+        substitutions = dict()
+        types = self.Types[max(self.typeField.currentIndex(), 0)][1]
+        for node in self.project.predicates():
+            if node.type() in types and (node.type() is Item.IndividualNode or node.special() is None):
+                text = node.text()
+                if text not in substitutions:
+                    substitutions[text] = substitute(text)
+                if substitutions[text] != text and not isEmpty(substitutions[text]):
+                    renames[node] = substitutions[text]
+        return renames
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def accept(self):
+        """
+        Accepts the rename form and perform refactoring.
+        """
+        try:
+            renames = self.renames()
+        except re.error:
+            renames = None
+        if renames:
+            self.session.undostack.push(CommandProjectRenamePredicates(self.project, renames,
+                name='rename {0} predicate nodes matching "{1}"'.format(len(renames), self.findField.value())))
+        super().accept()
+
+    @QtCore.pyqtSlot()
+    def fieldChanged(self):
+        """
+        Executed whenever the content of one of the form fields changes.
+        """
+        caption = ''
+        enabled = False
+        invalid = False
+
+        if not isEmpty(self.findField.value()):
+            try:
+                renames = self.renames()
+            except re.error as e:
+                caption = "\'{0}\' is not a valid regular expression: {1}".format(self.findField.value(), e)
+                invalid = True
+            else:
+                predicates = len({(node.type(), node.text()) for node in renames})
+                caption = '{0} predicate(s) ({1} node(s)) will be renamed'.format(predicates, len(renames))
+                enabled = bool(renames)
+
+        self.caption.setProperty('class', 'invalid' if invalid else None)
+        self.caption.style().unpolish(self.caption)
+        self.caption.style().polish(self.caption)
+        self.caption.setText(caption)
+        self.caption.setVisible(not isEmpty(caption))
+        self.confirmationBox.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(enabled)
+        self.setFixedSize(self.sizeHint())
+
+
 class ValueForm(QtWidgets.QDialog):
     """
     This class implements the form used to select the Value of an Individual node.
@@ -33,6 +33,8 @@
 ##########################################################################
 
 
+import logging
+
 from PyQt5 import QtCore
 from PyQt5 import QtGui
 from PyQt5 import QtWidgets
@@ -41,6 +43,8 @@ from eddy.core.functions.signals import connect
 from eddy.core.output import getLogger
 from eddy.core.datatypes.qt import Font
 
+from eddy.ui.fields import ComboBox
+
 
 LOGGER = getLogger()
 
@@ -49,6 +53,13 @@ class LogDialog(QtWidgets.QDialog):
     """
     Extends QtWidgets.QDialog providing a log message viewer.
     """
+    Levels = (
+        ('All messages', logging.NOTSET),
+        ('Info', logging.INFO),
+        ('Warning', logging.WARNING),
+        ('Error', logging.ERROR),
+    )
+
     def __init__(self, parent=None):
         """
         Initialize the dialog.
@@ -56,30 +67,45 @@ class LogDialog(QtWidgets.QDialog):
         """
         super().__init__(parent)
 
-        stream = LOGGER.getDefaultStream()
-
         #############################################
         # MESSAGE AREA
         #################################
 
-        self.messageArea = QtWidgets.QPlainTextEdit(self)
+        self.model = LogModel(LOGGER.getDefaultBuffer(), self)
+        self.messageArea = QtWidgets.QListView(self)
         self.messageArea.setAttribute(QtCore.Qt.WA_MacShowFocusRect, 0)
         self.messageArea.setContentsMargins(10, 0, 0, 0)
+        self.messageArea.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.messageArea.setFont(Font('Roboto Mono', 11))
-        self.messageArea.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.messageArea.setLayoutMode(QtWidgets.QListView.Batched)
         self.messageArea.setMinimumSize(800, 500)
-        self.highlighter = LogHighlighter(self.messageArea.document())
-        self.messageArea.setPlainText(stream.getvalue())
-        self.messageArea.setReadOnly(True)
+        self.messageArea.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.messageArea.setModel(self.model)
 
         #############################################
         # CONFIRMATION AREA
         #################################
 
+        self.levelField = ComboBox(self)
+        self.levelField.setFont(Font('Roboto', 12))
+        self.levelField.setScrollEnabled(False)
+        for text, level in self.Levels:
+            self.levelField.addItem(text, level)
+        connect(self.levelField.currentIndexChanged, self.onLevelChanged)
+
+        self.summaryLabel = QtWidgets.QLabel(self)
+        self.summaryLabel.setFont(Font('Roboto', 12))
+
         self.confirmationBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok, QtCore.Qt.Horizontal, self)
         self.confirmationBox.setContentsMargins(10, 0, 0, 0)
         self.confirmationBox.setFont(Font('Roboto', 12))
 
+        self.bottomLayout = QtWidgets.QHBoxLayout()
+        self.bottomLayout.setContentsMargins(0, 0, 0, 0)
+        self.bottomLayout.addWidget(self.levelField)
+        self.bottomLayout.addWidget(self.summaryLabel, 1)
+        self.bottomLayout.addWidget(self.confirmationBox, 0, QtCore.Qt.AlignRight)
+
         #############################################
         # SETUP DIALOG LAYOUT
         #################################
@@ -87,50 +113,123 @@ class LogDialog(QtWidgets.QDialog):
         self.mainLayout = QtWidgets.QVBoxLayout(self)
         self.mainLayout.setContentsMargins(10, 10, 10, 10)
         self.mainLayout.addWidget(self.messageArea)
-        self.mainLayout.addWidget(self.confirmationBox, 0, QtCore.Qt.AlignRight)
+        self.mainLayout.addLayout(self.bottomLayout)
 
         connect(self.confirmationBox.accepted, self.accept)
 
         self.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
         self.setWindowTitle('Log')
+        self.updateSummary()
+
+    #############################################
+    #   SLOTS
+    #################################
+
+    @QtCore.pyqtSlot()
+    def onLevelChanged(self):
+        """
+        Executed whenever the minimum level of the displayed messages changes.
+        """
+        self.model.setLevel(self.levelField.value())
+        self.updateSummary()
 
+    #############################################
+    #   INTERFACE
+    #################################
 
-class LogHighlighter(QtGui.QSyntaxHighlighter):
+    def updateSummary(self):
+        """
+        Update the label summarizing the content of the log buffer.
+        """
+        buffer = self.model.buffer
+        text = '{0} messages'.format(len(self.model.records))
+        if buffer.discarded():
+            text = '{0} ({1} older messages discarded)'.format(text, buffer.discarded())
+        self.summaryLabel.setText(text)
+
+
+class LogModel(QtCore.QAbstractListModel):
     """
-    Extends QtGui.QSyntaxHighlighter providing a syntax highlighter for log messages.
+    Extends QtCore.QAbstractListModel exposing a snapshot of the log buffer.
+    Rows are handed over to the view one page at a time, and log lines are only
+    formatted when the view requests them, so that the dialog opens immediately
+    regardless of the number of records stored in the buffer.
     """
-    def __init__(self, document):
+    PageSize = 1000
+
+    def __init__(self, buffer, parent=None):
+        """
+        Initialize the log model.
+        :type buffer: OutputBuffer
+        :type parent: QtCore.QObject
         """
-        Initialize the syntax highlighter.
-        :type document: QTextDocument
+        super().__init__(parent)
+        self.brushes = {
+            logging.CRITICAL: QtGui.QBrush(QtGui.QColor('#8000FF')),
+            logging.ERROR: QtGui.QBrush(QtGui.QColor('#FF0000')),
+            logging.WARNING: QtGui.QBrush(QtGui.QColor('#FFAE00')),
+        }
+        self.buffer = buffer
+        self.level = logging.NOTSET
+        self.records = buffer.snapshot()
+        self.size = min(len(self.records), LogModel.PageSize)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
         """
-        super().__init__(document)
-        self.rules = [
-            (QtCore.QRegExp(r'^(.{10})\s(.{8})\s+CRITICAL\s+(.*)$'), 0, self.fmt('#8000FF')),
-            (QtCore.QRegExp(r'^(.{10})\s(.{8})\s+ERROR\s+(.*)$'), 0, self.fmt('#FF0000')),
-            (QtCore.QRegExp(r'^(.{10})\s(.{8})\s+WARNING\s+(.*)$'), 0, self.fmt('#FFAE00')),
-        ]
+        Returns True if there are more records to be handed over to the view.
+        :type parent: QtCore.QModelIndex
+        :rtype: bool
+        """
+        return not parent.isValid() and self.size < len(self.records)
 
-    @staticmethod
-    def fmt(color):
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data stored under the given role for the record referred to by the index.
+        :type index: QtCore.QModelIndex
+        :type role: int
+        :rtype: object
+        """
+        if index.isValid() and 0 <= index.row() < self.size:
+            record = self.records[index.row()]
+            if role == QtCore.Qt.DisplayRole:
+                return self.buffer.formatRecord(record)
+            if role == QtCore.Qt.ForegroundRole:
+                for level in sorted(self.brushes, reverse=True):
+                    if record.levelno >= level:
+                        return self.brushes[level]
+        return None
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        """
+        Hand over the next page of records to the view.
+        :type parent: QtCore.QModelIndex
+        """
+        if not parent.isValid():
+            count = min(len(self.records) - self.size, LogModel.PageSize)
+            if count > 0:
+                self.beginInsertRows(QtCore.QModelIndex(), self.size, self.size + count - 1)
+                self.size += count
+                self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
         """
-        Return a QTextCharFormat with the given attributes.
+        Returns the number of rows handed over to the view.
+        :type parent: QtCore.QModelIndex
+        :rtype: int
         """
-        _color = QtGui.QColor()
-        _color.setNamedColor(color)
-        _format = QtGui.QTextCharFormat()
-        _format.setForeground(_color)
-        return _format
+        return 0 if parent.isValid() else self.size
 
-    def highlightBlock(self, text):
+    def setLevel(self, level):
         """
-        Apply syntax highlighting to the given block of text.
-        :type text: str
+        Reload the model so that it only contains records having at least the given level.
+        :type level: int
         """
-        for exp, nth, fmt in self.rules:
-            index = exp.indexIn(text, 0)
-            while index >= 0:
-                index = exp.pos(nth)
-                length = len(exp.cap(nth))
-                self.setFormat(index, length, fmt)
-                index = exp.indexIn(text, index + length)
+        self.beginResetModel()
+        self.level = level
+        self.records = self.buffer.snapshot(level)
+        self.size = min(len(self.records), LogModel.PageSize)
+        self.endResetModel()
\ No newline at end of file
@@ -83,13 +83,26 @@ class MdiArea(QtWidgets.QMdiArea):
     @QtCore.pyqtSlot('QGraphicsScene')
     def onDiagramRemoved(self, diagram):
         """
-        Executed when a diagram is renamed.
+        Executed when a diagram is removed.
         :type diagram: Diagram
         """
         for subwindow in self.subWindowList():
             if subwindow.diagram is diagram:
                 subwindow.close()
 
+    @QtCore.pyqtSlot('QGraphicsScene', str)
+    def onDiagramRenamed(self, diagram, _):
+        """
+        Executed when a diagram is renamed.
+        :type diagram: Diagram
+        :type _: str
+        """
+        for subwindow in self.subWindowList():
+            if subwindow.diagram is diagram:
+                subwindow.setWindowTitle(diagram.name)
+                if subwindow is self.activeSubWindow():
+                    self.session.setWindowTitle(self.session.project, diagram)
+
     @QtCore.pyqtSlot(QtWidgets.QMdiSubWindow)
     def onSubWindowActivated(self, subwindow):
         """
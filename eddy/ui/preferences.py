@@ -84,8 +84,22 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         spinbox.setValue(settings.value('diagram/size', 5000, int))
         self.addWidget(spinbox)
 
+        prefix = QtWidgets.QLabel(self, objectName='undo_budget_prefix')
+        prefix.setFont(Font('Roboto', 12))
+        prefix.setText('Undo history budget (MB)')
+        self.addWidget(prefix)
+
+        spinbox = SpinBox(self, objectName='undo_budget_field')
+        spinbox.setFont(Font('Roboto', 12))
+        spinbox.setRange(0, 4096)
+        spinbox.setSingleStep(16)
+        spinbox.setToolTip('Memory budget of the undo history: older commands are compacted when exceeded (0 = no budget)')
+        spinbox.setValue(settings.value('undo/budget', 64, int))
+        self.addWidget(spinbox)
+
         formlayout = QtWidgets.QFormLayout()
         formlayout.addRow(self.widget('diagram_size_prefix'), self.widget('diagram_size_field'))
+        formlayout.addRow(self.widget('undo_budget_prefix'), self.widget('undo_budget_field'))
         groupbox = QtWidgets.QGroupBox('Editor', self, objectName='editor_widget')
         groupbox.setLayout(formlayout)
         self.addWidget(groupbox)
@@ -381,6 +395,7 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
         #################################
 
         settings.setValue('diagram/size', self.widget('diagram_size_field').value())
+        settings.setValue('undo/budget', self.widget('undo_budget_field').value())
         settings.setValue('update/channel', self.widget('update_channel_switch').currentText())
         settings.setValue('update/check_on_startup', self.widget('update_startup_checkbox').isChecked())
 
@@ -390,4 +405,6 @@ class PreferencesDialog(QtWidgets.QDialog, HasWidgetSystem):
 
         settings.sync()
 
+        self.session.undostack.setBudget(self.widget('undo_budget_field').value() * 1024 * 1024)
+
         super().accept()
\ No newline at end of file
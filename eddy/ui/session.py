@@ -48,7 +48,7 @@ from eddy import ORGANIZATION, VERSION, WORKSPACE
 from eddy.core.clipboard import Clipboard
 from eddy.core.commands.common import CommandComposeAxiom
 from eddy.core.commands.common import CommandItemsRemove
-from eddy.core.commands.common import CommandItemsTranslate
+from eddy.core.commands.common import CommandItemsTransform
 from eddy.core.commands.common import CommandSnapItemsToGrid
 from eddy.core.commands.diagram import CommandDiagramAdd
 from eddy.core.commands.diagram import CommandDiagramRemove
@@ -61,6 +61,7 @@ from eddy.core.commands.nodes import CommandNodeSwitchTo
 from eddy.core.commands.nodes import CommandNodeSetBrush
 from eddy.core.commands.nodes import CommandNodeSetDepth
 from eddy.core.commands.project import CommandProjectSetProfile
+from eddy.core.commands.stack import UndoStack
 from eddy.core.common import HasActionSystem
 from eddy.core.common import HasDiagramExportSystem
 from eddy.core.common import HasDiagramLoadSystem
@@ -81,33 +82,43 @@ from eddy.core.datatypes.owl import Datatype, Facet
 from eddy.core.datatypes.qt import BrushIcon, Font
 from eddy.core.datatypes.system import Channel, File
 from eddy.core.diagram import Diagram
+from eddy.core.exporters.batch import BatchDiagramExporter
 from eddy.core.exporters.graphml import GraphMLDiagramExporter
 from eddy.core.exporters.graphol import GrapholProjectExporter
 from eddy.core.exporters.owl2 import OWLOntologyExporter
+from eddy.core.exporters.image import PngDiagramExporter
 from eddy.core.exporters.pdf import PdfDiagramExporter
+from eddy.core.exporters.pdf import PdfProjectExporter
 from eddy.core.exporters.printer import PrinterDiagramExporter
 from eddy.core.factory import MenuFactory, PropertyFactory
 from eddy.core.functions.fsystem import fexists
-from eddy.core.functions.misc import first, format_exception
-from eddy.core.functions.misc import snap, snapF
+from eddy.core.functions.misc import first, format_exception, postfix
+from eddy.core.functions.misc import snapF
 from eddy.core.functions.path import expandPath
 from eddy.core.functions.path import shortPath
 from eddy.core.functions.signals import connect
+from eddy.core.layout import AutoLayout
 from eddy.core.loaders.graphml import GraphMLOntologyLoader
 from eddy.core.loaders.graphol import GrapholOntologyLoader_v2
 from eddy.core.loaders.graphol import GrapholProjectLoader_v2
+from eddy.core.loaders.importer import OntologyImporter
 from eddy.core.output import getLogger
 from eddy.core.plugin import PluginManager
 from eddy.core.profiles.owl2 import OWL2Profile
 from eddy.core.profiles.owl2ql import OWL2QLProfile
 from eddy.core.profiles.owl2rl import OWL2RLProfile
+from eddy.core.search import PredicateSearchIndex
+from eddy.core.timer import CoalescingTimer
+from eddy.core.trace import Tracer
 from eddy.core.update import UpdateCheckWorker
 
 from eddy.ui.about import AboutDialog
+from eddy.ui.diff import AxiomDiffDialog
 from eddy.ui.fields import ComboBox
 from eddy.ui.forms import CardinalityRestrictionForm
 from eddy.ui.forms import NewDiagramForm
 from eddy.ui.forms import RefactorNameForm
+from eddy.ui.forms import RefactorNamesForm
 from eddy.ui.forms import RenameDiagramForm
 from eddy.ui.forms import ValueForm
 from eddy.ui.log import LogDialog
@@ -115,7 +126,6 @@ from eddy.ui.mdi import MdiArea
 from eddy.ui.mdi import MdiSubWindow
 from eddy.ui.plugin import PluginInstallDialog
 from eddy.ui.preferences import PreferencesDialog
-from eddy.ui.progress import BusyProgressDialog
 from eddy.ui.syntax import SyntaxValidationDialog
 from eddy.ui.view import DiagramView
 
@@ -175,12 +185,14 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
 
         self.app = application
         self.clipboard = Clipboard(self)
-        self.undostack = QtWidgets.QUndoStack(self)
+        self.undostack = UndoStack(self)
         self.mdi = MdiArea(self)
         self.mf = MenuFactory(self)
         self.pf = PropertyFactory(self)
         self.pmanager = PluginManager(self)
         self.project = None
+        self.searchIndex = None
+        self.stateTimer = CoalescingTimer(self)
 
         #############################################
         # CONFIGURE SESSION
@@ -206,6 +218,8 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         worker = self.createProjectLoader(File.Graphol, path, self)
         worker.run()
 
+        self.searchIndex = PredicateSearchIndex(self.project, self)
+
         #############################################
         # COMPLETE SESSION SETUP
         #################################
@@ -272,6 +286,14 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         action.setData(LogDialog)
         self.addAction(action)
 
+        action = QtWidgets.QAction(
+            QtGui.QIcon(':/icons/24/ic_code_black'), 'Performance tracing',
+            self, objectName='toggle_tracing', checkable=True,
+            statusTip='Record a performance trace to be saved in Chrome trace event format',
+            triggered=self.doToggleTracing)
+        action.setChecked(Tracer.isEnabled())
+        self.addAction(action)
+
         action = QtWidgets.QAction(
             QtGui.QIcon(':/icons/24/ic_extension_black'), 'Install Plugin...',
             self, objectName='install_plugin', statusTip='Install a plugin',
@@ -378,6 +400,11 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             self, objectName='syntax_check', triggered=self.doSyntaxCheck,
             statusTip='Run syntax validation according to the selected profile'))
 
+        self.addAction(QtWidgets.QAction(
+            QtGui.QIcon(':/icons/24/ic_compare_arrows_black'), 'Compare with...',
+            self, objectName='compare_project', triggered=self.doCompareProject,
+            statusTip='Compare the OWL 2 axioms of the project with another version of it'))
+
         #############################################
         # DIAGRAM SPECIFIC
         #################################
@@ -393,12 +420,35 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             statusTip='Open current diagram properties',
             triggered=self.doOpenDiagramProperties))
 
+        self.addAction(QtWidgets.QAction(
+            QtGui.QIcon(':/icons/24/ic_transform_black'), 'Auto layout',
+            self, objectName='auto_layout', enabled=False,
+            statusTip='Arrange the selected nodes (or the whole active diagram) using a force directed layout',
+            triggered=self.doAutoLayout))
+
         self.addAction(QtWidgets.QAction(
             QtGui.QIcon(':/icons/24/ic_healing_black'), 'Snap to grid',
             self, objectName='snap_to_grid', enabled=False,
             statusTip='Align the elements in the active diagram to the grid',
             triggered=self.doSnapTopGrid))
 
+        data = OrderedDict()
+        data[QtCore.Qt.AlignLeft] = 'Align left'
+        data[QtCore.Qt.AlignHCenter] = 'Align center'
+        data[QtCore.Qt.AlignRight] = 'Align right'
+        data[QtCore.Qt.AlignTop] = 'Align top'
+        data[QtCore.Qt.AlignVCenter] = 'Align middle'
+        data[QtCore.Qt.AlignBottom] = 'Align bottom'
+
+        group = QtWidgets.QActionGroup(self, objectName='align', enabled=False)
+        for k, v in data.items():
+            action = QtWidgets.QAction(v, group,
+                statusTip='{0} the selected nodes'.format(v),
+                triggered=self.doAlignNodes)
+            action.setData(k)
+            group.addAction(action)
+        self.addAction(group)
+
         icon = QtGui.QIcon()
         icon.addFile(':/icons/24/ic_grid_on_black', QtCore.QSize(), QtGui.QIcon.Normal, QtGui.QIcon.On)
         icon.addFile(':/icons/24/ic_grid_off_black', QtCore.QSize(), QtGui.QIcon.Normal, QtGui.QIcon.Off)
@@ -483,6 +533,12 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             self, objectName='refactor_name',
             triggered=self.doRefactorName))
 
+        self.addAction(QtWidgets.QAction(
+            QtGui.QIcon(':/icons/24/ic_label_outline_black'), 'Rename predicates...',
+            self, objectName='refactor_names',
+            statusTip='Rename many predicates at once by prefix or regular expression',
+            triggered=self.doRefactorNames))
+
         self.addAction(QtWidgets.QAction(
             QtGui.QIcon(':/icons/24/ic_refresh_black'), 'Relocate label',
             self, objectName='relocate_label',
@@ -642,8 +698,11 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         """
         self.addDiagramExporter(GraphMLDiagramExporter)
         self.addDiagramExporter(PdfDiagramExporter)
+        self.addDiagramExporter(PngDiagramExporter)
         self.addOntologyExporter(OWLOntologyExporter)
         self.addProjectExporter(GrapholProjectExporter)
+        self.addProjectExporter(PdfProjectExporter)
+        self.addProjectExporter(BatchDiagramExporter)
 
     def initLoaders(self):
         """
@@ -680,6 +739,10 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         menu.addAction(self.action('quit'))
         self.addMenu(menu)
 
+        menu = QtWidgets.QMenu('Align', objectName='align')
+        menu.addActions(self.action('align').actions())
+        self.addMenu(menu)
+
         menu = QtWidgets.QMenu('\u200CEdit', objectName='edit')
         menu.addAction(self.action('undo'))
         menu.addAction(self.action('redo'))
@@ -691,11 +754,15 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         menu.addSeparator()
         menu.addAction(self.action('bring_to_front'))
         menu.addAction(self.action('send_to_back'))
+        menu.addMenu(self.menu('align'))
         menu.addSeparator()
         menu.addAction(self.action('swap_edge'))
         menu.addSeparator()
+        menu.addAction(self.action('refactor_names'))
+        menu.addSeparator()
         menu.addAction(self.action('select_all'))
         menu.addAction(self.action('snap_to_grid'))
+        menu.addAction(self.action('auto_layout'))
         menu.addAction(self.action('center_diagram'))
         menu.addSeparator()
         menu.addAction(self.action('open_preferences'))
@@ -723,12 +790,14 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
 
         menu = QtWidgets.QMenu('Ontology', objectName='ontology')
         menu.addAction(self.action('syntax_check'))
+        menu.addAction(self.action('compare_project'))
         self.addMenu(menu)
 
         menu = QtWidgets.QMenu('Tools', objectName='tools')
         menu.addAction(self.action('install_plugin'))
         menu.addSeparator()
         menu.addAction(self.action('system_log'))
+        menu.addAction(self.action('toggle_tracing'))
         self.addMenu(menu)
 
         menu = QtWidgets.QMenu('Help', objectName='help')
@@ -870,6 +939,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         Connect session specific signals to their slots.
         """
         connect(self.undostack.cleanChanged, self.doUpdateState)
+        connect(self.undostack.sgnFootprintChanged, self.onUndoFootprintChanged)
         connect(self.sgnCheckForUpdate, self.doCheckForUpdate)
         connect(self.sgnFocusDiagram, self.doFocusDiagram)
         connect(self.sgnFocusItem, self.doFocusItem)
@@ -877,6 +947,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         connect(self.sgnReady, self.onSessionReady)
         connect(self.sgnSaveProject, self.doSave)
         connect(self.sgnUpdateState, self.doUpdateState)
+        connect(self.stateTimer.timeout, self.doUpdateState)
 
     def initState(self):
         """
@@ -886,6 +957,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         self.restoreGeometry(settings.value('session/geometry', QtCore.QByteArray(), QtCore.QByteArray))
         self.restoreState(settings.value('session/state', QtCore.QByteArray(), QtCore.QByteArray))
         self.action('toggle_grid').setChecked(settings.value('diagram/grid', False, bool))
+        self.undostack.setBudget(settings.value('undo/budget', 64, int) * 1024 * 1024)
 
     def initStatusBar(self):
         """
@@ -893,6 +965,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         """
         statusbar = QtWidgets.QStatusBar(self)
         statusbar.addPermanentWidget(self.widget('progress_bar'))
+        statusbar.addPermanentWidget(self.widget('undo_footprint'))
         statusbar.addPermanentWidget(QtWidgets.QWidget())
         statusbar.setSizeGripEnabled(False)
         self.setStatusBar(statusbar)
@@ -970,10 +1043,51 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         progressBar.setVisible(False)
         self.addWidget(progressBar)
 
+        label = QtWidgets.QLabel(objectName='undo_footprint')
+        label.setContentsMargins(0, 0, 0, 0)
+        label.setFont(Font('Roboto', 11))
+        label.setStatusTip('Estimated memory used by the undo history')
+        label.setText('Undo history: 0.0 MB')
+        self.addWidget(label)
+
     #############################################
     #   SLOTS
     #################################
 
+    @QtCore.pyqtSlot()
+    def doAlignNodes(self):
+        """
+        Align the selected nodes of the active diagram.
+        """
+        diagram = self.mdi.activeDiagram()
+        if diagram:
+            diagram.setMode(DiagramMode.Idle)
+            action = self.sender()
+            selected = diagram.selectedNodes()
+            if len(selected) > 1:
+                undo = diagram.geometry(selected, ())
+                redo = undo.copy().align(action.data())
+                nodes, _ = undo.changed(redo)
+                if nodes:
+                    name = 'align {0} nodes'.format(len(selected))
+                    self.undostack.push(CommandItemsTransform(diagram, undo, redo, name))
+
+    @QtCore.pyqtSlot()
+    def doAutoLayout(self):
+        """
+        Arrange the selected nodes (or all the nodes if none is selected) of the active diagram.
+        """
+        diagram = self.mdi.activeDiagram()
+        if diagram:
+            diagram.setMode(DiagramMode.Idle)
+            layout = AutoLayout(diagram, diagram.selectedNodes() or None, parent=self)
+            connect(layout.sgnCompleted, layout.deleteLater)
+            connect(layout.sgnCompleted, self.statusBar().clearMessage)
+            if layout.start():
+                self.statusBar().showMessage('Computing the layout of {0} nodes...'.format(len(layout.nodes)))
+            else:
+                layout.deleteLater()
+
     @QtCore.pyqtSlot()
     def doBringToFront(self):
         """
@@ -1014,9 +1128,9 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
                 moveX = snapF(((R1.right() - R2.right()) - (R2.left() - R1.left())) / 2, Diagram.GridSize)
                 moveY = snapF(((R1.bottom() - R2.bottom()) - (R2.top() - R1.top())) / 2, Diagram.GridSize)
                 if moveX or moveY:
-                    items = [x for x in items if x.isNode() or x.isEdge()]
-                    command = CommandItemsTranslate(diagram, items, moveX, moveY, 'center diagram')
-                    self.undostack.push(command)
+                    undo = diagram.geometry()
+                    redo = undo.copy().translate(moveX, moveY)
+                    self.undostack.push(CommandItemsTransform(diagram, undo, redo, 'center diagram'))
                     self.mdi.activeView().centerOn(0, 0)
 
     @QtCore.pyqtSlot()
@@ -1050,6 +1164,21 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         self.close()
         self.sgnClosed.emit()
 
+    @QtCore.pyqtSlot()
+    def doCompareProject(self):
+        """
+        Compare the OWL 2 axioms of the active project with the ones of another version of it.
+        """
+        dialog = QtWidgets.QFileDialog(self)
+        dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptOpen)
+        dialog.setDirectory(expandPath(self.project.path))
+        dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+        dialog.setNameFilters([File.Graphol.value])
+        dialog.setViewMode(QtWidgets.QFileDialog.Detail)
+        if dialog.exec_():
+            window = AxiomDiffDialog(self.project, expandPath(first(dialog.selectedFiles())), self)
+            window.show()
+
     @QtCore.pyqtSlot()
     def doComposePropertyExpression(self):
         """
@@ -1222,15 +1351,30 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             filetype = File.valueOf(dialog.selectedNameFilter())
             selected = [x for x in dialog.selectedFiles() if File.forPath(x) is filetype and fexists(x)]
             if selected:
-                try:
-                    with BusyProgressDialog(parent=self) as progress:
-                        for path in selected:
-                            progress.setWindowTitle('Importing {0}...'.format(os.path.basename(path)))
-                            worker = self.createOntologyLoader(filetype, path, self.project, self)
-                            worker.run()
-                except Exception as e:
+                loop = QtCore.QEventLoop(self)
+                importer = OntologyImporter(filetype, selected, self.project, self)
+                progress = QtWidgets.QProgressDialog(self)
+                progress.setAutoClose(False)
+                progress.setLabelText('Parsing {0} file(s)...'.format(len(selected)))
+                progress.setRange(0, len(selected))
+                progress.setValue(0)
+                progress.setWindowIcon(QtGui.QIcon(':/icons/128/ic_eddy'))
+                progress.setWindowModality(QtCore.Qt.WindowModal)
+                progress.setWindowTitle('Importing...')
+                connect(progress.canceled, importer.cancel)
+                connect(importer.sgnFinished, loop.quit)
+                connect(importer.sgnProgress, lambda done, _: progress.setValue(done))
+                connect(importer.sgnStarted, lambda path: progress.setLabelText(
+                    'Importing {0}...'.format(os.path.basename(path))))
+                progress.show()
+                importer.start()
+                if not importer.completed:
+                    loop.exec_()
+                progress.close()
+                importer.deleteLater()
+                if importer.errors:
                     msgbox = QtWidgets.QMessageBox(self)
-                    msgbox.setDetailedText(format_exception(e))
+                    msgbox.setDetailedText('\n'.join(format_exception(e) for _, e in importer.errors))
                     msgbox.setIconPixmap(QtGui.QIcon(':/icons/48/ic_error_outline_black').pixmap(48))
                     msgbox.setStandardButtons(QtWidgets.QMessageBox.Close)
                     msgbox.setText('Eddy could not import all the selected files!')
@@ -1302,7 +1446,7 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             diagram = Diagram.create(name, size, self.project)
             connect(diagram.sgnItemAdded, self.project.doAddItem)
             connect(diagram.sgnItemRemoved, self.project.doRemoveItem)
-            connect(diagram.selectionChanged, self.doUpdateState)
+            connect(diagram.selectionChanged, self.onDiagramSelectionChanged)
             self.undostack.push(CommandDiagramAdd(diagram, self.project))
             self.sgnFocusDiagram.emit(diagram)
 
@@ -1464,6 +1608,17 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
                  dialog = RefactorNameForm(node, self)
                  dialog.exec_()
 
+    @QtCore.pyqtSlot()
+    def doRefactorNames(self):
+        """
+        Rename many predicates at once, matching their names by prefix or regular expression.
+        """
+        diagram = self.mdi.activeDiagram()
+        if diagram:
+            diagram.setMode(DiagramMode.Idle)
+        dialog = RefactorNamesForm(self)
+        dialog.exec_()
+
     @QtCore.pyqtSlot()
     def doRelocateLabel(self):
         """
@@ -1729,29 +1884,12 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         diagram = self.mdi.activeDiagram()
         if diagram:
             diagram.setMode(DiagramMode.Idle)
-            data = {'redo': {'nodes': {}, 'edges': {}}, 'undo': {'nodes': {}, 'edges': {}}}
-            for item in diagram.items():
-                if item.isNode():
-                    undoPos = item.pos()
-                    redoPos = snap(undoPos, Diagram.GridSize)
-                    if undoPos != redoPos:
-                        data['undo']['nodes'][item] = {
-                            'pos': undoPos,
-                            'anchors': {k: v for k, v in item.anchors.items()}
-                        }
-                        data['redo']['nodes'][item] = {
-                            'pos': redoPos,
-                            'anchors': {k: v + redoPos - undoPos for k, v in item.anchors.items()}
-                        }
-                elif item.isEdge():
-                    undoPts = item.breakpoints
-                    redoPts = [snap(x, Diagram.GridSize) for x in undoPts]
-                    if undoPts != redoPts:
-                        data['undo']['edges'][item] = {'breakpoints': undoPts}
-                        data['redo']['edges'][item] = {'breakpoints': redoPts}
-
-            if data['undo']['nodes'] or data['undo']['edges']:
-                self.undostack.push(CommandSnapItemsToGrid(diagram, data))
+            geometry = diagram.geometry()
+            nodes, edges = geometry.changed(geometry.copy().snap(Diagram.GridSize))
+            if nodes or edges:
+                undo = diagram.geometry(nodes, edges)
+                redo = undo.copy().snap(Diagram.GridSize)
+                self.undostack.push(CommandSnapItemsToGrid(diagram, undo, redo))
 
     @QtCore.pyqtSlot()
     def doSwapEdge(self):
@@ -1823,62 +1961,82 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
             viewport = subwindow.view.viewport()
             viewport.update()
 
+    @QtCore.pyqtSlot()
+    def doToggleTracing(self):
+        """
+        Start recording a performance trace, or stop recording it and save it to disk.
+        """
+        if self.action('toggle_tracing').isChecked():
+            Tracer.start()
+            LOGGER.info('Performance tracing started')
+        else:
+            Tracer.stop()
+            LOGGER.info('Performance tracing stopped (%s events recorded)', len(Tracer.events))
+            dialog = QtWidgets.QFileDialog(self)
+            dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave)
+            dialog.setDirectory(expandPath('~/'))
+            dialog.setFileMode(QtWidgets.QFileDialog.AnyFile)
+            dialog.setNameFilters([File.Json.value])
+            dialog.setViewMode(QtWidgets.QFileDialog.Detail)
+            dialog.selectFile('trace')
+            if dialog.exec_():
+                path = postfix(expandPath(first(dialog.selectedFiles())), File.Json.extension)
+                Tracer.dump(path)
+                LOGGER.info('Performance trace saved to %s', path)
+
     @QtCore.pyqtSlot()
     def doUpdateState(self):
         """
         Update built-in actions according to the application state.
         """
-        isDomainRangeUsable = False
         isDiagramActive = False
         isClipboardEmpty = True
-        isEdgeSelected = False
         isEdgeSwapEnabled = False
-        isNodeSelected = False
-        isPredicateSelected = False
         isProjectEmpty = self.project.isEmpty()
         isUndoStackClean = self.undostack.isClean()
 
+        self.stateTimer.stop()
+
+        diagram = None
         if self.mdi.subWindowList():
             diagram = self.mdi.activeDiagram()
-            restrictables = {Item.AttributeNode, Item.RoleNode}
-            predicates = {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.IndividualNode}
             if diagram:
-                nodes = diagram.selectedNodes()
-                edges = diagram.selectedEdges()
                 isDiagramActive = True
                 isClipboardEmpty = self.clipboard.empty()
-                isEdgeSelected = first(edges) is not None
-                isNodeSelected = first(nodes) is not None
-                isDomainRangeUsable = any([x.type() in restrictables for x in nodes])
-                isPredicateSelected = any([x.type() in predicates for x in nodes])
-                if isEdgeSelected:
-                    for edge in edges:
+                if diagram.selectionCount(lambda x: Item.InclusionEdge <= x <= Item.MembershipEdge):
+                    for edge in diagram.selectedEdges():
                         isEdgeSwapEnabled = edge.isSwapAllowed()
                         if isEdgeSwapEnabled:
                             break
 
-        self.action('bring_to_front').setEnabled(isNodeSelected)
+        self.updateSelectionState(diagram)
+        self.action('auto_layout').setEnabled(isDiagramActive)
         self.action('center_diagram').setEnabled(isDiagramActive)
-        self.action('cut').setEnabled(isNodeSelected)
-        self.action('copy').setEnabled(isNodeSelected)
-        self.action('delete').setEnabled(isNodeSelected or isEdgeSelected)
-        self.action('purge').setEnabled(isNodeSelected)
         self.action('export').setEnabled(not isProjectEmpty)
         self.action('paste').setEnabled(not isClipboardEmpty)
-        self.action('property_domain').setEnabled(isDomainRangeUsable)
-        self.action('property_domain_range').setEnabled(isDomainRangeUsable)
-        self.action('property_range').setEnabled(isDomainRangeUsable)
         self.action('save').setEnabled(not isUndoStackClean)
         self.action('save_as').setEnabled(isDiagramActive)
         self.action('select_all').setEnabled(isDiagramActive)
-        self.action('send_to_back').setEnabled(isNodeSelected)
         self.action('snap_to_grid').setEnabled(isDiagramActive)
         self.action('syntax_check').setEnabled(not isProjectEmpty)
-        self.action('swap_edge').setEnabled(isEdgeSelected and isEdgeSwapEnabled)
+        self.action('compare_project').setEnabled(not isProjectEmpty)
+        self.action('swap_edge').setEnabled(isEdgeSwapEnabled)
         self.action('toggle_grid').setEnabled(isDiagramActive)
-        self.widget('button_set_brush').setEnabled(isPredicateSelected)
         self.widget('profile_switch').setCurrentText(self.project.profile.name())
 
+    @QtCore.pyqtSlot()
+    def onDiagramSelectionChanged(self):
+        """
+        Executed whenever the selection of a diagram changes.
+        Actions which depend only on the kind of selected items are updated straight away using
+        the diagram selection index, while the full state update is deferred and coalesced so
+        that it runs at most once per event loop iteration (i.e: during rubber band selection).
+        """
+        diagram = self.mdi.activeDiagram()
+        if diagram and diagram is self.sender():
+            self.updateSelectionState(diagram)
+        self.stateTimer.schedule()
+
     @QtCore.pyqtSlot()
     def onNoUpdateAvailable(self):
         """
@@ -1909,12 +2067,24 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         """
         ## CONNECT PROJECT SPECIFIC SIGNALS
         connect(self.project.sgnDiagramRemoved, self.mdi.onDiagramRemoved)
+        connect(self.project.sgnDiagramRenamed, self.mdi.onDiagramRenamed)
         ## CHECK FOR UPDATES ON STARTUP
         settings = QtCore.QSettings(ORGANIZATION, APPNAME)
         if settings.value('update/check_on_startup', True, bool):
             action = self.action('check_for_updates')
             action.trigger()
 
+    @QtCore.pyqtSlot(int)
+    def onUndoFootprintChanged(self, size):
+        """
+        Executed when the estimated memory footprint of the undo history changes.
+        :type size: int
+        """
+        label = self.widget('undo_footprint')
+        label.setText('Undo history: {0:.1f} MB'.format(size / (1024 * 1024)))
+        if self.undostack.budget:
+            label.setToolTip('Budget: {0:.1f} MB'.format(self.undostack.budget / (1024 * 1024)))
+
     @QtCore.pyqtSlot(str, str)
     def onUpdateAvailable(self, name, url):
         """
@@ -2048,4 +2218,42 @@ class Session(HasActionSystem, HasMenuSystem, HasPluginSystem, HasWidgetSystem,
         title = '{0} - [{1}]'.format(project.name, shortPath(project.path))
         if diagram:
             title = '{0} - {1}'.format(diagram.name, title)
-        super().setWindowTitle(title)
\ No newline at end of file
+        super().setWindowTitle(title)
+
+    def updateSelectionState(self, diagram):
+        """
+        Update built-in actions depending on the kind of items selected in the given diagram.
+        :type diagram: Diagram
+        """
+        isAlignEnabled = False
+        isDomainRangeUsable = False
+        isEdgeSelected = False
+        isNodeSelected = False
+        isPredicateSelected = False
+
+        if diagram:
+            restrictables = {Item.AttributeNode, Item.RoleNode}
+            predicates = {Item.ConceptNode, Item.AttributeNode, Item.RoleNode, Item.IndividualNode}
+            f1 = lambda x: Item.ConceptNode <= x < Item.InclusionEdge
+            f2 = lambda x: Item.InclusionEdge <= x <= Item.MembershipEdge
+            f3 = lambda x: x in restrictables
+            f4 = lambda x: x in predicates
+            isNodeSelected = diagram.selectionCount(f1) > 0
+            isAlignEnabled = diagram.selectionCount(f1) > 1
+            isEdgeSelected = diagram.selectionCount(f2) > 0
+            isDomainRangeUsable = diagram.selectionCount(f3) > 0
+            isPredicateSelected = diagram.selectionCount(f4) > 0
+
+        self.action('align').setEnabled(isAlignEnabled)
+        self.action('bring_to_front').setEnabled(isNodeSelected)
+        self.action('cut').setEnabled(isNodeSelected)
+        self.action('copy').setEnabled(isNodeSelected)
+        self.action('delete').setEnabled(isNodeSelected or isEdgeSelected)
+        self.action('purge').setEnabled(isNodeSelected)
+        self.action('property_domain').setEnabled(isDomainRangeUsable)
+        self.action('property_domain_range').setEnabled(isDomainRangeUsable)
+        self.action('property_range').setEnabled(isDomainRangeUsable)
+        self.action('send_to_back').setEnabled(isNodeSelected)
+        self.widget('button_set_brush').setEnabled(isPredicateSelected)
+        if not isEdgeSelected:
+            self.action('swap_edge').setEnabled(False)
\ No newline at end of file
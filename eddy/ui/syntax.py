@@ -308,7 +308,7 @@ class SyntaxValidationWorker(AbstractWorker):
         Main worker.
         """
         errorMsg = None
-        while self.i < len(self.items):
+        while self.i < len(self.items) and not self.isCancelled():
 
             item = self.items[self.i]
 
@@ -346,7 +346,7 @@ class SyntaxValidationWorker(AbstractWorker):
 
         if errorMsg:
             self.sgnSyntaxError.emit(errorMsg)
-        else:
+        elif not self.isCancelled():
             self.sgnCompleted.emit()
 
         self.finished.emit()
\ No newline at end of file
@@ -34,6 +34,7 @@
 ##########################################################################
 
 
+import multiprocessing
 import platform
 import os
 import sys
@@ -88,10 +89,12 @@ from argparse import ArgumentParser
 from sip import SIP_VERSION_STR
 
 from eddy import APPNAME, COPYRIGHT, VERSION, BUG_TRACKER
+from eddy.core.analysis import ProcessPool
 from eddy.core.application import Eddy
 from eddy.core.functions.misc import format_exception
 from eddy.core.functions.signals import connect
 from eddy.core.output import getLogger
+from eddy.core.trace import Tracer
 
 from eddy.ui import fonts_rc
 from eddy.ui import images_rc
@@ -144,10 +147,13 @@ def main():
     """
     Application entry point.
     """
+    multiprocessing.freeze_support()
+
     parser = ArgumentParser()
     parser.add_argument('--nosplash', dest='nosplash', action='store_true')
     parser.add_argument('--tests', dest='tests', action='store_true')
     parser.add_argument('--open', dest='open', default=None)
+    parser.add_argument('--trace', dest='trace', default=None)
 
     sys.excepthook = base_except_hook
 
@@ -169,6 +175,12 @@ def main():
     LOGGER.frame('SIP version: %s', SIP_VERSION_STR, separator='|')
     LOGGER.separator(separator='-')
 
+    if options.trace:
+        Tracer.start()
+        connect(app.aboutToQuit, lambda: Tracer.dump(expandPath(options.trace)))
+
+    connect(app.aboutToQuit, ProcessPool.shutdown)
+
     app.configure(options)
     app.start(options)
     sys.exit(app.exec_())
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+"""
+Benchmark suite for Eddy, running on the offscreen QPA platform.
+
+USAGE:
+    python -m tests.benchmarks.benchmark --scale medium --output results.json
+    python -m tests.benchmarks.benchmark --scale medium --compare results.json
+
+Each run generates a synthetic project (see GrapholProjectGenerator), loads it in a new
+Eddy instance and times the most expensive operations on it. Results are written as JSON
+together with the generator parameters and the git commit, so that runs can be compared.
+"""
+
+
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from argparse import ArgumentParser
+from unittest import mock
+
+from PyQt5 import Qt
+from PyQt5 import QtCore
+from PyQt5 import QtTest
+
+from tests import LoggingDisabled
+from tests.benchmarks.generator import GrapholProjectGenerator
+
+from eddy import APPNAME, ORGANIZATION, VERSION, WORKSPACE
+from eddy.core.analysis import ProjectAnalysis
+from eddy.core.application import Eddy
+from eddy.core.datatypes.graphol import Item
+from eddy.core.datatypes.owl import OWLAxiom, OWLSyntax
+from eddy.core.datatypes.system import File
+from eddy.core.exporters.graphml import GraphMLDiagramExporter
+from eddy.core.exporters.graphol import GrapholProjectExporter
+from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.functions.fsystem import mkdir
+from eddy.core.functions.misc import first, postfix
+from eddy.core.functions.path import expandPath
+from eddy.core.graph import Graph
+from eddy.core.layout import AutoLayout
+
+
+class Benchmark(object):
+    """
+    Run the benchmark suite on a synthetic project.
+    """
+    Scales = {
+        'small': dict(diagrams=2, concepts=200, roles=50, attributes=50, individuals=50, depth=2, clusters=20),
+        'medium': dict(diagrams=5, concepts=2000, roles=400, attributes=400, individuals=400, depth=3, clusters=100),
+        'large': dict(diagrams=10, concepts=10000, roles=2000, attributes=2000, individuals=2000, depth=4, clusters=300),
+    }
+
+    def __init__(self, scale='small', **kwargs):
+        """
+        Initialize the benchmark.
+        :type scale: str
+        """
+        self.params = dict(self.Scales[scale])
+        self.params.update({k: v for k, v in kwargs.items() if v is not None})
+        self.scale = scale
+        self.generator = GrapholProjectGenerator(**self.params)
+        self.eddy = None
+        self.graph = None
+        self.path = None
+        self.results = {}
+        self.session = None
+        self.workdir = None
+
+    #############################################
+    #   BENCHMARKS
+    #################################
+
+    def benchAlign(self):
+        """
+        Align all the nodes of the active diagram to the left.
+        """
+        self.session.action('select_all').trigger()
+        first(x for x in self.session.action('align').actions() if x.data() == QtCore.Qt.AlignLeft).trigger()
+
+    def benchAutoLayout(self):
+        """
+        Arrange all the nodes of the largest diagram using the force directed layout.
+        """
+        diagram = max(self.session.project.diagrams(), key=lambda x: len(x.nodes()))
+        AutoLayout(diagram).run()
+
+    def benchCsvExport(self):
+        """
+        Export the predicates of the project in CSV format using the CSV exporter plugin.
+        """
+        worker = self.session.createProjectExporter(File.Csv, self.session.project, self.session)
+        # THE EXPORTER OPENS THE GENERATED FILE USING THE OS DEFAULT PROGRAM
+        with mock.patch('os.system'):
+            worker.run(os.path.join(self.workdir, 'predicates.csv'))
+
+    def benchDrag(self):
+        """
+        Drag a single node of the active diagram using the mouse.
+        """
+        diagram = self.session.mdi.activeDiagram()
+        view = self.session.mdi.activeView()
+        node = next(x for x in diagram.nodes() if x.type() is Item.ConceptNode)
+        diagram.clearSelection()
+        view.centerOn(node)
+        pos = view.mapFromScene(node.pos())
+        viewport = view.viewport()
+        QtTest.QTest.mousePress(viewport, QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, pos)
+        for i in range(1, 21):
+            QtTest.QTest.mouseMove(viewport, pos + QtCore.QPoint(i * 5, i * 5))
+        QtTest.QTest.mouseRelease(viewport, QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, pos + QtCore.QPoint(100, 100))
+
+    def benchGraphMLExport(self):
+        """
+        Export all the diagrams of the project in GraphML format.
+        """
+        for diagram in self.session.project.diagrams():
+            worker = GraphMLDiagramExporter(diagram, self.session)
+            worker.run(os.path.join(self.workdir, '{0}.graphml'.format(diagram.name)))
+
+    def benchHeadlessAnalysis(self):
+        """
+        Validate, translate and count the items of each diagram of the headless graph in the process pool.
+        """
+        ProjectAnalysis(self.graph).run(processes=True)
+
+    def benchHeadlessAnalysisSerial(self):
+        """
+        Validate, translate and count the items of each diagram of the headless graph in this process.
+        """
+        ProjectAnalysis(self.graph).run(processes=False)
+
+    def benchHeadlessLoad(self):
+        """
+        Build the headless graph of the generated project.
+        """
+        self.graph = Graph.fromFile(os.path.join(self.path, postfix(self.generator.name, File.Graphol.extension)))
+
+    def benchHeadlessValidation(self):
+        """
+        Validate all the nodes and edges of the headless graph.
+        """
+        self.graph.validate()
+
+    def benchIdentification(self):
+        """
+        Run the identification of all the operator nodes of the project.
+        """
+        for node in self.session.project.nodes():
+            if Item.UnionNode <= node.type() <= Item.PropertyAssertionNode:
+                node.diagram.sgnNodeIdentification.emit(node)
+
+    def benchLoad(self):
+        """
+        Start Eddy loading the generated project.
+        """
+        self.path = self.generator.write(self.workdir)
+        arguments = ['--nosplash', '--tests', '--open', self.path]
+        parser = ArgumentParser()
+        parser.add_argument('--nosplash', dest='nosplash', action='store_true')
+        parser.add_argument('--tests', dest='tests', action='store_true')
+        parser.add_argument('--open', dest='open', default=None)
+        options, _ = parser.parse_known_args(args=arguments)
+        self.eddy = Eddy(options, arguments)
+        self.eddy.configure(options)
+        self.eddy.start(options)
+        QtTest.QTest.qWaitForWindowActive(self.eddy.sessions[0])
+        self.session = self.eddy.sessions[0]
+
+    def benchOWLExport(self):
+        """
+        Export the project as an OWL 2 ontology in functional syntax.
+        """
+        errors = []
+        worker = OWLOntologyExporterWorker(self.session.project,
+            os.path.join(self.workdir, 'ontology.owl'),
+            axioms={x for x in OWLAxiom}, normalize=False, syntax=OWLSyntax.Functional)
+        worker.sgnErrored.connect(errors.append)
+        worker.run()
+        if errors:
+            raise errors[0]
+
+    def benchPaste(self):
+        """
+        Copy the selection of the active diagram and paste it back.
+        """
+        self.session.doCopy()
+        self.session.doPaste()
+
+    def benchSave(self):
+        """
+        Save the project.
+        """
+        worker = GrapholProjectExporter(self.session.project)
+        worker.run()
+
+    def benchSelectAll(self):
+        """
+        Select all the items of the largest diagram.
+        """
+        diagram = max(self.session.project.diagrams(), key=lambda x: len(x.items()))
+        self.session.sgnFocusDiagram.emit(diagram)
+        self.session.doSelectAll()
+
+    def benchSnapToGrid(self):
+        """
+        Move all the elements of the active diagram off the grid and snap them back to it.
+        """
+        diagram = self.session.mdi.activeDiagram()
+        diagram.setGeometry(diagram.geometry().translate(3, 7))
+        self.session.action('snap_to_grid').trigger()
+
+    def benchValidation(self):
+        """
+        Validate all the nodes and edges of the project from scratch.
+        """
+        profile = self.session.project.profile
+        profile.reset()
+        for edge in self.session.project.edges():
+            profile.checkEdge(edge.source, edge, edge.target)
+        for node in self.session.project.nodes():
+            profile.checkNode(node)
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def measure(self, name, func):
+        """
+        Execute the given function recording its wall clock time under the given name.
+        :type name: str
+        :type func: callable
+        """
+        start = time.perf_counter()
+        try:
+            func()
+            QtCore.QCoreApplication.processEvents()
+        except Exception as e:
+            self.results[name] = {'error': '{0}: {1}'.format(e.__class__.__name__, e)}
+        else:
+            self.results[name] = {'seconds': round(time.perf_counter() - start, 6)}
+        sys.stderr.write('{0:<24}{1}\n'.format(name, self.results[name].get('seconds', self.results[name].get('error'))))
+
+    def report(self):
+        """
+        Returns the benchmark report.
+        :rtype: dict
+        """
+        try:
+            commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+                cwd=expandPath('@root/'), stderr=subprocess.DEVNULL).decode().strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'commit': commit,
+            'environment': {
+                'eddy': VERSION,
+                'platform': platform.platform(),
+                'python': platform.python_version(),
+                'pyqt': Qt.PYQT_VERSION_STR,
+                'qt': QtCore.QT_VERSION_STR,
+            },
+            'params': {k: getattr(self.generator, k) for k in ('diagrams', 'concepts', 'roles', 'attributes',
+                'individuals', 'depth', 'density', 'clusters', 'sharing', 'seed')},
+            'project': self.generator.stats,
+            'results': self.results,
+            'scale': self.scale,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+
+    def run(self):
+        """
+        Run the benchmark suite, returning the report.
+        :rtype: dict
+        """
+        settings = QtCore.QSettings(ORGANIZATION, APPNAME)
+        settings.setValue('workspace/home', WORKSPACE)
+        settings.setValue('update/check_on_startup', False)
+        settings.sync()
+        mkdir(expandPath(WORKSPACE))
+        self.workdir = tempfile.mkdtemp(prefix='eddy-benchmark-')
+        try:
+            with LoggingDisabled():
+                self.measure('load', self.benchLoad)
+                if self.session:
+                    self.measure('save', self.benchSave)
+                    self.measure('identification', self.benchIdentification)
+                    self.measure('validation', self.benchValidation)
+                    self.measure('owl_export', self.benchOWLExport)
+                    self.measure('graphml_export', self.benchGraphMLExport)
+                    self.measure('csv_export', self.benchCsvExport)
+                    self.measure('select_all', self.benchSelectAll)
+                    self.measure('paste', self.benchPaste)
+                    self.measure('drag', self.benchDrag)
+                    self.measure('auto_layout', self.benchAutoLayout)
+                    self.measure('snap_to_grid', self.benchSnapToGrid)
+                    self.measure('align', self.benchAlign)
+                    self.measure('headless_load', self.benchHeadlessLoad)
+                    if self.graph:
+                        self.measure('headless_validation', self.benchHeadlessValidation)
+                        self.measure('headless_analysis_serial', self.benchHeadlessAnalysisSerial)
+                        self.measure('headless_analysis', self.benchHeadlessAnalysis)
+        finally:
+            if self.eddy:
+                self.eddy.quit()
+            shutil.rmtree(self.workdir, ignore_errors=True)
+        return self.report()
+
+
+def compare(current, previous):
+    """
+    Print a comparison of the given benchmark reports.
+    :type current: dict
+    :type previous: dict
+    """
+    print('{0:<24}{1:>12}{2:>12}{3:>10}'.format('benchmark', 'previous', 'current', 'ratio'))
+    for name, result in current['results'].items():
+        before = previous['results'].get(name, {}).get('seconds')
+        after = result.get('seconds')
+        ratio = '{0:.2f}'.format(after / before) if before and after is not None else '-'
+        print('{0:<24}{1:>12}{2:>12}{3:>10}'.format(name,
+            '-' if before is None else '{0:.3f}'.format(before),
+            '-' if after is None else '{0:.3f}'.format(after), ratio))
+
+
+def main():
+    """
+    Run the benchmark suite from the command line.
+    """
+    parser = ArgumentParser(description='Eddy benchmark suite')
+    parser.add_argument('--scale', dest='scale', choices=sorted(Benchmark.Scales), default='small')
+    parser.add_argument('--output', dest='output', default=None)
+    parser.add_argument('--compare', dest='compare', default=None)
+    parser.add_argument('--seed', dest='seed', type=int, default=None)
+    for name in ('diagrams', 'concepts', 'roles', 'attributes', 'individuals', 'depth', 'clusters'):
+        parser.add_argument('--{0}'.format(name), dest=name, type=int, default=None)
+    parser.add_argument('--density', dest='density', type=float, default=None)
+    options = parser.parse_args()
+
+    params = {k: v for k, v in vars(options).items() if k not in ('scale', 'output', 'compare')}
+    report = Benchmark(options.scale, **params).run()
+    output = options.output or 'benchmark-{0}.json'.format(options.scale)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    if options.compare:
+        with open(options.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
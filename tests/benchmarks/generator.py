@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import math
+import os
+import random
+
+from PyQt5 import QtXml
+
+from eddy.core.datatypes.system import File
+from eddy.core.functions.fsystem import fwrite
+from eddy.core.functions.misc import postfix
+from eddy.core.functions.path import expandPath
+
+
+class GrapholProjectGenerator(object):
+    """
+    Generate synthetic Graphol (v2) projects of configurable scale.
+    Predicates are spread across the diagrams (a fraction of them is also shared among
+    diagrams), concepts are connected by inclusion edges according to the requested density,
+    roles and attributes are typed using domain and range restrictions, individuals are
+    instances of concepts and roles, and each diagram contains a number of neutral clusters,
+    i.e. trees of (neutral) operator nodes of the requested depth included in a concept.
+    The same parameters and seed always produce the same project.
+    """
+    Operators = ('intersection', 'union', 'complement', 'domain-restriction')
+    Sizes = {
+        'attribute': (20, 20),
+        'complement': (50, 30),
+        'concept': (110, 50),
+        'domain-restriction': (20, 20),
+        'individual': (60, 60),
+        'intersection': (50, 30),
+        'property-assertion': (52, 30),
+        'range-restriction': (20, 20),
+        'role': (70, 50),
+        'union': (50, 30),
+        'value-domain': (90, 40),
+    }
+    SpacingX = 200
+    SpacingY = 150
+
+    def __init__(self, name='synthetic', diagrams=4, concepts=400, roles=100, attributes=100,
+                 individuals=100, depth=2, density=1.5, clusters=50, sharing=0.1, seed=0):
+        """
+        Initialize the generator.
+        :type name: str
+        :type diagrams: int
+        :type concepts: int
+        :type roles: int
+        :type attributes: int
+        :type individuals: int
+        :type depth: int
+        :type density: float
+        :type clusters: int
+        :type sharing: float
+        :type seed: int
+        """
+        self.name = name
+        self.diagrams = max(diagrams, 1)
+        self.concepts = max(concepts, 1)
+        self.roles = roles
+        self.attributes = attributes
+        self.individuals = individuals
+        self.depth = depth
+        self.density = density
+        self.clusters = clusters
+        self.sharing = sharing
+        self.seed = seed
+        self.document = None
+        self.random = None
+        self.stats = None
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def chunk(self, prefix, count, i):
+        """
+        Returns the names of the predicates with the given prefix allotted to the i-th diagram,
+        including the ones shared with other diagrams.
+        :type prefix: str
+        :type count: int
+        :type i: int
+        :rtype: list
+        """
+        names = ['{0}{1}'.format(prefix, j) for j in range(i, count, self.diagrams)]
+        others = count - len(names)
+        if others > 0 and self.sharing > 0:
+            shared = set()
+            for _ in range(int(len(names) * self.sharing)):
+                j = self.random.randrange(count)
+                if j % self.diagrams != i:
+                    shared.add('{0}{1}'.format(prefix, j))
+            names.extend(sorted(shared))
+        return names
+
+    #############################################
+    #   DIAGRAM GENERATION
+    #################################
+
+    def createDiagram(self, i):
+        """
+        Create the i-th diagram element.
+        :type i: int
+        :rtype: QDomElement
+        """
+        concepts = self.chunk('Concept', self.concepts, i)
+        roles = self.chunk('role', self.roles, i)
+        attributes = self.chunk('attribute', self.attributes, i)
+        individuals = self.chunk('individual', self.individuals, i)
+
+        estimate = len(concepts) + 3 * len(roles) + 4 * len(attributes) + 2 * len(individuals)
+        estimate += self.clusters * (2 ** (self.depth + 1))
+        builder = DiagramBuilder(self, 'diagram{0}'.format(i), int(math.ceil(math.sqrt(estimate))) or 1)
+
+        # CONCEPTS AND INCLUSIONS
+        cnodes = [builder.node('concept', x) for x in concepts]
+        for _ in range(int(len(cnodes) * self.density)):
+            if len(cnodes) > 1:
+                source, target = self.random.sample(cnodes, 2)
+                builder.edge('inclusion', source, target)
+
+        # ROLES TYPING
+        for name in roles:
+            role = builder.node('role', name)
+            for restriction in ('domain-restriction', 'range-restriction'):
+                node = builder.node(restriction, 'exists')
+                builder.edge('input', role, node)
+                builder.edge('inclusion', node, self.random.choice(cnodes))
+
+        # ATTRIBUTES TYPING
+        if attributes:
+            datatype = builder.node('value-domain', 'xsd:string')
+            for name in attributes:
+                attribute = builder.node('attribute', name)
+                node = builder.node('domain-restriction', 'exists')
+                builder.edge('input', attribute, node)
+                builder.edge('inclusion', node, self.random.choice(cnodes))
+                node = builder.node('range-restriction', 'exists')
+                builder.edge('input', attribute, node)
+                builder.edge('inclusion', node, datatype)
+
+        # INDIVIDUALS MEMBERSHIP AND ROLE ASSERTIONS
+        inodes = [builder.node('individual', x) for x in individuals]
+        for node in inodes:
+            builder.edge('membership', node, self.random.choice(cnodes))
+        if roles:
+            rnodes = builder.nodes['role']
+            for _ in range(len(inodes) // 2):
+                source, target = self.random.sample(inodes, 2)
+                node = builder.node('property-assertion')
+                e1 = builder.edge('input', source, node)
+                e2 = builder.edge('input', target, node)
+                node.setAttribute('inputs', '{0},{1}'.format(e1.attribute('id'), e2.attribute('id')))
+                builder.edge('membership', node, self.random.choice(rnodes))
+
+        # NEUTRAL CLUSTERS
+        for _ in range(self.clusters):
+            root = self.createExpression(builder, self.depth, cnodes)
+            builder.edge('inclusion', root, self.random.choice(cnodes))
+
+        return builder.element()
+
+    def createExpression(self, builder, depth, cnodes):
+        """
+        Create a tree of operator nodes of the given depth, having concept nodes as leaves.
+        :type builder: DiagramBuilder
+        :type depth: int
+        :type cnodes: list
+        :rtype: QDomElement
+        """
+        if depth <= 0:
+            return self.random.choice(cnodes)
+        operator = self.random.choice(self.Operators)
+        if operator == 'domain-restriction' and not builder.nodes['role']:
+            operator = 'intersection'
+        if operator == 'domain-restriction':
+            node = builder.node(operator, 'exists')
+            builder.edge('input', self.random.choice(builder.nodes['role']), node)
+            builder.edge('input', self.createExpression(builder, depth - 1, cnodes), node)
+        elif operator == 'complement':
+            node = builder.node(operator)
+            builder.edge('input', self.createExpression(builder, depth - 1, cnodes), node)
+        else:
+            node = builder.node(operator)
+            for _ in range(2):
+                builder.edge('input', self.createExpression(builder, depth - 1, cnodes), node)
+        return node
+
+    #############################################
+    #   INTERFACE
+    #################################
+
+    def generate(self):
+        """
+        Generate the project, returning the QDomDocument holding it.
+        :rtype: QDomDocument
+        """
+        self.random = random.Random(self.seed)
+        self.stats = {'diagrams': self.diagrams, 'nodes': 0, 'edges': 0}
+        self.document = QtXml.QDomDocument()
+        instruction = self.document.createProcessingInstruction('xml', 'version="1.0" encoding="UTF-8"')
+        self.document.appendChild(instruction)
+        graphol = self.document.createElement('graphol')
+        graphol.setAttribute('version', '2')
+        self.document.appendChild(graphol)
+
+        ontology = self.document.createElement('ontology')
+        for tag, value in (('name', self.name),
+                           ('version', '1.0'),
+                           ('prefix', self.name.lower()),
+                           ('iri', 'http://www.example.com/{0}'.format(self.name.lower())),
+                           ('profile', 'OWL 2')):
+            element = self.document.createElement(tag)
+            element.appendChild(self.document.createTextNode(value))
+            ontology.appendChild(element)
+        graphol.appendChild(ontology)
+        graphol.appendChild(self.document.createElement('predicates'))
+
+        section = self.document.createElement('diagrams')
+        for i in range(self.diagrams):
+            section.appendChild(self.createDiagram(i))
+        graphol.appendChild(section)
+        return self.document
+
+    def write(self, path):
+        """
+        Generate the project and write it in a project directory inside the given path.
+        Returns the path of the project directory.
+        :type path: str
+        :rtype: str
+        """
+        document = self.generate()
+        directory = os.path.join(expandPath(path), self.name)
+        os.makedirs(directory, exist_ok=True)
+        fwrite(document.toString(2), os.path.join(directory, postfix(self.name, File.Graphol.extension)))
+        return directory
+
+
+class DiagramBuilder(object):
+    """
+    Helper used by GrapholProjectGenerator to create the nodes and the edges of a diagram,
+    laying out nodes on a grid with the given number of columns.
+    """
+    def __init__(self, generator, name, columns):
+        """
+        Initialize the builder.
+        :type generator: GrapholProjectGenerator
+        :type name: str
+        :type columns: int
+        """
+        self.generator = generator
+        self.document = generator.document
+        self.columns = columns
+        self.edges = []
+        self.extent = 0
+        self.name = name
+        self.nodes = {k: [] for k in GrapholProjectGenerator.Sizes}
+        self.positions = dict()
+        self.sequence = 0
+
+    def edge(self, kind, source, target):
+        """
+        Create an edge of the given type connecting the given nodes.
+        :type kind: str
+        :type source: QDomElement
+        :type target: QDomElement
+        :rtype: QDomElement
+        """
+        element = self.document.createElement('edge')
+        element.setAttribute('id', 'e{0}'.format(len(self.edges)))
+        element.setAttribute('type', kind)
+        element.setAttribute('source', source.attribute('id'))
+        element.setAttribute('target', target.attribute('id'))
+        for node in (source, target):
+            x, y = self.positions[node.attribute('id')]
+            point = self.document.createElement('point')
+            point.setAttribute('x', x)
+            point.setAttribute('y', y)
+            element.appendChild(point)
+        self.edges.append(element)
+        self.generator.stats['edges'] += 1
+        return element
+
+    def element(self):
+        """
+        Returns the diagram element containing all the created nodes and edges.
+        :rtype: QDomElement
+        """
+        size = max(5000, 2 * self.extent + 1000)
+        element = self.document.createElement('diagram')
+        element.setAttribute('name', self.name)
+        element.setAttribute('width', size)
+        element.setAttribute('height', size)
+        for kind in GrapholProjectGenerator.Sizes:
+            for node in self.nodes[kind]:
+                element.appendChild(node)
+        for edge in self.edges:
+            element.appendChild(edge)
+        return element
+
+    def node(self, kind, text=None):
+        """
+        Create a node of the given type, placing it in the next free cell of the grid.
+        :type kind: str
+        :type text: str
+        :rtype: QDomElement
+        """
+        row, column = divmod(self.sequence, self.columns)
+        x = (column - self.columns // 2) * GrapholProjectGenerator.SpacingX
+        y = (row - self.columns // 2) * GrapholProjectGenerator.SpacingY
+        width, height = GrapholProjectGenerator.Sizes[kind]
+        element = self.document.createElement('node')
+        element.setAttribute('id', 'n{0}'.format(self.sequence))
+        element.setAttribute('type', kind)
+        element.setAttribute('color', '#fcfcfc')
+        geometry = self.document.createElement('geometry')
+        geometry.setAttribute('width', width)
+        geometry.setAttribute('height', height)
+        geometry.setAttribute('x', x)
+        geometry.setAttribute('y', y)
+        element.appendChild(geometry)
+        if text is not None:
+            label = self.document.createElement('label')
+            label.setAttribute('width', 10 * len(text))
+            label.setAttribute('height', 23)
+            label.setAttribute('x', x)
+            label.setAttribute('y', y if kind not in {'domain-restriction', 'range-restriction'} else y - 22)
+            label.appendChild(self.document.createTextNode(text))
+            element.appendChild(label)
+        self.extent = max(self.extent, abs(x), abs(y))
+        self.nodes[kind].append(element)
+        self.positions[element.attribute('id')] = (x, y)
+        self.generator.stats['nodes'] += 1
+        self.sequence += 1
+        return element
\ No newline at end of file
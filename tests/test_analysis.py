@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import time
+import unittest
+
+from PyQt5 import QtWidgets
+
+from eddy.core.analysis import Analysis, ProcessPool, ProjectAnalysis
+from eddy.core.axioms import ExpressionIndex, OWLAxiomTranslator, OWLFunctionalSyntax
+from eddy.core.datatypes.graphol import Item
+from eddy.core.graph import Graph, GraphDiagram, GraphEdge, GraphNode
+
+from tests import EddyTestCase
+from tests.benchmarks.generator import GrapholProjectGenerator
+
+
+class ExpressionIndexTestCase(unittest.TestCase):
+    """
+    Tests for the hash-consing index of Graphol expressions.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        self.graph = Graph('test', 'test', 'http://www.example.com/test')
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def createDiagram(self, name, role, concept, restriction='exists', subclass='Person'):
+        """
+        Create a diagram expressing the inclusion 'subclass ISA restriction role.concept'.
+        :type name: str
+        :type role: str
+        :type concept: str
+        :type restriction: str
+        :type subclass: str
+        :rtype: GraphDiagram
+        """
+        diagram = GraphDiagram(name, self.graph)
+        nodes = [
+            GraphNode(diagram, 'n0', Item.RoleNode, role),
+            GraphNode(diagram, 'n1', Item.ConceptNode, concept),
+            GraphNode(diagram, 'n2', Item.DomainRestrictionNode, restriction),
+            GraphNode(diagram, 'n3', Item.ConceptNode, subclass),
+        ]
+        edges = [
+            GraphEdge(diagram, 'e0', Item.InputEdge, nodes[0], nodes[2]),
+            GraphEdge(diagram, 'e1', Item.InputEdge, nodes[1], nodes[2]),
+            GraphEdge(diagram, 'e2', Item.InclusionEdge, nodes[3], nodes[2]),
+        ]
+        for item in nodes + edges:
+            diagram.addItem(item)
+        for edge in edges:
+            edge.source.edges.append(edge)
+            edge.target.edges.append(edge)
+        self.graph.addDiagram(diagram)
+        self.graph.identify()
+        return diagram
+
+    #############################################
+    #   TESTS
+    #################################
+
+    def test_equal_expressions_share_the_same_id(self):
+        # GIVEN
+        diagram1 = self.createDiagram('diagram1', 'hasParent', 'Person')
+        diagram2 = self.createDiagram('diagram2', 'hasParent', 'Person')
+        diagram3 = self.createDiagram('diagram3', 'hasParent', 'Person', restriction='forall')
+        diagram4 = self.createDiagram('diagram4', 'hasParent', 'Animal')
+        index = ExpressionIndex()
+        # WHEN
+        index.index(self.graph.nodes())
+        # THEN
+        self.assertEqual(index.id(diagram1.node('n2')), index.id(diagram2.node('n2')))
+        self.assertNotEqual(index.id(diagram1.node('n2')), index.id(diagram3.node('n2')))
+        self.assertNotEqual(index.id(diagram1.node('n2')), index.id(diagram4.node('n2')))
+        self.assertEqual([[diagram1.node('n2'), diagram2.node('n2')]], index.duplicates())
+
+    def test_ordered_inputs_are_preserved(self):
+        # GIVEN
+        diagram = GraphDiagram('diagram', self.graph)
+        r1 = GraphNode(diagram, 'n0', Item.RoleNode, 'hasParent')
+        r2 = GraphNode(diagram, 'n1', Item.RoleNode, 'hasSibling')
+        c1 = GraphNode(diagram, 'n2', Item.RoleChainNode, inputs=['e0', 'e1'])
+        c2 = GraphNode(diagram, 'n3', Item.RoleChainNode, inputs=['e3', 'e2'])
+        edges = [
+            GraphEdge(diagram, 'e0', Item.InputEdge, r1, c1),
+            GraphEdge(diagram, 'e1', Item.InputEdge, r2, c1),
+            GraphEdge(diagram, 'e2', Item.InputEdge, r1, c2),
+            GraphEdge(diagram, 'e3', Item.InputEdge, r2, c2),
+        ]
+        for item in [r1, r2, c1, c2] + edges:
+            diagram.addItem(item)
+        for edge in edges:
+            edge.source.edges.append(edge)
+            edge.target.edges.append(edge)
+        self.graph.addDiagram(diagram)
+        index = ExpressionIndex()
+        # THEN
+        self.assertNotEqual(index.id(c1), index.id(c2))
+        self.assertEqual((Item.RoleChainNode, c1.identity(), (index.id(r1), index.id(r2))), index.key(c1))
+
+    def test_duplicate_assertions(self):
+        # GIVEN
+        diagram1 = self.createDiagram('diagram1', 'hasParent', 'Person')
+        diagram2 = self.createDiagram('diagram2', 'hasParent', 'Person')
+        diagram3 = self.createDiagram('diagram3', 'hasParent', 'Person', subclass='Human')
+        index = ExpressionIndex()
+        # WHEN
+        duplicates = index.duplicateAssertions(self.graph.edges())
+        # THEN
+        self.assertEqual([[diagram1.edge('e2'), diagram2.edge('e2')]], duplicates)
+        self.assertNotIn(diagram3.edge('e2'), duplicates[0])
+
+    def test_redundant_assertions(self):
+        # GIVEN
+        diagram1 = self.createDiagram('diagram1', 'hasParent', 'Person')
+        diagram2 = self.createDiagram('diagram2', 'hasParent', 'Person')
+        edge = diagram2.edge('e2')
+        equivalence = GraphEdge(diagram2, 'e2', Item.EquivalenceEdge, edge.target, edge.source)
+        edge.source.edges[edge.source.edges.index(edge)] = equivalence
+        edge.target.edges[edge.target.edges.index(edge)] = equivalence
+        diagram2.addItem(equivalence)
+        index = ExpressionIndex()
+        # WHEN
+        redundant = index.redundantAssertions(self.graph.edges())
+        # THEN
+        self.assertEqual([diagram1.edge('e2')], redundant)
+
+    def test_equal_expressions_are_translated_once(self):
+        # GIVEN
+        self.createDiagram('diagram1', 'hasParent', 'Person')
+        self.createDiagram('diagram2', 'hasParent', 'Person')
+        translator = OWLAxiomTranslator(self.graph)
+        # WHEN
+        axioms = translator.translate()
+        # THEN
+        self.assertEqual(8, len(translator.converted()))
+        self.assertEqual(3, len(translator.expressions()))
+        self.assertIn(('SubClassOf', ('Class', 'test:Person'),
+            ('ObjectSomeValuesFrom', ('ObjectProperty', 'test:hasParent'), ('Class', 'test:Person'))), axioms)
+
+
+class OWLAxiomTranslatorTestCase(EddyTestCase):
+    """
+    Tests for the pure Python OWL 2 axioms translation.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+
+    def test_translate_project(self):
+        # WHEN
+        translator = OWLAxiomTranslator(self.project)
+        content = {OWLFunctionalSyntax(x) for x in translator.translate()}
+        # THEN
+        self.assertEmpty(translator.errors)
+        self.assertIn('Declaration(Class(test:Vegetable))', content)
+        self.assertIn('Declaration(ObjectProperty(test:hasAncestor))', content)
+        self.assertIn('Declaration(DataProperty(test:name))', content)
+        self.assertIn('Declaration(Datatype(xsd:string))', content)
+        self.assertIn('AnnotationAssertion(rdfs:comment test:Person "A human being"^^xsd:string)', content)
+        self.assertIn('SubClassOf(test:Person ObjectSomeValuesFrom(test:hasAncestor owl:Thing))', content)
+        self.assertIn('SubClassOf(test:Father test:Male)', content)
+        self.assertIn('SubClassOf(test:Underage ObjectAllValuesFrom(test:drives test:Less_than_50_cc))', content)
+        self.assertIn('SubObjectPropertyOf(test:hasFather test:hasParent)', content)
+        self.assertIn('FunctionalObjectProperty(test:hasFather)', content)
+        self.assertIn('DataPropertyRange(test:name xsd:string)', content)
+        self.assertIn('DataPropertyDomain(test:name test:Person)', content)
+        self.assertIn('InverseObjectProperties(test:hasAncestor test:isAncestorOf)', content)
+        self.assertIn('ObjectPropertyAssertion(test:isAncestorOf test:Bob test:Alice)', content)
+        self.assertIn('ObjectPropertyRange(test:drives test:Vehicle)', content)
+        self.assertIn('NegativeObjectPropertyAssertion(test:isAncestorOf test:Bob test:Trudy)', content)
+
+    def test_translate_headless_graph(self):
+        # WHEN
+        axioms1 = OWLAxiomTranslator(self.project).translate()
+        axioms2 = OWLAxiomTranslator(Graph.fromProject(self.project)).translate()
+        # THEN
+        self.assertEqual(axioms1, axioms2)
+
+    def test_translate_malformed_expression(self):
+        # GIVEN
+        graph = Graph('test', 'test', 'http://www.example.com/test')
+        diagram = GraphDiagram('diagram', graph)
+        inverse = GraphNode(diagram, 'n0', Item.RoleInverseNode)
+        role = GraphNode(diagram, 'n1', Item.RoleNode, 'knows')
+        edge = GraphEdge(diagram, 'e0', Item.InclusionEdge, inverse, role)
+        for item in (inverse, role, edge):
+            diagram.addItem(item)
+        inverse.edges.append(edge)
+        role.edges.append(edge)
+        graph.addDiagram(diagram)
+        # WHEN
+        translator = OWLAxiomTranslator(graph)
+        axioms = translator.translate()
+        # THEN
+        self.assertEqual({('Declaration', ('ObjectProperty', 'test:knows'))}, axioms)
+        self.assertEqual([(inverse, 'missing operand')], translator.errors)
+
+
+class ProjectAnalysisTestCase(EddyTestCase):
+    """
+    Tests for the project analysis running in worker processes.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        generator = GrapholProjectGenerator(diagrams=3, concepts=30, roles=8, attributes=6,
+            individuals=10, depth=3, clusters=6, seed=11)
+        generator.write('@tests/.tests/.generated/')
+        self.init('.tests/.generated/synthetic')
+
+    def test_analysis_in_processes(self):
+        # GIVEN
+        analysis1 = ProjectAnalysis(self.project)
+        analysis2 = ProjectAnalysis(self.project)
+        # WHEN
+        analysis1.run(processes=False)
+        analysis2.run(processes=True)
+        # THEN
+        self.assertTrue(analysis2.isCompleted())
+        self.assertEqual({d.name for d in self.project.diagrams()}, set(analysis2.results))
+        self.assertEqual(OWLAxiomTranslator(self.project).translate(), analysis2.axioms())
+        self.assertEqual(analysis1.axioms(), analysis2.axioms())
+        self.assertEqual(analysis1.errors(), analysis2.errors())
+        self.assertEqual(analysis1.statistics(), analysis2.statistics())
+        self.assertEqual(len(self.project.nodes()), analysis2.statistics()['nodes'])
+        self.assertEqual(len(self.project.edges()), analysis2.statistics()['edges'])
+        self.assertEqual({(x.type(), x.text()) for x in self.project.predicates()}, analysis2.statistics()['predicates'])
+
+    def test_analysis_in_background(self):
+        # GIVEN
+        analysis = ProjectAnalysis(self.project, analyses={Analysis.Validation, Analysis.Statistics})
+        # WHEN
+        self.assertTrue(analysis.start())
+        deadline = time.monotonic() + 30
+        while not analysis.isCompleted() and time.monotonic() < deadline:
+            QtWidgets.QApplication.processEvents()
+            time.sleep(0.01)
+        # THEN
+        self.assertTrue(analysis.isCompleted())
+        self.assertEmpty(analysis.axioms())
+        self.assertEmpty(analysis.errors())
+        self.assertEqual(len(self.project.nodes()), analysis.statistics()['nodes'])
+
+    def test_analysis_errors_are_mapped_to_project_items(self):
+        # GIVEN
+        graph = Graph.fromProject(self.project)
+        diagram = graph.diagrams()[0]
+        concept = next(x for x in diagram.nodes() if x.type() is Item.ConceptNode)
+        role = next(x for x in diagram.nodes() if x.type() is Item.RoleNode)
+        edge = GraphEdge(diagram, 'e9999', Item.InclusionEdge, concept, role)
+        diagram.addItem(edge)
+        concept.edges.append(edge)
+        role.edges.append(edge)
+        analysis = ProjectAnalysis(graph, analyses={Analysis.Validation})
+        # WHEN
+        analysis.run(processes=True)
+        # THEN
+        self.assertLen(1, analysis.errors())
+        self.assertEqual((concept, edge, role), analysis.errors()[0][0])
+
+    def test_process_pool_shutdown_cancels_pending_futures(self):
+        # GIVEN
+        futures = [ProcessPool.submit(time.sleep, 0.2) for _ in range(ProcessPool.MaxProcesses * 4)]
+        # WHEN
+        ProcessPool.shutdown(wait=True)
+        # THEN
+        self.assertIsNone(ProcessPool.Executor)
+        self.assertAll([x.done() for x in futures])
+        self.assertAny([x.cancelled() for x in futures])
+        self.assertEmpty(ProcessPool.Futures)
\ No newline at end of file
@@ -33,14 +33,23 @@
 ##########################################################################
 
 
+from unittest import mock
+
 from PyQt5 import QtCore
 from PyQt5 import QtTest
 
 from tests import EddyTestCase
 
+from eddy.core.commands.common import CommandItemsRemove
+from eddy.core.commands.diagram import CommandDiagramRename
+from eddy.core.commands.nodes import CommandNodeMove
+from eddy.core.commands.stack import UndoStack
 from eddy.core.datatypes.graphol import Item
 from eddy.core.datatypes.misc import DiagramMode
+from eddy.core.diagram import Diagram
 from eddy.core.functions.misc import first
+from eddy.core.items.common import AbstractItem
+from eddy.core.items.edges.common.base import AbstractEdge
 
 
 class DiagramTestCase(EddyTestCase):
@@ -191,3 +200,401 @@ class DiagramTestCase(EddyTestCase):
         self.assertEqual(num_edges_in_diagram, len(diagram.edges()))
         self.assertEqual(num_items_in_project, len(self.project.items()))
         self.assertEqual(num_edges_in_project, len(self.project.edges()))
+
+    #############################################
+    #   SELECTION
+    #################################
+
+    def test_selection_index_tracks_selection_changes(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        diagram.clearSelection()
+        # WHEN
+        node.setSelected(True)
+        for edge in node.edges:
+            edge.setSelected(True)
+        # THEN
+        self.assertEqual(1, diagram.selectionCount(lambda x: x is Item.RoleNode))
+        self.assertEqual(len(diagram.selectedItems()), diagram.selectionCount())
+        self.assertTrue(self.session.action('copy').isEnabled())
+        self.assertTrue(self.session.widget('button_set_brush').isEnabled())
+        # WHEN
+        diagram.clearSelection()
+        # THEN
+        self.assertEqual(0, diagram.selectionCount())
+        self.assertFalse(self.session.action('copy').isEnabled())
+        self.assertFalse(self.session.widget('button_set_brush').isEnabled())
+
+    def test_selection_index_tracks_removed_items(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        diagram.clearSelection()
+        for node in diagram.nodes():
+            node.setSelected(True)
+        # WHEN
+        self.session.action('delete').trigger()
+        # THEN
+        self.assertEqual(0, diagram.selectionCount())
+        self.assertEqual(len(diagram.selectedItems()), diagram.selectionCount())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(len(diagram.selectedItems()), diagram.selectionCount())
+
+    #############################################
+    #   BULK LOAD
+    #################################
+
+    def test_loaded_diagrams_are_indexed(self):
+        for diagram in self.project.diagrams():
+            # THEN
+            self.assertFalse(diagram.isBulkLoading())
+            self.assertFalse(diagram.signalsBlocked())
+            self.assertEqual(Diagram.BspTreeIndex, diagram.itemIndexMethod())
+            self.assertLessEqual(Diagram.BspTreeMinDepth, diagram.bspTreeDepth())
+            for node in diagram.nodes():
+                self.assertIn(node, diagram.items(node.pos()))
+
+    def test_bulk_load_defers_item_refresh(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        diagram.clearSelection()
+        node = diagram.factory.create(Item.ConceptNode)
+        # WHEN
+        diagram.beginBulkLoad()
+        diagram.addItem(node)
+        node.setSelected(True)
+        # THEN
+        self.assertTrue(diagram.isBulkLoading())
+        self.assertTrue(diagram.signalsBlocked())
+        self.assertEqual(Diagram.NoIndex, diagram.itemIndexMethod())
+        # WHEN
+        diagram.endBulkLoad()
+        # THEN
+        self.assertFalse(diagram.isBulkLoading())
+        self.assertFalse(diagram.signalsBlocked())
+        self.assertEqual(Diagram.BspTreeIndex, diagram.itemIndexMethod())
+        self.assertEqual(1, diagram.selectionCount(lambda x: x is Item.ConceptNode))
+        self.assertIn(node, diagram.items(node.pos()))
+
+    def test_bulk_load_updates_edge_depth(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        added, updated = sorted(diagram.edges(), key=lambda x: x.id)[:2]
+        diagram.removeItem(added)
+        updates = []
+        updateZValue = AbstractEdge.updateZValue
+        def update(edge):
+            updates.append((edge, edge.diagram.isBulkLoading()))
+            updateZValue(edge)
+        # WHEN
+        with mock.patch.object(AbstractEdge, 'updateZValue', update):
+            diagram.beginBulkLoad()
+            diagram.addItem(added)
+            updated.updateEdge()
+            diagram.endBulkLoad()
+        # THEN
+        self.assertIn((added, False), updates)
+        self.assertIn((updated, False), updates)
+        self.assertLen(1, [x for x, bulk in updates if x is added and not bulk])
+
+    def test_bsp_tree_depth_for_count(self):
+        # THEN
+        self.assertEqual(Diagram.BspTreeMinDepth, Diagram.bspTreeDepthForCount(0))
+        self.assertEqual(Diagram.BspTreeMinDepth, Diagram.bspTreeDepthForCount(100))
+        self.assertEqual(12, Diagram.bspTreeDepthForCount(10000))
+        self.assertEqual(Diagram.BspTreeMaxDepth, Diagram.bspTreeDepthForCount(10 ** 9))
+
+    #############################################
+    #   RENAME
+    #################################
+
+    def test_rename_diagram(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        did = diagram.id
+        num_items = len(self.project.items(diagram))
+        # WHEN
+        self.session.undostack.push(CommandDiagramRename('diagram', 'renamed', diagram, self.project))
+        # THEN
+        self.assertEqual(did, diagram.id)
+        self.assertIs(diagram, self.project.diagram('renamed'))
+        self.assertIs(diagram, self.project.diagram(did))
+        self.assertIsNone(self.project.diagram('diagram'))
+        self.assertEqual(num_items, len(self.project.items(diagram)))
+        self.assertIs(diagram, self.session.mdi.activeDiagram())
+        self.assertEqual('renamed', self.session.mdi.activeSubWindow().windowTitle())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertIs(diagram, self.project.diagram('diagram'))
+        self.assertIsNone(self.project.diagram('renamed'))
+        self.assertEqual(num_items, len(self.project.items(diagram)))
+
+    def test_rename_diagram_with_name_in_use(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        other = Diagram.create('other', 2000, self.project)
+        self.project.addDiagram(other)
+        # WHEN
+        renamed = self.project.renameDiagram(other, 'diagram')
+        # THEN
+        self.assertFalse(renamed)
+        self.assertEqual('other', other.name)
+        self.assertIs(diagram, self.project.diagram('diagram'))
+        self.assertIs(other, self.project.diagram('other'))
+
+    def test_add_diagram_with_name_in_use(self):
+        # GIVEN
+        diagram = Diagram.create('diagram', 2000, self.project)
+        # WHEN
+        added = self.project.addDiagram(diagram)
+        # THEN
+        self.assertFalse(added)
+        self.assertEqual('diagram', diagram.name)
+        self.assertIsNone(self.project.diagram(diagram.id))
+        self.assertIsNot(diagram, self.project.diagram('diagram'))
+
+    def test_add_diagrams_with_unique_names(self):
+        # GIVEN
+        diagrams = [Diagram.create('diagram', 2000, self.project) for _ in range(3)]
+        # WHEN
+        for diagram in diagrams:
+            diagram.name = self.project.uniqueName(diagram.name)
+            self.assertTrue(self.project.addDiagram(diagram))
+        # THEN
+        self.assertEqual(['diagram_1', 'diagram_2', 'diagram_3'], [x.name for x in diagrams])
+        self.assertEqual(4, len({x.id for x in self.project.diagrams()}))
+        for diagram in diagrams:
+            self.assertIs(diagram, self.project.diagram(diagram.name))
+
+    #############################################
+    #   NODE RENDERING
+    #################################
+
+    def test_visual_state_tracks_resize_handles(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(x for x in diagram.nodes() if x.type() is Item.ConceptNode)
+        node.updateNode(selected=True, handle=node.HandleTL)
+        state = node.visualState()
+        # WHEN
+        node.updateNode(selected=True, handle=node.HandleBR)
+        # THEN
+        self.assertNotEqual(state, node.visualState())
+        self.assertEqual(node.visualState(), node._visualState)
+
+    #############################################
+    #   EXTENT
+    #################################
+
+    def test_visible_rect_tracks_moved_and_removed_items(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        def scan():
+            rect = QtCore.QRectF()
+            for item in diagram.items():
+                rect |= item.sceneBoundingRect()
+            return rect
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        self.assertEqual(scan(), diagram.visibleRect())
+        # WHEN
+        node.moveBy(5000, 0)
+        node.updateEdges()
+        # THEN
+        self.assertIsNotNone(diagram.extent)
+        self.assertEqual(scan(), diagram.visibleRect())
+        # WHEN
+        node.moveBy(-5000, 0)
+        node.updateEdges()
+        # THEN
+        self.assertEqual(scan(), diagram.visibleRect())
+        # WHEN
+        self.session.undostack.push(CommandItemsRemove(diagram, {node} | node.edges))
+        # THEN
+        self.assertEqual(scan(), diagram.visibleRect())
+
+    #############################################
+    #   GEOMETRY
+    #################################
+
+    def test_geometry_transformations(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        geometry = diagram.geometry()
+        # WHEN
+        translated = geometry.copy().translate(15, -5)
+        scaled = geometry.copy().scale(2, QtCore.QPointF(0, 0))
+        snapped = geometry.copy().translate(3, 7).snap(Diagram.GridSize)
+        # THEN
+        self.assertEqual(set(diagram.nodes()), set(geometry.nodes))
+        self.assertEqual(set(diagram.edges()), {x for x, _ in geometry.edges})
+        self.assertEqual(len(geometry.nodes), len(geometry.changed(translated)[0]))
+        self.assertEqual(([], []), geometry.changed(geometry.copy()))
+        self.assertEqual([x + 15 for x in geometry.positionData[0::2]], list(translated.positionData[0::2]))
+        self.assertEqual([x + 15 for x in geometry.anchorData[0::2]], list(translated.anchorData[0::2]))
+        self.assertEqual([x * 2 for x in geometry.breakpointData], list(scaled.breakpointData))
+        self.assertTrue(all(x % Diagram.GridSize == 0 for x in snapped.positionData + snapped.breakpointData))
+        # WHEN
+        diagram.setGeometry(translated)
+        # THEN
+        i = geometry.nodes.index(node)
+        self.assertEqual(QtCore.QPointF(*geometry.positionData[i * 2:i * 2 + 2]) + QtCore.QPointF(15, -5), node.pos())
+        self.assertEqual(diagram.geometry().changed(translated), ([], []))
+
+    #############################################
+    #   UNDO HISTORY
+    #################################
+
+    def test_consecutive_moves_of_the_same_nodes_are_merged(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        pos = node.pos()
+        count = self.session.undostack.count()
+        # WHEN
+        for offset in (QtCore.QPointF(20, 0), QtCore.QPointF(0, 40)):
+            initData = diagram.setupMove([node])
+            moveData = diagram.completeMove(initData, offset)
+            self.session.undostack.push(CommandNodeMove(diagram, initData, moveData))
+        # THEN
+        self.assertEqual(count + 1, self.session.undostack.count())
+        self.assertEqual(pos + QtCore.QPointF(20, 40), node.pos())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(pos, node.pos())
+
+    def test_bulk_moves_update_edge_depth_after_bulk_load(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        nodes = diagram.nodes()
+        updates = []
+        updateZValue = AbstractEdge.updateZValue
+        def update(edge):
+            updates.append((edge, edge.diagram.isBulkLoading()))
+            updateZValue(edge)
+        # WHEN
+        with mock.patch.object(Diagram, 'BulkThreshold', 1), mock.patch.object(AbstractEdge, 'updateZValue', update):
+            initData = diagram.setupMove(nodes)
+            moveData = diagram.completeMove(initData, QtCore.QPointF(20, 0))
+            self.session.undostack.push(CommandNodeMove(diagram, initData, moveData))
+        # THEN
+        self.assertFalse(diagram.isBulkLoading())
+        self.assertEqual(set(diagram.edges()), {edge for edge, bulk in updates if not bulk})
+
+    def test_snap_to_grid_undo_restores_positions(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        node.setPos(node.pos() + QtCore.QPointF(3, 7))
+        positions = {x: x.pos() for x in diagram.nodes()}
+        breakpoints = {x: x.breakpoints[:] for x in diagram.edges()}
+        # WHEN
+        self.session.action('snap_to_grid').trigger()
+        # THEN
+        self.assertNotEqual(positions[node], node.pos())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(positions, {x: x.pos() for x in diagram.nodes()})
+        self.assertEqual(breakpoints, {x: x.breakpoints for x in diagram.edges()})
+
+    def test_align_selected_nodes(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        nodes = [first(self.project.predicates(Item.RoleNode, x, diagram)) for x in ('hasParent', 'hasMother')]
+        nodes[0].setPos(nodes[0].pos() + QtCore.QPointF(33, 0))
+        positions = [x.pos() for x in nodes]
+        anchors = [{k: v - x.pos() for k, v in x.anchors.items()} for x in nodes]
+        for node in nodes:
+            node.setSelected(True)
+        # WHEN
+        first(x for x in self.session.action('align').actions() if x.data() == QtCore.Qt.AlignLeft).trigger()
+        # THEN
+        self.assertEqual(nodes[0].sceneBoundingRect().left(), nodes[1].sceneBoundingRect().left())
+        self.assertEqual([x.pos().y() for x in nodes], [x.y() for x in positions])
+        self.assertEqual(anchors, [{k: v - x.pos() for k, v in x.anchors.items()} for x in nodes])
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(positions, [x.pos() for x in nodes])
+
+    def test_center_diagram_undo_restores_positions(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        for item in diagram.items():
+            item.moveBy(200, 100)
+        for edge in diagram.edges():
+            edge.updateEdge()
+        positions = {x: x.pos() for x in diagram.nodes()}
+        breakpoints = {x: x.breakpoints[:] for x in diagram.edges()}
+        # WHEN
+        self.session.action('center_diagram').trigger()
+        # THEN
+        self.assertNotEqual(positions, {x: x.pos() for x in diagram.nodes()})
+        offset = diagram.visibleRect().center() - diagram.sceneRect().center()
+        self.assertLessEqual(abs(offset.x()), Diagram.GridSize)
+        self.assertLessEqual(abs(offset.y()), Diagram.GridSize)
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(positions, {x: x.pos() for x in diagram.nodes()})
+        self.assertEqual(breakpoints, {x: x.breakpoints for x in diagram.edges()})
+
+    def test_undo_history_compacts_distant_moves(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        nodes = sorted(diagram.nodes(), key=lambda x: x.id)[:2]
+        positions = {x: x.pos() for x in diagram.nodes()}
+        commands = []
+        # WHEN
+        with mock.patch.object(UndoStack, 'CompactAfter', 2):
+            for i in range(6):
+                initData = diagram.setupMove([nodes[i % 2]])
+                moveData = diagram.completeMove(initData, QtCore.QPointF(20, 0))
+                commands.append(CommandNodeMove(diagram, initData, moveData))
+                self.session.undostack.push(commands[-1])
+            # THEN
+            self.assertIsNotNone(commands[0]._redo.packed)
+            self.assertIsNotNone(commands[3]._undo.packed)
+            self.assertIsNone(commands[4]._redo.packed)
+            self.assertEqual(sum(map(UndoStack.footprintOf, commands)), self.session.undostack.footprint())
+            # WHEN
+            for _ in commands:
+                self.session.undostack.undo()
+        # THEN
+        self.assertEqual(positions, {x: x.pos() for x in diagram.nodes()})
+
+    def test_undo_history_measures_only_commands_near_the_index(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        nodes = sorted(diagram.nodes(), key=lambda x: x.id)[:2]
+        for i in range(UndoStack.CompactAfter * 2):
+            initData = diagram.setupMove([nodes[i % 2]])
+            moveData = diagram.completeMove(initData, QtCore.QPointF(20, 0))
+            self.session.undostack.push(CommandNodeMove(diagram, initData, moveData))
+        # WHEN
+        with mock.patch.object(UndoStack, 'footprintOf', wraps=UndoStack.footprintOf) as footprintOf:
+            self.session.undostack.undo()
+        # THEN
+        self.assertLessEqual(footprintOf.call_count, 3)
+
+    def test_undo_history_budget_compacts_removed_items(self):
+        # GIVEN
+        diagram = self.session.mdi.activeDiagram()
+        node = first(self.project.predicates(Item.RoleNode, 'hasParent', diagram))
+        self.session.undostack.push(CommandItemsRemove(diagram, {node} | node.edges))
+        footprint = self.session.undostack.footprint()
+        # WHEN
+        self.session.undostack.setBudget(1)
+        # THEN
+        self.assertLess(self.session.undostack.footprint(), footprint)
+        self.assertEqual(AbstractItem.NoCache, node.cacheMode())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(AbstractItem.DeviceCoordinateCache, node.cacheMode())
+        self.assertIn(node, diagram.nodes())
\ No newline at end of file
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import io
+
+from contextlib import redirect_stdout
+
+from PyQt5 import QtCore
+from PyQt5 import QtTest
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.diff import AxiomDiff, main
+from eddy.core.functions.path import expandPath
+from eddy.core.graph import Graph
+from eddy.core.project import K_DESCRIPTION, K_FUNCTIONAL
+from eddy.ui.diff import AxiomDiffDialog
+
+from tests import EddyTestCase
+
+
+class AxiomDiffTestCase(EddyTestCase):
+    """
+    Tests for the axiom level diff between two versions of a project.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.path = expandPath('@tests/.tests/test_project_1/test_project_1.graphol')
+
+    def test_diff_ignores_layout_changes(self):
+        # GIVEN
+        for node in self.project.nodes():
+            node.setPos(node.pos() + QtCore.QPointF(100, 100))
+        diff = AxiomDiff(Graph.fromFile(self.path), self.project)
+        # WHEN
+        diff.compute(processes=False)
+        # THEN
+        self.assertTrue(diff.isEmpty())
+        self.assertEmpty(diff.report())
+
+    def test_diff_renamed_predicate(self):
+        # GIVEN
+        graph = Graph.fromProject(self.project)
+        for node in graph.nodes():
+            if node.type() is Item.ConceptNode and node.text() == 'Male':
+                node._text = 'Man'
+        diff = AxiomDiff(self.project, graph)
+        # WHEN
+        diff.compute(processes=False)
+        # THEN
+        self.assertFalse(diff.isEmpty())
+        self.assertEmpty(diff.metadata())
+        self.assertIn(('Declaration', ('Class', 'test:Man')), diff.added())
+        self.assertIn(('Declaration', ('Class', 'test:Male')), diff.removed())
+        self.assertIn('+ SubClassOf(test:Father test:Man)', diff.report())
+        self.assertIn('- SubClassOf(test:Father test:Male)', diff.report())
+        self.assertEqual(len(diff.added()), len(diff.removed()))
+
+    def test_diff_changed_metadata(self):
+        # GIVEN
+        graph = Graph.fromProject(self.project)
+        meta = graph.meta(Item.RoleNode, 'hasFather')
+        graph.setMeta(Item.RoleNode, 'hasFather', dict(meta, **{K_FUNCTIONAL: False}))
+        graph.setMeta(Item.ConceptNode, 'Male', {K_DESCRIPTION: 'A male human being'})
+        diff = AxiomDiff(self.project, graph)
+        # WHEN
+        diff.compute(processes=False)
+        # THEN
+        self.assertEqual({(Item.ConceptNode, 'Male'), (Item.RoleNode, 'hasFather')}, set(diff.metadata()))
+        self.assertEqual(({}, {K_DESCRIPTION: 'A male human being'}), diff.metadata()[(Item.ConceptNode, 'Male')])
+        self.assertIn(('FunctionalObjectProperty', ('ObjectProperty', 'test:hasFather')), diff.removed())
+        self.assertIn('~ role hasFather: functional = True -> None', diff.report())
+
+    def test_diff_from_files(self):
+        # WHEN
+        diff = AxiomDiff.fromFiles(self.path, self.path)
+        diff.compute()
+        # THEN
+        self.assertTrue(diff.isEmpty())
+
+    def test_diff_from_command_line(self):
+        # GIVEN
+        with open(self.path) as f:
+            content = f.read()
+        with open(expandPath('@tests/.tests/test_project_2.graphol'), 'w') as f:
+            f.write(content.replace('>Male<', '>Man<'))
+        # WHEN
+        stream1 = io.StringIO()
+        with redirect_stdout(stream1):
+            status1 = main([self.path, self.path, '--serial'])
+        stream2 = io.StringIO()
+        with redirect_stdout(stream2):
+            status2 = main([self.path, expandPath('@tests/.tests/test_project_2.graphol')])
+        # THEN
+        self.assertEqual(0, status1)
+        self.assertEqual('', stream1.getvalue())
+        self.assertEqual(1, status2)
+        self.assertIn('+ Declaration(Class(test:Man))', stream2.getvalue().splitlines())
+        self.assertIn('- Declaration(Class(test:Male))', stream2.getvalue().splitlines())
+
+    def test_diff_dialog(self):
+        # GIVEN
+        for node in self.project.nodes():
+            if node.type() is Item.ConceptNode and node.text() == 'Male':
+                node.setText('Man')
+        dialog = AxiomDiffDialog(self.project, self.path, self.session)
+        # WHEN
+        dialog.show()
+        for _ in range(600):
+            if dialog.diff is not None:
+                break
+            QtTest.QTest.qWait(50)
+        # THEN
+        self.assertIsNotNone(dialog.diff)
+        self.assertIn('+ Declaration(Class(test:Man))', dialog.model.stringList())
+        self.assertIn('- Declaration(Class(test:Male))', dialog.model.stringList())
+        dialog.close()
\ No newline at end of file
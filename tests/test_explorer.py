@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from unittest import mock
+
+from tests import EddyTestCase
+
+from eddy.core.commands.nodes import CommandNodeAdd
+from eddy.core.commands.project import CommandProjectRenamePredicates
+from eddy.core.datatypes.graphol import Item
+
+
+class OntologyExplorerTestCase(EddyTestCase):
+    """
+    Tests for eddy's ontology explorer model.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+        self.widget = self.session.plugin('ontology_explorer').widget('ontology_explorer')
+        self.model = self.widget.model
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def groups(self):
+        """
+        Returns the texts of the top level rows of the model.
+        :rtype: list
+        """
+        return [self.model.data(self.model.index(i, 0)) for i in range(self.model.rowCount())]
+
+    def occurrences(self, name, item):
+        """
+        Returns the nodes listed under the top level row of the given predicate.
+        :type name: str
+        :type item: Item
+        :rtype: set
+        """
+        row = self.model.keys.index((name, item))
+        parent = self.model.index(row, 0)
+        return {self.model.node(self.model.index(i, 0, parent)) for i in range(self.model.rowCount(parent))}
+
+    #############################################
+    #   MODEL
+    #################################
+
+    def test_model_lists_project_predicates(self):
+        # THEN
+        self.assertEqual(sorted(self.model.keys), self.model.keys)
+        self.assertIn('Mother', self.groups())
+        self.assertEqual(set(self.project.predicates(Item.ConceptNode, 'Mother')), self.occurrences('Mother', Item.ConceptNode))
+
+    def test_add_node(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        node = diagram.factory.create(Item.ConceptNode)
+        node.setText('Pet')
+        # WHEN
+        self.session.undostack.push(CommandNodeAdd(diagram, node))
+        # THEN
+        self.assertEqual(sorted(self.model.keys), self.model.keys)
+        self.assertEqual({node}, self.occurrences('Pet', Item.ConceptNode))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertNotIn(('Pet', Item.ConceptNode), self.model.keys)
+
+    def test_remove_node(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        nodes = set(self.project.predicates(Item.ConceptNode, 'Mother'))
+        diagram.clearSelection()
+        for node in nodes:
+            node.setSelected(True)
+        # WHEN
+        self.session.action('delete').trigger()
+        # THEN
+        self.assertNotIn(('Mother', Item.ConceptNode), self.model.keys)
+        self.assertEqual(len(self.model.keys), self.model.rowCount())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(nodes, self.occurrences('Mother', Item.ConceptNode))
+
+    def test_rename_nodes(self):
+        # GIVEN
+        nodes = set(self.project.predicates(Item.ConceptNode, 'Mother'))
+        # WHEN
+        self.session.undostack.push(CommandProjectRenamePredicates(self.project, {x: 'Mom' for x in nodes}))
+        # THEN
+        self.assertNotIn(('Mother', Item.ConceptNode), self.model.keys)
+        self.assertEqual(nodes, self.occurrences('Mom', Item.ConceptNode))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertNotIn(('Mom', Item.ConceptNode), self.model.keys)
+        self.assertEqual(nodes, self.occurrences('Mother', Item.ConceptNode))
+
+    def test_rename_many_nodes_resets_the_model(self):
+        # GIVEN
+        nodes = [x for x in self.project.nodes() if x.type() in self.model.Types]
+        spy = []
+        self.model.modelReset.connect(lambda: spy.append(True))
+        # WHEN
+        with mock.patch.object(type(self.model), 'ResetThreshold', len(nodes) - 1):
+            self.session.undostack.push(CommandProjectRenamePredicates(self.project, {x: 'X' + x.text() for x in nodes}))
+        # THEN
+        self.assertEqual([True], spy)
+        self.assertEqual(sorted(self.model.keys), self.model.keys)
+        self.assertTrue(all(x.startswith('X') for x in self.groups()))
+
+    def test_filter(self):
+        # WHEN
+        self.widget.search.setText('moth')
+        # THEN
+        proxy = self.widget.proxy
+        texts = [proxy.data(proxy.index(i, 0)) for i in range(proxy.rowCount())]
+        self.assertIn('Mother', texts)
+        self.assertTrue(all('moth' in x.lower() for x in texts))
+        # WHEN
+        self.widget.search.setText('')
+        # THEN
+        self.assertEqual(self.model.rowCount(), proxy.rowCount())
\ No newline at end of file
@@ -33,15 +33,29 @@
 ##########################################################################
 
 
+import json
+import time
+import zipfile
+
 from mock import patch
 
+from PyQt5 import QtCore
+from PyQt5 import QtGui
+
 from tests import EddyTestCase
 
 from eddy.core.datatypes.owl import OWLSyntax, OWLAxiom
+from eddy.core.datatypes.system import File
+from eddy.core.diagram import Diagram
+from eddy.core.exporters.batch import BatchDiagramExporter
 from eddy.core.exporters.graphml import GraphMLDiagramExporter
 from eddy.core.exporters.owl2 import OWLOntologyExporterWorker
+from eddy.core.exporters.image import PngDiagramExporter
 from eddy.core.exporters.pdf import PdfDiagramExporter
-from eddy.core.functions.fsystem import fread
+from eddy.core.exporters.pdf import PdfProjectExporter
+from eddy.core.exporters.pdf import PdfWriter
+from eddy.core.exporters.tiles import DiagramSnapshot, tiles
+from eddy.core.functions.fsystem import fread, fexists
 from eddy.core.functions.path import expandPath
 
 
@@ -56,6 +70,74 @@ class ExportTestCase(EddyTestCase):
         super().setUp()
         self.init('test_project_1')
 
+    def exportDiagrams(self, path, **kwargs):
+        """
+        Export all the diagrams of the current project in the given path, waiting for the export to complete.
+        :type path: str
+        :type kwargs: dict
+        :rtype: BatchDiagramExporter
+        """
+        worker = BatchDiagramExporter(self.project, self.session, **kwargs)
+        worker.run(path)
+        deadline = time.monotonic() + 60
+        while not worker.completed and time.monotonic() < deadline:
+            QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+        self.assertTrue(worker.completed, 'export did not complete within 60 seconds')
+        return worker
+
+    #############################################
+    #   BATCH EXPORT
+    #################################
+
+    def test_export_diagrams_to_directory(self):
+        # WHEN
+        worker = BatchDiagramExporter(self.project, self.session, threads=2)
+        worker.run('@tests/.tests/batch')
+        # THEN
+        self.assertFalse(worker.completed)
+        # WHEN
+        deadline = time.monotonic() + 60
+        while not worker.completed and time.monotonic() < deadline:
+            QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+        # THEN
+        self.assertTrue(worker.completed)
+        self.assertEmpty(worker.errors)
+        self.assertFileExists('@tests/.tests/batch/index.json')
+        index = json.loads(fread('@tests/.tests/batch/index.json'))
+        self.assertEqual('test_project_1', index['project'])
+        self.assertEqual(sorted(x.name for x in self.project.diagrams()), sorted(x['diagram'] for x in index['diagrams']))
+        for entry in index['diagrams']:
+            self.assertEqual({x.filetype().name for x in self.session.diagramExporters()}, set(entry['files']))
+            for files in entry['files'].values():
+                self.assertNotEmpty(files)
+                self.assertAll(fexists(expandPath('@tests/.tests/batch/{0}'.format(x))) for x in files)
+
+    def test_export_diagrams_to_zip_archive(self):
+        # WHEN
+        worker = self.exportDiagrams('@tests/.tests/batch.zip', filetypes={File.GraphML})
+        # THEN
+        self.assertEmpty(worker.errors)
+        with zipfile.ZipFile(expandPath('@tests/.tests/batch.zip')) as archive:
+            names = set(archive.namelist())
+        self.assertIn('index.json', names)
+        self.assertAllIn(['{0}.graphml'.format(x.name) for x in self.project.diagrams()], names)
+        self.assertLen(len(self.project.diagrams()) + 1, names)
+
+    def test_export_diagrams_with_colliding_file_names(self):
+        # GIVEN
+        for name in ('a b', 'a_b', 'A:B'):
+            self.assertTrue(self.project.addDiagram(Diagram.create(name, 2000, self.project)))
+        # WHEN
+        worker = self.exportDiagrams('@tests/.tests/batch', filetypes={File.GraphML})
+        # THEN
+        self.assertEmpty(worker.errors)
+        index = json.loads(fread('@tests/.tests/batch/index.json'))
+        files = [x for entry in index['diagrams'] for x in entry['files'][File.GraphML.name]]
+        self.assertLen(len(self.project.diagrams()), set(files))
+        self.assertLen(len(files), set(files))
+        self.assertAllIn(['a_b.graphml', 'A_B_1.graphml', 'a_b_2.graphml'], files)
+        self.assertAll(fexists(expandPath('@tests/.tests/batch/{0}'.format(x))) for x in files)
+
     #############################################
     #   GRAPHML EXPORT
     #################################
@@ -83,6 +165,75 @@ class ExportTestCase(EddyTestCase):
         # THEN
         self.assertFileExists('@tests/.tests/diagram.pdf')
 
+    def test_export_diagram_to_pdf_pages(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        shape = diagram.visibleRect(margin=20)
+        # WHEN
+        writer = PdfWriter(expandPath('@tests/.tests/diagram.pdf'), pageSize=QtCore.QSizeF(200, 200))
+        pages = writer.write(diagram)
+        writer.close()
+        # THEN
+        self.assertFileExists('@tests/.tests/diagram.pdf')
+        self.assertLen(pages, tiles(shape, 200, 200))
+        self.assertGreater(pages, 1)
+        self.assertEqual(pages, writer.pages)
+
+    @patch('eddy.core.exporters.pdf.openPath')
+    def test_export_project_to_pdf(self, _):
+        # WHEN
+        worker = PdfProjectExporter(self.project, self.session)
+        worker.run(expandPath('@tests/.tests/test_project_1.pdf'))
+        # THEN
+        self.assertFileExists('@tests/.tests/test_project_1.pdf')
+        self.assertIn(('/Count %d' % len(self.project.diagrams())).encode(), open(expandPath('@tests/.tests/test_project_1.pdf'), 'rb').read())
+
+    #############################################
+    #   PNG EXPORT
+    #################################
+
+    def test_export_diagram_to_png(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        shape = diagram.visibleRect(margin=20)
+        # WHEN
+        worker = PngDiagramExporter(diagram, self.session, resolution=72)
+        files = worker.run(expandPath('@tests/.tests/diagram.png'))
+        # THEN
+        self.assertEqual([expandPath('@tests/.tests/diagram.png')], files)
+        self.assertEqual(QtCore.QSize(int(shape.width()), int(shape.height())), QtGui.QImage(files[0]).size())
+
+    def test_export_diagram_to_png_tiles(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        shape = diagram.visibleRect(margin=20)
+        # WHEN
+        worker = PngDiagramExporter(diagram, self.session, resolution=144, tileSize=256)
+        files = worker.run(expandPath('@tests/.tests/diagram.png'))
+        # THEN
+        self.assertLen(len(tiles(shape, 128, 128)), files)
+        self.assertAll(QtGui.QImage(x).width() <= 256 for x in files)
+        self.assertFileExists('@tests/.tests/diagram_0_0.png')
+        self.assertFileExists('@tests/.tests/diagram_0_1.png')
+        self.assertFileExists('@tests/.tests/diagram_1_0.png')
+
+    def test_snapshot_tiles_match_single_image(self):
+        # GIVEN
+        snapshot = DiagramSnapshot(self.project.diagram('diagram'))
+        rect = snapshot.rect
+        # WHEN
+        _, whole = next(snapshot.render([rect]))
+        images = list(snapshot.render(tiles(rect, 400, 300)))
+        # THEN
+        self.assertLen(len(tiles(rect, 400, 300)), images)
+        for tile, image in images:
+            offset = (tile.topLeft() - rect.topLeft()).toPoint()
+            expected = whole.copy(QtCore.QRect(offset, image.size()))
+            self.assertEqual(expected.size(), image.size())
+            # ALLOW ANTIALIASING DIFFERENCES ON A FEW PIXELS
+            mismatch = sum(1 for x in range(0, image.width(), 2) for y in range(0, image.height(), 2) if expected.pixel(x, y) != image.pixel(x, y))
+            self.assertLessEqual(mismatch, 10)
+
     #############################################
     #   OWL EXPORT
     #################################
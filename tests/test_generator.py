@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from tests import EddyTestCase
+from tests.benchmarks.generator import GrapholProjectGenerator
+
+from eddy.core.datatypes.graphol import Identity, Item
+
+
+class GeneratorTestCase(EddyTestCase):
+    """
+    Tests for the synthetic Graphol project generator used by the benchmark suite.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.generator = GrapholProjectGenerator(diagrams=3, concepts=30, roles=8, attributes=6,
+            individuals=10, depth=3, density=1.5, clusters=5, sharing=0.2, seed=42)
+        self.generator.write('@tests/.tests/.generated/')
+        self.init('.tests/.generated/synthetic')
+
+    #############################################
+    #   GENERATION
+    #################################
+
+    def test_generated_project_is_reproducible(self):
+        # GIVEN
+        document = self.generator.document.toString()
+        # WHEN
+        self.generator.generate()
+        # THEN
+        self.assertEqual(document, self.generator.document.toString())
+
+    def test_generated_project_loads(self):
+        # THEN
+        self.assertEqual(3, len(self.project.diagrams()))
+        self.assertEqual(self.generator.stats['nodes'], len(self.project.nodes()))
+        self.assertEqual(self.generator.stats['edges'], len(self.project.edges()))
+        self.assertEqual(30, len({x.text() for x in self.project.predicates(Item.ConceptNode)}))
+        self.assertLess(30, len(self.project.predicates(Item.ConceptNode)))
+
+    def test_generated_project_is_valid(self):
+        # THEN
+        self.assertEmpty([x for x in self.project.nodes() if x.identity() is Identity.Neutral])
+        self.assertEmpty([x for x in self.project.nodes() if x.identity() is Identity.Unknown])
+        for edge in self.project.edges():
+            pvr = self.project.profile.checkEdge(edge.source, edge, edge.target)
+            self.assertTrue(pvr.isValid(), '{0}: {1}'.format(edge, pvr.message()))
\ No newline at end of file
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import pickle
+
+from unittest import mock
+
+from eddy.core.datatypes.graphol import Item, Identity
+from eddy.core.datatypes.system import File
+from eddy.core.functions.fsystem import fread
+from eddy.core.functions.graph import closure, K_INPUT
+from eddy.core.functions.misc import first
+from eddy.core.graph import Graph, GraphDiagram, GraphEdge, GraphNode
+
+from tests import EddyTestCase
+from tests.benchmarks.generator import GrapholProjectGenerator
+
+
+class GraphTestCase(EddyTestCase):
+    """
+    Tests for the headless graph model.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        generator = GrapholProjectGenerator(diagrams=2, concepts=30, roles=8, attributes=6,
+            individuals=10, depth=3, clusters=6, seed=7)
+        generator.write('@tests/.tests/.generated/')
+        self.init('.tests/.generated/synthetic')
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def assertGraphMatchesProject(self, graph):
+        """
+        Check that the given graph matches the project loaded in the session.
+        :type graph: Graph
+        """
+        self.assertEqual(self.project.name, graph.name)
+        self.assertEqual(self.project.iri, graph.iri)
+        self.assertIs(self.project.profile.type(), graph.profile.type())
+        self.assertEqual(len(self.project.nodes()), len(graph.nodes()))
+        self.assertEqual(len(self.project.edges()), len(graph.edges()))
+        for diagram in self.project.diagrams():
+            headless = graph.diagram(diagram.name)
+            for node in diagram.nodes():
+                record = headless.node(node.id)
+                self.assertIs(node.type(), record.type())
+                self.assertIs(node.identity(), record.identity(), node)
+                if node.isPredicate():
+                    self.assertEqual(node.text(), record.text())
+            for edge in diagram.edges():
+                record = headless.edge(edge.id)
+                self.assertEqual(edge.source.id, record.source.id)
+                self.assertEqual(edge.target.id, record.target.id)
+
+    #############################################
+    #   BUILD
+    #################################
+
+    def test_graph_from_file(self):
+        # WHEN
+        graph = Graph.fromFile('@tests/.tests/.generated/synthetic/synthetic.graphol')
+        # THEN
+        self.assertGraphMatchesProject(graph)
+
+    def test_graph_from_project(self):
+        # WHEN
+        graph = Graph.fromProject(self.project)
+        # THEN
+        self.assertGraphMatchesProject(graph)
+        self.assertEqual(len(self.project.metas()), len(graph.metas()))
+
+    def test_graph_pickle(self):
+        # GIVEN
+        graph = Graph.fromProject(self.project)
+        # WHEN
+        clone = pickle.loads(pickle.dumps(graph))
+        # THEN
+        self.assertGraphMatchesProject(clone)
+        self.assertEqual(graph.metas(), clone.metas())
+
+    def test_graph_split(self):
+        # GIVEN
+        graph = Graph.fromProject(self.project)
+        # WHEN
+        graphs = graph.split()
+        # THEN
+        self.assertLen(len(self.project.diagrams()), graphs)
+        for diagram, subgraph in zip(graph.diagrams(), graphs):
+            self.assertEqual([diagram.name], [x.name for x in subgraph.diagrams()])
+            self.assertEqual({x.id for x in diagram.nodes()}, {x.id for x in subgraph.nodes()})
+            self.assertEqual({x.id for x in diagram.edges()}, {x.id for x in subgraph.edges()})
+            self.assertEqual(graph.metas(), subgraph.metas())
+
+    def test_graph_predicates(self):
+        # GIVEN
+        graph = Graph.fromFile('@tests/.tests/.generated/synthetic/synthetic.graphol')
+        diagram = first(self.project.diagrams())
+        # THEN
+        self.assertEqual({(x.type(), x.text()) for x in self.project.predicates()},
+                         {(x.type(), x.text()) for x in graph.predicates()})
+        self.assertEqual({x.id for x in diagram.nodes() if x.type() is Item.ConceptNode},
+                         {x.id for x in graph.predicates(Item.ConceptNode, diagram=graph.diagram(diagram.name))})
+
+    #############################################
+    #   EXPORT
+    #################################
+
+    def test_csv_export_from_graph(self):
+        # GIVEN
+        exporter = self.session.projectExporter(File.Csv)
+        graph = Graph.fromFile('@tests/.tests/.generated/synthetic/synthetic.graphol')
+        # WHEN
+        with mock.patch('os.system'):
+            exporter(self.project, self.session).run('@tests/.tests/project.csv')
+            exporter(graph).run('@tests/.tests/graph.csv')
+        # THEN
+        self.assertEqual(fread('@tests/.tests/project.csv'), fread('@tests/.tests/graph.csv'))
+        self.assertLen(len({(x.type(), x.text()) for x in graph.predicates()
+                            if x.type() in exporter.Types}) + 1, fread('@tests/.tests/graph.csv').splitlines())
+
+    #############################################
+    #   VALIDATION
+    #################################
+
+    def test_graph_validation_on_valid_project(self):
+        # WHEN
+        graph = Graph.fromProject(self.project)
+        # THEN
+        self.assertEmpty(graph.validate())
+
+    def test_graph_validation_on_invalid_inclusion(self):
+        # GIVEN
+        graph = Graph('test', 'test', 'http://www.example.com/test')
+        diagram = GraphDiagram('diagram', graph)
+        concept = GraphNode(diagram, 'n0', Item.ConceptNode, 'Person')
+        role = GraphNode(diagram, 'n1', Item.RoleNode, 'knows')
+        edge = GraphEdge(diagram, 'e0', Item.InclusionEdge, concept, role)
+        for item in (concept, role, edge):
+            diagram.addItem(item)
+        concept.edges.append(edge)
+        role.edges.append(edge)
+        graph.addDiagram(diagram)
+        # WHEN
+        errors = graph.validate()
+        # THEN
+        self.assertLen(1, errors)
+        self.assertEqual((concept, edge, role), errors[0].item())
+
+    def test_graph_identification_of_neutral_nodes(self):
+        # GIVEN
+        graph = Graph('test', 'test', 'http://www.example.com/test')
+        diagram = GraphDiagram('diagram', graph)
+        individual = GraphNode(diagram, 'n0', Item.IndividualNode, 'john')
+        union = GraphNode(diagram, 'n1', Item.UnionNode)
+        complement = GraphNode(diagram, 'n2', Item.ComplementNode)
+        e1 = GraphEdge(diagram, 'e0', Item.MembershipEdge, individual, union)
+        e2 = GraphEdge(diagram, 'e1', Item.InputEdge, complement, union)
+        for item in (individual, union, complement, e1, e2):
+            diagram.addItem(item)
+        individual.edges.append(e1)
+        union.edges.extend([e1, e2])
+        complement.edges.append(e2)
+        graph.addDiagram(diagram)
+        # WHEN
+        graph.identify()
+        # THEN
+        self.assertIs(Identity.Individual, individual.identity())
+        self.assertIs(Identity.Concept, union.identity())
+        self.assertIs(Identity.Concept, complement.identity())
+
+    def test_graph_closure_is_shared_among_component_nodes(self):
+        # GIVEN
+        diagram = GraphDiagram('diagram', Graph('test', 'test', 'http://www.example.com/test'))
+        union = GraphNode(diagram, 'n0', Item.UnionNode)
+        complement = GraphNode(diagram, 'n1', Item.ComplementNode)
+        intersection = GraphNode(diagram, 'n2', Item.IntersectionNode)
+        e1 = GraphEdge(diagram, 'e0', Item.InputEdge, complement, union)
+        e2 = GraphEdge(diagram, 'e1', Item.InputEdge, intersection, complement)
+        union.edges.append(e1)
+        complement.edges.extend([e1, e2])
+        intersection.edges.append(e2)
+        # WHEN
+        nodes = closure(union, K_INPUT)
+        # THEN
+        self.assertEqual((union, complement, intersection), nodes)
+        self.assertIs(nodes, closure(intersection, K_INPUT))
+        self.assertIs(nodes, complement.closures[K_INPUT][0])
+        self.assertEqual((union, complement), closure(union, K_INPUT, exclude=e2))
+
+    def test_graph_closure_invalidation_on_identity_change(self):
+        # GIVEN
+        diagram = GraphDiagram('diagram', Graph('test', 'test', 'http://www.example.com/test'))
+        union = GraphNode(diagram, 'n0', Item.UnionNode)
+        complement = GraphNode(diagram, 'n1', Item.ComplementNode)
+        intersection = GraphNode(diagram, 'n2', Item.IntersectionNode)
+        e1 = GraphEdge(diagram, 'e0', Item.InputEdge, complement, union)
+        e2 = GraphEdge(diagram, 'e1', Item.InputEdge, intersection, complement)
+        union.edges.append(e1)
+        complement.edges.extend([e1, e2])
+        intersection.edges.append(e2)
+        closure(union, K_INPUT)
+        # WHEN
+        complement.setIdentity(Identity.Concept)
+        # THEN
+        self.assertEqual({}, union.closures)
+        self.assertEqual({}, complement.closures)
+        self.assertEqual({}, intersection.closures)
+        self.assertEqual((union,), closure(union, K_INPUT))
+        self.assertEqual((intersection,), closure(intersection, K_INPUT))
\ No newline at end of file
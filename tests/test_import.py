@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import time
+
+from unittest import mock
+
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+
+from tests import EddyTestCase
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.datatypes.system import File
+from eddy.core.exporters.graphml import GraphMLDiagramExporter
+from eddy.core.functions.fsystem import cpdir, fread
+from eddy.core.functions.path import expandPath
+from eddy.core.graph import Graph
+from eddy.core.loaders.graphml import GraphMLDocument
+from eddy.core.loaders.importer import OntologyImporter, OntologyImportWorker
+from eddy.core.project import ProjectMergeWorker
+from eddy.core.project import K_DESCRIPTION
+
+
+class ImportTestCase(EddyTestCase):
+    """
+    Tests for the concurrent import of ontology files.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        cpdir('@tests/test_project_2/', '@tests/.tests/test_project_2')
+        self.init('test_project_1')
+        self.path1 = expandPath('@tests/.tests/test_project_1/test_project_1.graphol')
+        self.path2 = expandPath('@tests/.tests/test_project_2/test_project_2.graphol')
+
+    #############################################
+    #   UTILITIES
+    #################################
+
+    def importFiles(self, *paths, cancel=False, filetype=File.Graphol):
+        """
+        Import the given files in the current project, waiting for the import to complete.
+        :type paths: list
+        :type cancel: bool
+        :type filetype: File
+        :rtype: OntologyImporter
+        """
+        importer = OntologyImporter(filetype, paths, self.project, self.session)
+        importer.start()
+        if cancel:
+            importer.cancel()
+        deadline = time.monotonic() + 30
+        while not importer.completed and time.monotonic() < deadline:
+            QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+        self.assertTrue(importer.completed, 'import did not complete within 30 seconds')
+        return importer
+
+    #############################################
+    #   IMPORT
+    #################################
+
+    def test_import_multiple_files(self):
+        # GIVEN
+        num_diagrams = len(self.project.diagrams())
+        num_nodes = len(self.project.nodes())
+        graph1 = Graph.fromFile(self.path1)
+        graph2 = Graph.fromFile(self.path2)
+        # WHEN
+        importer = self.importFiles(self.path1, self.path2)
+        # THEN
+        self.assertTrue(importer.completed)
+        self.assertEmpty(importer.errors)
+        self.assertEqual(num_diagrams + len(graph1.diagrams()) + len(graph2.diagrams()), len(self.project.diagrams()))
+        self.assertEqual(num_nodes + len(graph1.nodes()) + len(graph2.nodes()), len(self.project.nodes()))
+        self.assertIsNotNone(self.project.diagram('diagram_1'))
+        self.assertEqual(2, self.session.undostack.count())
+        self.assertEqual('A human being', self.project.meta(Item.ConceptNode, 'Person')[K_DESCRIPTION])
+
+    def test_import_reports_failures(self):
+        # GIVEN
+        num_diagrams = len(self.project.diagrams())
+        missing = expandPath('@tests/.tests/missing.graphol')
+        # WHEN
+        importer = self.importFiles(missing, self.path2)
+        # THEN
+        self.assertTrue(importer.completed)
+        self.assertEqual([missing], [x[0] for x in importer.errors])
+        self.assertEqual(num_diagrams + len(Graph.fromFile(self.path2).diagrams()), len(self.project.diagrams()))
+
+    def test_import_reports_unscheduled_workers(self):
+        # GIVEN
+        num_diagrams = len(self.project.diagrams())
+        # WHEN
+        with mock.patch.object(self.session, 'startThread', return_value=False):
+            importer = self.importFiles(self.path2)
+        # THEN
+        self.assertEqual([self.path2], [x[0] for x in importer.errors])
+        self.assertEqual(num_diagrams, len(self.project.diagrams()))
+
+    def test_import_cancel(self):
+        # GIVEN
+        num_diagrams = len(self.project.diagrams())
+        # WHEN
+        importer = self.importFiles(self.path1, self.path2, cancel=True)
+        # THEN
+        self.assertTrue(importer.completed)
+        self.assertEqual(num_diagrams, len(self.project.diagrams()))
+        self.assertEqual(0, self.session.undostack.count())
+
+    #############################################
+    #   GRAPHML
+    #################################
+
+    def test_graphml_document_from_file(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        GraphMLDiagramExporter(diagram, self.session).run('@tests/.tests/exported.graphml')
+        # WHEN
+        document = GraphMLDocument.fromFile(expandPath('@tests/.tests/exported.graphml'))
+        # THEN
+        content = fread('@tests/.tests/exported.graphml')
+        self.assertEqual({'nodegraphics', 'edgegraphics'}, set(document.keys))
+        self.assertEqual(content.count('<node '), len(document.nodes))
+        self.assertEqual(content.count('<edge '), len(document.edges))
+        self.assertTrue(all(x.geometry for x in document.nodes))
+
+    def test_import_graphml(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        for node in diagram.nodes():
+            node.moveBy(400, 300)
+        GraphMLDiagramExporter(diagram, self.session).run('@tests/.tests/exported.graphml')
+        document = GraphMLDocument.fromFile(expandPath('@tests/.tests/exported.graphml'))
+        # WHEN
+        importer = self.importFiles(expandPath('@tests/.tests/exported.graphml'), filetype=File.GraphML)
+        # THEN
+        self.assertTrue(importer.completed)
+        self.assertEmpty(importer.errors)
+        imported = self.project.diagram('exported')
+        self.assertIsNotNone(imported)
+        self.assertEqual(len(document.nodes), len(imported.nodes()))
+        self.assertEqual(len(document.edges), len(imported.edges()))
+        rect = imported.visibleRect(margin=0)
+        self.assertLessEqual(abs(rect.center().x()), 20)
+        self.assertLessEqual(abs(rect.center().y()), 20)
+        self.assertTrue(imported.sceneRect().contains(rect))
+
+    #############################################
+    #   META MERGE
+    #################################
+
+    def test_classify_meta(self):
+        # GIVEN
+        k1 = (Item.ConceptNode, 'A')
+        k2 = (Item.ConceptNode, 'B')
+        k3 = (Item.ConceptNode, 'C')
+        predicates = {k2, k3}
+        current = {k2: {K_DESCRIPTION: 'B'}, k3: {K_DESCRIPTION: 'C'}}
+        importing = {k1: {K_DESCRIPTION: 'A'}, k2: {K_DESCRIPTION: 'B'}, k3: {K_DESCRIPTION: 'D'}}
+        # WHEN
+        unbound, conflicts = ProjectMergeWorker.classifyMeta(predicates, current, importing)
+        # THEN
+        self.assertEqual({k1}, unbound)
+        self.assertEqual({k3}, conflicts)
+
+    def test_import_meta_from_document(self):
+        # GIVEN
+        document = QtXml.QDomDocument()
+        self.assertTrue(document.setContent(fread(self.path1)))
+        graph = Graph.fromFile(self.path1)
+        # WHEN
+        metas = OntologyImportWorker.importMeta(document)
+        # THEN
+        self.assertLen(3, metas)
+        self.assertEqual({k: graph.meta(*k) for k in graph.metas()}, metas)
+
+    def test_import_parses_each_file_once(self):
+        # WHEN
+        with mock.patch.object(Graph, 'fromFile', side_effect=AssertionError('file parsed twice')):
+            importer = self.importFiles(self.path2)
+        # THEN
+        self.assertEmpty(importer.errors)
\ No newline at end of file
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import math
+import time
+import unittest
+
+from unittest import mock
+
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+from eddy.core.commands.nodes import CommandNodeMove
+from eddy.core.datatypes.graphol import Item
+from eddy.core.diagram import Diagram
+from eddy.core.functions.geometry import packPoints, unpackPoints
+from eddy.core.layout import AutoLayout, ForceDirectedLayout
+
+from tests import EddyTestCase
+
+
+class ForceDirectedLayoutTestCase(unittest.TestCase):
+    """
+    Tests for the multilevel force directed layout engine.
+    """
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    @staticmethod
+    def createLayout(count, fixed=None, iterations=50):
+        """
+        Create a layout of a chain of the given number of nodes, all of them placed at the origin.
+        Every third edge of the chain has half the rest length of the others.
+        :type count: int
+        :type fixed: set
+        :type iterations: int
+        :rtype: ForceDirectedLayout
+        """
+        positions = packPoints([QtCore.QPointF(0, 0)] * count)
+        edges = [(i, i + 1, 80.0 if i % 3 == 0 else 160.0) for i in range(count - 1)]
+        return ForceDirectedLayout(positions, [50.0] * count, edges, fixed, 160.0, iterations)
+
+    def test_layout_separates_nodes(self):
+        # GIVEN
+        layout = self.createLayout(200)
+        # WHEN
+        points = unpackPoints(layout.run())
+        # THEN
+        self.assertEqual(200, len(points))
+        for i, p in enumerate(points):
+            for q in points[i + 1:]:
+                self.assertGreater(math.hypot(p.x() - q.x(), p.y() - q.y()), 50.0)
+
+    def test_layout_keeps_edges_short(self):
+        # GIVEN
+        layout = self.createLayout(200)
+        # WHEN
+        points = unpackPoints(layout.run())
+        # THEN
+        lengths = {80.0: [], 160.0: []}
+        for i, j, length in layout.edges:
+            lengths[length].append(math.hypot(points[i].x() - points[j].x(), points[i].y() - points[j].y()))
+        self.assertLess(sorted(lengths[160.0])[100], 400.0)
+        self.assertLess(sum(lengths[80.0]) / len(lengths[80.0]), sum(lengths[160.0]) / len(lengths[160.0]))
+
+    def test_layout_does_not_move_fixed_nodes(self):
+        # GIVEN
+        layout = self.createLayout(50, fixed={0, 49})
+        # WHEN
+        points = unpackPoints(layout.run())
+        # THEN
+        self.assertEqual(QtCore.QPointF(0, 0), points[0])
+        self.assertEqual(QtCore.QPointF(0, 0), points[49])
+        self.assertNotEqual(QtCore.QPointF(0, 0), points[25])
+
+    def test_layout_can_be_interrupted(self):
+        # GIVEN
+        layout = self.createLayout(50, iterations=10)
+        calls = []
+        # WHEN
+        layout.run(lambda i, total: calls.append((i, total)) or i == 5)
+        # THEN
+        self.assertEqual(5, len(calls))
+        self.assertEqual(0, calls[-1][1] % 10)
+
+
+class AutoLayoutTestCase(EddyTestCase):
+    """
+    Tests for the automatic layout of diagrams.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.diagram = self.project.diagram('diagram')
+        self.session.action('toggle_grid').setChecked(False)
+
+    def test_auto_layout(self):
+        # GIVEN
+        positions = {node: node.pos() for node in self.diagram.nodes()}
+        breakpoints = {edge: len(edge.breakpoints) for edge in self.diagram.edges()}
+        count = self.session.undostack.count()
+        # WHEN
+        AutoLayout(self.diagram).run()
+        # THEN
+        self.assertEqual(count + 1, self.session.undostack.count())
+        self.assertAny(node.pos() != positions[node] for node in self.diagram.nodes())
+        self.assertAll(len(edge.breakpoints) == breakpoints[edge] for edge in self.diagram.edges())
+        for edge in self.diagram.edges():
+            if edge.type() is Item.InputEdge:
+                self.assertLess(QtCore.QLineF(edge.source.pos(), edge.target.pos()).length(), 1000)
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertAll(node.pos() == positions[node] for node in self.diagram.nodes())
+
+    def test_auto_layout_in_bulk_mode(self):
+        # GIVEN
+        positions = {node: node.pos() for node in self.diagram.nodes()}
+        # WHEN
+        with mock.patch.object(Diagram, 'BulkThreshold', 1):
+            AutoLayout(self.diagram).run()
+            self.session.undostack.undo()
+        # THEN
+        self.assertFalse(self.diagram.isBulkLoading())
+        self.assertAll(node.pos() == positions[node] for node in self.diagram.nodes())
+        self.assertAll(edge.zValue() > max(edge.source.zValue(), edge.target.zValue()) for edge in self.diagram.edges())
+
+    def test_auto_layout_selected_nodes(self):
+        # GIVEN
+        nodes = [n for n in self.diagram.nodes() if n.type() is Item.IndividualNode]
+        others = {node: node.pos() for node in self.diagram.nodes() if node not in nodes}
+        # WHEN
+        AutoLayout(self.diagram, nodes).run()
+        # THEN
+        self.assertAll(node.pos() == others[node] for node in others)
+        self.assertEqual('auto layout {0} nodes'.format(len(nodes)), self.session.undostack.undoText())
+
+    def test_auto_layout_is_not_merged_with_node_moves(self):
+        # GIVEN
+        initData = self.diagram.setupMove(self.diagram.nodes())
+        moveData = self.diagram.completeMove(initData, QtCore.QPointF(40, 0))
+        self.session.undostack.push(CommandNodeMove(self.diagram, initData, moveData))
+        positions = {node: node.pos() for node in self.diagram.nodes()}
+        count = self.session.undostack.count()
+        # WHEN
+        AutoLayout(self.diagram).run()
+        # THEN
+        self.assertEqual(count + 1, self.session.undostack.count())
+        self.assertEqual('auto layout {0} nodes'.format(len(positions)), self.session.undostack.undoText())
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertAll(node.pos() == positions[node] for node in self.diagram.nodes())
+
+    def test_auto_layout_in_background(self):
+        # GIVEN
+        positions = {node: node.pos() for node in self.diagram.nodes()}
+        layout = AutoLayout(self.diagram)
+        # WHEN
+        completed = []
+        layout.sgnCompleted.connect(lambda: completed.append(True))
+        self.assertTrue(layout.start())
+        deadline = time.monotonic() + 30
+        while not completed and time.monotonic() < deadline:
+            QtWidgets.QApplication.processEvents()
+            time.sleep(0.01)
+        self.assertTrue(completed, 'auto layout did not complete within 30 seconds')
+        # THEN
+        self.assertAny(node.pos() != positions[node] for node in self.diagram.nodes())
\ No newline at end of file
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import logging
+import os
+import tempfile
+
+from tests import EddyTestCase
+
+from eddy.core.output import OutputBuffer
+from eddy.ui.log import LogModel
+
+
+class OutputTestCase(EddyTestCase):
+    """
+    Tests for eddy's log output buffer.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.buffer = OutputBuffer(capacity=5)
+        self.buffer.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        self.logger = logging.Logger('eddy.tests.output')
+        self.logger.addHandler(self.buffer)
+
+    def tearDown(self):
+        """
+        Perform operation on test end.
+        """
+        self.buffer.close()
+        super().tearDown()
+
+    #############################################
+    #   BUFFER
+    #################################
+
+    def test_buffer_discards_oldest_records(self):
+        # WHEN
+        for i in range(8):
+            self.logger.info('message %s', i)
+        # THEN
+        self.assertEqual(5, len(self.buffer.snapshot()))
+        self.assertEqual(3, self.buffer.discarded())
+        self.assertEqual(['message %s' % i for i in range(3, 8)], [x.message for x in self.buffer.snapshot()])
+        self.assertEqual([4, 5, 6, 7, 8], [x.sequence for x in self.buffer.snapshot()])
+
+    def test_buffer_set_capacity(self):
+        # GIVEN
+        for i in range(5):
+            self.logger.info('message %s', i)
+        # WHEN
+        self.buffer.setCapacity(2)
+        # THEN
+        self.assertEqual(2, self.buffer.capacity())
+        self.assertEqual(['message 3', 'message 4'], [x.message for x in self.buffer.snapshot()])
+
+    def test_buffer_level_filtering(self):
+        # GIVEN
+        self.buffer.setLevel(logging.INFO)
+        # WHEN
+        self.logger.debug('debug')
+        self.logger.info('info')
+        self.logger.error('error')
+        # THEN
+        self.assertEqual(['info', 'error'], [x.message for x in self.buffer.snapshot()])
+        self.assertEqual(['error'], [x.message for x in self.buffer.snapshot(logging.WARNING)])
+
+    def test_buffer_stores_exception_text(self):
+        # WHEN
+        try:
+            raise ValueError('broken')
+        except ValueError:
+            self.logger.exception('failure')
+        # THEN
+        message = self.buffer.snapshot()[0].message
+        self.assertTrue(message.startswith('failure\n'))
+        self.assertIn('ValueError: broken', message)
+
+    def test_buffer_rotating_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # GIVEN
+            path = os.path.join(directory, 'logs', 'eddy.log')
+            self.buffer.setFile(path, size=64, backups=2)
+            # WHEN
+            for i in range(20):
+                self.logger.info('message %s', i)
+            self.buffer.setFile(None)
+            # THEN
+            self.assertTrue(os.path.isfile(path))
+            self.assertTrue(os.path.isfile('{0}.1'.format(path)))
+            self.assertFalse(os.path.isfile('{0}.3'.format(path)))
+            with open(path) as f:
+                self.assertTrue(f.read().splitlines()[-1].endswith(' message 19'))
+
+    #############################################
+    #   MODEL
+    #################################
+
+    def test_model_fetches_records_lazily(self):
+        # GIVEN
+        self.buffer.setCapacity(2500)
+        for i in range(2500):
+            self.logger.log(logging.WARNING if i % 2 else logging.INFO, 'message %s', i)
+        # WHEN
+        model = LogModel(self.buffer)
+        # THEN
+        self.assertEqual(LogModel.PageSize, model.rowCount())
+        self.assertTrue(model.canFetchMore())
+        # WHEN
+        model.fetchMore()
+        model.fetchMore()
+        # THEN
+        self.assertEqual(2500, model.rowCount())
+        self.assertFalse(model.canFetchMore())
+        self.assertTrue(model.data(model.index(2499)).endswith('message 2499'))
+        # WHEN
+        model.setLevel(logging.WARNING)
+        # THEN
+        self.assertEqual(LogModel.PageSize, model.rowCount())
+        self.assertTrue(model.data(model.index(0)).endswith('message 1'))
\ No newline at end of file
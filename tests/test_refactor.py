@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from tests import EddyTestCase
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.functions.misc import first
+from eddy.core.project import K_DESCRIPTION
+from eddy.ui.forms import RefactorNameForm
+from eddy.ui.forms import RefactorNamesForm
+
+
+class RefactorTestCase(EddyTestCase):
+    """
+    Tests for eddy's predicate refactoring.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_2')
+
+    #############################################
+    #   RENAME
+    #################################
+
+    def test_refactor_name(self):
+        # GIVEN
+        nodes = self.project.predicates(Item.ConceptNode, 'C2')
+        count = self.session.undostack.count()
+        self.project.setMeta(Item.ConceptNode, 'C2', {K_DESCRIPTION: 'Second concept'})
+        # WHEN
+        form = RefactorNameForm(first(nodes), self.session)
+        form.renameField.setValue('C9')
+        form.accept()
+        # THEN
+        self.assertEqual(count + 1, self.session.undostack.count())
+        self.assertEmpty(self.project.predicates(Item.ConceptNode, 'C2'))
+        self.assertEqual(nodes, self.project.predicates(Item.ConceptNode, 'C9'))
+        self.assertEqual({K_DESCRIPTION: 'Second concept'}, self.project.meta(Item.ConceptNode, 'C9'))
+        self.assertEqual([('C9', 1.0)], [(x[1], x[2]) for x in self.session.searchIndex.search('C9')])
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEmpty(self.project.predicates(Item.ConceptNode, 'C9'))
+        self.assertEqual(nodes, self.project.predicates(Item.ConceptNode, 'C2'))
+        self.assertEqual({K_DESCRIPTION: 'Second concept'}, self.project.meta(Item.ConceptNode, 'C2'))
+        self.assertEqual({}, self.project.meta(Item.ConceptNode, 'C9'))
+        self.assertEqual([], self.session.searchIndex.search('C9', fuzzy=False))
+
+    def test_refactor_name_into_existing_predicate_merges_metadata(self):
+        # GIVEN
+        nodes = self.project.predicates(Item.ConceptNode, 'C2') | self.project.predicates(Item.ConceptNode, 'C1')
+        self.project.setMeta(Item.ConceptNode, 'C2', {K_DESCRIPTION: 'Second concept', 'url': 'http://example.com/c2'})
+        self.project.setMeta(Item.ConceptNode, 'C1', {K_DESCRIPTION: 'First concept'})
+        # WHEN
+        form = RefactorNameForm(first(self.project.predicates(Item.ConceptNode, 'C2')), self.session)
+        form.renameField.setValue('C1')
+        form.accept()
+        # THEN
+        self.assertEqual(nodes, self.project.predicates(Item.ConceptNode, 'C1'))
+        self.assertEqual({K_DESCRIPTION: 'First concept', 'url': 'http://example.com/c2'}, self.project.meta(Item.ConceptNode, 'C1'))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual({K_DESCRIPTION: 'Second concept', 'url': 'http://example.com/c2'}, self.project.meta(Item.ConceptNode, 'C2'))
+        self.assertEqual({K_DESCRIPTION: 'First concept'}, self.project.meta(Item.ConceptNode, 'C1'))
+
+    def test_refactor_names_with_prefix(self):
+        # GIVEN
+        count = self.session.undostack.count()
+        nodes = self.project.predicates(Item.ConceptNode)
+        # WHEN
+        form = RefactorNamesForm(self.session)
+        form.typeField.setCurrentIndex(1)
+        form.findField.setValue('C')
+        form.replaceField.setValue('Concept')
+        form.accept()
+        # THEN
+        self.assertEqual(count + 1, self.session.undostack.count())
+        self.assertTrue(all(x.text().startswith('Concept') for x in nodes))
+        self.assertEqual(8, len(self.project.predicates(Item.ConceptNode, 'Concept2')))
+        self.assertEmpty(self.project.predicates(Item.ConceptNode, 'C2'))
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual(8, len(self.project.predicates(Item.ConceptNode, 'C2')))
+        self.assertEmpty(self.project.predicates(Item.ConceptNode, 'Concept2'))
+
+    def test_refactor_names_with_regular_expression(self):
+        # GIVEN
+        i1 = self.project.predicates(Item.IndividualNode, 'I1')
+        i2 = self.project.predicates(Item.IndividualNode, 'I2')
+        # WHEN
+        form = RefactorNamesForm(self.session)
+        form.modeField.setCurrentIndex(1)
+        form.findField.setValue('^I([12])$')
+        form.replaceField.setValue(r'Individual_\1')
+        form.accept()
+        # THEN
+        self.assertEqual(i1, self.project.predicates(Item.IndividualNode, 'Individual_1'))
+        self.assertEqual(i2, self.project.predicates(Item.IndividualNode, 'Individual_2'))
+        self.assertEqual(2, len(self.project.predicates(Item.IndividualNode, 'I4')))
+
+    def test_refactor_names_with_invalid_regular_expression(self):
+        # WHEN
+        form = RefactorNamesForm(self.session)
+        form.modeField.setCurrentIndex(1)
+        form.findField.setValue('I(')
+        # THEN
+        self.assertFalse(form.confirmationBox.button(form.confirmationBox.Ok).isEnabled())
+        self.assertIn('not a valid regular expression', form.caption.text())
\ No newline at end of file
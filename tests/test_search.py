@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+from tests import EddyTestCase
+
+from eddy.core.datatypes.graphol import Item
+from eddy.core.project import K_DESCRIPTION
+
+
+class SearchTestCase(EddyTestCase):
+    """
+    Tests for eddy's predicate search index.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.session.sgnFocusDiagram.emit(self.project.diagram('diagram'))
+
+    #############################################
+    #   LOOKUP
+    #################################
+
+    def test_search_exact_match_ranks_first(self):
+        # WHEN
+        results = self.session.searchIndex.search('male')
+        # THEN
+        self.assertEqual((Item.ConceptNode, 'Male', 1.0), results[0])
+        self.assertIn('Female', [x[1] for x in results])
+
+    def test_search_prefix(self):
+        # WHEN
+        results = self.session.searchIndex.search('Mo')
+        # THEN
+        self.assertEqual(['Mother'], [x[1] for x in results])
+
+    def test_search_fuzzy(self):
+        # WHEN
+        results = self.session.searchIndex.search('Mothre')
+        # THEN
+        self.assertIn('Mother', [x[1] for x in results])
+        self.assertNotIn('Mother', [x[1] for x in self.session.searchIndex.search('Mothre', fuzzy=False)])
+
+    def test_search_description(self):
+        # WHEN
+        self.project.setMeta(Item.ConceptNode, 'Adult', {K_DESCRIPTION: 'A grown up person'})
+        # THEN
+        self.assertEqual([(Item.ConceptNode, 'Adult')], [x[:2] for x in self.session.searchIndex.search('grown pers')])
+        # WHEN
+        self.project.unsetMeta(Item.ConceptNode, 'Adult')
+        # THEN
+        self.assertEqual([], self.session.searchIndex.search('grown pers'))
+
+    #############################################
+    #   UPDATE
+    #################################
+
+    def test_search_index_tracks_removed_predicates(self):
+        # GIVEN
+        diagram = self.project.diagram('diagram')
+        diagram.clearSelection()
+        for node in self.project.predicates(Item.ConceptNode, 'Mother'):
+            node.setSelected(True)
+        # WHEN
+        self.session.action('delete').trigger()
+        # THEN
+        self.assertNotIn('Mother', [x[1] for x in self.session.searchIndex.search('Mother')])
+        # WHEN
+        self.session.undostack.undo()
+        # THEN
+        self.assertEqual((Item.ConceptNode, 'Mother', 1.0), self.session.searchIndex.search('Mother')[0])
\ No newline at end of file
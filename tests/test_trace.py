@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import json
+import os
+import tempfile
+
+from tests import EddyTestCase
+
+from eddy.core.exporters.graphol import GrapholProjectExporter
+from eddy.core.trace import Tracer, traced
+
+
+class TraceTestCase(EddyTestCase):
+    """
+    Tests for eddy's performance tracing facilities.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+
+    def tearDown(self):
+        """
+        Perform operation on test end.
+        """
+        Tracer.stop()
+        Tracer.clear()
+        super().tearDown()
+
+    #############################################
+    #   RECORDING
+    #################################
+
+    def test_tracing_disabled(self):
+        # WHEN
+        with Tracer.span('span'):
+            Tracer.counter('counter', value=1)
+            Tracer.instant('instant')
+        # THEN
+        self.assertFalse(Tracer.isEnabled())
+        self.assertEmpty(Tracer.events)
+        self.assertIs(Tracer.Null, Tracer.span('span'))
+
+    def test_tracing_spans_counters_and_instants(self):
+        # GIVEN
+        @traced(category='tests')
+        def function(x):
+            return x * 2
+        # WHEN
+        Tracer.start()
+        with Tracer.span('outer', 'tests', size=3):
+            self.assertEqual(4, function(2))
+            Tracer.counter('counter', 'tests', value=10)
+            Tracer.instant('instant', 'tests')
+        Tracer.stop()
+        # THEN
+        events = {x['name']: x for x in Tracer.trace()['traceEvents']}
+        self.assertEqual('X', events['outer']['ph'])
+        self.assertEqual({'size': 3}, events['outer']['args'])
+        self.assertEqual('X', events[function.__qualname__]['ph'])
+        self.assertLessEqual(events['outer']['ts'], events[function.__qualname__]['ts'])
+        self.assertGreaterEqual(events['outer']['dur'], events[function.__qualname__]['dur'])
+        self.assertEqual({'value': 10}, events['counter']['args'])
+        self.assertEqual('i', events['instant']['ph'])
+        self.assertEqual('M', events['thread_name']['ph'])
+
+    def test_tracing_limit(self):
+        # WHEN
+        Tracer.start(limit=2)
+        for i in range(5):
+            Tracer.instant('instant')
+        # THEN
+        self.assertEqual(2, len(Tracer.events))
+        self.assertEqual(3, Tracer.trace()['otherData']['dropped'])
+
+    def test_tracing_project_save_and_dump(self):
+        # WHEN
+        Tracer.start()
+        worker = GrapholProjectExporter(self.project)
+        worker.run()
+        Tracer.stop()
+        # THEN
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'trace.json')
+            Tracer.dump(path)
+            with open(path) as f:
+                trace = json.load(f)
+        names = {x['name'] for x in trace['traceEvents']}
+        self.assertIn('GrapholProjectExporter.run', names)
+        self.assertIn('GrapholProjectExporter.createDiagrams', names)
\ No newline at end of file
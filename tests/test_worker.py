@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#                                                                        #
+#  Eddy: a graphical editor for the specification of Graphol ontologies  #
+#  Copyright (C) 2015 Daniele Pantaleone <danielepantaleone@me.com>      #
+#                                                                        #
+#  This program is free software: you can redistribute it and/or modify  #
+#  it under the terms of the GNU General Public License as published by  #
+#  the Free Software Foundation, either version 3 of the License, or     #
+#  (at your option) any later version.                                   #
+#                                                                        #
+#  This program is distributed in the hope that it will be useful,       #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of        #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the          #
+#  GNU General Public License for more details.                          #
+#                                                                        #
+#  You should have received a copy of the GNU General Public License     #
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                        #
+#  #####################                          #####################  #
+#                                                                        #
+#  Graphol is developed by members of the DASI-lab group of the          #
+#  Dipartimento di Ingegneria Informatica, Automatica e Gestionale       #
+#  A.Ruberti at Sapienza University of Rome: http://www.dis.uniroma1.it  #
+#                                                                        #
+#     - Domenico Lembo <lembo@dis.uniroma1.it>                           #
+#     - Valerio Santarelli <santarelli@dis.uniroma1.it>                  #
+#     - Domenico Fabio Savo <savo@dis.uniroma1.it>                       #
+#     - Daniele Pantaleone <pantaleone@dis.uniroma1.it>                  #
+#     - Marco Console <console@dis.uniroma1.it>                          #
+#                                                                        #
+##########################################################################
+
+
+import threading
+import time
+
+from PyQt5 import QtCore
+
+from tests import EddyTestCase
+
+from eddy.core.worker import AbstractWorker, TaskScheduler
+
+
+class RecordingWorker(AbstractWorker):
+    """
+    Worker recording its execution in the given log, optionally blocking until the given event is set.
+    """
+    sgnStarted = QtCore.pyqtSignal()
+
+    def __init__(self, name, log, event=None, stats=None):
+        super().__init__()
+        self.event = event
+        self.log = log
+        self.name = name
+        self.stats = stats
+
+    def run(self):
+        if self.stats is not None:
+            with self.stats['lock']:
+                self.stats['running'] += 1
+                self.stats['max'] = max(self.stats['max'], self.stats['running'])
+        self.sgnStarted.emit()
+        if self.event:
+            while not self.event.wait(0.01) and not self.isCancelled():
+                pass
+        else:
+            time.sleep(0.02)
+        self.progress.emit(1, 1)
+        self.log.append((self.name, self.isCancelled()))
+        if self.stats is not None:
+            with self.stats['lock']:
+                self.stats['running'] -= 1
+        self.finished.emit()
+
+
+class SilentWorker(AbstractWorker):
+    """
+    Worker which terminates without emitting the finished signal.
+    """
+    def run(self):
+        pass
+
+
+class UntakeableThreadPool(QtCore.QThreadPool):
+    """
+    Thread pool which never releases pending runnables, like QThreadPool before Qt 5.9 (no tryTake).
+    """
+    def tryTake(self, runnable):
+        return False
+
+
+class TaskSchedulerTestCase(EddyTestCase):
+    """
+    Tests for the pooled task scheduler.
+    """
+    def setUp(self):
+        """
+        Initialize test case environment.
+        """
+        super().setUp()
+        self.init('test_project_1')
+        self.scheduler = TaskScheduler()
+
+    def tearDown(self):
+        """
+        Perform operation on test end.
+        """
+        self.scheduler.cancelAll()
+        self.scheduler.waitForDone(2000)
+        super().tearDown()
+
+    #############################################
+    #   AUXILIARY METHODS
+    #################################
+
+    def waitUntil(self, condition, timeout=5000):
+        """
+        Process events until the given condition is satisfied.
+        :type condition: callable
+        :type timeout: int
+        :rtype: bool
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while not condition() and time.monotonic() < deadline:
+            QtCore.QCoreApplication.processEvents(QtCore.QEventLoop.AllEvents, 10)
+        return condition()
+
+    #############################################
+    #   SCHEDULING
+    #################################
+
+    def test_queue_bounds_concurrency(self):
+        # GIVEN
+        log = []
+        stats = {'lock': threading.Lock(), 'running': 0, 'max': 0}
+        self.scheduler.addQueue('bounded', threads=2)
+        # WHEN
+        for i in range(8):
+            self.scheduler.submit('task{0}'.format(i), RecordingWorker(i, log, stats=stats), queue='bounded')
+        # THEN
+        self.assertTrue(self.waitUntil(lambda: not self.scheduler.tasks()))
+        self.assertLen(8, log)
+        self.assertLessEqual(stats['max'], 2)
+
+    def test_queue_starts_tasks_by_priority(self):
+        # GIVEN
+        log = []
+        event = threading.Event()
+        self.scheduler.addQueue('serial', threads=1)
+        blocker = RecordingWorker('blocker', log, event)
+        self.scheduler.submit('blocker', blocker, queue='serial')
+        self.assertTrue(self.waitUntil(lambda: self.scheduler.task('blocker').started))
+        # WHEN
+        self.scheduler.submit('low', RecordingWorker('low', log), queue='serial', priority=0)
+        self.scheduler.submit('high', RecordingWorker('high', log), queue='serial', priority=10)
+        event.set()
+        # THEN
+        self.assertTrue(self.waitUntil(lambda: not self.scheduler.tasks()))
+        self.assertEqual(['blocker', 'high', 'low'], [x[0] for x in log])
+
+    def test_queue_rejects_tasks_when_full(self):
+        # GIVEN
+        event = threading.Event()
+        self.scheduler.addQueue('small', threads=1, capacity=2)
+        # WHEN
+        task1 = self.scheduler.submit('task1', RecordingWorker(1, [], event), queue='small')
+        task2 = self.scheduler.submit('task2', RecordingWorker(2, [], event), queue='small')
+        task3 = self.scheduler.submit('task3', RecordingWorker(3, [], event), queue='small')
+        # THEN
+        self.assertIsNotNone(task1)
+        self.assertIsNotNone(task2)
+        self.assertIsNone(task3)
+        self.assertIsNone(self.scheduler.submit('task1', RecordingWorker(1, []), queue=TaskScheduler.DefaultQueue))
+        event.set()
+        self.assertTrue(self.waitUntil(lambda: not self.scheduler.tasks()))
+        self.assertIsNotNone(self.scheduler.submit('task3', RecordingWorker(3, []), queue='small'))
+
+    #############################################
+    #   CANCELLATION
+    #################################
+
+    def test_cancel_tasks(self):
+        # GIVEN
+        log = []
+        cancelled = []
+        event = threading.Event()
+        self.scheduler.addQueue('serial', threads=1)
+        self.scheduler.sgnTaskCancelled.connect(cancelled.append)
+        self.scheduler.submit('running', RecordingWorker('running', log, event), queue='serial')
+        self.scheduler.submit('pending', RecordingWorker('pending', log), queue='serial')
+        self.assertTrue(self.waitUntil(lambda: self.scheduler.task('running').started))
+        # WHEN
+        self.scheduler.cancel('pending')
+        self.scheduler.cancel('running')
+        # THEN
+        self.assertTrue(self.waitUntil(lambda: not self.scheduler.tasks()))
+        self.assertEqual([('running', True)], log)
+        self.assertEqual(['pending'], cancelled)
+
+    def test_cancel_pending_task_without_try_take(self):
+        # GIVEN
+        log = []
+        cancelled = []
+        event = threading.Event()
+        queue = self.scheduler.addQueue('serial', threads=1)
+        queue.pool = UntakeableThreadPool()
+        queue.pool.setMaxThreadCount(1)
+        self.scheduler.sgnTaskCancelled.connect(cancelled.append)
+        self.scheduler.submit('running', RecordingWorker('running', log, event), queue='serial')
+        self.scheduler.submit('pending', RecordingWorker('pending', log), queue='serial')
+        self.assertTrue(self.waitUntil(lambda: self.scheduler.task('running').started))
+        # WHEN
+        self.scheduler.cancel('pending')
+        # THEN
+        self.assertEqual(['pending'], cancelled)
+        self.assertIsNone(self.scheduler.task('pending'))
+        self.assertLen(1, queue.discarded)
+        # WHEN
+        event.set()
+        # THEN
+        self.assertTrue(queue.pool.waitForDone(2000))
+        self.assertEqual([('running', False)], log)
+        self.assertEmpty(queue.discarded)
+        self.assertEmpty(self.scheduler.tasks())
+
+    #############################################
+    #   COMPLETION
+    #################################
+
+    def test_tasks_are_released_without_finished_signal(self):
+        # GIVEN
+        finished = []
+        self.scheduler.sgnTaskFinished.connect(finished.append)
+        # WHEN
+        task = self.scheduler.submit('silent', SilentWorker())
+        # THEN
+        self.assertTrue(self.scheduler.waitForDone(2000))
+        self.assertTrue(task.isDone())
+        self.assertEmpty(self.scheduler.tasks())
+        self.assertTrue(self.waitUntil(lambda: finished))
+        self.assertEqual(['silent'], finished)
+
+    #############################################
+    #   PROGRESS
+    #################################
+
+    def test_progress_is_reported(self):
+        # GIVEN
+        progress = []
+        finished = []
+        self.scheduler.sgnTaskProgress.connect(lambda *args: progress.append(args))
+        self.scheduler.sgnTaskFinished.connect(finished.append)
+        # WHEN
+        self.scheduler.submit('task', RecordingWorker('task', []))
+        # THEN
+        self.assertTrue(self.waitUntil(lambda: finished))
+        self.assertEqual([('task', 1, 1)], progress)
+        self.assertEqual(['task'], finished)
+
+    #############################################
+    #   THREADING SYSTEM
+    #################################
+
+    def test_session_start_thread(self):
+        # GIVEN
+        log = []
+        event = threading.Event()
+        # WHEN
+        started1 = self.session.startThread('job', RecordingWorker(1, log, event))
+        started2 = self.session.startThread('job', RecordingWorker(2, log, event))
+        # THEN
+        self.assertTrue(started1)
+        self.assertFalse(started2)
+        self.assertIsNotNone(self.session.worker('job'))
+        event.set()
+        self.assertTrue(self.waitUntil(lambda: self.session.worker('job') is None))
+        self.assertEqual([(1, False)], log)
+        self.assertTrue(self.session.startThread('job', RecordingWorker(3, log)))
\ No newline at end of file